@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Chunk Assembly Benchmark
+========================
+Compares the old `np.concatenate(all_audio)` join with the preallocated
+ChunkAssembler (scripts/chunk_assembler.py) for multi-chunk synthesis.
+
+Reports peak traced memory relative to the output size, wall time, and the
+largest sample-to-sample jump at chunk boundaries (a click indicator).
+
+Usage:
+    python benchmarks/bench_chunk_assembly.py
+    python benchmarks/bench_chunk_assembly.py --chunks 6 24 --chunk-seconds 8
+"""
+
+import sys
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from chunk_assembler import ChunkAssembler, estimate_samples  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+
+def synth_chunk(seconds: float, rng) -> np.ndarray:
+    """Chunk with lead-in/out silence and a non-zero end sample, like model output"""
+    voiced = int(seconds * SAMPLE_RATE)
+    t = np.arange(voiced) / SAMPLE_RATE
+    wav = np.zeros(voiced + int(0.6 * SAMPLE_RATE), dtype=np.float32)
+    envelope = np.hanning(voiced)
+    wav[int(0.3 * SAMPLE_RATE):int(0.3 * SAMPLE_RATE) + voiced] = 0.3 * envelope * np.sin(2 * np.pi * rng.uniform(120, 240) * t)
+    # Smooth drift to a DC offset at the very end: only a hard join makes it click
+    ramp = int(0.1 * SAMPLE_RATE)
+    wav[-ramp:] += np.linspace(0.0, rng.uniform(0.05, 0.1), ramp, dtype=np.float32)
+    return wav
+
+
+def concat_join(chunks):
+    all_audio = []
+    for chunk in chunks:
+        all_audio.append(chunk.copy())  # each synthesize_audio call returns a fresh array
+    return np.concatenate(all_audio)
+
+
+def assembler_join(chunks, text_length: int):
+    assembler = ChunkAssembler(SAMPLE_RATE, expected_samples=estimate_samples("x" * text_length, SAMPLE_RATE))
+    for chunk in chunks:
+        assembler.add(chunk.copy())
+    return assembler.result()
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    out = fn()
+    elapsed = (time.perf_counter() - start) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return out, elapsed, peak
+
+
+def max_jump(wav: np.ndarray) -> float:
+    return float(np.abs(np.diff(wav)).max())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark multi-chunk audio assembly")
+    parser.add_argument("--chunks", type=int, nargs="+", default=[3, 12, 48])
+    parser.add_argument("--chunk-seconds", type=float, default=6.0)
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print(f"Chunk assembly benchmark ({args.chunk_seconds:.0f}s chunks at {SAMPLE_RATE} Hz)")
+    print("=" * 80)
+    print(f"{'chunks':>6} {'method':>10} {'output MB':>10} {'peak MB':>9} {'peak/out':>9} {'time':>9} {'max jump':>9}")
+
+    for count in args.chunks:
+        rng = np.random.default_rng(count)
+        chunks = [synth_chunk(args.chunk_seconds, rng) for _ in range(count)]
+        text_length = int(count * args.chunk_seconds * 14)
+
+        for name, fn in (("concat", lambda: concat_join(chunks)), ("assembler", lambda: assembler_join(chunks, text_length))):
+            out, elapsed, peak = measure(fn)
+            print(
+                f"{count:>6} {name:>10} {out.nbytes / 1e6:>10.1f} {peak / 1e6:>9.1f} "
+                f"{peak / out.nbytes:>8.2f}x {elapsed:>7.1f}ms {max_jump(out):>9.3f}"
+            )
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Output Format Size / Latency Benchmark
+======================================
+Compares WAV, MP3 and Opus (Ogg and raw packets) output for the same audio:
+bytes per second of speech, encode cost (× real time) and time to first
+byte for a simulated multi-chunk synthesis (each chunk takes `--synth-rtf`
+× its duration to generate; streaming encoders send after chunk one).
+
+Usage:
+    python benchmarks/bench_compressed_formats.py
+    python benchmarks/bench_compressed_formats.py --seconds 30 --opus-bitrates 16 24 32 48
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from audio_encoding import encode_wav  # noqa: E402
+from streaming_encoders import create_streaming_encoder, MP3_STREAMING, OPUS_AVAILABLE  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+
+def make_chunks(seconds: float, chunk_seconds: float) -> list:
+    """Speech-like test signal (modulated harmonics + noise) split into chunks"""
+    rng = np.random.default_rng(0)
+    num_samples = int(seconds * SAMPLE_RATE)
+    t = np.arange(num_samples) / SAMPLE_RATE
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 3 * t)
+    wav = sum(np.sin(2 * np.pi * 160 * k * t) / k for k in range(1, 8)) * 0.15 * envelope
+    wav = (wav + rng.standard_normal(num_samples) * 0.01).astype(np.float32)
+    step = int(chunk_seconds * SAMPLE_RATE)
+    return [wav[i:i + step] for i in range(0, num_samples, step)]
+
+
+def run_wav(chunks: list, synth_rtf: float):
+    """WAV needs the full length for its header: buffer everything"""
+    synth_ms = sum(len(chunk) for chunk in chunks) / SAMPLE_RATE * synth_rtf * 1000
+    start = time.perf_counter()
+    size = len(encode_wav(np.concatenate(chunks), SAMPLE_RATE))
+    encode_ms = (time.perf_counter() - start) * 1000
+    return encode_ms, synth_ms + encode_ms, size
+
+
+def run_streaming(format: str, bitrate: int, chunks: list, synth_rtf: float):
+    encoder = create_streaming_encoder(format, SAMPLE_RATE, bitrate)
+    synth_ms = 0.0
+    encode_ms = 0.0
+    ttfb_ms = None
+    size = 0
+
+    for chunk in chunks:
+        synth_ms += len(chunk) / SAMPLE_RATE * synth_rtf * 1000
+        start = time.perf_counter()
+        data = encoder.encode(chunk.copy())
+        encode_ms += (time.perf_counter() - start) * 1000
+        if data and ttfb_ms is None:
+            ttfb_ms = synth_ms + encode_ms
+        size += len(data)
+
+    start = time.perf_counter()
+    size += len(encoder.flush())
+    encode_ms += (time.perf_counter() - start) * 1000
+    return encode_ms, ttfb_ms if ttfb_ms is not None else synth_ms + encode_ms, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare output format size and latency")
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--chunk-seconds", type=float, default=4.0)
+    parser.add_argument("--synth-rtf", type=float, default=0.5)
+    parser.add_argument("--mp3-bitrates", type=int, nargs="+", default=[64, 128])
+    parser.add_argument("--opus-bitrates", type=int, nargs="+", default=[16, 24, 32])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    chunks = make_chunks(args.seconds, args.chunk_seconds)
+
+    cases = [("wav", None, lambda: run_wav(chunks, args.synth_rtf))]
+    if MP3_STREAMING:
+        for bitrate in args.mp3_bitrates:
+            cases.append(("mp3", bitrate, lambda b=bitrate: run_streaming("mp3", b, chunks, args.synth_rtf)))
+    else:
+        print("⚠ lameenc not installed - MP3 skipped")
+    if OPUS_AVAILABLE:
+        for bitrate in args.opus_bitrates:
+            for format in ("opus", "opus_packets"):
+                cases.append((format, bitrate, lambda f=format, b=bitrate: run_streaming(f, b, chunks, args.synth_rtf)))
+    else:
+        print("⚠ opuslib/libopus not installed - Opus skipped")
+
+    print("=" * 80)
+    print(f"Output formats: {args.seconds:.0f}s audio, {args.chunk_seconds:.0f}s chunks, "
+          f"synth RTF {args.synth_rtf}, median of {args.repeat}")
+    print("=" * 80)
+    print(f"{'format':>13} {'kbps':>5} {'bytes':>10} {'KB/s':>7} {'vs WAV':>7} {'encode':>9} {'x realtime':>11} {'TTFB':>9}")
+
+    wav_size = None
+    for format, bitrate, fn in cases:
+        runs = [fn() for _ in range(args.repeat)]
+        encode_ms = float(np.median([run[0] for run in runs]))
+        ttfb_ms = float(np.median([run[1] for run in runs]))
+        size = runs[0][2]
+        wav_size = wav_size or size
+        print(
+            f"{format:>13} {bitrate or '-':>5} {size:>10} {size / args.seconds / 1024:>7.1f} "
+            f"{size / wav_size:>6.1%} {encode_ms:>7.1f}ms {args.seconds * 1000 / encode_ms:>10.0f}x {ttfb_ms:>7.0f}ms"
+        )
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+CPU Acceleration Benchmark
+==========================
+RTF of fp32 vs int8-quantized Chatterbox on CPU (scripts/cpu_acceleration.py),
+with the quality guard's per-sentence duration ratio and spectral distance.
+
+RTF = synthesis seconds / audio seconds (below 1.0 is faster than real time).
+
+Usage:
+    python benchmarks/bench_cpu_acceleration.py
+    python benchmarks/bench_cpu_acceleration.py --threads 4
+    docker compose -f docker-compose.cpu.yml run --rm chatterbox-tts python benchmarks/bench_cpu_acceleration.py
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import cpu_acceleration  # noqa: E402
+from cpu_acceleration import accelerate_cpu, cgroup_cpu_limit, effective_cpus, QUALITY_TEST_SET  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark int8 CPU acceleration")
+    parser.add_argument("--threads", type=int, default=None, help="Override the cgroup-derived thread count")
+    parser.add_argument("--no-guard", action="store_true", help="Keep int8 regardless of the quality guard")
+    args = parser.parse_args()
+
+    if args.threads:
+        tune = cpu_acceleration.tune_threads
+        cpu_acceleration.tune_threads = lambda: tune(args.threads)
+
+    print("=" * 80)
+    print(f"CPU acceleration (cgroup quota: {cgroup_cpu_limit() or 'unlimited'}, usable CPUs: {effective_cpus()})")
+    print("=" * 80)
+
+    from tts_engines import ChatterboxEngine
+    model = ChatterboxEngine._load_model("cpu")  # fp32, whatever CPU_ACCELERATION says
+    report = accelerate_cpu(model, guard=not args.no_guard)
+
+    threads = report["threads"]
+    print(f"Threads: intra-op {threads['intra_op_threads']}, inter-op {threads['inter_op_threads']}")
+    print(f"Linear layers quantized: {report.get('quantized_linear_layers')}")
+    print()
+    print(f"{'model':<10} {'RTF':>10}")
+    print(f"{'fp32':<10} {str(report['fp32_rtf']):>10}")
+    print(f"{'int8':<10} {str(report.get('int8_rtf', 'n/a')):>10}")
+    print(f"Speedup: {report.get('speedup')}x")
+
+    if report.get("quality"):
+        print()
+        print(f"{'sentence':<50} {'duration ratio':>15} {'spectral dB':>12}")
+        for text, result in zip(QUALITY_TEST_SET, report["quality"]["sentences"]):
+            print(f"{text[:48]:<50} {result['duration_ratio']:>15} {result['spectral_distance_db']:>12}")
+        print(f"Quality guard: {'passed' if report['quality']['passed'] else 'FAILED (fp32 kept)'}")
+    if report.get("error"):
+        print(f"⚠ {report['error']}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
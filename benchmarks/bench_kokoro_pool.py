@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Kokoro Session Pool Benchmark
+=============================
+Memory and latency with all 7 customer-support voices loaded:
+
+- legacy: one ONNX session per voice (what per-voice `Kokoro(...)`
+  construction amounted to)
+- pool: one shared session (scripts/kokoro_tts_engine.py KokoroSessionPool)
+  at several concurrency levels, reporting per-request latency and
+  throughput (audio seconds per wall second)
+
+Requires kokoro-onnx and the model files (see kokoro_tts_engine.py).
+
+Usage:
+    python benchmarks/bench_kokoro_pool.py
+    python benchmarks/bench_kokoro_pool.py --concurrency 1,2,4 --requests 28 --skip-legacy
+"""
+
+import gc
+import sys
+import time
+import argparse
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import psutil
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from kokoro_tts_engine import (  # noqa: E402
+    KokoroSessionPool, KokoroTTSEngine, KOKORO_MODEL_PATH, KOKORO_VOICES_PATH, available_cpus
+)
+
+TEXT = (
+    "Good afternoon. This is a friendly reminder from CallWaiting Services. "
+    "You have an appointment scheduled for tomorrow at three P M."
+)
+
+
+def rss_mb() -> float:
+    gc.collect()
+    return psutil.Process().memory_info().rss / 1e6
+
+
+def bench_legacy(args, voices):
+    """One session per voice"""
+    before = rss_mb()
+    pools = {voice: KokoroSessionPool(args.model, args.voices_file) for voice in voices}
+    loaded = rss_mb()
+
+    latencies = []
+    for voice, pool in pools.items():
+        start = time.perf_counter()
+        pool.create(TEXT, voice=voice, speed=1.0)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    print(f"{'legacy':>12} {1:>5} {loaded - before:>9.0f}MB {np.median(latencies):>9.0f}ms {'-':>10} {'-':>9}")
+    del pools
+
+
+def bench_pool(args, voices, concurrency: int):
+    before = rss_mb()
+    pool = KokoroSessionPool(args.model, args.voices_file, concurrency=concurrency)
+    loaded = rss_mb()
+
+    for voice in voices:  # Warm every voice once
+        pool.create(TEXT, voice=voice, speed=1.0)
+
+    requests = [voices[i % len(voices)] for i in range(args.requests)]
+    latencies = []
+
+    def one(voice):
+        start = time.perf_counter()
+        samples, sr = pool.create(TEXT, voice=voice, speed=1.0)
+        latencies.append((time.perf_counter() - start) * 1000)
+        return len(samples) / sr
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        audio_seconds = sum(executor.map(one, requests))
+    wall = time.perf_counter() - start
+
+    print(
+        f"{'pool':>12} {concurrency:>5} {loaded - before:>9.0f}MB {np.median(latencies):>9.0f}ms "
+        f"{np.percentile(latencies, 95):>8.0f}ms {audio_seconds / wall:>8.1f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the shared Kokoro session pool")
+    parser.add_argument("--model", default=KOKORO_MODEL_PATH)
+    parser.add_argument("--voices-file", default=KOKORO_VOICES_PATH)
+    parser.add_argument("--concurrency", default="1,2,4", help="Comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=28)
+    parser.add_argument("--skip-legacy", action="store_true")
+    args = parser.parse_args()
+
+    voices = list(KokoroTTSEngine.VOICES)
+
+    print("=" * 80)
+    print(f"Kokoro: {len(voices)} voices, {available_cpus()} CPUs, {args.requests} requests per level")
+    print("=" * 80)
+    print(f"{'mode':>12} {'conc':>5} {'model RSS':>11} {'p50':>11} {'p95':>10} {'audio/s':>9}")
+
+    if not args.skip_legacy:
+        bench_legacy(args, voices)
+    for concurrency in (int(level) for level in args.concurrency.split(",")):
+        bench_pool(args, voices, concurrency)
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+MP3 Encoding Benchmark
+======================
+Compares the streaming in-process encoder (scripts/streaming_encoders.py)
+against the previous one-shot pydub + ffmpeg export.
+
+Reports encode throughput (× real time) and time to first byte (TTFB) for a
+simulated multi-chunk synthesis: each text chunk takes `--synth-rtf` ×
+its audio duration to generate. The streaming encoder can send the first
+frames after chunk one; the pydub path waits for every chunk, then spawns
+ffmpeg.
+
+Usage:
+    python benchmarks/bench_mp3_encoding.py
+    python benchmarks/bench_mp3_encoding.py --seconds 10 60 --chunk-seconds 4 --synth-rtf 0.3
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from streaming_encoders import StreamingMP3Encoder, encode_mp3_pydub, MP3_STREAMING  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+
+def make_chunks(seconds: float, chunk_seconds: float, rng) -> list:
+    """Speech-like test signal split into synthesis-sized chunks"""
+    num_samples = int(seconds * SAMPLE_RATE)
+    t = np.arange(num_samples) / SAMPLE_RATE
+    wav = 0.3 * np.sin(2 * np.pi * 180 * t) * (0.5 + 0.5 * np.sin(2 * np.pi * 3 * t))
+    wav = (wav + rng.standard_normal(num_samples) * 0.02).astype(np.float32)
+    step = int(chunk_seconds * SAMPLE_RATE)
+    return [wav[i:i + step] for i in range(0, num_samples, step)]
+
+
+def run_streaming(chunks: list, synth_rtf: float):
+    """Returns (encode_ms, ttfb_ms, total_bytes)"""
+    encoder = StreamingMP3Encoder(sample_rate=SAMPLE_RATE, bitrate=128)
+    synth_ms = 0.0
+    encode_ms = 0.0
+    ttfb_ms = None
+    total = 0
+
+    for chunk in chunks:
+        synth_ms += len(chunk) / SAMPLE_RATE * synth_rtf * 1000
+        start = time.perf_counter()
+        data = encoder.encode(chunk.copy())
+        encode_ms += (time.perf_counter() - start) * 1000
+        if data and ttfb_ms is None:
+            ttfb_ms = synth_ms + encode_ms
+        total += len(data)
+
+    start = time.perf_counter()
+    total += len(encoder.flush())
+    encode_ms += (time.perf_counter() - start) * 1000
+    return encode_ms, ttfb_ms if ttfb_ms is not None else synth_ms + encode_ms, total
+
+
+def run_pydub(chunks: list, synth_rtf: float):
+    """Returns (encode_ms, ttfb_ms, total_bytes)"""
+    synth_ms = sum(len(chunk) for chunk in chunks) / SAMPLE_RATE * synth_rtf * 1000
+    start = time.perf_counter()
+    data = encode_mp3_pydub(np.concatenate(chunks), SAMPLE_RATE, bitrate=128)
+    encode_ms = (time.perf_counter() - start) * 1000
+    return encode_ms, synth_ms + encode_ms, len(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark MP3 encoding paths")
+    parser.add_argument("--seconds", type=float, nargs="+", default=[5, 20, 60])
+    parser.add_argument("--chunk-seconds", type=float, default=4.0, help="Audio per synthesized chunk")
+    parser.add_argument("--synth-rtf", type=float, default=0.5, help="Simulated synthesis real-time factor")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if not MP3_STREAMING:
+        print("✗ lameenc not installed - pip install lameenc")
+        sys.exit(1)
+
+    try:
+        encode_mp3_pydub(np.zeros(2400, dtype=np.float32))
+        have_pydub = True
+    except Exception as e:
+        have_pydub = False
+        print(f"⚠ pydub/ffmpeg unavailable ({e}) - only the streaming encoder is timed")
+
+    print("=" * 80)
+    print(f"MP3 encoding benchmark (128 kbps, {SAMPLE_RATE} Hz mono, "
+          f"{args.chunk_seconds:.0f}s chunks, synth RTF {args.synth_rtf}, median of {args.repeat})")
+    print("=" * 80)
+    print(f"{'audio':>7} {'path':>10} {'encode':>10} {'x realtime':>11} {'TTFB':>10} {'bytes':>10}")
+
+    rng = np.random.default_rng(0)
+    for seconds in args.seconds:
+        chunks = make_chunks(seconds, args.chunk_seconds, rng)
+        paths = [("streaming", run_streaming)]
+        if have_pydub:
+            paths.append(("pydub", run_pydub))
+
+        for name, fn in paths:
+            runs = [fn(chunks, args.synth_rtf) for _ in range(args.repeat)]
+            encode_ms = float(np.median([run[0] for run in runs]))
+            ttfb_ms = float(np.median([run[1] for run in runs]))
+            size = runs[0][2]
+            print(
+                f"{seconds:>6.0f}s {name:>10} {encode_ms:>8.1f}ms {seconds * 1000 / encode_ms:>10.0f}x "
+                f"{ttfb_ms:>8.0f}ms {size:>10}"
+            )
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
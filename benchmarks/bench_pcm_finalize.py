@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Float → PCM Finalization Microbenchmark
+=======================================
+Times `finalize_audio` against the conversion chain it replaced, on 60-second
+24 kHz buffers:
+
+    np.array(wav, dtype=np.float32)   # copy
+    wav.flatten()                     # copy
+    wav / max_val                     # normalization pass
+    (wav * 32767).astype(np.int16)    # two more temporaries, no clipping
+
+Peak extra memory is measured with tracemalloc (numpy reports its
+allocations to it).
+
+Usage:
+    python benchmarks/bench_pcm_finalize.py
+    python benchmarks/bench_pcm_finalize.py --seconds 60 --repeat 20
+"""
+
+import sys
+import time
+import argparse
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from audio_encoding import finalize_audio  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+
+def legacy_pcm16(wav: np.ndarray) -> np.ndarray:
+    """The old generate_tts_production + pcm16 conversion chain"""
+    wav = np.array(wav, dtype=np.float32)
+    if len(wav.shape) > 1:
+        wav = wav.flatten()
+    max_val = np.abs(wav).max()
+    if max_val > 1.0:
+        wav = wav / max_val
+    return (wav * 32767).astype(np.int16)
+
+
+def measure(fn, make_input, repeat: int):
+    """Return (median ms, peak MB allocated during one call)"""
+    timings = []
+    for _ in range(repeat):
+        wav = make_input()
+        start = time.perf_counter()
+        fn(wav)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    wav = make_input()
+    tracemalloc.start()
+    fn(wav)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return float(np.median(timings)), peak / (1024 * 1024)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark float → PCM finalization")
+    parser.add_argument("--seconds", type=float, default=60.0)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    num_samples = int(args.seconds * SAMPLE_RATE)
+    rng = np.random.default_rng(0)
+    # Model-like output: 2-D, slightly over full scale so normalization kicks in
+    source = (rng.standard_normal((1, num_samples)) * 0.3).astype(np.float32)
+    source[0, ::977] = 1.2
+
+    cases = [
+        ("legacy chain (pcm16)", legacy_pcm16),
+        ("finalize clip (pcm16)", lambda w: finalize_audio(w, mode="clip")),
+        ("finalize normalize (pcm16)", lambda w: finalize_audio(w, mode="normalize")),
+        ("finalize normalize+dither (pcm16)", lambda w: finalize_audio(w, mode="normalize", dither=True)),
+        ("finalize clip (mulaw)", lambda w: finalize_audio(w, encoding="mulaw")),
+    ]
+
+    print("=" * 80)
+    print(f"PCM finalization: {args.seconds:.0f}s @ {SAMPLE_RATE} Hz "
+          f"({source.nbytes / 1024 / 1024:.1f} MB float32), median of {args.repeat}")
+    print("=" * 80)
+    print(f"{'case':<36} {'time':>10} {'peak alloc':>12}")
+
+    for name, fn in cases:
+        ms, peak_mb = measure(fn, source.copy, args.repeat)
+        print(f"{name:<36} {ms:>8.2f}ms {peak_mb:>10.2f}MB")
+
+    print("=" * 80)
+    print(f"Output size: pcm16 {num_samples * 2 / 1024 / 1024:.2f} MB, mulaw {num_samples / 1024 / 1024:.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
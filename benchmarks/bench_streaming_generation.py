@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Streaming Generation Benchmark
+==============================
+Time to first audio for whole-sentence synthesis vs token-window streaming
+(scripts/streaming_generation.py), per sentence length.
+
+Whole-sentence first audio = the full generate() call. Streaming first audio
+= the first block from engine.stream(). Total = time to the last sample.
+
+Usage:
+    python benchmarks/bench_streaming_generation.py                       # Chatterbox on the best device
+    python benchmarks/bench_streaming_generation.py --first-tokens 6 --tokens 20
+    TTS_FAKE_RTF=0.3 python benchmarks/bench_streaming_generation.py --engine fake
+"""
+
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from streaming_generation import StreamWindows  # noqa: E402
+from tts_engines import load_engine  # noqa: E402
+
+SENTENCES = [
+    "Hello, how can I help?",
+    "Your appointment is confirmed for Tuesday at three in the afternoon.",
+    "Thanks for calling. I have pulled up your account and can see the two payments you made last month.",
+]
+
+
+def best_device() -> str:
+    try:
+        import torch
+    except ImportError:
+        return "cpu"
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
+
+
+def measure(engine, text: str, windows: StreamWindows, rounds: int):
+    """Median (whole first audio, stream first audio, stream total) in ms"""
+    whole, first, total = [], [], []
+    for round_ in range(rounds):
+        started = time.perf_counter()
+        engine.generate(text, seed=round_ + 1)
+        whole.append((time.perf_counter() - started) * 1000)
+
+        started, first_at = time.perf_counter(), None
+        for _ in engine.stream(text, seed=round_ + 1, windows=windows):
+            first_at = first_at or time.perf_counter()
+        first.append((first_at - started) * 1000)
+        total.append((time.perf_counter() - started) * 1000)
+    return statistics.median(whole), statistics.median(first), statistics.median(total)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark time to first audio with token-window streaming")
+    parser.add_argument("--engine", default=None, help="chatterbox or fake (default: TTS_ENGINE, then chatterbox)")
+    parser.add_argument("--device", default=None, help="cuda, mps or cpu (default: best available)")
+    parser.add_argument("--rounds", type=int, default=3, help="Runs per sentence (median reported)")
+    parser.add_argument("--first-tokens", type=int, default=StreamWindows.first_tokens)
+    parser.add_argument("--tokens", type=int, default=StreamWindows.tokens)
+    parser.add_argument("--context-tokens", type=int, default=StreamWindows.context_tokens)
+    args = parser.parse_args()
+
+    windows = StreamWindows(first_tokens=args.first_tokens, tokens=args.tokens, context_tokens=args.context_tokens)
+    device = args.device or best_device()
+    engine = load_engine(args.engine, device)
+
+    print("=" * 80)
+    print(f"Streaming generation: {engine.name} on {device}, windows {windows}")
+    print("=" * 80)
+    if not engine.capabilities.streaming:
+        print(f"⚠ {engine.name} does not stream; both columns measure whole clips")
+
+    engine.generate(SENTENCES[0])  # Warm-up
+    print(f"{'sentence':<40} {'whole first ms':>15} {'stream first ms':>16} {'stream total ms':>16}")
+    for text in SENTENCES:
+        whole, first, total = measure(engine, text, windows, args.rounds)
+        print(f"{text[:38]:<40} {whole:>15.0f} {first:>16.0f} {total:>16.0f}")
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Telephony Output Benchmark
+==========================
+Compares native 8 kHz G.711 output (scripts/telephony_audio.py) with the
+current route: 24 kHz MP3 export via pydub/ffmpeg, then a downstream
+transcode to 8 kHz μ-law.
+
+Reports encode time and payload size per second of audio.
+
+Usage:
+    python benchmarks/bench_telephony_encoding.py
+    python benchmarks/bench_telephony_encoding.py --seconds 5 30 --repeat 5
+"""
+
+import io
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from audio_encoding import encode_pcm16  # noqa: E402
+from telephony_audio import encode_telephony, TelephonyEncoder, iter_frames  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+
+def mp3_export(wav: np.ndarray) -> bytes:
+    """Current /api/tts MP3 route"""
+    from pydub import AudioSegment
+
+    segment = AudioSegment(encode_pcm16(wav.copy()).tobytes(), frame_rate=SAMPLE_RATE, sample_width=2, channels=1)
+    buffer = io.BytesIO()
+    segment.export(buffer, format="mp3", bitrate="128k")
+    return buffer.getvalue()
+
+
+def mp3_then_transcode(wav: np.ndarray) -> bytes:
+    """MP3 export followed by the downstream decode → 8 kHz → μ-law step"""
+    from pydub import AudioSegment
+
+    segment = AudioSegment.from_file(io.BytesIO(mp3_export(wav)), format="mp3")
+    segment = segment.set_frame_rate(8000).set_sample_width(2)
+    samples = np.array(segment.get_array_of_samples(), dtype=np.float32) / 32768.0
+    return encode_telephony(samples, "mulaw", input_rate=8000).tobytes()
+
+
+def native_streaming(wav: np.ndarray) -> bytes:
+    """Native path fed in 1-second blocks, as chunks would arrive"""
+    encoder = TelephonyEncoder("mulaw", input_rate=SAMPLE_RATE)
+    frames = []
+    for start in range(0, len(wav), SAMPLE_RATE):
+        frames.extend(iter_frames(encoder.encode(wav[start:start + SAMPLE_RATE])))
+    frames.extend(iter_frames(encoder.flush()))
+    return b"".join(frames)
+
+
+def time_it(fn, wav: np.ndarray, repeat: int):
+    """Return (median ms, output bytes)"""
+    output = fn(wav.copy())
+    timings = []
+    for _ in range(repeat):
+        data = wav.copy()
+        start = time.perf_counter()
+        fn(data)
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings)), len(output)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark telephony output paths")
+    parser.add_argument("--seconds", type=float, nargs="+", default=[5, 30])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [
+        ("native mulaw (one shot)", lambda w: encode_telephony(w, "mulaw")),
+        ("native alaw (one shot)", lambda w: encode_telephony(w, "alaw")),
+        ("native mulaw (1s blocks, 20ms frames)", native_streaming),
+        ("mp3 export (current)", mp3_export),
+        ("mp3 export + transcode to mulaw", mp3_then_transcode),
+    ]
+
+    print("=" * 80)
+    print(f"Telephony output benchmark (median of {args.repeat})")
+    print("=" * 80)
+
+    rng = np.random.default_rng(0)
+    for seconds in args.seconds:
+        t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+        wav = (0.3 * np.sin(2 * np.pi * 220 * t) + 0.05 * rng.standard_normal(len(t))).astype(np.float32)
+
+        print(f"\n{seconds:.0f}s of audio")
+        print(f"  {'path':<40} {'time':>10} {'bytes/s':>10}")
+        for name, fn in cases:
+            try:
+                ms, size = time_it(fn, wav, args.repeat)
+                print(f"  {name:<40} {ms:>8.2f}ms {size / seconds:>10.0f}")
+            except Exception as e:
+                print(f"  {name:<40} {'skipped':>10} ({type(e).__name__}: {e})")
+
+    print("\n" + "=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Template-Slot Synthesis Benchmark
+=================================
+Model time per call for typical reminder templates: full-text synthesis
+versus template rendering with cached fixed segments
+(scripts/template_synthesis.py).
+
+By default the engine is a stub whose cost is proportional to text length
+(`--ms-per-char`, roughly Chatterbox on CPU); `--chatterbox` loads the
+real model instead.
+
+Usage:
+    python benchmarks/bench_template_synthesis.py
+    python benchmarks/bench_template_synthesis.py --chatterbox --device cuda --calls 5
+"""
+
+import sys
+import time
+import asyncio
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from template_synthesis import TemplateSynthesizer, SegmentCache  # noqa: E402
+
+PARAMS = {"temperature": 0.6, "exaggeration": 0.85, "cfg_weight": 0.75}
+
+TEMPLATES = [
+    (
+        "Good afternoon! This is a friendly reminder from CallWaiting Services. "
+        "You have an appointment scheduled for {day} at {time}. "
+        "Please ensure you arrive fifteen minutes early and bring your I D and insurance card.",
+        {"day": ["tomorrow", "Monday", "Friday"], "time": ["three P M", "nine thirty A M", "noon"]}
+    ),
+    (
+        "Good afternoon. This message confirms that your payment of {amount} has been successfully processed. "
+        "A receipt has been sent to your email address on file.",
+        {"amount": ["two hundred and fifty dollars", "forty dollars", "one thousand dollars"]}
+    ),
+]
+
+
+class StubEngine:
+    """Sleeps ms_per_char per character and returns 60 ms of tone per character"""
+
+    def __init__(self, ms_per_char: float):
+        self.ms_per_char = ms_per_char
+
+    def generate(self, text, **params):
+        time.sleep(len(text) * self.ms_per_char / 1000)
+        t = np.arange(int(24000 * 0.06 * len(text))) / 24000
+        return (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def fill(slots: dict, call: int) -> dict:
+    return {name: options[call % len(options)] for name, options in slots.items()}
+
+
+async def run(engine, calls: int):
+    synthesizer = TemplateSynthesizer(engine, cache=SegmentCache())
+
+    print(f"{'template':>9} {'path':>9} {'model/call':>11} {'cached':>7} {'speedup':>8}")
+    for index, (template, slots) in enumerate(TEMPLATES, 1):
+        full_ms = []
+        for call in range(calls):
+            start = time.perf_counter()
+            await asyncio.to_thread(engine.generate, text=template.format(**fill(slots, call)), **PARAMS)
+            full_ms.append((time.perf_counter() - start) * 1000)
+
+        await synthesizer.prerender(template, "bench", PARAMS)
+        template_ms, ratios = [], []
+        for call in range(calls):
+            _, stats = await synthesizer.render(template, fill(slots, call), "bench", PARAMS)
+            template_ms.append(stats["model_seconds"] * 1000)
+            ratios.append(stats["cached_ratio"])
+
+        full, templated = float(np.median(full_ms)), float(np.median(template_ms))
+        print(f"{index:>9} {'full':>9} {full:>9.0f}ms {'-':>7} {'-':>8}")
+        print(f"{index:>9} {'template':>9} {templated:>9.0f}ms {np.mean(ratios):>6.0%} {full / templated:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark template-slot synthesis")
+    parser.add_argument("--calls", type=int, default=9)
+    parser.add_argument("--ms-per-char", type=float, default=2.0, help="Stub engine cost")
+    parser.add_argument("--chatterbox", action="store_true", help="Use the real Chatterbox model")
+    parser.add_argument("--device", default="cpu")
+    args = parser.parse_args()
+
+    if args.chatterbox:
+        from chatterbox.tts import ChatterboxTTS
+        engine = ChatterboxTTS.from_pretrained(device=args.device)
+    else:
+        engine = StubEngine(args.ms_per_char)
+
+    print("=" * 80)
+    print(f"Template synthesis: {'Chatterbox on ' + args.device if args.chatterbox else 'stub engine'}, "
+          f"median of {args.calls} calls")
+    print("=" * 80)
+    asyncio.run(run(engine, args.calls))
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Time-Stretch Benchmark
+======================
+Compares the streaming WSOLA stretcher (scripts/time_stretch.py) with
+`librosa.effects.time_stretch` (STFT phase vocoder) at the speeds the API
+uses (e.g. Maya's default 0.88 → rate 1/0.88).
+
+Reports wall time, × real time and a quality proxy: median local SNR of a
+stretched 220 Hz tone against a best-fit sinusoid over 50 ms windows
+(pitch errors and frame-boundary artifacts both lower it).
+
+Usage:
+    python benchmarks/bench_time_stretch.py
+    python benchmarks/bench_time_stretch.py --seconds 30 --speeds 0.8 0.88 1.1 1.25
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from time_stretch import time_stretch, WSOLAStretcher  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+
+def speech_like(seconds: float) -> np.ndarray:
+    """Harmonic signal with gliding pitch and syllable-rate envelope"""
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    f0 = 140 + 30 * np.sin(2 * np.pi * 0.7 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / SAMPLE_RATE
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)
+    wav = sum(np.sin(k * phase) / k for k in range(1, 10)) * 0.2 * envelope
+    return wav.astype(np.float32)
+
+
+def local_snr(wav: np.ndarray, freq: float, window: int = 1200) -> float:
+    """Median SNR (dB) of windows against their best-fit sinusoid at freq"""
+    wav = wav[window:-window]
+    t = np.arange(window) / SAMPLE_RATE
+    basis = np.stack([np.sin(2 * np.pi * freq * t), np.cos(2 * np.pi * freq * t)], axis=1)
+    ratios = []
+    for start in range(0, len(wav) - window, window):
+        segment = wav[start:start + window]
+        coeffs, *_ = np.linalg.lstsq(basis, segment, rcond=None)
+        fit = basis @ coeffs
+        ratios.append(fit.var() / max((segment - fit).var(), 1e-20))
+    return float(10 * np.log10(np.median(ratios)))
+
+
+def median_ms(fn, repeat: int) -> float:
+    fn()  # warm up
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return float(np.median(samples))
+
+
+def streaming(wav: np.ndarray, rate: float, block: int = 4800) -> np.ndarray:
+    stretcher = WSOLAStretcher(rate, SAMPLE_RATE)
+    parts = [stretcher.process(wav[i:i + block]) for i in range(0, len(wav), block)]
+    parts.append(stretcher.flush())
+    return np.concatenate(parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark time-stretch implementations")
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--speeds", type=float, nargs="+", default=[0.85, 0.88, 0.92, 1.1])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    try:
+        import librosa
+    except ImportError:
+        librosa = None
+        print("⚠ librosa not installed - only WSOLA is timed")
+
+    wav = speech_like(args.seconds)
+    tone = (0.3 * np.sin(2 * np.pi * 220 * np.arange(len(wav)) / SAMPLE_RATE)).astype(np.float32)
+
+    print("=" * 80)
+    print(f"Time stretch benchmark ({args.seconds:.0f}s at {SAMPLE_RATE} Hz, median of {args.repeat})")
+    print("=" * 80)
+    print(f"{'speed':>6} {'rate':>6} {'method':>16} {'time':>10} {'x realtime':>11} {'tone SNR':>9}")
+
+    for speed in args.speeds:
+        rate = 1.0 / speed  # API semantics: rate = 1 / speed_factor
+        methods = [
+            ("WSOLA", lambda w: time_stretch(w, rate)),
+            ("WSOLA streaming", lambda w: streaming(w, rate)),
+        ]
+        if librosa is not None:
+            methods.append(("librosa", lambda w: librosa.effects.time_stretch(w, rate=rate)))
+
+        for name, fn in methods:
+            elapsed = median_ms(lambda: fn(wav.copy()), args.repeat)
+            snr = local_snr(fn(tone.copy()), 220.0)
+            print(
+                f"{speed:>6.2f} {rate:>6.3f} {name:>16} {elapsed:>8.1f}ms "
+                f"{args.seconds * 1000 / elapsed:>10.0f}x {snr:>7.1f}dB"
+            )
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
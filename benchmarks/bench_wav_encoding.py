@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+WAV Encoding Benchmark
+======================
+Compares the in-memory encoder (scripts/audio_encoding.py) against the old
+temp-file path used by generate_tts_production:
+sf.write → stat → read back → unlink.
+
+Usage:
+    python benchmarks/bench_wav_encoding.py
+    python benchmarks/bench_wav_encoding.py --seconds 5 30 120 --repeat 20
+"""
+
+import io
+import sys
+import time
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from audio_encoding import encode_wav  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+
+def tempfile_wav(wav: np.ndarray) -> bytes:
+    """The previous generate_tts_production WAV path"""
+    import soundfile as sf
+
+    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
+        tmp_path = tmp.name
+    try:
+        sf.write(tmp_path, wav, samplerate=SAMPLE_RATE, subtype="PCM_16")
+        if Path(tmp_path).stat().st_size == 0:
+            raise ValueError("empty")
+        with open(tmp_path, "rb") as f:
+            buffer = io.BytesIO(f.read())
+        return buffer.getvalue()
+    finally:
+        Path(tmp_path).unlink(missing_ok=True)
+
+
+def bytesio_wav(wav: np.ndarray) -> bytes:
+    """soundfile into BytesIO (the api_v1 path)"""
+    import soundfile as sf
+
+    buffer = io.BytesIO()
+    sf.write(buffer, wav, SAMPLE_RATE, format="WAV", subtype="PCM_16")
+    return buffer.getvalue()
+
+
+def time_it(fn, wav: np.ndarray, repeat: int) -> float:
+    """Median wall time in milliseconds"""
+    fn(wav)  # warm up
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(wav)
+        samples.append((time.perf_counter() - start) * 1000)
+    return float(np.median(samples))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark WAV encoding paths")
+    parser.add_argument("--seconds", type=float, nargs="+", default=[2, 10, 60])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    try:
+        import soundfile  # noqa: F401
+        have_soundfile = True
+    except ImportError:
+        have_soundfile = False
+        print("⚠ soundfile not installed - only the in-memory encoder is timed")
+
+    print("=" * 80)
+    print(f"WAV encoding benchmark ({SAMPLE_RATE} Hz mono, median of {args.repeat})")
+    print("=" * 80)
+    print(f"{'audio':>8} {'in-memory':>12} {'BytesIO+sf':>12} {'tempfile+sf':>12} {'speedup':>9}")
+
+    rng = np.random.default_rng(0)
+    for seconds in args.seconds:
+        wav = (rng.standard_normal(int(seconds * SAMPLE_RATE)) * 0.1).astype(np.float32)
+
+        in_memory = time_it(encode_wav, wav, args.repeat)
+        if have_soundfile:
+            via_bytesio = time_it(bytesio_wav, wav, args.repeat)
+            via_tempfile = time_it(tempfile_wav, wav, args.repeat)
+            print(
+                f"{seconds:>7.0f}s {in_memory:>10.2f}ms {via_bytesio:>10.2f}ms "
+                f"{via_tempfile:>10.2f}ms {via_tempfile / in_memory:>8.1f}x"
+            )
+        else:
+            print(f"{seconds:>7.0f}s {in_memory:>10.2f}ms {'-':>12} {'-':>12} {'-':>9}")
+
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Weight Cache Benchmark
+======================
+Cold vs warm model-weight loading (scripts/weight_cache.py).
+
+Synthetic mode (default) writes a state dict of `--mb` megabytes and times:
+- npz: read + deserialize into private memory (like torch.load)
+- cache cold: page cache evicted, map + touch every page
+- cache warm: pages already cached, map + touch
+- cache open: map only (lazy; what startup pays before first use)
+then loads the cache from `--workers` processes at once and reports each
+one's RSS vs PSS (proportional set size): PSS ~ RSS / workers means the
+weight pages are shared.
+
+`--chatterbox` times ChatterboxTTS.from_pretrained against load_chatterbox
+(first run fills the cache, later runs hit it).
+
+Page-cache eviction uses posix_fadvise(DONTNEED); on filesystems that ignore
+it "cold" numbers are warm.
+
+Usage:
+    python benchmarks/bench_weight_cache.py
+    python benchmarks/bench_weight_cache.py --mb 2000 --workers 4
+    python benchmarks/bench_weight_cache.py --chatterbox --device cuda
+"""
+
+import os
+import sys
+import time
+import tempfile
+import argparse
+from pathlib import Path
+import multiprocessing
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from weight_cache import WeightCache  # noqa: E402
+
+REPO = "bench/synthetic"
+REVISION = "r1"
+
+
+def evict(paths):
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except (AttributeError, OSError):
+            pass
+        finally:
+            os.close(fd)
+
+
+def touch(components) -> float:
+    # One read per 4 KiB page forces every page in without copying the data
+    return float(sum(
+        np.asarray(array).reshape(-1).view(np.uint8)[::4096].sum(dtype=np.uint64)
+        for tensors in components.values() for array in tensors.values()
+    ))
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def memory_kb(field: str) -> int:
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith(field + ":"):
+                return int(line.split()[1])
+    return 0
+
+
+def worker(root: str, barrier, results):
+    components = WeightCache(root).load(REPO, REVISION)
+    touch(components)
+    barrier.wait()  # Every worker has the weights mapped
+    results.put((memory_kb("Rss") / 1024, memory_kb("Pss") / 1024))
+    barrier.wait()  # Nobody unmaps before all have measured
+
+
+def synthetic(args):
+    rng = np.random.default_rng(0)
+    tensor_mb = 16
+    state = {f"layer{i}.weight": rng.standard_normal(tensor_mb * 262144).astype(np.float32)
+             for i in range(max(1, args.mb // tensor_mb))}
+
+    with tempfile.TemporaryDirectory(dir=args.dir) as root:
+        cache = WeightCache(root)
+        cache.store(REPO, REVISION, {"model": state})
+        npz = Path(root) / "weights.npz"
+        np.savez(npz, **state)
+        cache_files = [str(cache.file(REPO, REVISION, "model.bin"))]
+
+        print(f"{'path':<14} {'ms':>10}")
+        evict([str(npz)])
+        print(f"{'npz cold':<14} {timed(lambda: dict(np.load(npz))):>10.0f}")
+        evict(cache_files)
+        print(f"{'cache cold':<14} {timed(lambda: touch(cache.load(REPO, REVISION))):>10.0f}")
+        print(f"{'cache warm':<14} {timed(lambda: touch(cache.load(REPO, REVISION))):>10.0f}")
+        print(f"{'cache open':<14} {timed(lambda: cache.load(REPO, REVISION)):>10.1f}")
+        print()
+
+        # Fresh interpreters, so only the mapped weights can be shared
+        context = multiprocessing.get_context("spawn")
+        barrier, results = context.Barrier(args.workers), context.Queue()
+        workers = [context.Process(target=worker, args=(root, barrier, results)) for _ in range(args.workers)]
+        for process in workers:
+            process.start()
+        measurements = [results.get() for _ in workers]
+        for process in workers:
+            process.join()
+
+        print(f"{'worker':<8} {'RSS MB':>10} {'PSS MB':>10}")
+        for i, (rss, pss) in enumerate(measurements):
+            print(f"{i:<8} {rss:>10.0f} {pss:>10.0f}")
+
+
+def chatterbox(args):
+    from chatterbox.tts import ChatterboxTTS
+    from weight_cache import load_chatterbox
+
+    cache = WeightCache(args.dir or "model_cache/weights")
+    print(f"{'path':<28} {'s':>8}")
+    start = time.perf_counter()
+    ChatterboxTTS.from_pretrained(device=args.device)
+    print(f"{'from_pretrained':<28} {time.perf_counter() - start:>8.1f}")
+    for run in ("cache (fill or hit)", "cache (hit)"):
+        start = time.perf_counter()
+        load_chatterbox(cache, device=args.device)
+        print(f"{run:<28} {time.perf_counter() - start:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the memory-mapped weight cache")
+    parser.add_argument("--mb", type=int, default=512, help="Synthetic state dict size")
+    parser.add_argument("--workers", type=int, default=2, help="Processes sharing the mapped weights")
+    parser.add_argument("--dir", default=None, help="Cache directory (default: a temp dir)")
+    parser.add_argument("--chatterbox", action="store_true", help="Benchmark real Chatterbox loading")
+    parser.add_argument("--device", default="cpu")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print(f"Weight cache: {'Chatterbox on ' + args.device if args.chatterbox else f'{args.mb} MB synthetic'}")
+    print("=" * 80)
+    chatterbox(args) if args.chatterbox else synthetic(args)
+    print("=" * 80)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Admission Controller
+====================
+Admits synthesis calls to the model and picks the guidance mode for
+requests that leave it to the server ("auto", see guidance.py).
+
+Model calls go through `slot()`, at most `max_concurrent` at a time
+(Chatterbox keeps per-call state on the model, and one GPU runs one
+generate at a time anyway). The time each interactive call waits for a
+slot feeds an EWMA, and each call's duration feeds a service-time EWMA.
+
+Auto mode switches to guidance-free decoding (about 2x decoder throughput)
+while the queue is overloaded: the wait EWMA, or the wait predicted for a
+new arrival (calls queued ahead x service time / max_concurrent), exceeds
+`wait_threshold_ms`. It switches back once both drop below
+`recover_ratio` x the threshold, so the mode does not flap at the boundary.
+
+Usage:
+    admission = get_admission_controller(config)
+    mode, reason = admission.choose(payload.guidance, profile_mode(params))
+    async with admission.slot():
+        wav = await asyncio.to_thread(tts_model.generate, ...)
+"""
+
+import time
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional, Tuple
+
+from guidance import CFG, NONE, AUTO
+from monitoring import record_admission
+
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """Bounds concurrent model calls and trades CFG for throughput under load"""
+
+    def __init__(
+        self,
+        max_concurrent: int = 1,
+        wait_threshold_ms: float = 1500.0,
+        recover_ratio: float = 0.5,
+        alpha: float = 0.2,
+        auto_guidance: bool = True
+    ):
+        self.max_concurrent = max(1, max_concurrent)
+        self.wait_threshold = wait_threshold_ms / 1000
+        self.recover_ratio = recover_ratio
+        self.alpha = alpha
+        self.auto_guidance = auto_guidance
+        self._slots: Optional[asyncio.Semaphore] = None
+
+        self.wait_ewma = 0.0
+        self.service_ewma = 0.0
+        self.waiting = 0
+        self.active = 0
+        self.overloaded = False
+
+        # Stats
+        self.admitted = 0
+        self.modes: Dict[str, int] = {CFG: 0, NONE: 0}
+        self.overload_episodes = 0
+
+    def _ewma(self, current: float, sample: float) -> float:
+        return sample if current == 0 else (1 - self.alpha) * current + self.alpha * sample
+
+    @property
+    def predicted_wait(self) -> float:
+        """Seconds a call arriving now would wait for a slot"""
+        if self.active < self.max_concurrent:
+            return 0.0
+        # Everyone queued ahead, plus on average half of a running call
+        return (self.waiting + 0.5) * self.service_ewma / self.max_concurrent
+
+    @property
+    def predicted_latency(self) -> float:
+        """Seconds until a call arriving now would finish (wait + one service time)"""
+        return self.predicted_wait + self.service_ewma
+
+    def _update_overload(self):
+        pressure = max(self.wait_ewma, self.predicted_wait)
+        if not self.overloaded and pressure > self.wait_threshold:
+            self.overloaded = True
+            self.overload_episodes += 1
+            logger.warning(f"⚠ Synthesis queue overloaded ({pressure * 1000:.0f}ms wait): auto guidance -> none")
+        elif self.overloaded and pressure < self.wait_threshold * self.recover_ratio:
+            self.overloaded = False
+            logger.info(f"✓ Synthesis queue recovered ({pressure * 1000:.0f}ms wait): auto guidance -> cfg")
+        record_admission(self.wait_ewma, self.overloaded)
+
+    def choose(self, requested: Optional[str] = None, profile: str = AUTO) -> Tuple[str, str]:
+        """
+        Resolve the guidance mode for one request.
+
+        Returns:
+            (mode, reason): mode "cfg" or "none"; reason "request", "voice",
+            "load" (auto under overload) or "default"
+        """
+        if requested in (CFG, NONE):
+            mode, reason = requested, "request"
+        elif requested != AUTO and profile in (CFG, NONE):
+            mode, reason = profile, "voice"
+        else:
+            self._update_overload()
+            if self.auto_guidance and self.overloaded:
+                mode, reason = NONE, "load"
+            else:
+                mode, reason = CFG, "default"
+        self.modes[mode] += 1
+        return mode, reason
+
+    @asynccontextmanager
+    async def slot(self, record_wait: bool = True):
+        """Hold one model slot; `record_wait=False` for bulk work, whose waits are by design"""
+        if self._slots is None:
+            # Created lazily so the controller can be built outside an event loop
+            self._slots = asyncio.Semaphore(self.max_concurrent)
+
+        self.waiting += 1
+        queued_at = time.perf_counter()
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+        if record_wait:
+            self.wait_ewma = self._ewma(self.wait_ewma, time.perf_counter() - queued_at)
+            self._update_overload()
+
+        self.active += 1
+        self.admitted += 1
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.active -= 1
+            self.service_ewma = self._ewma(self.service_ewma, time.perf_counter() - started_at)
+            self._slots.release()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "active": self.active,
+            "waiting": self.waiting,
+            "wait_ewma_ms": round(self.wait_ewma * 1000, 1),
+            "predicted_wait_ms": round(self.predicted_wait * 1000, 1),
+            "predicted_latency_ms": round(self.predicted_latency * 1000, 1),
+            "service_ewma_ms": round(self.service_ewma * 1000, 1),
+            "wait_threshold_ms": self.wait_threshold * 1000,
+            "overloaded": self.overloaded,
+            "overload_episodes": self.overload_episodes,
+            "admitted": self.admitted,
+            "modes": dict(self.modes)
+        }
+
+
+# Global controller instance
+_admission_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller(config: Optional[Dict[str, Any]] = None) -> AdmissionController:
+    """Get or create the global admission controller from the `admission` config section"""
+    global _admission_controller
+    if _admission_controller is None:
+        settings = (config or {}).get("admission", {})
+        _admission_controller = AdmissionController(
+            max_concurrent=settings.get("max_concurrent", 1),
+            wait_threshold_ms=settings.get("wait_threshold_ms", 1500),
+            recover_ratio=settings.get("recover_ratio", 0.5),
+            auto_guidance=settings.get("auto_guidance", True)
+        )
+        logger.info(f"Admission controller initialized ({_admission_controller.max_concurrent} concurrent)")
+    return _admission_controller
@@ -10,18 +10,33 @@ Features:
 """
 
 import time
+import asyncio
 import logging
 import uuid
-from typing import Optional
+from typing import AsyncIterator, Dict, Optional
 from fastapi import APIRouter, HTTPException, Request, Response, Header
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-import soundfile as sf
-import io
 
+from audio_encoding import encode_wav, encode_pcm16, as_mono_float32
+from telephony_audio import encode_telephony, iter_frames, MEDIA_TYPES
+from streaming_encoders import (
+    create_streaming_encoder, resolve_bitrate, encode_mp3_pydub,
+    MP3_STREAMING, OPUS_AVAILABLE, MEDIA_TYPES as COMPRESSED_MEDIA_TYPES
+)
 from voice_manager import get_voice_manager
 from voice_queue import get_voice_queue
 from text_filters import preprocess_for_tts
+from time_stretch import time_stretch
+from silence_trim import SilenceTrimmer
+from template_synthesis import TemplateSynthesizer, get_segment_cache
+from single_flight import get_single_flight, request_key
+from guidance import validate_mode, profile_mode, apply_mode
+from admission import get_admission_controller
+from synthesis_lanes import get_lane_scheduler, INTERACTIVE
+from engine_fallback import FallbackDecision, get_fallback_router
+from model_manager import serving_engine, language_code
+from monitoring import record_silence_trimmed, record_single_flight, record_guidance, record_fallback
 
 logger = logging.getLogger(__name__)
 
@@ -30,12 +45,15 @@ router = APIRouter(prefix="/api", tags=["Production TTS"])
 class TTSRequestProduction(BaseModel):
     text: str
     voice: Optional[str] = None  # Voice slug, e.g., "maya-professional"
-    format: str = "wav"  # wav|mp3|pcm16
+    format: str = "wav"  # wav|mp3|opus|opus_packets|pcm16|mulaw|alaw (mulaw/alaw are 8 kHz telephony)
+    bitrate: Optional[int] = None  # kbps for mp3/opus (defaults: mp3 128, opus 32)
     session_id: Optional[str] = None  # Session ID for voice isolation
     temperature: Optional[float] = None
     exaggeration: Optional[float] = None
     cfg_weight: Optional[float] = None
     speed_factor: Optional[float] = None
+    guidance: Optional[str] = None  # cfg|none|auto (default: the voice's, else auto)
+    latency_budget_ms: Optional[int] = None  # Beyond the predicted queue latency, a mapped fallback voice answers
     auto_detect_emotion: Optional[bool] = True  # Auto-detect emotion from text
     style: Optional[str] = None  # Override style (calm, urgent, apologetic, etc.)
 
@@ -71,7 +89,6 @@ async def generate_tts_production(request: Request, payload: TTSRequestProductio
     - Prevents audio overlap in phone calls / multi-user scenarios
     """
     request_id = str(uuid.uuid4())
-    start_time = time.time()
 
     # Validate input
     if not payload.text or len(payload.text.strip()) == 0:
@@ -80,6 +97,8 @@ async def generate_tts_production(request: Request, payload: TTSRequestProductio
     if len(payload.text) > 2000:
         raise HTTPException(status_code=400, detail="Text too long (max 2000 characters)")
 
+    validate_output_format(payload.format, payload.bitrate)
+
     # Get TTS model from app state
     if not hasattr(request.app.state, 'tts_model') or request.app.state.tts_model is None:
         raise HTTPException(status_code=503, detail="TTS model not loaded")
@@ -128,6 +147,25 @@ async def generate_tts_production(request: Request, payload: TTSRequestProductio
     elif 'speed_factor' in style_params:
         voice_params['speed_factor'] = style_params['speed_factor']
 
+    try:
+        requested_guidance = validate_mode(payload.guidance)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # Engine fallback: a mapped fast voice when the queue can't meet the latency budget
+    config = getattr(request.app.state, "config", {})
+    admission = get_admission_controller(config)
+    fallback = get_fallback_router(config).decide(voice_slug, payload.latency_budget_ms, admission)
+    engine_headers = fallback.headers()
+    if fallback.degraded:
+        record_fallback("api", fallback.engine.name, voice_slug)
+    else:
+        # Guidance mode: request, then voice profile, then the admission controller
+        guidance, guidance_reason = admission.choose(requested_guidance, profile_mode(voice_params))
+        voice_params = apply_mode(voice_params, guidance)
+        record_guidance("api", guidance, guidance_reason)
+        engine_headers["X-Guidance-Mode"] = guidance
+
     logger.info(
         f"[{request_id}] Generating TTS: "
         f"voice={voice_slug}, "
@@ -136,219 +174,377 @@ async def generate_tts_production(request: Request, payload: TTSRequestProductio
         f"text_len={len(processed_text)}"
     )
 
+    # Step 3: Synthesize once per distinct request - identical concurrent
+    # requests (e.g. a campaign burst) join the render already in flight
+    flights = get_single_flight("api")
+    key = request_key(
+        text=processed_text,
+        voice=voice_slug,
+        format=payload.format,
+        bitrate=payload.bitrate,
+        params={name: voice_params.get(name) for name in ("temperature", "exaggeration", "cfg_weight", "speed_factor")},
+        fallback_voice=fallback.voice
+    )
+    stream, joined = flights.subscribe(
+        key,
+        lambda: render_production(
+            request, request_id, tts_model, processed_text, voice_slug, voice_params, payload, fallback
+        )
+    )
+    record_single_flight("api", joined, flights.dedup_ratio)
+    if joined:
+        logger.info(f"[{request_id}] Joined in-flight synthesis for identical request")
+
     try:
-        # Step 3: Acquire voice lock (prevents overlap)
-        # This is the KEY to preventing voice conflicts!
-        async with voice_queue.acquire_voice(
-            request_id=request_id,
-            voice_id=voice_slug,
-            session_id=payload.session_id,
-            timeout=30.0  # Max 30s wait time
-        ):
-            logger.info(f"[{request_id}] Voice lock acquired, synthesizing...")
-
-            # Generate audio using Chatterbox TTS
-            import numpy as np
-            import torch
-
-            wav = tts_model.generate(
-                text=processed_text,  # Use preprocessed text!
-                exaggeration=voice_params['exaggeration'],
-                temperature=voice_params['temperature'],
-                cfg_weight=voice_params['cfg_weight']
-            )
-        
-            # Convert torch tensor to numpy if needed
-            if isinstance(wav, torch.Tensor):
-                wav = wav.cpu().numpy()
-
-            # Ensure it's a 1D float32 array
-            wav = np.array(wav, dtype=np.float32)
-            if len(wav.shape) > 1:
-                wav = wav.flatten()
-
-            # Apply speed factor if needed
-            if voice_params['speed_factor'] != 1.0:
-                import librosa
-                wav = librosa.effects.time_stretch(wav, rate=1.0 / voice_params['speed_factor'])
-
-            logger.info(
-                f"[{request_id}] Audio generated: "
-                f"{len(wav)} samples, "
-                f"duration={(len(wav) / 24000):.2f}s"
-            )
-        # Voice lock automatically released here
-
-        # Convert to requested format
-        if payload.format == "wav":
-            # Create WAV file - ROBUST APPROACH
-            import numpy as np
-            import tempfile
-            from pathlib import Path
-
-            # Ensure wav is proper numpy array with correct dtype
-            if not isinstance(wav, np.ndarray):
-                logger.info(f"[{request_id}] Converting wav from {type(wav)} to numpy array")
-                wav = np.array(wav, dtype=np.float32)
-            else:
-                # Ensure float32 dtype for soundfile compatibility
-                if wav.dtype != np.float32:
-                    logger.info(f"[{request_id}] Converting wav dtype from {wav.dtype} to float32")
-                    wav = wav.astype(np.float32)
-
-            # Flatten if multi-dimensional
-            if len(wav.shape) > 1:
-                logger.info(f"[{request_id}] Flattening wav from shape {wav.shape}")
-                wav = wav.flatten()
-
-            # Validate audio data
-            if len(wav) == 0:
-                raise ValueError("Generated audio is empty")
-
-            # Normalize if values are out of range
-            max_val = np.abs(wav).max()
-            if max_val > 1.0:
-                logger.warning(f"[{request_id}] Audio values out of range (max={max_val}), normalizing")
-                wav = wav / max_val
-
-            logger.info(f"[{request_id}] Prepared WAV: shape={wav.shape}, dtype={wav.dtype}, range=[{wav.min():.3f}, {wav.max():.3f}]")
-
-            # Write to temp file with explicit parameters
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-                tmp_path = tmp.name
+        # First item is the response metadata; synthesis errors surface here
+        meta = await stream.__anext__()
 
-            try:
-                # Write with explicit format specification
-                sf.write(
-                    tmp_path,
-                    wav,
-                    samplerate=24000,
-                    subtype='PCM_16'  # Explicit 16-bit PCM encoding
-                )
-                logger.info(f"[{request_id}] ✓ Wrote WAV to {tmp_path} ({len(wav)} samples)")
+    except TimeoutError as e:
+        logger.error(f"[{request_id}] Voice queue timeout: {e}")
+        raise HTTPException(
+            status_code=429,  # Too Many Requests
+            detail=f"Voice busy: {str(e)}. Try again or use a different voice."
+        )
 
-                # Verify the file was created and has content
-                tmp_size = Path(tmp_path).stat().st_size
-                if tmp_size == 0:
-                    raise ValueError(f"Temp WAV file is empty: {tmp_path}")
-                logger.info(f"[{request_id}] ✓ Temp file size: {tmp_size} bytes")
+    except HTTPException:
+        raise
 
-            except Exception as write_error:
-                logger.error(f"[{request_id}] ✗ sf.write failed: {write_error}")
-                Path(tmp_path).unlink(missing_ok=True)
-                raise
+    except Exception as e:
+        logger.error(f"[{request_id}] TTS generation failed: {e}")
+        raise HTTPException(status_code=500, detail=f"TTS generation failed: {str(e)}")
 
-            # Read temp file into buffer
-            try:
-                with open(tmp_path, 'rb') as f:
-                    audio_bytes = f.read()
-                buffer = io.BytesIO(audio_bytes)
-                buffer.seek(0)
-                logger.info(f"[{request_id}] ✓ Read {len(audio_bytes)} bytes from temp file")
-            except Exception as read_error:
-                logger.error(f"[{request_id}] ✗ Failed to read temp file: {read_error}")
-                raise
-            finally:
-                # Always clean up temp file
-                Path(tmp_path).unlink(missing_ok=True)
-                logger.info(f"[{request_id}] ✓ Cleaned up temp file")
-
-            media_type = "audio/wav"
-
-        elif payload.format == "pcm16":
-            # Raw PCM16 for telephony
-            import numpy as np
-            pcm = (wav * 32767).astype(np.int16)
-            buffer = io.BytesIO(pcm.tobytes())
-            buffer.seek(0)
-            media_type = "audio/L16; rate=24000; channels=1"
-
-        elif payload.format == "mp3":
-            # Convert to MP3 (requires pydub + ffmpeg)
-            try:
-                from pydub import AudioSegment
-                import numpy as np
-
-                # Convert to AudioSegment
-                pcm = (wav * 32767).astype(np.int16)
-                audio_segment = AudioSegment(
-                    pcm.tobytes(),
-                    frame_rate=24000,
-                    sample_width=2,
-                    channels=1
-                )
+    # Return streaming response
+    return StreamingResponse(
+        stream,
+        media_type=meta["media_type"],
+        headers={
+            "X-Request-ID": request_id,
+            **meta["headers"],
+            "X-Voice": voice_slug,
+            "X-Session-ID": payload.session_id or "global",
+            "X-Detected-Style": style_params.get('detected_style', 'neutral'),
+            "X-Coalesced": "true" if joined else "false",
+            **engine_headers,
+            "X-Queue-Stats": str(voice_queue.get_stats())
+        }
+    )
 
-                # Export as MP3
-                buffer = io.BytesIO()
-                audio_segment.export(buffer, format="mp3", bitrate="128k")
-                buffer.seek(0)
-                media_type = "audio/mpeg"
 
+def validate_output_format(format: str, bitrate: Optional[int]):
+    """Reject unavailable codecs and out-of-range bitrates before synthesis (400)"""
+    if format in COMPRESSED_MEDIA_TYPES:
+        if format.startswith("opus") and not OPUS_AVAILABLE:
+            raise HTTPException(status_code=400, detail="Opus encoding not available")
+        try:
+            resolve_bitrate(format, bitrate)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+
+def encode_response(wav, format: str, bitrate: Optional[int], request_id: str):
+    """
+    Encode synthesized audio for an /api response.
+
+    Returns:
+        (body iterable of bytes chunks, media type)
+    """
+    if format == "wav":
+        # Normalizes only if the peak is out of range
+        audio = encode_wav(wav, sample_rate=24000, mode="normalize")
+        logger.info(f"[{request_id}] ✓ Encoded WAV in memory ({len(wav)} samples, {audio.nbytes} bytes)")
+
+        media_type = "audio/wav"
+
+    elif format == "pcm16":
+        # Raw PCM16 for telephony
+        audio = encode_pcm16(wav)
+        media_type = "audio/L16; rate=24000; channels=1"
+
+    elif format in ("opus", "opus_packets"):
+        # In-process libopus: pages/packets stream out block by block
+        audio = create_streaming_encoder(format, 24000, bitrate).iter_encode(wav)
+        media_type = COMPRESSED_MEDIA_TYPES[format]
+
+    elif format == "mp3":
+        if MP3_STREAMING:
+            # In-process LAME: frames stream out block by block, no ffmpeg
+            audio = create_streaming_encoder("mp3", 24000, bitrate).iter_encode(wav)
+            media_type = "audio/mpeg"
+        else:
+            # Fallback: pydub + ffmpeg, WAV if that fails too
+            try:
+                audio = encode_mp3_pydub(wav, sample_rate=24000, bitrate=resolve_bitrate("mp3", bitrate))
+                media_type = "audio/mpeg"
             except Exception as e:
                 logger.error(f"[{request_id}] MP3 conversion failed: {e}, falling back to WAV")
-                import numpy as np
-                import tempfile
-                from pathlib import Path
-
-                # Ensure proper numpy array
-                if not isinstance(wav, np.ndarray):
-                    wav = np.array(wav, dtype=np.float32)
-                elif wav.dtype != np.float32:
-                    wav = wav.astype(np.float32)
-
-                # Normalize if needed
-                max_val = np.abs(wav).max()
-                if max_val > 1.0:
-                    wav = wav / max_val
-
-                with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp:
-                    tmp_path = tmp.name
-
-                try:
-                    sf.write(tmp_path, wav, samplerate=24000, subtype='PCM_16')
-                    with open(tmp_path, 'rb') as f:
-                        buffer = io.BytesIO(f.read())
-                    buffer.seek(0)
-                    logger.info(f"[{request_id}] ✓ MP3 fallback: Generated WAV")
-                finally:
-                    Path(tmp_path).unlink(missing_ok=True)
-
+                audio = encode_wav(wav, sample_rate=24000, mode="normalize")
                 media_type = "audio/wav"
 
+    elif format in ("mulaw", "alaw"):
+        # Native 8 kHz G.711 for telephony - no downstream transcode
+        audio = encode_telephony(wav, format, input_rate=24000)
+        media_type = MEDIA_TYPES[format]
+
+    else:
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
+
+    # Telephony formats stream as 20 ms frames, compressed formats as encoded
+    if format in ("mulaw", "alaw"):
+        body = iter_frames(audio)
+    elif format in ("opus", "opus_packets") or (format == "mp3" and MP3_STREAMING):
+        body = audio
+    else:
+        body = iter([audio])
+
+    return body, media_type
+
+
+async def render_production(
+    request: Request,
+    request_id: str,
+    tts_model,
+    processed_text: str,
+    voice_slug: str,
+    voice_params: dict,
+    payload: TTSRequestProduction,
+    fallback: Optional[FallbackDecision] = None
+) -> AsyncIterator:
+    """
+    Synthesize and encode one /api/tts response.
+
+    Yields a metadata dict (media type and response headers) first, then
+    the body chunks. Runs as a single-flight producer, so every identical
+    concurrent request streams the same output. A degraded `fallback`
+    decision synthesizes with the fallback engine and voice instead.
+    """
+    start_time = time.time()
+    voice_queue = get_voice_queue()
+
+    # Acquire voice lock (prevents overlap)
+    # This is the KEY to preventing voice conflicts!
+    async with voice_queue.acquire_voice(
+        request_id=request_id,
+        voice_id=voice_slug,
+        session_id=payload.session_id,
+        timeout=30.0  # Max 30s wait time
+    ):
+        logger.info(f"[{request_id}] Voice lock acquired, synthesizing...")
+
+        if fallback and fallback.degraded:
+            # Fallback engine: outside the Chatterbox admission slots, its own pacing
+            # (an explicit speed_factor is passed through, else the voice's default)
+            wav = await asyncio.to_thread(
+                fallback.engine.generate,
+                text=processed_text,
+                voice=fallback.voice,
+                speed=payload.speed_factor
+            )
         else:
-            raise HTTPException(status_code=400, detail=f"Unsupported format: {payload.format}")
-
-        duration_ms = int((time.time() - start_time) * 1000)
-        audio_duration = len(wav) / 24000
-
-        logger.info(f"[{request_id}] Generated {audio_duration:.2f}s audio in {duration_ms}ms")
-
-        # Return streaming response
-        return StreamingResponse(
-            buffer,
-            media_type=media_type,
-            headers={
-                "X-Request-ID": request_id,
-                "X-Generation-Time-MS": str(duration_ms),
-                "X-Audio-Duration-Seconds": f"{audio_duration:.2f}",
-                "X-Voice": voice_slug,
-                "X-Session-ID": payload.session_id or "global",
-                "X-Detected-Style": style_params.get('detected_style', 'neutral'),
-                "X-Queue-Stats": str(voice_queue.get_stats())
-            }
+            # Generate audio using Chatterbox TTS (off the event loop, so
+            # identical requests arriving meanwhile can join this flight);
+            # non-default languages may wait for their model to load
+            language = (get_voice_manager().get_voice(voice_slug) or {}).get("language")
+            config = getattr(request.app.state, "config", {})
+            async with serving_engine(tts_model, language, config) as engine, \
+                    get_lane_scheduler().slot(INTERACTIVE), get_admission_controller().slot():
+                wav = await asyncio.to_thread(
+                    engine.generate,
+                    text=processed_text,  # Use preprocessed text!
+                    exaggeration=voice_params['exaggeration'],
+                    temperature=voice_params['temperature'],
+                    cfg_weight=voice_params['cfg_weight'],
+                    language=language_code(language) or "en"  # Multilingual models only
+                )
+
+        # Ensure it's a 1D float32 array (torch tensors converted)
+        wav = as_mono_float32(wav)
+
+        # Apply speed factor if needed
+        if not (fallback and fallback.degraded) and voice_params['speed_factor'] != 1.0:
+            wav = time_stretch(wav, rate=1.0 / voice_params['speed_factor'])
+
+        logger.info(
+            f"[{request_id}] Audio generated: "
+            f"{len(wav)} samples, "
+            f"duration={(len(wav) / 24000):.2f}s"
         )
+    # Voice lock automatically released here
+
+    # Drop leading/trailing near-silence (dead air on calls, wasted payload)
+    audio_config = getattr(request.app.state, "config", {}).get("audio_output", {})
+    trimmer = SilenceTrimmer.from_config(audio_config.get("trim_silence"), 24000)
+    trimmed_ms = 0
+    if trimmer:
+        wav = trimmer.trim(wav)
+        trimmed_ms = int(trimmer.trimmed_ms)
+        record_silence_trimmed("api", trimmer.trimmed_head_ms, trimmer.trimmed_tail_ms)
+
+    # Convert to requested format (in memory - no temp files)
+    if len(wav) == 0:
+        raise ValueError("Generated audio is empty")
+    body, media_type = encode_response(wav, payload.format, payload.bitrate, request_id)
+
+    duration_ms = int((time.time() - start_time) * 1000)
+    audio_duration = len(wav) / 24000
+
+    logger.info(f"[{request_id}] Generated {audio_duration:.2f}s audio in {duration_ms}ms")
+
+    yield {
+        "media_type": media_type,
+        "headers": {
+            "X-Generation-Time-MS": str(duration_ms),
+            "X-Audio-Duration-Seconds": f"{audio_duration:.2f}",
+            "X-Silence-Trimmed-MS": str(trimmed_ms)
+        }
+    }
+    for chunk in body:
+        yield chunk
+
+
+class TemplateTTSRequest(BaseModel):
+    template: str  # e.g. "Your appointment is tomorrow at {time}."
+    values: Dict[str, str] = {}  # Slot values, e.g. {"time": "three P M"}
+    voice: Optional[str] = None
+    format: str = "wav"
+    bitrate: Optional[int] = None
+    session_id: Optional[str] = None
+    temperature: Optional[float] = None
+    exaggeration: Optional[float] = None
+    cfg_weight: Optional[float] = None
+    speed_factor: Optional[float] = None
 
+
+def _template_voice_params(voice_slug: str, payload: TemplateTTSRequest) -> dict:
+    """Voice defaults overridden by explicit request params (no emotion detection for templates)"""
+    voice_params = dict(get_voice_manager().get_voice_params(voice_slug))
+    for name in ("temperature", "exaggeration", "cfg_weight", "speed_factor"):
+        if getattr(payload, name) is not None:
+            voice_params[name] = getattr(payload, name)
+    voice_params.setdefault("speed_factor", 1.0)
+    return voice_params
+
+
+@router.post("/tts/template", summary="Generate TTS from a Template")
+async def generate_tts_template(request: Request, payload: TemplateTTSRequest):
+    """
+    Generate TTS for a templated message, synthesizing only the slots
+
+    Fixed wording is rendered once per voice and cached; each request
+    synthesizes just its slot values and stitches the pieces with
+    crossfades.
+
+    Example:
+    ```json
+    {
+        "template": "Your appointment is tomorrow at {time}. Please arrive fifteen minutes early.",
+        "values": {"time": "three P M"},
+        "voice": "maya-professional"
+    }
+    ```
+
+    Response headers report how much of the audio came from cache
+    (X-Template-Cached-Ratio, by duration) and the model time spent.
+    """
+    request_id = str(uuid.uuid4())
+    start_time = time.time()
+
+    if not payload.template or len(payload.template.strip()) == 0:
+        raise HTTPException(status_code=400, detail="Template cannot be empty")
+
+    if len(payload.template) > 2000:
+        raise HTTPException(status_code=400, detail="Template too long (max 2000 characters)")
+
+    validate_output_format(payload.format, payload.bitrate)
+
+    if not hasattr(request.app.state, 'tts_model') or request.app.state.tts_model is None:
+        raise HTTPException(status_code=503, detail="TTS model not loaded")
+
+    voice_queue = get_voice_queue()
+    voice_slug = payload.voice or get_voice_manager().get_default_voice()
+    voice_params = _template_voice_params(voice_slug, payload)
+
+    synthesizer = TemplateSynthesizer(request.app.state.tts_model)
+    try:
+        wav, stats = await synthesizer.render(
+            payload.template,
+            payload.values,
+            voice_slug,
+            voice_params,
+            lock=lambda: voice_queue.acquire_voice(
+                request_id=request_id,
+                voice_id=voice_slug,
+                session_id=payload.session_id,
+                timeout=30.0
+            )
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except TimeoutError as e:
         logger.error(f"[{request_id}] Voice queue timeout: {e}")
-        raise HTTPException(
-            status_code=429,  # Too Many Requests
-            detail=f"Voice busy: {str(e)}. Try again or use a different voice."
-        )
-
+        raise HTTPException(status_code=429, detail=f"Voice busy: {str(e)}. Try again or use a different voice.")
     except Exception as e:
-        logger.error(f"[{request_id}] TTS generation failed: {e}")
+        logger.error(f"[{request_id}] Template TTS failed: {e}")
         raise HTTPException(status_code=500, detail=f"TTS generation failed: {str(e)}")
 
+    if voice_params['speed_factor'] != 1.0:
+        wav = time_stretch(wav, rate=1.0 / voice_params['speed_factor'])
+
+    audio_config = getattr(request.app.state, "config", {}).get("audio_output", {})
+    trimmer = SilenceTrimmer.from_config(audio_config.get("trim_silence"), 24000)
+    if trimmer:
+        wav = trimmer.trim(wav)
+        record_silence_trimmed("api_template", trimmer.trimmed_head_ms, trimmer.trimmed_tail_ms)
+
+    if len(wav) == 0:
+        raise HTTPException(status_code=500, detail="TTS generation failed: generated audio is empty")
+    body, media_type = encode_response(wav, payload.format, payload.bitrate, request_id)
+
+    duration_ms = int((time.time() - start_time) * 1000)
+    logger.info(
+        f"[{request_id}] Template rendered: {stats['cached_segments']} cached + "
+        f"{stats['synthesized_segments']} synthesized segments, "
+        f"{stats['cached_ratio']:.0%} of audio from cache, model {stats['model_seconds'] * 1000:.0f}ms"
+    )
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={
+            "X-Request-ID": request_id,
+            "X-Generation-Time-MS": str(duration_ms),
+            "X-Model-Time-MS": str(int(stats['model_seconds'] * 1000)),
+            "X-Audio-Duration-Seconds": f"{len(wav) / 24000:.2f}",
+            "X-Template-Cached-Ratio": f"{stats['cached_ratio']:.3f}",
+            "X-Template-Segments": f"cached={stats['cached_segments']}, synthesized={stats['synthesized_segments']}",
+            "X-Voice": voice_slug
+        }
+    )
+
+
+@router.post("/tts/template/prerender", summary="Pre-render Template Segments")
+async def prerender_template(request: Request, payload: TemplateTTSRequest):
+    """
+    Render a template's fixed segments ahead of traffic (values are ignored)
+
+    Call once per template and voice before a campaign so the first calls
+    only pay for their slots.
+    """
+    if not hasattr(request.app.state, 'tts_model') or request.app.state.tts_model is None:
+        raise HTTPException(status_code=503, detail="TTS model not loaded")
+
+    voice_slug = payload.voice or get_voice_manager().get_default_voice()
+    synthesizer = TemplateSynthesizer(request.app.state.tts_model)
+    try:
+        rendered = await synthesizer.prerender(payload.template, voice_slug, _template_voice_params(voice_slug, payload))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "voice": voice_slug,
+        "rendered_segments": rendered,
+        "cache": synthesizer.cache.get_stats()
+    }
+
 
 @router.get("/voices", response_model=VoiceListResponse, summary="List Voices")
 async def list_voices():
@@ -386,7 +582,7 @@ async def health_check(request: Request):
         "status": "healthy",
         "tts_model_loaded": hasattr(request.app.state, 'tts_model') and request.app.state.tts_model is not None,
         "voices_available": len(get_voice_manager().list_voices()),
-        "formats_supported": ["wav", "mp3", "pcm16"],
+        "formats_supported": ["wav", "mp3", "pcm16", "mulaw", "alaw"] + (["opus", "opus_packets"] if OPUS_AVAILABLE else []),
         "features": [
             "voice_isolation",
             "emotion_detection",
@@ -403,6 +599,8 @@ async def get_queue_stats():
     voice_queue = get_voice_queue()
     return {
         "queue": voice_queue.get_stats(),
+        "single_flight": get_single_flight("api").get_stats(),
+        "template_cache": get_segment_cache().get_stats(),
         "timestamp": time.time()
     }
 
@@ -4,10 +4,10 @@ Production API v1 Endpoints
 Provides stable, versioned API for TTS and voice management
 """
 
-import io
 import uuid
 import logging
 import asyncio
+from contextlib import nullcontext
 from typing import Optional, Dict, List, AsyncIterator
 from pathlib import Path
 
@@ -15,9 +15,29 @@ from fastapi import APIRouter, Request, HTTPException, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 import asyncpg
-import soundfile as sf
 import numpy as np
 
+from audio_encoding import encode_wav, encode_pcm16
+from telephony_audio import TelephonyEncoder, iter_frames, MEDIA_TYPES as TELEPHONY_MEDIA_TYPES
+from voice_catalog import compute_etag, etag_matches
+from text_filters import chunk_text, split_sentences
+from time_stretch import time_stretch
+from chunk_assembler import ChunkAssembler, estimate_samples
+from silence_trim import SilenceTrimmer
+from sentence_cache import SentenceCache, get_sentence_cache
+from synthesis_lanes import get_lane_scheduler, INTERACTIVE, BULK
+from single_flight import get_single_flight, request_key
+from guidance import CFG, validate_mode, profile_mode, apply_mode
+from admission import get_admission_controller
+from engine_fallback import get_fallback_router
+from model_manager import serving_engine, language_code
+from streaming_generation import StreamWindows, astream, stream_windows
+from monitoring import record_silence_trimmed, record_single_flight, record_guidance, record_fallback
+from streaming_encoders import (
+    create_streaming_encoder, resolve_bitrate, encode_mp3_pydub,
+    MP3_STREAMING, OPUS_AVAILABLE, MEDIA_TYPES as COMPRESSED_MEDIA_TYPES
+)
+
 logger = logging.getLogger(__name__)
 
 # Create router
@@ -32,9 +52,22 @@ class TTSRequest(BaseModel):
     """Request model for TTS generation"""
     text: str = Field(..., description="Text to synthesize (max 1200 chars)", max_length=1200)
     voice_id: str = Field(..., description="Voice ID from catalog")
-    format: str = Field(default="wav", description="Audio format: wav, mp3, pcm16")
+    format: str = Field(
+        default="wav",
+        description="Audio format: wav, mp3, opus (Ogg), opus_packets (length-prefixed), pcm16, mulaw, alaw (8 kHz telephony)"
+    )
+    bitrate: Optional[int] = Field(default=None, description="Bitrate in kbps for mp3/opus (defaults: mp3 128, opus 32)")
     speed: float = Field(default=1.0, ge=0.5, le=2.0, description="Playback speed multiplier")
     seed: Optional[int] = Field(default=None, description="Random seed for reproducibility")
+    guidance: Optional[str] = Field(
+        default=None,
+        description="Guidance mode: cfg, none (guidance-free, faster) or auto (server decides under load); default: the voice's, else auto"
+    )
+    latency_budget_ms: Optional[int] = Field(
+        default=None,
+        ge=0,
+        description="Max acceptable time to first audio; if the queue can't meet it, a mapped fallback voice serves the request (X-Degraded: true)"
+    )
 
 
 class VoiceResponse(BaseModel):
@@ -92,32 +125,38 @@ async def get_voice_by_id(conn: asyncpg.Connection, voice_id: str, tenant_id: Op
     return dict(row)
 
 
-def chunk_text(text: str, max_length: int = 200) -> List[str]:
+async def lookup_voice(request: Request, voice_id: str) -> Optional[Dict]:
     """
-    Split text into chunks for long-form synthesis.
-    Splits on sentence boundaries when possible.
+    Resolve a voice for the current request.
+
+    Served from the in-process voice catalog when it is loaded, so the TTS hot
+    path does not touch Postgres. Falls back to the database only for IDs the
+    catalog has never seen (e.g. voices created since the last refresh).
     """
-    if len(text) <= max_length:
-        return [text]
-    
-    chunks = []
-    current_chunk = ""
-    
-    # Split on sentence boundaries
-    sentences = text.replace("! ", "!|").replace("? ", "?|").replace(". ", ".|").split("|")
-    
-    for sentence in sentences:
-        if len(current_chunk) + len(sentence) <= max_length:
-            current_chunk += sentence
-        else:
-            if current_chunk:
-                chunks.append(current_chunk.strip())
-            current_chunk = sentence
-    
-    if current_chunk:
-        chunks.append(current_chunk.strip())
-    
-    return chunks
+    tenant_id = getattr(request.state, "tenant_id", None)
+
+    catalog = getattr(request.app.state, "voice_catalog", None)
+    if catalog is not None and catalog.loaded:
+        voice = catalog.get(voice_id, tenant_id)
+        if voice is not None or catalog.contains(voice_id):
+            return voice
+
+    async with request.app.state.pg.acquire() as conn:
+        return await get_voice_by_id(conn, voice_id, tenant_id)
+
+
+def _voice_response(voice: Dict) -> VoiceResponse:
+    """Build the public representation of a voice row"""
+    return VoiceResponse(
+        id=str(voice["id"]),
+        slug=voice["slug"],
+        display_name=voice["display_name"],
+        description=voice.get("description"),
+        language=voice["language"],
+        gender=voice.get("gender"),
+        sample_url=voice.get("sample_url"),
+        is_public=voice["is_public"]
+    )
 
 
 async def synthesize_audio(
@@ -126,46 +165,106 @@ async def synthesize_audio(
     voice_params: Dict,
     reference_audio: Optional[str] = None,
     speed: float = 1.0,
-    seed: Optional[int] = None
+    seed: Optional[int] = None,
+    lane: str = INTERACTIVE,
+    guidance: str = CFG,
+    fallback_voice: Optional[str] = None
 ) -> np.ndarray:
     """
     Synthesize audio using Chatterbox TTS model.
     
     Args:
-        tts_model: The loaded ChatterboxTTS model
+        tts_model: The loaded TTS engine (see tts_engines)
         text: Text to synthesize
         voice_params: Voice generation parameters (temperature, exaggeration, cfg_weight)
         reference_audio: Path to reference audio file for voice cloning
         speed: Playback speed multiplier
         seed: Random seed for reproducibility
+        lane: "interactive" or "bulk" (bulk yields the model to interactive calls)
+        guidance: "cfg" or "none" (guidance-free decode, see guidance.py)
+        fallback_voice: Set when tts_model is the fallback engine (see engine_fallback.py)
     
     Returns:
         Audio waveform as numpy array
     """
-    params = voice_params.get("params", {}) if isinstance(voice_params, dict) else {}
-    
-    # Generate audio
-    wav = await asyncio.to_thread(
-        tts_model.generate,
-        text=text,
-        temperature=params.get("temperature", 0.8),
-        exaggeration=params.get("exaggeration", 1.3),
-        cfg_weight=params.get("cfg_weight", 0.5),
-        seed=seed,
-        reference_audio=reference_audio
-    )
+    if fallback_voice:
+        # Fallback engine runs outside the primary engine's lanes and slots
+        wav = await asyncio.to_thread(tts_model.generate, text=text, voice=fallback_voice, seed=seed)
+        return time_stretch(wav, rate=1.0 / speed) if speed != 1.0 else wav
+    
+    voice_params = voice_params if isinstance(voice_params, dict) else {}
+    params = apply_mode(voice_params.get("params", {}), guidance)
+    
+    # Generate audio (bulk waits don't count towards interactive queue pressure)
+    async with get_lane_scheduler().slot(lane), get_admission_controller().slot(record_wait=lane != BULK):
+        wav = await asyncio.to_thread(
+            tts_model.generate,
+            text=text,
+            temperature=params.get("temperature", 0.8),
+            exaggeration=params.get("exaggeration", 1.3),
+            cfg_weight=params.get("cfg_weight", 0.5),
+            seed=seed,
+            reference_audio=reference_audio,
+            language=language_code(voice_params.get("language")) or "en"  # Multilingual models only
+        )
     
     # Apply speed adjustment if needed
     if speed != 1.0:
-        try:
-            import librosa
-            wav = librosa.effects.time_stretch(wav, rate=1.0 / speed)
-        except ImportError:
-            logger.warning("librosa not available, skipping speed adjustment")
+        wav = time_stretch(wav, rate=1.0 / speed)
     
     return wav
 
 
+async def stream_audio(
+    tts_model,
+    text: str,
+    voice_params: Dict,
+    reference_audio: Optional[str] = None,
+    seed: Optional[int] = None,
+    lane: str = INTERACTIVE,
+    guidance: str = CFG,
+    windows: Optional[StreamWindows] = None
+) -> AsyncIterator[np.ndarray]:
+    """
+    Synthesize audio block by block as the engine streams it (see
+    streaming_generation.py), holding the model slots until the last block.
+    
+    Args: as synthesize_audio, plus `windows` (speech-token window sizes)
+    
+    Yields:
+        Contiguous audio blocks of one clip
+    """
+    params = voice_params.get("params", {}) if isinstance(voice_params, dict) else {}
+    params = apply_mode(params, guidance)
+    
+    async with get_lane_scheduler().slot(lane), get_admission_controller().slot(record_wait=lane != BULK):
+        async for block in astream(
+            tts_model,
+            text,
+            temperature=params.get("temperature", 0.8),
+            exaggeration=params.get("exaggeration", 1.3),
+            cfg_weight=params.get("cfg_weight", 0.5),
+            seed=seed,
+            reference_audio=reference_audio,
+            windows=windows
+        ):
+            yield block
+
+
+async def serving_audio_stream(tts_model, config: Dict, text: str, voice: Dict, *args, **kwargs) -> AsyncIterator[bytes]:
+    """
+    audio_stream_generator on the model serving the voice's language (see
+    model_manager.serving_engine), kept resident until the stream ends.
+    `tts_model` is the primary engine, or the fallback engine when a
+    `fallback_voice` is given (used as is).
+    """
+    engine = nullcontext(tts_model) if kwargs.get("fallback_voice") else \
+        serving_engine(tts_model, voice.get("language"), config)
+    async with engine as model:
+        async for chunk in audio_stream_generator(model, text, voice, *args, **kwargs):
+            yield chunk
+
+
 async def audio_stream_generator(
     tts_model,
     text: str,
@@ -173,15 +272,39 @@ async def audio_stream_generator(
     format: str,
     speed: float,
     seed: Optional[int],
-    sample_rate: int = 24000
+    sample_rate: int = 24000,
+    bitrate: Optional[int] = None,
+    trimmer: Optional[SilenceTrimmer] = None,
+    sentence_cache: Optional[SentenceCache] = None,
+    lane: str = INTERACTIVE,
+    guidance: str = CFG,
+    fallback_voice: Optional[str] = None,
+    windows: Optional[StreamWindows] = None
 ) -> AsyncIterator[bytes]:
     """
     Generate audio stream in chunks for large texts.
     
-    Yields audio chunks as they're generated to reduce latency.
+    Yields audio chunks as they're generated to reduce latency. With a
+    trimmer, leading/trailing silence is gated out before encoding. With a
+    sentence cache, text is synthesized sentence by sentence and only
+    sentences not already cached for this voice and settings hit the model.
+    With `windows`, streamed formats (pcm16, G.711, Opus, streaming MP3)
+    go out in sub-sentence blocks when the engine streams (speed 1.0 only);
+    otherwise sentence by sentence.
     """
-    # Get reference audio path if available
-    reference_audio = voice.get("audio_file_path")
+    def gate(audio: np.ndarray) -> np.ndarray:
+        return trimmer.process(audio) if trimmer else audio
+
+    def gate_end(audio: np.ndarray) -> np.ndarray:
+        if not trimmer:
+            return audio
+        return np.concatenate((trimmer.process(audio), trimmer.flush()))
+
+    def trim(audio) -> np.ndarray:
+        return trimmer.trim(audio) if trimmer else audio
+
+    # Get reference audio path if available (the fallback engine uses its own voice)
+    reference_audio = None if fallback_voice else voice.get("audio_file_path")
     if reference_audio:
         audio_path = Path(reference_audio)
         if not audio_path.exists():
@@ -192,78 +315,122 @@ async def audio_stream_generator(
             else:
                 reference_audio = str(audio_path)
     
-    # Chunk long text
-    text_chunks = chunk_text(text, max_length=200)
+    # Chunk long text (per sentence when cached, so sentences are reusable)
+    if sentence_cache is not None:
+        text_chunks = split_sentences(text) or [text]
+    else:
+        text_chunks = chunk_text(text, max_length=200)
+    
+    def cache_key(chunk: str) -> str:
+        if fallback_voice:
+            return sentence_cache.key(chunk, f"{tts_model.name}:{fallback_voice}", None, speed, seed)
+        return sentence_cache.key(
+            chunk, voice.get("id"), apply_mode(voice.get("params") or {}, guidance), speed, seed, reference_audio
+        )
+    
+    async def synthesize_chunk(chunk: str) -> np.ndarray:
+        if sentence_cache is None:
+            return await synthesize_audio(
+                tts_model, chunk, voice, reference_audio, speed, seed, lane, guidance, fallback_voice
+            )
+        key = cache_key(chunk)
+        wav = sentence_cache.get(key)
+        if wav is None:
+            wav = await synthesize_audio(
+                tts_model, chunk, voice, reference_audio, speed, seed, lane, guidance, fallback_voice
+            )
+            await asyncio.to_thread(sentence_cache.put, key, wav)
+        return wav
+    
+    streams = windows is not None and not fallback_voice and speed == 1.0 and tts_model.capabilities.streaming
+    
+    async def assemble_chunk(assembler: ChunkAssembler, chunk: str) -> AsyncIterator[np.ndarray]:
+        """Final samples of one chunk, block by block when it is streamed"""
+        if not streams:
+            yield assembler.add(await synthesize_chunk(chunk))
+            return
+        key = cache_key(chunk) if sentence_cache is not None else None
+        wav = sentence_cache.get(key) if key else None
+        if wav is not None:
+            yield assembler.add(wav)
+            return
+        blocks = []
+        async for block in stream_audio(tts_model, chunk, voice, reference_audio, seed, lane, guidance, windows):
+            # The assembler may pass the block through as a view, which encoders scale in place
+            blocks.append(block.copy())
+            yield assembler.extend(block) if len(blocks) > 1 else assembler.add(block, partial=True)
+        if key:
+            await asyncio.to_thread(
+                sentence_cache.put, key, np.concatenate(blocks) if blocks else np.empty(0, dtype=np.float32)
+            )
     
     # For WAV format with multiple chunks, we need to handle headers specially
     if format == "wav" and len(text_chunks) > 1:
-        logger.warning("Multiple chunks with WAV format - concatenating audio first")
-        # Generate all audio first, then encode
-        all_audio = []
+        logger.warning("Multiple chunks with WAV format - assembling audio first")
+        # Generate all audio into one preallocated buffer, then encode
+        assembler = ChunkAssembler(sample_rate, expected_samples=estimate_samples(text, sample_rate, speed))
         for chunk in text_chunks:
-            wav = await synthesize_audio(
-                tts_model, chunk, voice, reference_audio, speed, seed
-            )
-            all_audio.append(wav)
-        
-        # Concatenate
-        full_audio = np.concatenate(all_audio)
+            wav = await synthesize_chunk(chunk)
+            assembler.add(wav)
         
         # Encode as WAV
-        buffer = io.BytesIO()
-        sf.write(buffer, full_audio, sample_rate, format='WAV')
-        buffer.seek(0)
-        yield buffer.read()
+        yield encode_wav(trim(assembler.result()), sample_rate)
     
     elif format == "pcm16":
-        # PCM16 can be streamed directly
+        # PCM16 can be streamed directly (crossfaded at chunk boundaries, in blocks when the engine streams)
+        assembler = ChunkAssembler(sample_rate, streaming=True)
         for chunk in text_chunks:
-            wav = await synthesize_audio(
-                tts_model, chunk, voice, reference_audio, speed, seed
-            )
-            # Convert to PCM16
-            pcm_data = (wav * 32767).astype(np.int16).tobytes()
-            yield pcm_data
+            async for audio in assemble_chunk(assembler, chunk):
+                # Convert to PCM16 (clipped - no int16 wrap-around)
+                audio = gate(audio)
+                if len(audio):
+                    yield encode_pcm16(audio)
+        yield encode_pcm16(gate_end(assembler.finish()))
+    
+    elif format in ("mulaw", "alaw"):
+        # 8 kHz G.711 for telephony, streamed as 20 ms frames as chunks finish
+        assembler = ChunkAssembler(sample_rate, streaming=True)
+        encoder = TelephonyEncoder(format, input_rate=sample_rate)
+        for chunk in text_chunks:
+            async for audio in assemble_chunk(assembler, chunk):
+                for frame in iter_frames(encoder.encode(gate(audio))):
+                    yield frame
+        for frame in iter_frames(encoder.encode(gate_end(assembler.finish()))):
+            yield frame
+        for frame in iter_frames(encoder.flush()):
+            yield frame
+    
+    elif format in ("opus", "opus_packets") or (format == "mp3" and MP3_STREAMING):
+        # One persistent in-process encoder: compressed frames go out as chunks finish
+        assembler = ChunkAssembler(sample_rate, streaming=True)
+        encoder = create_streaming_encoder(format, sample_rate, bitrate)
+        for chunk in text_chunks:
+            async for audio in assemble_chunk(assembler, chunk):
+                data = encoder.encode(gate(audio))
+                if data:
+                    yield data
+        yield encoder.encode(gate_end(assembler.finish())) + encoder.flush()
     
     elif format == "mp3":
-        # MP3 requires full audio (or complex streaming)
-        all_audio = []
+        # Fallback without lameenc: full audio through pydub + ffmpeg
+        assembler = ChunkAssembler(sample_rate, expected_samples=estimate_samples(text, sample_rate, speed))
         for chunk in text_chunks:
-            wav = await synthesize_audio(
-                tts_model, chunk, voice, reference_audio, speed, seed
-            )
-            all_audio.append(wav)
+            wav = await synthesize_chunk(chunk)
+            assembler.add(wav)
         
-        full_audio = np.concatenate(all_audio)
-        
-        # Convert to MP3 using pydub
         try:
-            from pydub import AudioSegment
-            
-            # Save to WAV buffer first
-            wav_buffer = io.BytesIO()
-            sf.write(wav_buffer, full_audio, sample_rate, format='WAV')
-            wav_buffer.seek(0)
-            
-            # Convert to MP3
-            audio_segment = AudioSegment.from_wav(wav_buffer)
-            mp3_buffer = io.BytesIO()
-            audio_segment.export(mp3_buffer, format="mp3", bitrate="128k")
-            mp3_buffer.seek(0)
-            yield mp3_buffer.read()
+            yield encode_mp3_pydub(trim(assembler.result()), sample_rate, resolve_bitrate("mp3", bitrate))
         except ImportError:
-            logger.error("pydub not available for MP3 encoding")
+            logger.error("Neither lameenc nor pydub available for MP3 encoding")
             raise HTTPException(status_code=500, detail="MP3 encoding not available")
     
     else:
         # Default to WAV single chunk
-        wav = await synthesize_audio(
-            tts_model, text, voice, reference_audio, speed, seed
-        )
-        buffer = io.BytesIO()
-        sf.write(buffer, wav, sample_rate, format='WAV')
-        buffer.seek(0)
-        yield buffer.read()
+        wav = await synthesize_chunk(text_chunks[0] if len(text_chunks) == 1 else text)
+        yield encode_wav(trim(wav), sample_rate)
+    
+    if trimmer:
+        record_silence_trimmed("v1", trimmer.trimmed_head_ms, trimmer.trimmed_tail_ms)
 
 
 # ============================================================================
@@ -289,7 +456,7 @@ async def generate_tts(request: Request, payload: TTSRequest):
     Requires valid API key in x-api-key header.
     
     Returns:
-        Audio stream in requested format (WAV, MP3, or PCM16)
+        Audio stream in requested format (WAV, MP3, Opus, PCM16 or G.711)
     """
     # Get TTS model from app state
     tts_model = request.app.state.tts_model
@@ -299,10 +466,9 @@ async def generate_tts(request: Request, payload: TTSRequest):
     # Track text length for usage metering
     request.state.text_length = len(payload.text)
     
-    # Get voice from database
+    # Get voice from catalog (database only on catalog miss)
     try:
-        async with request.app.state.pg.acquire() as conn:
-            voice = await get_voice_by_id(conn, payload.voice_id, request.state.tenant_id)
+        voice = await lookup_voice(request, payload.voice_id)
     except Exception as e:
         logger.error(f"Database error getting voice: {e}")
         raise HTTPException(status_code=503, detail="Database error")
@@ -313,32 +479,92 @@ async def generate_tts(request: Request, payload: TTSRequest):
     # Track voice_id for logging
     request.state.voice_id = uuid.UUID(payload.voice_id)
     
+    # Validate compressed format options before streaming starts
+    if payload.format in COMPRESSED_MEDIA_TYPES:
+        if payload.format.startswith("opus") and not OPUS_AVAILABLE:
+            raise HTTPException(status_code=400, detail="Opus encoding not available")
+        try:
+            resolve_bitrate(payload.format, payload.bitrate)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        requested_guidance = validate_mode(payload.guidance)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # Engine fallback: a mapped fast voice when the queue can't meet the latency budget
+    admission = get_admission_controller(request.app.state.config)
+    fallback = get_fallback_router(request.app.state.config).decide(
+        (voice.get("slug"), payload.voice_id), payload.latency_budget_ms, admission
+    )
+    engine_headers = fallback.headers()
+    if fallback.degraded:
+        tts_model = fallback.engine
+        guidance = CFG  # Not used by the fallback engine
+        record_fallback("v1", fallback.engine.name, voice.get("slug") or payload.voice_id)
+    else:
+        # Guidance mode: request, then voice profile, then the admission controller
+        guidance, guidance_reason = admission.choose(requested_guidance, profile_mode(voice.get("params")))
+        record_guidance("v1", guidance, guidance_reason)
+        engine_headers["X-Guidance-Mode"] = guidance
+    
     # Determine media type
     media_types = {
         "wav": "audio/wav",
-        "mp3": "audio/mpeg",
-        "pcm16": "audio/L16; rate=24000; channels=1"
+        "pcm16": "audio/L16; rate=24000; channels=1",
+        **COMPRESSED_MEDIA_TYPES,
+        **TELEPHONY_MEDIA_TYPES
     }
     media_type = media_types.get(payload.format, "audio/wav")
     
     # Generate and stream audio
     try:
-        sample_rate = request.app.state.config.get("audio_output", {}).get("sample_rate", 24000)
+        audio_config = request.app.state.config.get("audio_output", {})
+        sample_rate = audio_config.get("sample_rate", 24000)
+        trimmer = SilenceTrimmer.from_config(audio_config.get("trim_silence"), sample_rate)
         
-        return StreamingResponse(
-            audio_stream_generator(
+        # Identical concurrent requests share one synthesis (late joiners get a replay)
+        flights = get_single_flight("v1")
+        key = request_key(
+            text=payload.text,
+            voice_id=payload.voice_id,
+            format=payload.format,
+            speed=payload.speed,
+            seed=payload.seed,
+            bitrate=payload.bitrate,
+            guidance=guidance,
+            fallback_voice=fallback.voice
+        )
+        stream, joined = flights.subscribe(
+            key,
+            lambda: serving_audio_stream(
                 tts_model,
+                request.app.state.config,
                 payload.text,
                 voice,
                 payload.format,
                 payload.speed,
                 payload.seed,
-                sample_rate
-            ),
+                sample_rate,
+                payload.bitrate,
+                trimmer,
+                get_sentence_cache(request.app.state.config),
+                guidance=guidance,
+                fallback_voice=fallback.voice,
+                windows=stream_windows(request.app.state.config)
+            )
+        )
+        record_single_flight("v1", joined, flights.dedup_ratio)
+        
+        return StreamingResponse(
+            stream,
             media_type=media_type,
             headers={
                 "X-Voice-ID": payload.voice_id,
                 "X-Text-Length": str(len(payload.text)),
+                "X-Coalesced": "true" if joined else "false",
+                **engine_headers,
                 "Content-Disposition": f'attachment; filename="tts_{payload.voice_id[:8]}.{payload.format}"'
             }
         )
@@ -348,52 +574,60 @@ async def generate_tts(request: Request, payload: TTSRequest):
 
 
 @router.get("/voices", response_model=List[VoiceResponse])
-async def list_voices(request: Request):
+async def list_voices(request: Request, response: Response):
     """
     List available voices from catalog.
     
     Returns:
     - All public voices
     - Private voices owned by the requesting tenant
+    
+    Responses carry a strong ETag; send it back in If-None-Match to get a
+    304 Not Modified when the tenant's view has not changed.
     """
-    try:
-        async with request.app.state.pg.acquire() as conn:
-            # Get public voices + tenant private voices
-            tenant_id = getattr(request.state, "tenant_id", None)
-            
-            if tenant_id:
-                rows = await conn.fetch("""
-                    SELECT id, slug, display_name, description, language, gender, 
-                           sample_url, is_public
-                    FROM voices
-                    WHERE status = 'active' AND (is_public = TRUE OR owner_tenant = $1)
-                    ORDER BY display_name
-                """, tenant_id)
-            else:
-                rows = await conn.fetch("""
-                    SELECT id, slug, display_name, description, language, gender, 
-                           sample_url, is_public
-                    FROM voices
-                    WHERE status = 'active' AND is_public = TRUE
-                    ORDER BY display_name
-                """)
-            
-            return [
-                VoiceResponse(
-                    id=str(row["id"]),
-                    slug=row["slug"],
-                    display_name=row["display_name"],
-                    description=row["description"],
-                    language=row["language"],
-                    gender=row["gender"],
-                    sample_url=row["sample_url"],
-                    is_public=row["is_public"]
-                )
-                for row in rows
-            ]
-    except Exception as e:
-        logger.error(f"Database error listing voices: {e}")
-        raise HTTPException(status_code=503, detail="Database error")
+    tenant_id = getattr(request.state, "tenant_id", None)
+    catalog = getattr(request.app.state, "voice_catalog", None)
+    
+    if catalog is not None and catalog.loaded:
+        view = catalog.view_for_tenant(tenant_id)
+        voices, etag = view.voices, view.etag
+    else:
+        try:
+            async with request.app.state.pg.acquire() as conn:
+                # Get public voices + tenant private voices
+                if tenant_id:
+                    rows = await conn.fetch("""
+                        SELECT id, slug, display_name, description, language, gender, 
+                               sample_url, is_public
+                        FROM voices
+                        WHERE status = 'active' AND (is_public = TRUE OR owner_tenant = $1)
+                        ORDER BY display_name
+                    """, tenant_id)
+                else:
+                    rows = await conn.fetch("""
+                        SELECT id, slug, display_name, description, language, gender, 
+                               sample_url, is_public
+                        FROM voices
+                        WHERE status = 'active' AND is_public = TRUE
+                        ORDER BY display_name
+                    """)
+        except Exception as e:
+            logger.error(f"Database error listing voices: {e}")
+            raise HTTPException(status_code=503, detail="Database error")
+        
+        voices = [dict(row) for row in rows]
+        etag = compute_etag(voices)
+    
+    cache_headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache"
+    }
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=cache_headers)
+    
+    response.headers.update(cache_headers)
+    return [_voice_response(voice) for voice in voices]
 
 
 @router.get("/voices/{voice_id}", response_model=VoiceResponse)
@@ -404,8 +638,7 @@ async def get_voice(request: Request, voice_id: str):
     Returns voice if public or owned by requesting tenant.
     """
     try:
-        async with request.app.state.pg.acquire() as conn:
-            voice = await get_voice_by_id(conn, voice_id, request.state.tenant_id)
+        voice = await lookup_voice(request, voice_id)
     except Exception as e:
         logger.error(f"Database error getting voice: {e}")
         raise HTTPException(status_code=503, detail="Database error")
@@ -413,16 +646,7 @@ async def get_voice(request: Request, voice_id: str):
     if not voice:
         raise HTTPException(status_code=404, detail="Voice not found or access denied")
     
-    return VoiceResponse(
-        id=str(voice["id"]),
-        slug=voice["slug"],
-        display_name=voice["display_name"],
-        description=None,  # Not in our query
-        language=voice["language"],
-        gender=None,  # Not in our query
-        sample_url=None,  # Not in our query
-        is_public=voice["is_public"]
-    )
+    return _voice_response(voice)
 
 
 @router.get("/usage", response_model=List[UsageResponse])
@@ -0,0 +1,291 @@
+"""
+In-Memory Audio Encoding
+========================
+Shared encoders for TTS responses. Everything happens in memory: no temp
+files, no `outputs/` round trips.
+
+WAV encoding builds the 44-byte RIFF header directly and converts float
+samples to PCM16 with `finalize_audio` (one vectorized clip/dither/round
+pass), writing straight into the response buffer. The result is returned
+as a memoryview over that buffer so it can be handed to the response
+without another copy.
+
+Usage:
+    from audio_encoding import encode_wav
+
+    audio = encode_wav(wav, sample_rate=24000)   # memoryview
+    return StreamingResponse(iter([audio]), media_type="audio/wav")
+"""
+
+import struct
+import logging
+from typing import Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+WAV_HEADER_SIZE = 44
+PCM16_SCALE = 32767.0
+
+
+def wav_header(num_samples: int, sample_rate: int = 24000, channels: int = 1, bits_per_sample: int = 16) -> bytes:
+    """
+    Build a canonical 44-byte RIFF/WAVE header for PCM audio.
+
+    Args:
+        num_samples: Number of samples per channel
+        sample_rate: Sample rate in Hz
+        channels: Channel count
+        bits_per_sample: Sample width in bits
+
+    Returns:
+        Header bytes
+    """
+    header = bytearray(WAV_HEADER_SIZE)
+    _pack_wav_header(header, num_samples, sample_rate, channels, bits_per_sample)
+    return bytes(header)
+
+
+def _pack_wav_header(buffer, num_samples: int, sample_rate: int, channels: int, bits_per_sample: int):
+    """Write a RIFF/WAVE header into the first 44 bytes of buffer"""
+    block_align = channels * bits_per_sample // 8
+    data_size = num_samples * block_align
+    struct.pack_into(
+        "<4sI4s4sIHHIIHH4sI",
+        buffer,
+        0,
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,                         # fmt chunk size
+        1,                          # PCM
+        channels,
+        sample_rate,
+        sample_rate * block_align,  # byte rate
+        block_align,
+        bits_per_sample,
+        b"data",
+        data_size
+    )
+
+
+def as_mono_float32(wav) -> np.ndarray:
+    """
+    View model output as a 1-D float32 array.
+
+    Accepts numpy arrays, torch tensors and lists. Only copies when the input
+    is not already contiguous float32.
+    """
+    if hasattr(wav, "detach"):  # torch.Tensor
+        wav = wav.detach().cpu().numpy()
+    return np.ascontiguousarray(wav, dtype=np.float32).reshape(-1)
+
+
+def _build_mulaw_table() -> np.ndarray:
+    """
+    Build a 64K-entry G.711 μ-law lookup table indexed by PCM16 bit pattern.
+
+    Follows the reference (Sun g711.c / audioop) algorithm on the top 14
+    bits. Index with `pcm16.view(np.uint16)` to encode a whole buffer in one
+    gather.
+    """
+    pcm = np.arange(-32768, 32768, dtype=np.int32) >> 2
+    mask = np.where(pcm < 0, 0x7F, 0xFF)
+    magnitude = np.minimum(np.abs(pcm), MULAW_CLIP) + MULAW_BIAS
+    segment = np.floor(np.log2(magnitude)).astype(np.int32) - 5
+    codes = np.where(
+        segment > 7,
+        0x7F,  # out of range: clamp to the top code, as the reference does
+        (segment << 4) | ((magnitude >> (segment + 1)) & 0x0F)
+    ) ^ mask
+
+    table = np.empty(65536, dtype=np.uint8)
+    table[np.arange(-32768, 32768) & 0xFFFF] = codes
+    return table
+
+
+def _build_alaw_table() -> np.ndarray:
+    """
+    Build a 64K-entry G.711 A-law lookup table indexed by PCM16 bit pattern.
+
+    Follows the reference (Sun g711.c / audioop) algorithm on the top 13 bits.
+    """
+    pcm = np.arange(-32768, 32768, dtype=np.int32) >> 3
+    mask = np.where(pcm >= 0, 0xD5, 0x55)
+    magnitude = np.where(pcm >= 0, pcm, -pcm - 1)
+    segment = np.searchsorted(ALAW_SEGMENT_ENDS, magnitude)
+    shift = np.maximum(segment, 1)
+    codes = ((segment << 4) | ((magnitude >> shift) & 0x0F)) ^ mask
+
+    table = np.empty(65536, dtype=np.uint8)
+    table[np.arange(-32768, 32768) & 0xFFFF] = codes
+    return table
+
+
+MULAW_BIAS = 0x21
+MULAW_CLIP = 8159
+MULAW_TABLE = _build_mulaw_table()
+
+ALAW_SEGMENT_ENDS = np.array([0x1F, 0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF])
+ALAW_TABLE = _build_alaw_table()
+
+# Lookup tables for 8-bit companded encodings
+COMPANDING_TABLES = {
+    "mulaw": MULAW_TABLE,
+    "alaw": ALAW_TABLE,
+}
+
+# Byte value of digital silence per encoding (used to pad partial frames)
+SILENCE_CODES = {
+    "mulaw": 0xFF,
+    "alaw": 0xD5,
+}
+
+# Samples processed per block by finalize_audio (bounds scratch memory)
+FINALIZE_BLOCK = 65536
+
+
+def finalize_audio(
+    wav,
+    encoding: str = "pcm16",
+    mode: str = "clip",
+    dither: bool = False,
+    out: Optional[np.ndarray] = None,
+    rng: Optional[np.random.Generator] = None
+) -> np.ndarray:
+    """
+    Convert model output to integer audio in a single pass.
+
+    This is the one place float audio becomes PCM. It replaces the old chain
+    of `np.array(...)` copy → `flatten()` copy → normalization pass →
+    `(wav * 32767).astype(np.int16)`, which also overflowed (wrapped around)
+    on samples above 1.0 because nothing clipped them.
+
+    The float input is scaled, dithered, clipped and rounded IN PLACE when it
+    is already contiguous float32 (pass a copy if you still need it). The
+    only full-size allocation is the output array, unless `out` is given.
+
+    Args:
+        wav: Audio samples (numpy array or torch tensor, float in [-1, 1])
+        encoding: "pcm16" (little-endian int16), "mulaw" or "alaw" (G.711 bytes)
+        mode: "clip" hard-clips out-of-range samples; "normalize" rescales
+            the whole buffer when its peak exceeds 1.0
+        dither: Add TPDF dither (±1 LSB triangular noise) before rounding
+        out: Optional preallocated output (int16 for pcm16, uint8 for G.711)
+        rng: Random generator for dither (seeded for reproducible output)
+
+    Returns:
+        The int16 or uint8 output array
+    """
+    if encoding != "pcm16" and encoding not in COMPANDING_TABLES:
+        raise ValueError(f"Unsupported encoding: {encoding}")
+    if mode not in ("clip", "normalize"):
+        raise ValueError(f"Unsupported mode: {mode}")
+
+    samples = as_mono_float32(wav)
+    num_samples = samples.shape[0]
+
+    if out is None:
+        out = np.empty(num_samples, dtype="<i2" if encoding == "pcm16" else np.uint8)
+
+    if num_samples == 0:
+        return out
+
+    scale = PCM16_SCALE
+    if mode == "normalize":
+        peak = max(float(samples.max()), -float(samples.min()))
+        if peak > 1.0:
+            logger.debug(f"Audio peak {peak:.3f} out of range, normalizing")
+            scale = PCM16_SCALE / peak
+
+    block = min(FINALIZE_BLOCK, num_samples)
+    if dither:
+        rng = rng or np.random.default_rng()
+        noise = np.empty(block, dtype=np.float32)
+        noise_b = np.empty(block, dtype=np.float32)
+    if encoding != "pcm16":
+        table = COMPANDING_TABLES[encoding]
+        scratch = np.empty(block, dtype="<i2")
+
+    for start in range(0, num_samples, block):
+        chunk = samples[start:start + block]
+        n = chunk.shape[0]
+
+        chunk *= scale
+        if dither:
+            # TPDF: difference of two uniforms → triangular on (-1, 1) LSB
+            rng.random(n, dtype=np.float32, out=noise[:n])
+            rng.random(n, dtype=np.float32, out=noise_b[:n])
+            noise[:n] -= noise_b[:n]
+            chunk += noise[:n]
+        np.clip(chunk, -32768.0, 32767.0, out=chunk)
+        np.rint(chunk, out=chunk)
+
+        if encoding == "pcm16":
+            np.copyto(out[start:start + n], chunk, casting="unsafe")
+        else:
+            np.copyto(scratch[:n], chunk, casting="unsafe")
+            np.take(table, scratch[:n].view(np.uint16), out=out[start:start + n])
+
+    return out
+
+
+def encode_wav(wav, sample_rate: int = 24000, mode: str = "clip", dither: bool = False) -> memoryview:
+    """
+    Encode audio as a 16-bit mono WAV file entirely in memory.
+
+    One buffer is allocated for header + data; PCM samples are written into
+    it directly by `finalize_audio` (which scales `wav` in place).
+
+    Args:
+        wav: Audio samples (numpy array or torch tensor, float in [-1, 1])
+        sample_rate: Sample rate in Hz
+        mode: "clip" or "normalize" (see finalize_audio)
+        dither: Apply TPDF dither before rounding
+
+    Returns:
+        memoryview over the complete WAV file
+    """
+    samples = as_mono_float32(wav)
+    num_samples = samples.shape[0]
+
+    buffer = bytearray(WAV_HEADER_SIZE + 2 * num_samples)
+    _pack_wav_header(buffer, num_samples, sample_rate, 1, 16)
+
+    pcm = np.frombuffer(buffer, dtype="<i2", count=num_samples, offset=WAV_HEADER_SIZE)
+    finalize_audio(samples, encoding="pcm16", mode=mode, dither=dither, out=pcm)
+
+    return memoryview(buffer)
+
+
+def encode_pcm16(wav, mode: str = "clip", dither: bool = False) -> memoryview:
+    """
+    Encode audio as raw little-endian PCM16 (no header).
+
+    Returns:
+        Byte-format memoryview over the PCM data
+    """
+    pcm = finalize_audio(wav, encoding="pcm16", mode=mode, dither=dither)
+    return memoryview(pcm).cast("B")
+
+
+def encode_mulaw(wav, mode: str = "clip", dither: bool = False) -> memoryview:
+    """
+    Encode audio as raw G.711 μ-law bytes at the input sample rate.
+
+    Returns:
+        memoryview over the μ-law data
+    """
+    return memoryview(finalize_audio(wav, encoding="mulaw", mode=mode, dither=dither))
+
+
+def encode_alaw(wav, mode: str = "clip", dither: bool = False) -> memoryview:
+    """
+    Encode audio as raw G.711 A-law bytes at the input sample rate.
+
+    Returns:
+        memoryview over the A-law data
+    """
+    return memoryview(finalize_audio(wav, encoding="alaw", mode=mode, dither=dither))
@@ -83,7 +83,7 @@ class APIKeyMiddleware(BaseHTTPMiddleware):
         request.state.request_id = request_id
         
         # Skip auth for public endpoints
-        public_paths = ["/health", "/v1/health", "/docs", "/openapi.json", "/redoc", "/"]
+        public_paths = ["/health", "/ready", "/live", "/v1/health", "/docs", "/openapi.json", "/redoc", "/"]
         if any(request.url.path.startswith(path) for path in public_paths):
             return await call_next(request)
         
@@ -0,0 +1,522 @@
+"""
+Batch Synthesis Jobs
+====================
+Asynchronous `/v1/batch` API for synthesizing many items in one job.
+
+n8n workflows used to loop over `/tts` one HTTP call at a time for
+hundreds of reminders. A batch job instead:
+
+- is accepted in one request (voices validated up front) and returns a
+  job ID immediately (202)
+- runs its items in the bulk synthesis lane, so live traffic keeps
+  priority on the model (see synthesis_lanes.py)
+- persists job and item progress in SQLite (a local stand-in for
+  Postgres), so queued and interrupted jobs resume after a restart from
+  the first unfinished item
+- reports progress at GET /v1/batch/{job_id} and, when done, POSTs the
+  final status to an optional callback URL
+- stores each output as an individually fetchable artifact, plus a zip of
+  all outputs on request
+
+Endpoints:
+    POST /v1/batch                          submit a job
+    GET  /v1/batch/{job_id}                 status and per-item progress
+    GET  /v1/batch/{job_id}/items/{index}   one item's audio
+    GET  /v1/batch/{job_id}/archive         zip of all finished items
+"""
+
+import json
+import uuid
+import time
+import asyncio
+import logging
+import sqlite3
+import threading
+import zipfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import FileResponse
+from pydantic import BaseModel, Field
+
+from api_v1 import serving_audio_stream, lookup_voice
+from silence_trim import SilenceTrimmer
+from sentence_cache import get_sentence_cache
+from streaming_encoders import resolve_bitrate, OPUS_AVAILABLE, MEDIA_TYPES as COMPRESSED_MEDIA_TYPES
+from telephony_audio import MEDIA_TYPES as TELEPHONY_MEDIA_TYPES
+from synthesis_lanes import BULK
+from guidance import CFG, NONE, profile_mode
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/v1")
+
+MAX_BATCH_ITEMS = 1000
+CALLBACK_ATTEMPTS = 3
+CALLBACK_TIMEOUT = 10.0
+
+FILE_EXTENSIONS = {
+    "wav": "wav",
+    "mp3": "mp3",
+    "opus": "ogg",
+    "opus_packets": "opus",
+    "pcm16": "pcm",
+    "mulaw": "ulaw",
+    "alaw": "alaw"
+}
+
+MEDIA_TYPES = {
+    "wav": "audio/wav",
+    "pcm16": "audio/L16; rate=24000; channels=1",
+    **COMPRESSED_MEDIA_TYPES,
+    **TELEPHONY_MEDIA_TYPES
+}
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+# Item states
+PENDING = "pending"
+DONE = "done"
+
+
+# ============================================================================
+# Request Models
+# ============================================================================
+
+class BatchItem(BaseModel):
+    """One text to synthesize"""
+    text: str = Field(..., description="Text to synthesize (max 1200 chars)", max_length=1200)
+    voice_id: Optional[str] = Field(default=None, description="Voice ID (defaults to the job's voice_id)")
+    speed: Optional[float] = Field(default=None, ge=0.5, le=2.0)
+    seed: Optional[int] = None
+    reference: Optional[str] = Field(default=None, description="Caller's own ID for this item, echoed back")
+
+
+class BatchRequest(BaseModel):
+    """Batch job submission"""
+    items: List[BatchItem] = Field(..., description=f"Items to synthesize (max {MAX_BATCH_ITEMS})")
+    voice_id: Optional[str] = Field(default=None, description="Default voice for items without one")
+    format: str = Field(default="mp3", description="Output format for every item (see /v1/tts)")
+    bitrate: Optional[int] = None
+    speed: float = Field(default=1.0, ge=0.5, le=2.0)
+    callback_url: Optional[str] = Field(default=None, description="POSTed the final job status when done")
+
+
+# ============================================================================
+# Persistent Store
+# ============================================================================
+
+class BatchStore:
+    """SQLite job/item store (one connection, serialized by a lock)"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS batch_jobs (
+                    id TEXT PRIMARY KEY,
+                    tenant_id TEXT,
+                    status TEXT NOT NULL,
+                    format TEXT NOT NULL,
+                    bitrate INTEGER,
+                    callback_url TEXT,
+                    callback_status TEXT,
+                    total INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    finished_at REAL
+                );
+                CREATE TABLE IF NOT EXISTS batch_items (
+                    job_id TEXT NOT NULL,
+                    idx INTEGER NOT NULL,
+                    text TEXT NOT NULL,
+                    voice TEXT NOT NULL,
+                    speed REAL NOT NULL,
+                    seed INTEGER,
+                    reference TEXT,
+                    status TEXT NOT NULL,
+                    artifact TEXT,
+                    bytes INTEGER,
+                    error TEXT,
+                    PRIMARY KEY (job_id, idx)
+                );
+            """)
+
+    def _execute(self, sql: str, params=()):
+        with self._lock, self._conn:
+            return self._conn.execute(sql, params).fetchall()
+
+    def create_job(self, job_id: str, tenant_id: Optional[str], payload: BatchRequest, voices: Dict[str, Dict]):
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO batch_jobs (id, tenant_id, status, format, bitrate, callback_url, total, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, tenant_id, QUEUED, payload.format, payload.bitrate, payload.callback_url,
+                 len(payload.items), now, now)
+            )
+            self._conn.executemany(
+                "INSERT INTO batch_items (job_id, idx, text, voice, speed, seed, reference, status) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (job_id, idx, item.text, json.dumps(voices[item.voice_id or payload.voice_id], default=str),
+                     item.speed if item.speed is not None else payload.speed, item.seed, item.reference, PENDING)
+                    for idx, item in enumerate(payload.items)
+                ]
+            )
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        rows = self._execute("SELECT * FROM batch_jobs WHERE id = ?", (job_id,))
+        return dict(rows[0]) if rows else None
+
+    def get_items(self, job_id: str) -> List[Dict[str, Any]]:
+        return [dict(row) for row in self._execute(
+            "SELECT idx, reference, status, artifact, bytes, error FROM batch_items WHERE job_id = ? ORDER BY idx",
+            (job_id,)
+        )]
+
+    def pending_items(self, job_id: str) -> List[Dict[str, Any]]:
+        return [dict(row) for row in self._execute(
+            "SELECT * FROM batch_items WHERE job_id = ? AND status = ? ORDER BY idx", (job_id, PENDING)
+        )]
+
+    def finish_item(self, job_id: str, idx: int, artifact: Optional[str], size: Optional[int], error: Optional[str]):
+        self._execute(
+            "UPDATE batch_items SET status = ?, artifact = ?, bytes = ?, error = ? WHERE job_id = ? AND idx = ?",
+            (DONE if error is None else FAILED, artifact, size, error, job_id, idx)
+        )
+
+    def set_status(self, job_id: str, status: str, finished: bool = False):
+        now = time.time()
+        self._execute(
+            "UPDATE batch_jobs SET status = ?, updated_at = ?, finished_at = ? WHERE id = ?",
+            (status, now, now if finished else None, job_id)
+        )
+
+    def set_callback_status(self, job_id: str, callback_status: str):
+        self._execute("UPDATE batch_jobs SET callback_status = ? WHERE id = ?", (callback_status, job_id))
+
+    def counts(self, job_id: str) -> Dict[str, int]:
+        rows = self._execute("SELECT status, COUNT(*) AS n FROM batch_items WHERE job_id = ? GROUP BY status", (job_id,))
+        return {row["status"]: row["n"] for row in rows}
+
+    def unfinished_jobs(self) -> List[str]:
+        rows = self._execute(
+            "SELECT id FROM batch_jobs WHERE status IN (?, ?) ORDER BY created_at", (QUEUED, RUNNING)
+        )
+        return [row["id"] for row in rows]
+
+
+# ============================================================================
+# Worker
+# ============================================================================
+
+class BatchWorker:
+    """Runs batch jobs one at a time in the bulk synthesis lane"""
+
+    def __init__(self, app, store: BatchStore, artifact_dir):
+        self.app = app
+        self.store = store
+        self.artifact_dir = Path(artifact_dir)
+        self.artifact_dir.mkdir(parents=True, exist_ok=True)
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Start the worker and re-queue jobs left unfinished by a previous run"""
+        self._queue = asyncio.Queue()
+        resumed = self.store.unfinished_jobs()
+        for job_id in resumed:
+            self._queue.put_nowait(job_id)
+        self._task = asyncio.create_task(self._run())
+        if resumed:
+            logger.info(f"✓ Batch worker started, resuming {len(resumed)} job(s)")
+        else:
+            logger.info("✓ Batch worker started")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    def submit(self, job_id: str):
+        self._queue.put_nowait(job_id)
+
+    async def _run(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run_job(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Batch job {job_id} crashed: {e}")
+                self.store.set_status(job_id, FAILED, finished=True)
+                await self._callback(job_id)
+
+    async def _run_job(self, job_id: str):
+        job = self.store.get_job(job_id)
+        if job is None:
+            return
+        self.store.set_status(job_id, RUNNING)
+        pending = self.store.pending_items(job_id)
+        logger.info(f"Batch job {job_id}: {len(pending)}/{job['total']} items to synthesize")
+
+        tts_model = getattr(self.app.state, "tts_model", None)
+        config = getattr(self.app.state, "config", {})
+        audio_config = config.get("audio_output", {})
+        sample_rate = audio_config.get("sample_rate", 24000)
+
+        job_dir = self.artifact_dir / job_id
+        job_dir.mkdir(parents=True, exist_ok=True)
+        extension = FILE_EXTENSIONS.get(job["format"], job["format"])
+
+        for item in pending:
+            while tts_model is None:
+                # Model not loaded (yet): keep the job queued rather than failing it
+                await asyncio.sleep(5)
+                tts_model = getattr(self.app.state, "tts_model", None)
+
+            artifact = f"{item['idx']:05d}.{extension}"
+            try:
+                chunks = []
+                voice = json.loads(item["voice"])
+                async for chunk in serving_audio_stream(
+                    tts_model,
+                    config,
+                    item["text"],
+                    voice,
+                    job["format"],
+                    item["speed"],
+                    item["seed"],
+                    sample_rate,
+                    job["bitrate"],
+                    SilenceTrimmer.from_config(audio_config.get("trim_silence"), sample_rate),
+                    get_sentence_cache(config),
+                    lane=BULK,
+                    # Bulk work has no caller waiting: guided unless the voice opts out
+                    guidance=NONE if profile_mode(voice.get("params")) == NONE else CFG
+                ):
+                    chunks.append(bytes(chunk))
+                data = b"".join(chunks)
+                await asyncio.to_thread((job_dir / artifact).write_bytes, data)
+                self.store.finish_item(job_id, item["idx"], artifact, len(data), None)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Batch job {job_id} item {item['idx']} failed: {e}")
+                self.store.finish_item(job_id, item["idx"], None, None, str(e))
+
+        counts = self.store.counts(job_id)
+        status = FAILED if counts.get(DONE, 0) == 0 else COMPLETED
+        self.store.set_status(job_id, status, finished=True)
+        logger.info(f"✓ Batch job {job_id} {status}: {counts.get(DONE, 0)} done, {counts.get(FAILED, 0)} failed")
+        await self._callback(job_id)
+
+    async def _callback(self, job_id: str):
+        job = self.store.get_job(job_id)
+        if not job or not job["callback_url"]:
+            return
+
+        body = job_status(self.store, job)
+        for attempt in range(1, CALLBACK_ATTEMPTS + 1):
+            try:
+                async with httpx.AsyncClient(timeout=CALLBACK_TIMEOUT) as client:
+                    response = await client.post(job["callback_url"], json=body)
+                if response.status_code < 300:
+                    self.store.set_callback_status(job_id, f"delivered ({response.status_code})")
+                    return
+                error = f"HTTP {response.status_code}"
+            except httpx.HTTPError as e:
+                error = str(e) or type(e).__name__
+            logger.warning(f"⚠ Batch job {job_id} callback attempt {attempt} failed: {error}")
+            await asyncio.sleep(2 ** attempt)
+
+        self.store.set_callback_status(job_id, f"failed ({error})")
+
+
+def job_status(store: BatchStore, job: Dict[str, Any]) -> Dict[str, Any]:
+    """Public status document for a job (also the callback body)"""
+    counts = store.counts(job["id"])
+    base = f"/v1/batch/{job['id']}"
+    finished = job["status"] in (COMPLETED, FAILED)
+    return {
+        "job_id": job["id"],
+        "status": job["status"],
+        "format": job["format"],
+        "total": job["total"],
+        "completed": counts.get(DONE, 0),
+        "failed": counts.get(FAILED, 0),
+        "pending": counts.get(PENDING, 0),
+        "created_at": job["created_at"],
+        "finished_at": job["finished_at"],
+        "callback_status": job["callback_status"],
+        "archive_url": f"{base}/archive" if finished and counts.get(DONE, 0) else None,
+        "items": [
+            {
+                "index": item["idx"],
+                "reference": item["reference"],
+                "status": item["status"],
+                "url": f"{base}/items/{item['idx']}" if item["status"] == DONE else None,
+                "bytes": item["bytes"],
+                "error": item["error"]
+            }
+            for item in store.get_items(job["id"])
+        ]
+    }
+
+
+# Global worker instance
+_batch_worker: Optional[BatchWorker] = None
+
+
+async def start_batch_worker(app, config: Dict[str, Any]) -> BatchWorker:
+    """Create and start the global batch worker from the `batch` config section"""
+    global _batch_worker
+    settings = config.get("batch", {})
+    store = BatchStore(settings.get("db_path", "./batch/jobs.db"))
+    _batch_worker = BatchWorker(app, store, settings.get("artifact_dir", "./batch/artifacts"))
+    await _batch_worker.start()
+    return _batch_worker
+
+
+def get_batch_worker() -> BatchWorker:
+    if _batch_worker is None:
+        raise HTTPException(status_code=503, detail="Batch processing not available")
+    return _batch_worker
+
+
+def _owned_job(request: Request, job_id: str) -> Dict[str, Any]:
+    """Job row if it exists and belongs to the requesting tenant (404 otherwise)"""
+    job = get_batch_worker().store.get_job(job_id)
+    tenant_id = getattr(request.state, "tenant_id", None)
+    if job is None or job["tenant_id"] != (str(tenant_id) if tenant_id else None):
+        raise HTTPException(status_code=404, detail="Batch job not found")
+    return job
+
+
+# ============================================================================
+# API Endpoints
+# ============================================================================
+
+@router.post("/batch", status_code=202)
+async def submit_batch(request: Request, payload: BatchRequest):
+    """
+    Submit a batch synthesis job.
+
+    Items run in the background at bulk priority. Poll the returned
+    status_url, or pass callback_url to be notified when the job finishes.
+    """
+    worker = get_batch_worker()
+
+    if not payload.items:
+        raise HTTPException(status_code=400, detail="Batch has no items")
+    if len(payload.items) > MAX_BATCH_ITEMS:
+        raise HTTPException(status_code=400, detail=f"Too many items (max {MAX_BATCH_ITEMS})")
+    if payload.format not in MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {payload.format}")
+    if payload.format in COMPRESSED_MEDIA_TYPES:
+        if payload.format.startswith("opus") and not OPUS_AVAILABLE:
+            raise HTTPException(status_code=400, detail="Opus encoding not available")
+        try:
+            resolve_bitrate(payload.format, payload.bitrate)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    # Resolve every voice now: access is checked with the submitter's
+    # credentials and the job does not depend on the catalog later
+    voices = {}
+    for voice_id in {item.voice_id or payload.voice_id for item in payload.items}:
+        if voice_id is None:
+            raise HTTPException(status_code=400, detail="Item without voice_id and no default voice_id")
+        try:
+            voice = await lookup_voice(request, voice_id)
+        except Exception as e:
+            logger.error(f"Database error getting voice: {e}")
+            raise HTTPException(status_code=503, detail="Database error")
+        if not voice:
+            raise HTTPException(status_code=404, detail=f"Voice not found or access denied: {voice_id}")
+        voices[voice_id] = voice
+
+    # Track text length for usage metering
+    request.state.text_length = sum(len(item.text) for item in payload.items)
+
+    job_id = str(uuid.uuid4())
+    tenant_id = getattr(request.state, "tenant_id", None)
+    worker.store.create_job(job_id, str(tenant_id) if tenant_id else None, payload, voices)
+    worker.submit(job_id)
+    logger.info(f"Batch job {job_id} queued: {len(payload.items)} items, format={payload.format}")
+
+    return {
+        "job_id": job_id,
+        "status": QUEUED,
+        "total": len(payload.items),
+        "status_url": f"/v1/batch/{job_id}"
+    }
+
+
+@router.get("/batch/{job_id}")
+async def get_batch_status(request: Request, job_id: str):
+    """Job status with per-item progress and artifact URLs"""
+    job = _owned_job(request, job_id)
+    return job_status(get_batch_worker().store, job)
+
+
+@router.get("/batch/{job_id}/items/{index}")
+async def get_batch_item(request: Request, job_id: str, index: int):
+    """Audio for one finished item"""
+    job = _owned_job(request, job_id)
+    worker = get_batch_worker()
+    item = next((item for item in worker.store.get_items(job_id) if item["idx"] == index), None)
+    if item is None:
+        raise HTTPException(status_code=404, detail="Item not found")
+    if item["status"] != DONE:
+        raise HTTPException(status_code=409, detail=f"Item is {item['status']}")
+
+    return FileResponse(
+        worker.artifact_dir / job_id / item["artifact"],
+        media_type=MEDIA_TYPES.get(job["format"], "application/octet-stream"),
+        filename=f"{job_id[:8]}_{item['artifact']}"
+    )
+
+
+@router.get("/batch/{job_id}/archive")
+async def get_batch_archive(request: Request, job_id: str):
+    """Zip of every finished item (built once, after the job completes)"""
+    job = _owned_job(request, job_id)
+    if job["status"] not in (COMPLETED, FAILED):
+        raise HTTPException(status_code=409, detail=f"Job is {job['status']}")
+
+    worker = get_batch_worker()
+    items = [item for item in worker.store.get_items(job_id) if item["status"] == DONE]
+    if not items:
+        raise HTTPException(status_code=404, detail="Job produced no audio")
+
+    job_dir = worker.artifact_dir / job_id
+    archive = job_dir / "archive.zip"
+    if not archive.exists():
+        def build():
+            partial = archive.with_suffix(".tmp")
+            # Audio is already compressed or PCM: store without deflate
+            with zipfile.ZipFile(partial, "w", compression=zipfile.ZIP_STORED) as zf:
+                for item in items:
+                    zf.write(job_dir / item["artifact"], arcname=item["artifact"])
+                zf.writestr("manifest.json", json.dumps(job_status(worker.store, job), indent=2))
+            partial.replace(archive)
+        await asyncio.to_thread(build)
+
+    return FileResponse(archive, media_type="application/zip", filename=f"batch_{job_id[:8]}.zip")
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Bulk Synthesis CLI
+==================
+Renders thousands of (text, voice, params) rows to WAV files in parallel.
+
+`generate_demo.py` renders scenarios one after another and builds a new
+engine for each. This tool instead:
+
+- reads rows from CSV (header row) or JSONL: `text` and `voice` columns,
+  optional `id`, `speed`, `pitch`, `temperature`, `exaggeration`,
+  `cfg_weight` (anything else is carried into the manifest untouched)
+- groups rows by voice and hands them to a process pool in chunks; each
+  worker process keeps one engine per voice for its whole life, and runs
+  its math libraries single-threaded so N workers use N cores cleanly
+- names each output by a hash of engine + voice + text + params, so a
+  re-run skips rows already rendered (resume after a crash or Ctrl-C just
+  by running the same command again), and identical rows are rendered
+  once and share the file
+- appends one manifest line per row (file, audio seconds, synthesis
+  seconds, real-time factor, or the error) to manifest.jsonl
+
+Usage:
+    python scripts/bulk_synthesize.py reminders.csv --out bulk_outputs
+    python scripts/bulk_synthesize.py rows.jsonl --engine chatterbox --device cuda --workers 1
+    python scripts/bulk_synthesize.py reminders.csv --workers 8 --chunk-size 32
+    TTS_FAKE_RTF=0.1 python scripts/bulk_synthesize.py reminders.csv --engine fake
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import hashlib
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 24000
+PARAM_COLUMNS = ("speed", "pitch", "temperature", "exaggeration", "cfg_weight")
+
+
+# ============================================================================
+# Engines (one per voice per worker process)
+# ============================================================================
+
+_models: Dict[tuple, Any] = {}
+
+
+def _engine_factory(name: str) -> Callable[[str, str], Callable]:
+    """Per-voice synthesize(text, params) over one shared tts_engines engine per process"""
+    def factory(voice: str, device: str):
+        from tts_engines import load_engine
+        if (name, device) not in _models:
+            _models[(name, device)] = load_engine(name, device=device)
+        engine = _models[(name, device)]
+        # Chatterbox "voices" are reference clips; Kokoro/fake take a voice name
+        target = {"reference_audio": voice} if engine.capabilities.cloning and Path(voice).exists() else {"voice": voice}
+        return lambda text, params: engine.generate(text, **target, **params)
+    return factory
+
+
+ENGINE_FACTORIES: Dict[str, Callable[[str, str], Callable]] = {
+    "kokoro": _engine_factory("kokoro"),
+    "chatterbox": _engine_factory("chatterbox"),
+    "fake": _engine_factory("fake"),
+}
+
+_engines: Dict[tuple, Callable] = {}
+
+
+def _init_worker(threads: int):
+    """Pin each worker's math libraries to `threads` threads (avoid N x cores oversubscription)"""
+    for variable in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ[variable] = str(threads)
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+
+def _get_engine(engine: str, voice: str, device: str) -> Callable:
+    key = (engine, voice, device)
+    if key not in _engines:
+        start = time.perf_counter()
+        _engines[key] = ENGINE_FACTORIES[engine](voice, device)
+        logger.info(f"[pid {os.getpid()}] Loaded {engine} engine for {voice} in {time.perf_counter() - start:.1f}s")
+    return _engines[key]
+
+
+# ============================================================================
+# Rows
+# ============================================================================
+
+def read_rows(path: Path) -> List[Dict[str, Any]]:
+    """Load rows from .csv (header row) or .jsonl; numeric param columns are parsed"""
+    if path.suffix.lower() in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+    else:
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+    for number, row in enumerate(rows):
+        row["_row"] = number
+        for name in PARAM_COLUMNS:
+            if row.get(name) in ("", None):
+                row.pop(name, None)
+            elif name in row:
+                row[name] = float(row[name])
+    return rows
+
+
+def row_params(row: Dict[str, Any]) -> Dict[str, float]:
+    return {name: row[name] for name in PARAM_COLUMNS if name in row}
+
+
+def output_name(engine: str, voice: str, text: str, params: Dict[str, Any]) -> str:
+    """Content-hash file name: identical inputs map to the same file"""
+    canonical = json.dumps({"engine": engine, "voice": voice, "text": text, "params": params}, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:20] + ".wav"
+
+
+# ============================================================================
+# Work
+# ============================================================================
+
+def synthesize_chunk(engine: str, voice: str, device: str, rows: List[Dict[str, Any]], out_dir: str) -> List[Dict[str, Any]]:
+    """Worker: render rows sharing one voice; returns manifest entries"""
+    from audio_encoding import encode_wav
+
+    synthesize = _get_engine(engine, voice, device)
+    results = []
+    for row in rows:
+        params = row_params(row)
+        path = Path(out_dir) / output_name(engine, voice, row["text"], params)
+        entry = {"row": row["_row"], "id": row.get("id"), "voice": voice, "file": path.name, "chars": len(row["text"])}
+
+        start = time.perf_counter()
+        try:
+            wav = synthesize(row["text"], params)
+            synth_seconds = time.perf_counter() - start
+            audio_seconds = len(wav) / SAMPLE_RATE
+            data = encode_wav(wav, SAMPLE_RATE)
+
+            # Unique temp file: a crashed or concurrent writer never leaves a half-written .wav
+            fd, partial = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(partial, path)
+            except BaseException:
+                os.unlink(partial)
+                raise
+
+            entry.update(
+                status="ok",
+                audio_seconds=round(audio_seconds, 3),
+                synth_seconds=round(synth_seconds, 3),
+                rtf=round(synth_seconds / audio_seconds, 4) if audio_seconds else None
+            )
+        except Exception as e:
+            entry.update(status="error", error=str(e))
+        results.append(entry)
+    return results
+
+
+def plan_chunks(rows: Iterable[Dict[str, Any]], chunk_size: int) -> List[tuple]:
+    """Group rows by voice, then split into chunks (one pool task each)"""
+    by_voice: Dict[str, List[Dict[str, Any]]] = {}
+    for row in rows:
+        by_voice.setdefault(row["voice"], []).append(row)
+    return [
+        (voice, voice_rows[i:i + chunk_size])
+        for voice, voice_rows in by_voice.items()
+        for i in range(0, len(voice_rows), chunk_size)
+    ]
+
+
+def run_bulk(
+    rows: List[Dict[str, Any]],
+    out_dir: Path,
+    engine: str = "kokoro",
+    device: str = "cpu",
+    workers: Optional[int] = None,
+    chunk_size: int = 16,
+    default_voice: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Render all rows not already present in out_dir.
+
+    Returns:
+        Summary (rendered, skipped, failed, wall and audio seconds)
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / "manifest.jsonl"
+    workers = workers or os.cpu_count() or 1
+    threads = max(1, (os.cpu_count() or 1) // workers)
+
+    todo, skipped = [], 0
+    duplicates: Dict[str, List[Dict[str, Any]]] = {}  # Output name -> identical rows after the first
+    with open(manifest_path, "a", encoding="utf-8") as manifest:
+        for row in rows:
+            row["voice"] = row.get("voice") or default_voice
+            if not row.get("text") or not row["voice"]:
+                manifest.write(json.dumps({"row": row["_row"], "id": row.get("id"), "status": "error",
+                                           "error": "missing text or voice"}) + "\n")
+                continue
+            name = output_name(engine, row["voice"], row["text"], row_params(row))
+            if (out_dir / name).exists():
+                skipped += 1
+            elif name in duplicates:
+                duplicates[name].append(row)
+            else:
+                duplicates[name] = []
+                todo.append(row)
+
+    chunks = plan_chunks(todo, chunk_size)
+    repeated = sum(len(copies) for copies in duplicates.values())
+    logger.info(
+        f"{len(rows)} rows: {skipped} already rendered, {len(todo)} to render ({repeated} duplicates share them) "
+        f"in {len(chunks)} chunks on {workers} workers ({threads} thread(s) each)"
+    )
+
+    start = time.perf_counter()
+    rendered = failed = 0
+    audio_seconds = 0.0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(threads,)) as pool, \
+            open(manifest_path, "a", encoding="utf-8") as manifest:
+        futures = [pool.submit(synthesize_chunk, engine, voice, device, chunk, str(out_dir)) for voice, chunk in chunks]
+        for future in as_completed(futures):
+            for first in future.result():
+                copies = [{**first, "row": row["_row"], "id": row.get("id")} for row in duplicates[first["file"]]]
+                for entry in (first, *copies):
+                    manifest.write(json.dumps(entry) + "\n")
+                    if entry["status"] == "ok":
+                        rendered += 1
+                        audio_seconds += entry["audio_seconds"]
+                    else:
+                        failed += 1
+                        logger.warning(f"⚠ Row {entry['row']} failed: {entry['error']}")
+            manifest.flush()
+            done = rendered + failed
+            logger.info(f"Progress: {done}/{len(todo) + repeated} ({done / max(time.perf_counter() - start, 1e-9):.1f} rows/s)")
+
+    wall = time.perf_counter() - start
+    return {
+        "rows": len(rows),
+        "rendered": rendered,
+        "skipped": skipped,
+        "failed": failed,
+        "wall_seconds": round(wall, 2),
+        "audio_seconds": round(audio_seconds, 2),
+        "throughput_rtf": round(wall / audio_seconds, 4) if audio_seconds else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel, resumable bulk TTS synthesis")
+    parser.add_argument("input", type=Path, help="CSV (with header) or JSONL rows")
+    parser.add_argument("--out", type=Path, default=Path("bulk_outputs"))
+    parser.add_argument("--engine", choices=sorted(ENGINE_FACTORIES), default="kokoro")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--voice", help="Default voice for rows without one")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int, default=16, help="Rows per pool task")
+    args = parser.parse_args()
+
+    rows = read_rows(args.input)
+    summary = run_bulk(rows, args.out, args.engine, args.device, args.workers, args.chunk_size, args.voice)
+
+    print("=" * 80)
+    print(f"✓ Rendered {summary['rendered']}, skipped {summary['skipped']} existing, failed {summary['failed']}")
+    print(f"  Wall time: {summary['wall_seconds']:.1f}s for {summary['audio_seconds']:.1f}s of audio "
+          f"(throughput RTF {summary['throughput_rtf']})")
+    print(f"  Manifest: {args.out / 'manifest.jsonl'}")
+    print("=" * 80)
+    sys.exit(1 if summary["failed"] else 0)
+
+
+if __name__ == "__main__":
+    main()
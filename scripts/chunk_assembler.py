@@ -0,0 +1,207 @@
+"""
+Chunk Assembler
+===============
+Stitches per-sentence synthesis output into one continuous signal.
+
+Long texts are synthesized chunk by chunk. Joining the pieces with
+`np.concatenate(list)` keeps every chunk alive plus a full-size copy (2x
+peak memory), and hard joins click where one chunk's last sample meets the
+next one's first. The assembler instead:
+
+- writes into a single preallocated float32 array sized from an up-front
+  length estimate, growing geometrically only if the estimate was short
+  (buffered mode), or holds back just the crossfade tail (streaming mode)
+- trims near-silence at internal boundaries down to a natural pause, so
+  per-chunk lead-in/lead-out silence does not pile up between sentences
+- joins chunks with a short equal-power (sin/cos) crossfade
+
+Usage (buffered):
+    assembler = ChunkAssembler(sample_rate, expected_samples=estimate_samples(text, sample_rate))
+    for wav in chunk_outputs:
+        assembler.add(wav)
+    audio = assembler.result()
+
+Usage (streaming):
+    assembler = ChunkAssembler(sample_rate, streaming=True)
+    for wav in chunk_outputs:
+        yield assembler.add(wav)
+    yield assembler.finish()
+
+A chunk synthesized as a stream of blocks goes in as `add(first_block,
+partial=True)` followed by `extend(block)` for the rest.
+"""
+
+import logging
+from typing import Optional
+
+import numpy as np
+
+from audio_encoding import as_mono_float32
+from silence_trim import leading_silence, trailing_silence, SILENCE_THRESHOLD_DB, SILENCE_FRAME_MS
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CROSSFADE_MS = 10.0
+DEFAULT_PAUSE_MS = 120.0          # Silence kept on each side of an internal boundary
+
+# Typical speaking rate used to size the output buffer (characters per second)
+CHARS_PER_SECOND = 14.0
+ESTIMATE_MARGIN = 1.25
+
+
+def estimate_samples(text: str, sample_rate: int = 24000, speed: float = 1.0) -> int:
+    """
+    Estimate the synthesized length of text, with headroom.
+
+    `speed` follows the API semantics (output duration scales with speed,
+    see `time_stretch` call sites).
+    """
+    seconds = len(text) / CHARS_PER_SECOND * speed * ESTIMATE_MARGIN
+    return int(seconds * sample_rate) + sample_rate // 2
+
+
+class ChunkAssembler:
+    """
+    Joins synthesized chunks with boundary trimming and equal-power crossfades.
+
+    In buffered mode `add` returns nothing and `result` returns a view of
+    the assembled audio. In streaming mode `add` returns the samples that
+    are final (everything except the held-back crossfade tail) and
+    `finish` returns the tail.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 24000,
+        expected_samples: Optional[int] = None,
+        streaming: bool = False,
+        crossfade_ms: float = DEFAULT_CROSSFADE_MS,
+        pause_ms: Optional[float] = DEFAULT_PAUSE_MS,
+        threshold_db: float = SILENCE_THRESHOLD_DB
+    ):
+        self.sample_rate = sample_rate
+        self.streaming = streaming
+        self.crossfade = int(sample_rate * crossfade_ms / 1000)
+        self.pause = None if pause_ms is None else int(sample_rate * pause_ms / 1000)
+        self.threshold_db = threshold_db
+        self.frame = max(1, int(sample_rate * SILENCE_FRAME_MS / 1000))
+
+        self._fades = {}
+
+        # Buffered mode: one growing output array
+        self._buffer = np.empty(0 if streaming else (expected_samples or sample_rate * 10), dtype=np.float32)
+        self._length = 0
+        self.reallocations = 0
+
+        # Streaming mode: only the tail awaiting the next crossfade
+        self._tail = np.empty(0, dtype=np.float32)
+
+        self.chunks = 0
+        self.trimmed_samples = 0
+
+    def _fade(self, length: int):
+        """Equal-power (sin/cos) fade-in and fade-out curves of a given length"""
+        fades = self._fades.get(length)
+        if fades is None:
+            theta = (np.arange(length, dtype=np.float32) + 0.5) * (np.pi / 2 / length)
+            fades = self._fades[length] = (np.sin(theta), np.cos(theta))
+        return fades
+
+    def _trim_boundaries(self, wav: np.ndarray, tail: bool = True) -> np.ndarray:
+        """Trim internal-boundary silence down to `pause` samples per side"""
+        if self.pause is None:
+            return wav
+
+        # Head: only for chunks after the first (the request's own start is left alone)
+        if self.chunks > 0:
+            head = leading_silence(wav, self.frame, self.threshold_db) - self.pause
+            if head > 0:
+                wav = wav[head:]
+                self.trimmed_samples += head
+
+        # Tail: any chunk may be followed by another, so the last chunk's
+        # trailing silence is capped the same way
+        if tail:
+            excess = trailing_silence(wav, self.frame, self.threshold_db) - self.pause
+            if excess > 0:
+                wav = wav[:len(wav) - excess]
+                self.trimmed_samples += excess
+
+        return wav
+
+    def _ensure_capacity(self, needed: int):
+        if needed <= len(self._buffer):
+            return
+        capacity = max(needed, int(len(self._buffer) * 1.5))
+        grown = np.empty(capacity, dtype=np.float32)
+        grown[:self._length] = self._buffer[:self._length]
+        self._buffer = grown
+        self.reallocations += 1
+        logger.debug(f"Chunk assembler grew to {capacity} samples (estimate was short)")
+
+    def add(self, wav, partial: bool = False) -> Optional[np.ndarray]:
+        """
+        Append one chunk of synthesized audio.
+
+        Args:
+            wav: Chunk audio
+            partial: The chunk's first block, with more to follow via
+                `extend` (its trailing silence is not a boundary)
+
+        Returns:
+            Streaming mode: newly final samples. Buffered mode: None.
+        """
+        wav = self._trim_boundaries(as_mono_float32(wav), tail=not partial)
+        first = self.chunks == 0
+        self.chunks += 1
+        return self._append(wav, crossfade=not first)
+
+    def extend(self, wav) -> Optional[np.ndarray]:
+        """
+        Append a later block of the current chunk (streamed synthesis):
+        contiguous audio, so no boundary trimming and no crossfade.
+        """
+        return self._append(as_mono_float32(wav), crossfade=False)
+
+    def _append(self, wav: np.ndarray, crossfade: bool) -> Optional[np.ndarray]:
+        if self.streaming:
+            return self._add_streaming(wav, crossfade)
+
+        self._ensure_capacity(self._length + len(wav))
+        overlap = min(self.crossfade, self._length, len(wav)) if crossfade else 0
+        if overlap:
+            fade_in, fade_out = self._fade(overlap)
+            region = self._buffer[self._length - overlap:self._length]
+            region *= fade_out
+            region += wav[:overlap] * fade_in
+        self._buffer[self._length:self._length + len(wav) - overlap] = wav[overlap:]
+        self._length += len(wav) - overlap
+        return None
+
+    def _add_streaming(self, wav: np.ndarray, crossfade: bool) -> np.ndarray:
+        overlap = min(self.crossfade, len(self._tail), len(wav)) if crossfade else 0
+        if overlap:
+            fade_in, fade_out = self._fade(overlap)
+            mixed = self._tail[len(self._tail) - overlap:] * fade_out
+            mixed += wav[:overlap] * fade_in
+            combined = np.concatenate((self._tail[:len(self._tail) - overlap], mixed, wav[overlap:]))
+        else:
+            combined = np.concatenate((self._tail, wav)) if len(self._tail) else wav
+
+        # Hold back what the next chunk's crossfade will overlap
+        keep = min(self.crossfade, len(combined))
+        self._tail = combined[len(combined) - keep:].copy()
+        return combined[:len(combined) - keep]
+
+    def finish(self) -> np.ndarray:
+        """Streaming mode: return the held-back tail (end of stream)"""
+        tail, self._tail = self._tail, np.empty(0, dtype=np.float32)
+        return tail
+
+    def result(self) -> np.ndarray:
+        """Buffered mode: the assembled audio (a view into the output buffer)"""
+        return self._buffer[:self._length]
+
+    @property
+    def trimmed_ms(self) -> float:
+        return self.trimmed_samples * 1000 / self.sample_rate
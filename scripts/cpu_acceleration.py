@@ -0,0 +1,224 @@
+"""
+CPU Acceleration
+================
+Opt-in faster CPU inference for Chatterbox (CPU_ACCELERATION=1).
+
+1. Threads: torch intra-op threads are set to the CPUs the container may
+   actually use (cgroup CPU quota and affinity), not the host's core count.
+   Oversubscribing a 4-CPU quota on a 64-core host throttles badly.
+2. Dynamic int8 quantization of the nn.Linear layers in the text-to-token
+   model (t3) and the vocoder stage (s3gen): weights stored as int8,
+   activations quantized on the fly.
+3. Quality guard: a fixed test set is synthesized with the fp32 and int8
+   models (same seeds). Sampling diverges once logits change, so outputs
+   are compared by duration ratio and long-term log-mel spectrum distance
+   rather than sample by sample. If the guard fails, fp32 is kept.
+
+RTF (synthesis seconds / audio seconds) is measured before and after and
+returned in the report (exposed on /health as "acceleration").
+
+Usage:
+    report = accelerate_cpu(chatterbox_model)
+"""
+
+import os
+import math
+import time
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 24000
+
+QUALITY_TEST_SET = [
+    "Hello! How can I help you today?",
+    "This is a friendly reminder from CallWaiting Services. Your appointment is tomorrow at three P M.",
+    "Your payment of two hundred and fifty dollars has been successfully processed. Thank you!",
+]
+QUALITY_SEED = 1234
+MAX_SPECTRAL_DISTANCE_DB = 3.0   # Mean |difference| of long-term log-mel spectra
+MAX_DURATION_RATIO = 1.3         # Longer / shorter clip
+
+
+# ============================================================================
+# Threads
+# ============================================================================
+
+def cgroup_cpu_limit(root: str = "/sys/fs/cgroup") -> Optional[float]:
+    """CPU quota of this container in CPUs (cgroup v2 cpu.max or v1 cfs), None if unlimited"""
+    root = Path(root)
+    try:
+        quota, period = (root / "cpu.max").read_text().split()[:2]
+        return None if quota == "max" else int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        quota = int((root / "cpu" / "cpu.cfs_quota_us").read_text())
+        period = int((root / "cpu" / "cpu.cfs_period_us").read_text())
+        return None if quota <= 0 else quota / period
+    except (OSError, ValueError):
+        return None
+
+
+def effective_cpus(cgroup_root: str = "/sys/fs/cgroup") -> int:
+    """CPUs this process can really use: affinity, capped by the cgroup quota"""
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    limit = cgroup_cpu_limit(cgroup_root)
+    if limit is not None:
+        cpus = min(cpus, max(1, math.floor(limit)))
+    return cpus
+
+
+def tune_threads(cpus: Optional[int] = None) -> Dict[str, int]:
+    """Set torch intra-op threads to the usable CPUs and keep inter-op small"""
+    import torch
+
+    cpus = cpus or effective_cpus()
+    interop = 1 if cpus <= 4 else 2
+    torch.set_num_threads(cpus)
+    try:
+        torch.set_interop_threads(interop)
+    except RuntimeError:
+        # Only settable before the first parallel op; keep whatever is active
+        interop = torch.get_num_interop_threads()
+    logger.info(f"✓ CPU threads: intra-op={cpus}, inter-op={interop}")
+    return {"intra_op_threads": cpus, "inter_op_threads": interop}
+
+
+# ============================================================================
+# Quantization
+# ============================================================================
+
+def linear_layers(module) -> int:
+    import torch
+    return sum(1 for m in module.modules() if isinstance(m, torch.nn.Linear))
+
+
+def quantize_linear(module):
+    """Dynamic int8 quantization of every nn.Linear in `module` (returns a new module)"""
+    import torch
+    return torch.ao.quantization.quantize_dynamic(module, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+# ============================================================================
+# Measurement
+# ============================================================================
+
+def log_mel_profile(wav: np.ndarray, sr: int = SAMPLE_RATE, n_fft: int = 1024, n_mels: int = 64) -> np.ndarray:
+    """Long-term log-mel spectrum (dB per mel band, averaged over voiced frames)"""
+    wav = np.asarray(wav, dtype=np.float32).reshape(-1)
+    if len(wav) < n_fft:
+        wav = np.pad(wav, (0, n_fft - len(wav)))
+    hop = n_fft // 4
+    frames = np.lib.stride_tricks.sliding_window_view(wav, n_fft)[::hop] * np.hanning(n_fft)
+    power = np.abs(np.fft.rfft(frames, axis=1)) ** 2
+
+    # Triangular mel filterbank
+    mel = lambda f: 2595 * np.log10(1 + f / 700)  # noqa: E731
+    hz = lambda m: 700 * (10 ** (m / 2595) - 1)  # noqa: E731
+    edges = hz(np.linspace(mel(50), mel(sr / 2), n_mels + 2))
+    bins = np.fft.rfftfreq(n_fft, 1 / sr)
+    filters = np.maximum(0, np.minimum(
+        (bins[None, :] - edges[:-2, None]) / (edges[1:-1, None] - edges[:-2, None]),
+        (edges[2:, None] - bins[None, :]) / (edges[2:, None] - edges[1:-1, None])
+    ))
+    mel_power = power @ filters.T
+
+    energy = mel_power.sum(axis=1)
+    voiced = energy > energy.max() * 1e-3 if energy.max() > 0 else np.ones_like(energy, dtype=bool)
+    return 10 * np.log10(mel_power[voiced].mean(axis=0) + 1e-10)
+
+
+def compare_outputs(reference: np.ndarray, candidate: np.ndarray, sr: int = SAMPLE_RATE) -> Dict[str, float]:
+    """Duration ratio and long-term spectral distance between two renderings"""
+    longer, shorter = max(len(reference), len(candidate)), max(1, min(len(reference), len(candidate)))
+    distance = float(np.mean(np.abs(log_mel_profile(reference, sr) - log_mel_profile(candidate, sr))))
+    return {"duration_ratio": round(longer / shorter, 3), "spectral_distance_db": round(distance, 2)}
+
+
+def _synthesize(model, text: str, seed: int) -> np.ndarray:
+    import torch
+    torch.manual_seed(seed)
+    wav = model.generate(text)
+    if hasattr(wav, "detach"):
+        wav = wav.detach().cpu().numpy()
+    return np.asarray(wav, dtype=np.float32).reshape(-1)
+
+
+def render_test_set(model, texts: List[str], seed: int = QUALITY_SEED) -> Dict[str, Any]:
+    """Synthesize the test set; returns outputs and overall RTF"""
+    outputs, synth_seconds = [], 0.0
+    for index, text in enumerate(texts):
+        start = time.perf_counter()
+        outputs.append(_synthesize(model, text, seed + index))
+        synth_seconds += time.perf_counter() - start
+    audio_seconds = sum(len(wav) for wav in outputs) / SAMPLE_RATE
+    return {"outputs": outputs, "rtf": round(synth_seconds / audio_seconds, 3) if audio_seconds else None}
+
+
+def quality_guard(
+    reference: List[np.ndarray],
+    candidate: List[np.ndarray],
+    max_spectral_db: float = MAX_SPECTRAL_DISTANCE_DB,
+    max_duration_ratio: float = MAX_DURATION_RATIO
+) -> Dict[str, Any]:
+    """Pass if every test sentence stays within the duration and spectral limits"""
+    results = [compare_outputs(ref, cand) for ref, cand in zip(reference, candidate)]
+    passed = all(
+        r["duration_ratio"] <= max_duration_ratio and r["spectral_distance_db"] <= max_spectral_db
+        for r in results
+    )
+    return {"passed": passed, "sentences": results}
+
+
+# ============================================================================
+# Entry point
+# ============================================================================
+
+def accelerate_cpu(model, texts: Optional[List[str]] = None, guard: bool = True) -> Dict[str, Any]:
+    """
+    Tune threads, quantize t3 and s3gen to int8, and keep the result only if
+    the quality guard passes. Modifies `model` in place.
+
+    Returns:
+        Report: threads, fp32/int8 RTF, speedup, guard results, applied
+    """
+    texts = texts or QUALITY_TEST_SET
+    report: Dict[str, Any] = {"threads": tune_threads(), "applied": False}
+
+    baseline = render_test_set(model, texts)
+    report["fp32_rtf"] = baseline["rtf"]
+
+    original = {"t3": model.t3, "s3gen": model.s3gen}
+    report["quantized_linear_layers"] = sum(linear_layers(module) for module in original.values())
+    try:
+        model.t3 = quantize_linear(model.t3)
+        model.s3gen = quantize_linear(model.s3gen)
+        accelerated = render_test_set(model, texts)
+    except Exception as e:
+        model.t3, model.s3gen = original["t3"], original["s3gen"]
+        report["error"] = str(e)
+        logger.warning(f"⚠ int8 quantization failed, keeping fp32: {e}")
+        return report
+
+    report["int8_rtf"] = accelerated["rtf"]
+    report["speedup"] = round(baseline["rtf"] / accelerated["rtf"], 2) if accelerated["rtf"] else None
+    report["quality"] = quality_guard(baseline["outputs"], accelerated["outputs"]) if guard else None
+
+    if guard and not report["quality"]["passed"]:
+        model.t3, model.s3gen = original["t3"], original["s3gen"]
+        logger.warning(f"⚠ int8 quality guard failed, keeping fp32: {report['quality']['sentences']}")
+    else:
+        report["applied"] = True
+        logger.info(
+            f"✓ CPU acceleration: RTF {report['fp32_rtf']} -> {report['int8_rtf']} "
+            f"({report['speedup']}x, {report['quantized_linear_layers']} linear layers int8)"
+        )
+    return report
@@ -0,0 +1,177 @@
+"""
+Engine Fallback
+===============
+Routes requests from a backed-up Chatterbox queue to Kokoro.
+
+A caller on a live phone line is better served by a fast stock voice than
+by a timeout. Each request may carry a latency budget (time to first
+audio, default `fallback.budget_ms`). When the admission controller
+predicts the request would not get its first audio within the budget
+(queue wait, see admission.py, plus `fallback.first_audio_ms` for the
+model's own first audio, capped at the average whole-call service time),
+and the voice has a fallback mapping, the request is synthesized by the
+fallback engine instead, with the mapped voice. A slow model on an idle
+queue is not a backed-up queue, so it never degrades requests by itself:
+
+    fallback:
+      voices:
+        maya-professional: af_heart
+
+Fallback responses are marked degraded (X-Degraded, X-Engine) and counted
+in tts_engine_fallback_total. Kokoro runs on CPU outside the Chatterbox
+admission slots, so degraded requests do not add to the queue they avoid.
+
+Usage:
+    router = get_fallback_router(config)
+    decision = router.decide(voice_slug, budget_ms, get_admission_controller())
+    if decision.degraded:
+        wav = await asyncio.to_thread(decision.engine.generate, text, voice=decision.voice)
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from tts_engines import TTSEngine, KokoroEngine, get_engine_registry
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_ENGINE = "kokoro"
+
+
+@dataclass
+class FallbackDecision:
+    """Which engine serves a request, and why"""
+    degraded: bool
+    reason: str                          # "budget" when degraded; else why not
+    predicted_ms: float = 0.0
+    budget_ms: Optional[float] = None
+    engine: Optional[TTSEngine] = None   # Fallback engine when degraded
+    voice: Optional[str] = None          # Fallback engine's voice when degraded
+
+    def headers(self) -> Dict[str, str]:
+        """Response headers marking a degraded response"""
+        if not self.degraded:
+            return {"X-Degraded": "false"}
+        return {
+            "X-Degraded": "true",
+            "X-Engine": self.engine.name,
+            "X-Fallback-Voice": self.voice,
+            "X-Predicted-Latency-MS": str(int(self.predicted_ms))
+        }
+
+
+class FallbackRouter:
+    """Decides per request whether to leave the primary engine's queue"""
+
+    def __init__(
+        self,
+        voices: Optional[Dict[str, str]] = None,
+        budget_ms: Optional[float] = None,
+        enabled: bool = True,
+        engine_name: str = FALLBACK_ENGINE,
+        first_audio_ms: float = 0.0
+    ):
+        self.voices = dict(voices or {})
+        self.budget_ms = budget_ms
+        self.enabled = enabled
+        self.engine_name = engine_name
+        self.first_audio_ms = first_audio_ms
+
+        # Stats
+        self.decisions = 0
+        self.degraded = 0
+
+    def fallback_voice(self, voice_keys: Iterable[Optional[str]]) -> Optional[str]:
+        """Mapped fallback voice for the first key (slug, ID) that has one"""
+        for key in voice_keys:
+            if key is not None and str(key) in self.voices:
+                return self.voices[str(key)]
+        return None
+
+    def decide(self, voice_keys, budget_ms: Optional[float], admission) -> FallbackDecision:
+        """
+        Route one request.
+
+        Args:
+            voice_keys: Voice slug, or an iterable of identifiers (slug, ID)
+            budget_ms: Request's latency budget (None: the configured default)
+            admission: AdmissionController of the primary engine
+        """
+        self.decisions += 1
+        if isinstance(voice_keys, str):
+            voice_keys = (voice_keys,)
+        budget_ms = budget_ms if budget_ms is not None else self.budget_ms
+        # Time to first audio: the queue wait plus the model's own first audio (never more than a whole call)
+        predicted_ms = 1000 * (admission.predicted_wait + min(self.first_audio_ms / 1000, admission.service_ewma))
+
+        def primary(reason: str) -> FallbackDecision:
+            return FallbackDecision(False, reason, predicted_ms, budget_ms)
+
+        if not self.enabled:
+            return primary("disabled")
+        if budget_ms is None:
+            return primary("no_budget")
+        if predicted_ms <= budget_ms:
+            return primary("within_budget")
+        voice = self.fallback_voice(voice_keys)
+        if voice is None:
+            return primary("no_mapping")
+        registry = get_engine_registry()
+        engine = registry.get(self.engine_name)
+        if engine is None or registry.default == self.engine_name:
+            return primary("unavailable")
+
+        self.degraded += 1
+        logger.warning(
+            f"⚠ Degrading to {self.engine_name}:{voice} "
+            f"(predicted {predicted_ms:.0f}ms > budget {budget_ms:.0f}ms)"
+        )
+        return FallbackDecision(True, "budget", predicted_ms, budget_ms, engine, voice)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "engine": self.engine_name,
+            "available": get_engine_registry().get(self.engine_name) is not None,
+            "budget_ms": self.budget_ms,
+            "voices": len(self.voices),
+            "decisions": self.decisions,
+            "degraded": self.degraded
+        }
+
+
+def load_fallback_engine(router: FallbackRouter, device: str = "cpu") -> Optional[TTSEngine]:
+    """
+    Build the fallback engine, load its mapped voices and register it
+    (not as default). Returns None when disabled or unavailable.
+    """
+    if not router.enabled or not router.voices:
+        return None
+    try:
+        engine = KokoroEngine(device=device)
+        engine.preload(set(router.voices.values()))
+    except Exception as e:
+        logger.warning(f"⚠ Fallback engine unavailable, requests stay on the primary engine: {e}")
+        return None
+    get_engine_registry().register(engine, name=router.engine_name)
+    logger.info(f"✓ Fallback engine ready: {router.engine_name} ({len(router.voices)} mapped voices)")
+    return engine
+
+
+# Global router instance
+_fallback_router: Optional[FallbackRouter] = None
+
+
+def get_fallback_router(config: Optional[Dict[str, Any]] = None) -> FallbackRouter:
+    """Get or create the global fallback router from the `fallback` config section"""
+    global _fallback_router
+    if _fallback_router is None:
+        settings = (config or {}).get("fallback", {})
+        _fallback_router = FallbackRouter(
+            voices=settings.get("voices") or {},
+            budget_ms=settings.get("budget_ms"),
+            enabled=settings.get("enabled", False),
+            first_audio_ms=settings.get("first_audio_ms", 0.0)
+        )
+    return _fallback_router
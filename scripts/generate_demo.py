@@ -10,6 +10,8 @@ Scenarios:
 3. Service update (professional, clear)
 4. Technical support greeting (helpful, warm)
 5. Payment confirmation (professional, secure)
+
+For rendering large row sets (CSV/JSONL), use bulk_synthesize.py.
 """
 
 import sys
@@ -130,14 +132,17 @@ We appreciate your understanding and wish you a wonderful holiday!"""
     print()
 
     results = []
+    engines = {}  # One engine per voice, reused across scenarios
 
     for idx, scenario in enumerate(scenarios, 1):
         print(f"[{idx}/{len(scenarios)}] {scenario['name']}")
         print("-" * 80)
 
         try:
-            # Initialize engine
-            engine = KokoroTTSEngine(voice=scenario['voice'])
+            # Initialize engine (once per voice)
+            if scenario['voice'] not in engines:
+                engines[scenario['voice']] = KokoroTTSEngine(voice=scenario['voice'])
+            engine = engines[scenario['voice']]
 
             # Generate audio
             output_file = output_dir / f"{idx}_{scenario['name'].lower().replace(' ', '_')}.wav"
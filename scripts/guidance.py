@@ -0,0 +1,226 @@
+"""
+Guidance Modes
+==============
+Classifier-free guidance (CFG) on or off per synthesis.
+
+With CFG, Chatterbox decodes every speech token twice (a conditional and an
+unconditional row, mixed by `cfg_weight`), so the text-to-token decoder
+runs a batch of two per step. Guidance-free decoding runs a batch of one:
+about 2x decoder throughput for slightly looser adherence to text and
+prosody.
+
+Modes:
+- "cfg": guided decoding with the voice's cfg_weight
+- "none": guidance-free (cfg_weight 0)
+- "auto": the admission controller decides per request (see admission.py)
+
+Precedence: the request's `guidance`, then the voice profile's
+`params.guidance` (a profile with cfg_weight 0 counts as "none"), then auto.
+
+The upstream ChatterboxTTS.generate cannot decode with cfg_weight 0 (T3
+always builds the two-row batch), so `chatterbox_generate_unguided` runs
+the same pipeline with a batch-of-one decode loop. The loop
+(`iter_speech_tokens`) yields tokens as they are sampled, guided or not,
+which streaming_generation.py vocodes window by window.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CFG = "cfg"
+NONE = "none"
+AUTO = "auto"
+MODES = (CFG, NONE, AUTO)
+DEFAULT_CFG_WEIGHT = 0.5  # Guided requests on a voice stored with cfg_weight 0
+
+
+def validate_mode(mode: Optional[str]) -> Optional[str]:
+    """
+    Normalize a requested mode (None passes through).
+
+    Raises:
+        ValueError: Unknown mode
+    """
+    if mode is None:
+        return None
+    mode = mode.lower()
+    if mode not in MODES:
+        raise ValueError(f"Unknown guidance mode: {mode} (expected cfg, none or auto)")
+    return mode
+
+
+def profile_mode(params: Optional[Dict[str, Any]]) -> str:
+    """Guidance mode a voice profile asks for"""
+    params = params or {}
+    if params.get("guidance") in MODES:
+        return params["guidance"]
+    if params.get("cfg_weight") == 0:
+        return NONE
+    return AUTO
+
+
+def apply_mode(params: Dict[str, Any], mode: str) -> Dict[str, Any]:
+    """Generation parameters for a resolved mode ("none": cfg_weight 0, "cfg": a positive cfg_weight)"""
+    params = {name: value for name, value in params.items() if name != "guidance"}
+    if mode == NONE:
+        params["cfg_weight"] = 0.0
+    elif params.get("cfg_weight", DEFAULT_CFG_WEIGHT) <= 0:
+        params["cfg_weight"] = DEFAULT_CFG_WEIGHT
+    return params
+
+
+# ============================================================================
+# Chatterbox guidance-free decode
+# ============================================================================
+
+def iter_speech_tokens(
+    t3,
+    backend,
+    t3_cond,
+    text_tokens,
+    max_new_tokens: int = 1000,
+    temperature: float = 0.8,
+    repetition_penalty: float = 1.2,
+    min_p: float = 0.05,
+    top_p: float = 1.0,
+    cfg_weight: float = 0.0
+):
+    """
+    T3 speech-token sampling, one (1, 1) token tensor per step up to and
+    excluding the stop token.
+
+    With `cfg_weight` > 0 each step decodes a conditional and an
+    unconditional row (as upstream); with 0, the conditional row only.
+    """
+    import torch
+    from transformers.generation.logits_process import (
+        MinPLogitsWarper, TopPLogitsWarper, RepetitionPenaltyLogitsProcessor
+    )
+
+    guided = cfg_weight > 0
+    device = t3.device
+    text_tokens = torch.atleast_2d(text_tokens).to(dtype=torch.long, device=device)
+    if guided:
+        text_tokens = torch.cat([text_tokens, text_tokens])  # Unconditional row (text zeroed by T3)
+    embeds, _ = t3.prepare_input_embeds(
+        t3_cond=t3_cond,
+        text_tokens=text_tokens,
+        speech_tokens=t3.hp.start_speech_token * torch.ones_like(text_tokens[:, :1]),
+        cfg_weight=cfg_weight
+    )
+
+    bos_token = torch.tensor([[t3.hp.start_speech_token]], dtype=torch.long, device=device)
+    bos_embed = t3.speech_emb(bos_token) + t3.speech_pos_emb.get_fixed_embedding(0)
+    rows = 2 if guided else 1
+
+    min_p_warper = MinPLogitsWarper(min_p=min_p)
+    top_p_warper = TopPLogitsWarper(top_p=top_p)
+    repetition = RepetitionPenaltyLogitsProcessor(penalty=float(repetition_penalty))
+
+    output = backend(
+        inputs_embeds=torch.cat([embeds, bos_embed.expand(rows, -1, -1)], dim=1),
+        past_key_values=None,
+        use_cache=True
+    )
+    generated = bos_token.clone()
+    for step in range(max_new_tokens):
+        logits = output.logits[:, -1, :]
+        if guided:
+            cond, uncond = logits[0:1], logits[1:2]
+            logits = cond + cfg_weight * (cond - uncond)
+        logits = repetition(generated, logits)
+        if temperature != 1.0:
+            logits = logits / temperature
+        logits = top_p_warper(generated, min_p_warper(generated, logits))
+
+        next_token = torch.multinomial(torch.softmax(logits, dim=-1), num_samples=1)
+        if next_token.view(-1) == t3.hp.stop_speech_token:
+            return
+        generated = torch.cat([generated, next_token], dim=1)
+        yield next_token
+
+        next_embed = t3.speech_emb(next_token) + t3.speech_pos_emb.get_fixed_embedding(step + 1)
+        output = backend(
+            inputs_embeds=next_embed.expand(rows, -1, -1),
+            past_key_values=output.past_key_values,
+            use_cache=True
+        )
+
+
+def prepare_text_tokens(model, text: str, exaggeration: float = 0.5, audio_prompt_path: Optional[str] = None):
+    """
+    Condition a ChatterboxTTS on the voice (and exaggeration) and tokenize
+    the text as upstream generate does.
+
+    Returns:
+        Text tokens (1, length) with start/stop tokens, on the model's device
+    """
+    import torch
+    import torch.nn.functional as F
+    from chatterbox.tts import punc_norm
+    from chatterbox.models.t3.modules.cond_enc import T3Cond
+
+    if audio_prompt_path:
+        model.prepare_conditionals(audio_prompt_path, exaggeration=exaggeration)
+    elif model.conds is None:
+        raise ValueError("No conditionals: call prepare_conditionals or pass audio_prompt_path")
+
+    if exaggeration != model.conds.t3.emotion_adv[0, 0, 0]:
+        cond = model.conds.t3
+        model.conds.t3 = T3Cond(
+            speaker_emb=cond.speaker_emb,
+            cond_prompt_speech_tokens=cond.cond_prompt_speech_tokens,
+            emotion_adv=exaggeration * torch.ones(1, 1, 1),
+        ).to(device=model.device)
+
+    text_tokens = model.tokenizer.text_to_tokens(punc_norm(text)).to(model.device)
+    text_tokens = F.pad(text_tokens, (1, 0), value=model.t3.hp.start_text_token)
+    return F.pad(text_tokens, (0, 1), value=model.t3.hp.stop_text_token)
+
+
+def chatterbox_generate_unguided(
+    model,
+    text: str,
+    temperature: float = 0.8,
+    exaggeration: float = 0.5,
+    audio_prompt_path: Optional[str] = None,
+    repetition_penalty: float = 1.2,
+    min_p: float = 0.05,
+    top_p: float = 1.0,
+    max_new_tokens: int = 1000,
+    backend=None
+):
+    """
+    ChatterboxTTS.generate without classifier-free guidance.
+
+    Same conditioning, text normalization, vocoder and watermark as
+    upstream; only the token decode differs. `backend` is a reusable
+    T3HuggingfaceBackend (built per call when omitted).
+
+    Returns:
+        torch.Tensor of shape (1, samples)
+    """
+    import torch
+
+    text_tokens = prepare_text_tokens(model, text, exaggeration, audio_prompt_path)
+
+    with torch.inference_mode():
+        tokens = list(iter_speech_tokens(
+            model.t3, backend or unguided_backend(model.t3), model.conds.t3, text_tokens,
+            max_new_tokens, temperature, repetition_penalty, min_p, top_p
+        ))
+        speech_tokens = torch.cat(tokens, dim=1)[0] if tokens else torch.zeros(0, dtype=torch.long)
+        speech_tokens = speech_tokens[speech_tokens < 6561].to(model.device)
+
+        wav, _ = model.s3gen.inference(speech_tokens=speech_tokens, ref_dict=model.conds.gen)
+        wav = wav.squeeze(0).detach().cpu().numpy()
+        wav = model.watermarker.apply_watermark(wav, sample_rate=model.sr)
+    return torch.from_numpy(wav).unsqueeze(0)
+
+
+def unguided_backend(t3):
+    """Decoder wrapper over T3's transformer and speech head (build once per model, any batch size)"""
+    from chatterbox.models.t3.inference.t3_hf_backend import T3HuggingfaceBackend
+    return T3HuggingfaceBackend(config=t3.cfg, llama=t3.tfmr, speech_enc=t3.speech_emb, speech_head=t3.speech_head)
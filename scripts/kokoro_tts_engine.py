@@ -13,6 +13,14 @@ Features:
 
 Installation:
     pip install kokoro-onnx
+    # Model files (paths override with KOKORO_MODEL_PATH / KOKORO_VOICES_PATH)
+    wget https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v1.0/kokoro-v1.0.onnx
+    wget https://github.com/thewh1teagle/kokoro-onnx/releases/download/model-files-v1.0/voices-v1.0.bin
+
+The ONNX model is loaded once per process (KokoroSessionPool) and shared by
+every voice; a voice is just a style vector selected per call.
+KOKORO_CONCURRENCY sets how many syntheses may run at once (default 1);
+the host's CPUs are split between them for ONNX intra-op threads.
 
 Usage:
     from kokoro_tts_engine import KokoroTTSEngine
@@ -25,13 +33,134 @@ Usage:
     )
 """
 
+import os
+import time
+import queue
 import logging
+import threading
 import numpy as np
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+KOKORO_MODEL_PATH = os.getenv("KOKORO_MODEL_PATH", "kokoro-v1.0.onnx")
+KOKORO_VOICES_PATH = os.getenv("KOKORO_VOICES_PATH", "voices-v1.0.bin")
+
+
+def available_cpus() -> int:
+    """CPUs this process may run on (respects taskset/cpuset affinity)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+class KokoroSessionPool:
+    """
+    Process-wide Kokoro model: one ONNX session shared by all voices.
+
+    `InferenceSession.run` is thread-safe, so the pool keeps a single session
+    (one copy of the weights) and `concurrency` lightweight Kokoro wrappers
+    over it, each with its own phonemizer. A call checks out a wrapper, so at
+    most `concurrency` syntheses run at once; intra-op threads default to the
+    available CPUs divided by `concurrency` so concurrent runs don't
+    oversubscribe the host.
+    """
+
+    def __init__(
+        self,
+        model_path: str = KOKORO_MODEL_PATH,
+        voices_path: str = KOKORO_VOICES_PATH,
+        concurrency: int = 1,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: int = 1,
+        device: str = "cpu"
+    ):
+        import onnxruntime as ort
+        from kokoro_onnx import Kokoro
+
+        self.concurrency = max(1, concurrency)
+        self.intra_op_threads = intra_op_threads or max(1, available_cpus() // self.concurrency)
+        self.inter_op_threads = inter_op_threads
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = self.intra_op_threads
+        options.inter_op_num_threads = self.inter_op_threads
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        providers = ["CPUExecutionProvider"]
+        if device == "cuda" and "CUDAExecutionProvider" in ort.get_available_providers():
+            providers.insert(0, "CUDAExecutionProvider")
+
+        start = time.perf_counter()
+        self.session = ort.InferenceSession(model_path, sess_options=options, providers=providers)
+
+        self._idle: "queue.Queue" = queue.Queue()
+        first = Kokoro.from_session(self.session, voices_path)
+        self._idle.put(first)
+        for _ in range(self.concurrency - 1):
+            wrapper = Kokoro.from_session(self.session, voices_path)
+            if hasattr(first, "voices"):
+                wrapper.voices = first.voices  # Share the style vectors too
+            self._idle.put(wrapper)
+
+        self.load_seconds = time.perf_counter() - start
+        self.voices = set(first.get_voices()) if hasattr(first, "get_voices") else set()
+
+        # Stats
+        self.calls = 0
+        self.wait_seconds = 0.0
+        self._stats_lock = threading.Lock()
+
+        logger.info(
+            f"✓ Kokoro session pool ready in {self.load_seconds:.1f}s: "
+            f"concurrency={self.concurrency}, intra_op_threads={self.intra_op_threads}, "
+            f"providers={self.session.get_providers()}"
+        )
+
+    def create(self, text: str, voice: str, speed: float = 1.0, lang: str = "en-us") -> Tuple[np.ndarray, int]:
+        """Synthesize with the given voice's style vector; returns (samples, sample_rate)"""
+        start = time.perf_counter()
+        wrapper = self._idle.get()
+        waited = time.perf_counter() - start
+        try:
+            return wrapper.create(text, voice=voice, speed=speed, lang=lang)
+        finally:
+            self._idle.put(wrapper)
+            with self._stats_lock:
+                self.calls += 1
+                self.wait_seconds += waited
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "concurrency": self.concurrency,
+            "intra_op_threads": self.intra_op_threads,
+            "inter_op_threads": self.inter_op_threads,
+            "voices": len(self.voices),
+            "calls": self.calls,
+            "avg_wait_ms": round(1000 * self.wait_seconds / self.calls, 2) if self.calls else 0.0,
+            "load_seconds": round(self.load_seconds, 2)
+        }
+
+
+# Global pool instance
+_kokoro_pool: Optional[KokoroSessionPool] = None
+_kokoro_pool_lock = threading.Lock()
+
+
+def get_kokoro_pool(device: str = "cpu") -> KokoroSessionPool:
+    """Get or create the process-wide Kokoro session pool"""
+    global _kokoro_pool
+    with _kokoro_pool_lock:
+        if _kokoro_pool is None:
+            _kokoro_pool = KokoroSessionPool(
+                concurrency=int(os.getenv("KOKORO_CONCURRENCY", "1")),
+                device=device
+            )
+        return _kokoro_pool
+
 
 class KokoroTTSEngine:
     """
@@ -129,8 +258,7 @@ class KokoroTTSEngine:
         self.device = device
 
         try:
-            from kokoro_onnx import Kokoro
-            self.kokoro = Kokoro(language, voice)
+            self.kokoro = get_kokoro_pool(device=device)
             logger.info(f"✓ Kokoro TTS initialized: voice={voice}, lang={language}")
         except ImportError:
             logger.error("Kokoro ONNX not installed. Run: pip install kokoro-onnx")
@@ -152,7 +280,8 @@ class KokoroTTSEngine:
         Args:
             text: Input text to synthesize
             speed: Speech speed (0.5-2.0, default: 0.85 for professional tone)
-            pitch: Voice pitch (-1.0 to 1.0, default: -0.2 for authority)
+            pitch: Voice pitch (-1.0 to 1.0, default: -0.2 for authority);
+                kokoro-onnx has no pitch control, so this is logged only
             output_file: Optional path to save audio
 
         Returns:
@@ -181,10 +310,11 @@ class KokoroTTSEngine:
 
         try:
             # Generate audio
-            audio = self.kokoro.create(
+            audio, _ = self.kokoro.create(
                 text,
+                voice=self.voice_id,
                 speed=speed,
-                voice_pitch=pitch
+                lang=self.language
             )
 
             # Ensure numpy array
@@ -215,7 +345,8 @@ class KokoroTTSEngine:
             output_file: Output file path (.wav)
         """
         try:
-            self.kokoro.save(audio, output_file)
+            import soundfile as sf
+            sf.write(output_file, audio, 24000)
             logger.info(f"✓ Saved audio to: {output_file}")
         except Exception as e:
             logger.error(f"Failed to save audio: {e}")
@@ -0,0 +1,385 @@
+"""
+Twilio Media Streams
+====================
+Bidirectional WebSocket handler that plays our own synthesized voice into a
+live Twilio call.
+
+Instead of writing a WAV to disk and falling back to `<Say>`, the call is
+connected to this endpoint with `<Connect><Stream>`. Text is synthesized
+sentence by sentence; each chunk is converted to 8 kHz μ-law and sent as
+20 ms base64 `media` messages while the next chunk is still synthesizing.
+
+Features:
+- Real-time pacing: frames go out at playback rate with a small lead, so
+  Twilio's buffer stays short and interruptions take effect immediately
+- Barge-in: caller speech (inbound energy) cancels synthesis, drops queued
+  frames and sends `clear` so Twilio discards what it already buffered
+- `mark` messages after each utterance; when Twilio echoes the last one the
+  utterance has finished playing and the socket can be closed, which
+  returns the call to the next TwiML verb
+
+Protocol reference: https://www.twilio.com/docs/voice/media-streams/websocket-messages
+
+Usage (TwiML):
+    <Connect>
+        <Stream url="wss://host/twilio/media-stream">
+            <Parameter name="text" value="Hello!"/>
+            <Parameter name="voice" value="maya-professional"/>
+        </Stream>
+    </Connect>
+"""
+
+import json
+import time
+import uuid
+import base64
+import asyncio
+import logging
+from typing import Optional, Dict, List, Any, Callable, Tuple
+
+import numpy as np
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+
+from admission import get_admission_controller
+from synthesis_lanes import get_lane_scheduler, INTERACTIVE
+from telephony_audio import TelephonyEncoder, iter_frames, decode_telephony, FRAME_MS
+from text_filters import chunk_text
+from voice_manager import get_voice_manager
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Shorter chunks than HTTP synthesis: first audio matters more than throughput
+MEDIA_CHUNK_CHARS = 120
+
+# Frames sent ahead of real time (absorbs network jitter)
+DEFAULT_LEAD_FRAMES = 3
+
+# Barge-in: inbound RMS above threshold for this many consecutive frames
+BARGE_IN_RMS = 1200.0
+BARGE_IN_FRAMES = 5
+
+# Generation parameters accepted by the TTS engine
+ENGINE_PARAMS = ("temperature", "exaggeration", "cfg_weight")
+
+# Utterances queued for a stream that never connects (hang-up, failed call)
+# are dropped after this long, and each call holds at most this many
+PENDING_TTL_SECONDS = 120.0
+MAX_PENDING_UTTERANCES = 20
+
+# Utterances queued by webhooks for calls whose stream has not connected yet:
+# CallSid -> (time of the last queued utterance, utterances)
+_pending_utterances: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+
+# Active sessions by CallSid
+_sessions: Dict[str, "MediaStreamSession"] = {}
+
+
+def queue_utterance(call_sid: str, text: str, voice: Optional[str] = None):
+    """
+    Queue text to be spoken when the call's media stream connects.
+
+    Used by webhooks that answer with `<Connect><Stream>`: the text stays
+    server-side instead of travelling in TwiML `<Parameter>` values.
+    Entries expire after PENDING_TTL_SECONDS; past MAX_PENDING_UTTERANCES
+    the oldest utterance of the call is dropped.
+    """
+    now = time.monotonic()
+    for expired in [sid for sid, (queued_at, _) in _pending_utterances.items() if now - queued_at > PENDING_TTL_SECONDS]:
+        logger.warning(f"⚠ Dropping utterances queued for call {expired}: its stream never connected")
+        del _pending_utterances[expired]
+
+    _, utterances = _pending_utterances.get(call_sid, (now, []))
+    utterances.append({"text": text, "voice": voice})
+    if len(utterances) > MAX_PENDING_UTTERANCES:
+        logger.warning(f"⚠ Call {call_sid} has {len(utterances)} queued utterances, dropping the oldest")
+        del utterances[0]
+    _pending_utterances[call_sid] = (now, utterances)
+
+
+def discard_call(call_sid: str):
+    """Forget utterances still queued for a call that ended (status callback)"""
+    if _pending_utterances.pop(call_sid, None) is not None:
+        logger.info(f"Dropped utterances queued for ended call {call_sid}")
+
+
+def get_session(call_sid: str) -> Optional["MediaStreamSession"]:
+    """Get the active media stream session for a call, if any"""
+    return _sessions.get(call_sid)
+
+
+def resolve_voice_params(voice: Optional[str]) -> Dict[str, Any]:
+    """Map a voice slug to engine generation parameters"""
+    manager = get_voice_manager()
+    params = manager.get_voice_params(voice or manager.get_default_voice())
+    return {key: params[key] for key in ENGINE_PARAMS if key in params}
+
+
+def media_stream_twiml(response, stream_url: str, call_sid: Optional[str] = None, text: Optional[str] = None, voice: Optional[str] = None):
+    """
+    Append `<Connect><Stream>` to a Twilio VoiceResponse.
+
+    With `call_sid`, the text is queued server-side (same process as the
+    WebSocket endpoint); otherwise it is passed as a stream `<Parameter>`.
+    """
+    from twilio.twiml.voice_response import Connect
+
+    connect = Connect()
+    stream = connect.stream(url=stream_url)
+    if text is not None:
+        if call_sid:
+            queue_utterance(call_sid, text, voice)
+        else:
+            stream.parameter(name="text", value=text)
+            if voice:
+                stream.parameter(name="voice", value=voice)
+    response.append(connect)
+    return response
+
+
+class MediaStreamSession:
+    """
+    One Twilio Media Stream connection.
+
+    Synthesis (producer) and sending (paced consumer) run as separate tasks
+    connected by a frame queue, so audio starts playing as soon as the first
+    chunk is encoded.
+    """
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        synthesize: Callable[[str, Dict[str, Any]], Any],
+        sample_rate: int = 24000,
+        encoding: str = "mulaw",
+        lead_frames: int = DEFAULT_LEAD_FRAMES,
+        barge_in: bool = True,
+        barge_in_rms: float = BARGE_IN_RMS,
+        barge_in_frames: int = BARGE_IN_FRAMES
+    ):
+        self.websocket = websocket
+        self.synthesize = synthesize
+        self.sample_rate = sample_rate
+        self.encoding = encoding
+        self.lead = lead_frames * FRAME_MS / 1000
+        self.barge_in = barge_in
+        self.barge_in_rms = barge_in_rms
+        self.barge_in_frames = barge_in_frames
+
+        self.stream_sid: Optional[str] = None
+        self.call_sid: Optional[str] = None
+        self.close_when_done = False
+
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._speech_lock = asyncio.Lock()
+        self._speaking: List[asyncio.Task] = []
+        self._sender: Optional[asyncio.Task] = None
+        self._clock: Optional[float] = None  # Playout time of the next frame
+        self._pending_marks: set = set()
+        self._loud_frames = 0
+        self._closed = False
+
+        self.frames_sent = 0
+        self.interruptions = 0
+        self.first_audio_latency: Optional[float] = None
+
+    @property
+    def speaking(self) -> bool:
+        """True while audio is synthesizing, queued or still playing"""
+        return bool(self._speaking) or not self._queue.empty() or bool(self._pending_marks)
+
+    async def _send(self, message: Dict[str, Any]):
+        if not self._closed:
+            await self.websocket.send_text(json.dumps(message))
+
+    async def _pace(self):
+        """Wait until the next frame is due (playout clock minus lead)"""
+        now = time.monotonic()
+        if self._clock is None or self._clock < now:
+            # Idle or underrun: playback restarts from now
+            self._clock = now
+        delay = self._clock - now - self.lead
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self._clock += FRAME_MS / 1000
+
+    async def _send_loop(self):
+        while True:
+            kind, payload = await self._queue.get()
+            if kind == "media":
+                await self._pace()
+                await self._send({
+                    "event": "media",
+                    "streamSid": self.stream_sid,
+                    "media": {"payload": base64.b64encode(payload).decode("ascii")}
+                })
+                self.frames_sent += 1
+            elif kind == "mark":
+                self._pending_marks.add(payload)
+                await self._send({"event": "mark", "streamSid": self.stream_sid, "mark": {"name": payload}})
+
+    async def _produce(self, text: str, params: Dict[str, Any], mark: str):
+        started = time.monotonic()
+        encoder = TelephonyEncoder(self.encoding, input_rate=self.sample_rate)
+
+        async with self._speech_lock:
+            for chunk in chunk_text(text, max_length=MEDIA_CHUNK_CHARS):
+                async with get_lane_scheduler().slot(INTERACTIVE), get_admission_controller().slot():
+                    wav = await asyncio.to_thread(self.synthesize, chunk, params)
+                for frame in iter_frames(encoder.encode(wav)):
+                    self._queue.put_nowait(("media", bytes(frame)))
+                if self.first_audio_latency is None and not self._queue.empty():
+                    self.first_audio_latency = time.monotonic() - started
+                    logger.info(f"Stream {self.stream_sid}: first audio after {self.first_audio_latency * 1000:.0f}ms")
+
+            for frame in iter_frames(encoder.flush()):
+                self._queue.put_nowait(("media", bytes(frame)))
+            self._queue.put_nowait(("mark", mark))
+
+    def speak(self, text: str, params: Optional[Dict[str, Any]] = None) -> asyncio.Task:
+        """
+        Synthesize and stream text. Utterances play in order.
+
+        Returns:
+            The synthesis task (completes when all frames are queued)
+        """
+        mark = f"utt-{uuid.uuid4().hex[:8]}"
+        task = asyncio.create_task(self._produce(text, params or {}, mark))
+        self._speaking.append(task)
+        task.add_done_callback(self._speech_done)
+        return task
+
+    def _speech_done(self, task: asyncio.Task):
+        if task in self._speaking:
+            self._speaking.remove(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Stream {self.stream_sid}: synthesis failed: {task.exception()}")
+            self._queue.put_nowait(("mark", "error"))
+
+    async def clear(self):
+        """Stop speaking now: cancel synthesis, drop queued audio, tell Twilio to flush"""
+        for task in list(self._speaking):
+            task.cancel()
+        self._speaking.clear()  # Cancelled: nothing left of them to wait for
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._pending_marks.clear()
+        self._clock = None
+        self.interruptions += 1
+        await self._send({"event": "clear", "streamSid": self.stream_sid})
+        logger.info(f"Stream {self.stream_sid}: cleared (barge-in)")
+        # The dropped utterances' marks will never echo back, so close here
+        if self.close_when_done and not self.speaking:
+            logger.info(f"Stream {self.stream_sid}: playback interrupted, closing")
+            await self.close()
+
+    async def _on_start(self, message: Dict[str, Any]):
+        start = message.get("start", {})
+        self.stream_sid = message.get("streamSid") or start.get("streamSid")
+        self.call_sid = start.get("callSid")
+        if self.call_sid:
+            _sessions[self.call_sid] = self
+
+        media_format = start.get("mediaFormat", {})
+        logger.info(f"Media stream started: {self.stream_sid} (call {self.call_sid}, {media_format.get('encoding', 'audio/x-mulaw')})")
+
+        _, utterances = _pending_utterances.pop(self.call_sid, (None, [])) if self.call_sid else (None, [])
+        custom = start.get("customParameters") or {}
+        if custom.get("text"):
+            utterances.append({"text": custom["text"], "voice": custom.get("voice")})
+
+        # Streams opened to speak a reply hand control back to TwiML when done
+        self.close_when_done = bool(utterances) and custom.get("keep_open", "").lower() != "true"
+        for utterance in utterances:
+            self.speak(utterance["text"], resolve_voice_params(utterance.get("voice")))
+
+    async def _on_media(self, message: Dict[str, Any]):
+        if not self.barge_in or not self.speaking:
+            self._loud_frames = 0
+            return
+
+        media = message.get("media", {})
+        if media.get("track", "inbound") != "inbound":
+            return
+
+        samples = decode_telephony(base64.b64decode(media.get("payload", "")), self.encoding).astype(np.float32)
+        rms = float(np.sqrt(np.mean(samples * samples))) if len(samples) else 0.0
+
+        self._loud_frames = self._loud_frames + 1 if rms >= self.barge_in_rms else 0
+        if self._loud_frames >= self.barge_in_frames:
+            self._loud_frames = 0
+            await self.clear()
+
+    async def _on_mark(self, message: Dict[str, Any]):
+        name = message.get("mark", {}).get("name")
+        self._pending_marks.discard(name)
+        if self.close_when_done and not self.speaking:
+            logger.info(f"Stream {self.stream_sid}: playback complete, closing")
+            await self.close()
+
+    async def close(self):
+        if not self._closed:
+            self._closed = True
+            await self.websocket.close()
+
+    async def run(self):
+        """Receive loop; returns when the stream stops or the socket closes"""
+        self._sender = asyncio.create_task(self._send_loop())
+        try:
+            while not self._closed:
+                message = json.loads(await self.websocket.receive_text())
+                event = message.get("event")
+
+                if event == "media":
+                    await self._on_media(message)
+                elif event == "start":
+                    await self._on_start(message)
+                elif event == "mark":
+                    await self._on_mark(message)
+                elif event == "stop":
+                    logger.info(f"Media stream stopped: {self.stream_sid}")
+                    break
+                elif event == "connected":
+                    logger.debug(f"Media stream connected: protocol {message.get('protocol')}")
+        except WebSocketDisconnect:
+            logger.info(f"Media stream disconnected: {self.stream_sid}")
+        finally:
+            self._closed = True
+            for task in list(self._speaking):
+                task.cancel()
+            self._sender.cancel()
+            if self.call_sid and _sessions.get(self.call_sid) is self:
+                del _sessions[self.call_sid]
+            logger.info(
+                f"Media stream {self.stream_sid} ended: {self.frames_sent} frames sent, "
+                f"{self.interruptions} interruptions"
+            )
+
+
+def engine_synthesizer(tts_model) -> Callable[[str, Dict[str, Any]], Any]:
+    """Adapt a loaded TTS model to the session's synthesize(text, params) callable"""
+    def synthesize(text: str, params: Dict[str, Any]):
+        return tts_model.generate(text=text, **params)
+    return synthesize
+
+
+@router.websocket("/twilio/media-stream")
+async def twilio_media_stream(websocket: WebSocket):
+    """
+    Twilio Media Streams endpoint (bidirectional).
+
+    Speaks `customParameters.text` (or utterances queued for the call) and
+    supports barge-in via `clear`.
+    """
+    tts_model = getattr(websocket.app.state, "tts_model", None)
+    if tts_model is None:
+        await websocket.close(code=1013)  # Try again later
+        return
+
+    config = getattr(websocket.app.state, "config", None) or {}
+    sample_rate = config.get("audio_output", {}).get("sample_rate", 24000)
+
+    await websocket.accept()
+    session = MediaStreamSession(websocket, engine_synthesizer(tts_model), sample_rate=sample_rate)
+    await session.run()
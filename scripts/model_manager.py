@@ -0,0 +1,385 @@
+"""
+Model Manager
+=============
+Loads engines and model variants on demand and keeps the resident set
+within a memory budget.
+
+Each model is a named spec: the engine to build (see tts_engines.load_engine)
+and the languages it serves:
+
+    models:
+      budget_mb: 12000
+      specs:
+        chatterbox: {engine: chatterbox, languages: [en], pinned: true}
+        chatterbox-multilingual: {engine: chatterbox-multilingual, languages: [fr, de], estimated_mb: 3200}
+
+The first request for a model that is not resident starts its load in a
+background thread; that request and any arriving meanwhile queue on the
+same load. Loads run one at a time, so the resident size of a model can be
+measured (parameter and buffer bytes of its torch modules, else the process
+RSS growth, else `estimated_mb`).
+
+When a load would take the resident set over `budget_mb`, the least
+recently used models are evicted: unregistered from the engine registry and
+released. Pinned models, models serving a request (`use()`) and models
+just loaded for callers that have not resumed yet are never evicted; if
+only those remain, the budget is overshot with a warning rather than
+failing the request, and settled when the model is released.
+
+Usage:
+    manager = get_model_manager(config)
+    async with manager.use(manager.resolve(language="fr")) as engine:
+        wav = await asyncio.to_thread(engine.generate, text, language="fr")
+
+    # Request handlers: the primary engine for its languages, else the manager's model
+    async with serving_engine(app.state.tts_model, voice["language"], config) as engine:
+        ...
+"""
+
+import gc
+import os
+import sys
+import time
+import asyncio
+import logging
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import psutil
+
+from tts_engines import TTSEngine, load_engine, get_engine_registry
+from monitoring import record_model_load, record_model_eviction
+
+logger = logging.getLogger(__name__)
+
+MB = 1024 * 1024
+
+
+@dataclass
+class ModelSpec:
+    """A loadable model: engine name plus the languages it serves"""
+    name: str
+    engine: str
+    languages: List[str] = field(default_factory=list)
+    pinned: bool = False        # Never evicted
+    preload: bool = False       # Loaded at startup instead of on first request
+    estimated_mb: float = 0.0   # Size used before the first load, and when it can't be measured
+
+
+@dataclass
+class ResidentModel:
+    engine: TTSEngine
+    size_bytes: int
+    load_seconds: float
+    loaded_at: float
+    last_used: float
+    uses: int = 0
+    in_use: int = 0
+
+
+def language_code(language: Optional[str]) -> Optional[str]:
+    """Primary subtag of a language tag ("en-US" -> "en"), as engines take it"""
+    return language.split("-")[0].lower() if language else None
+
+
+def _rss() -> int:
+    return psutil.Process().memory_info().rss
+
+
+def engine_memory_bytes(engine: TTSEngine) -> Optional[int]:
+    """Bytes of the torch parameters and buffers behind an engine (None when it has none)"""
+    explicit = getattr(engine, "memory_bytes", None)
+    if explicit is not None:
+        return int(explicit)
+
+    model = getattr(engine, "model", None)
+    if model is None or "torch" not in sys.modules:
+        return None
+    import torch
+
+    modules = [model] if isinstance(model, torch.nn.Module) else [
+        value for value in vars(model).values() if isinstance(value, torch.nn.Module)
+    ]
+    tensors = {}
+    for module in modules:
+        for tensor in (*module.parameters(), *module.buffers()):
+            tensors[id(tensor)] = tensor.numel() * tensor.element_size()
+    return sum(tensors.values()) or None
+
+
+class ModelManager:
+    """LRU residency of engines under a memory budget"""
+
+    def __init__(
+        self,
+        specs: Iterable[ModelSpec],
+        budget_mb: Optional[float] = None,
+        device: str = "cpu",
+        default: Optional[str] = None,
+        loader: Callable[[str, str], TTSEngine] = load_engine
+    ):
+        self.specs: Dict[str, ModelSpec] = {spec.name: spec for spec in specs}
+        self.budget = int(budget_mb * MB) if budget_mb else None
+        self.device = device
+        self.default = default or next(iter(self.specs), None)
+        self.loader = loader
+
+        self._resident: "OrderedDict[str, ResidentModel]" = OrderedDict()  # Least recently used first
+        self._loading: Dict[str, asyncio.Task] = {}
+        self._waiting: Dict[str, int] = {}  # Callers waiting on a load: the model is reserved for them
+        self._load_lock: Optional[asyncio.Lock] = None
+
+        # Stats
+        self.loads = 0
+        self.evictions = 0
+        self.queued = 0
+        self.load_failures = 0
+
+    @property
+    def resident_bytes(self) -> int:
+        return sum(model.size_bytes for model in self._resident.values())
+
+    def resolve(self, engine: Optional[str] = None, language: Optional[str] = None) -> str:
+        """
+        Name of the model serving a request: an explicit model name, else the
+        model listing `language` (or its primary subtag: "fr-CA" -> "fr"),
+        else the default model.
+
+        Raises:
+            KeyError: Unknown model name
+        """
+        if engine:
+            if engine not in self.specs:
+                raise KeyError(f"Unknown model: {engine}")
+            return engine
+        if language:
+            language = language.lower()
+            default = self.specs.get(self.default)
+            for code in dict.fromkeys((language, language_code(language))):
+                if default and code in default.languages:
+                    return self.default
+                for spec in self.specs.values():
+                    if code in spec.languages:
+                        return spec.name
+        return self.default
+
+    def is_resident(self, name: str) -> bool:
+        return name in self._resident
+
+    async def acquire(self, name: str) -> TTSEngine:
+        """
+        Engine for a model, loading it first if needed (callers arriving
+        during a load wait for the same load).
+
+        Raises:
+            KeyError: Unknown model name
+            Exception: Whatever the load raised
+        """
+        resident = self._resident.get(name)
+        if resident is None:
+            if name not in self.specs:
+                raise KeyError(f"Unknown model: {name}")
+            task = self._loading.get(name)
+            if task is None:
+                task = self._loading[name] = asyncio.create_task(self._load(name))
+            else:
+                self.queued += 1
+            # Shielded: a caller hanging up does not cancel the load for the others
+            self._waiting[name] = self._waiting.get(name, 0) + 1
+            try:
+                await asyncio.shield(task)
+            finally:
+                self._waiting[name] -= 1
+                if not self._waiting[name]:
+                    del self._waiting[name]
+            resident = self._resident[name]
+            if self.budget is not None and self.resident_bytes > self.budget:
+                self._evict_for(0, keep=name)  # Settle an overshoot the reservation was holding up
+
+        self._resident.move_to_end(name)
+        resident.last_used = time.time()
+        resident.uses += 1
+        return resident.engine
+
+    @asynccontextmanager
+    async def use(self, name: str):
+        """Acquire a model and keep it from eviction until the block exits"""
+        engine = await self.acquire(name)
+        resident = self._resident[name]
+        resident.in_use += 1
+        try:
+            yield engine
+        finally:
+            resident.in_use -= 1
+            if self.budget is not None and self.resident_bytes > self.budget:
+                self._evict_for(0)  # Settle an overshoot this model was holding up
+
+    def adopt(self, name: str, engine: TTSEngine, pinned: bool = False):
+        """Track an engine loaded elsewhere (e.g. the fallback engine) as resident"""
+        spec = self.specs.setdefault(name, ModelSpec(name=name, engine=engine.name))
+        spec.pinned = spec.pinned or pinned
+        size = engine_memory_bytes(engine) or int(spec.estimated_mb * MB)
+        now = time.time()
+        self._resident[name] = ResidentModel(engine, size, 0.0, now, now)
+        record_model_load(name, 0.0, size)
+
+    async def _load(self, name: str):
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        spec = self.specs[name]
+        try:
+            async with self._load_lock:
+                # Room for the estimate up front; measured size settled after the load
+                self._evict_for(int(spec.estimated_mb * MB), keep=name)
+
+                logger.info(f"Loading model '{name}' ({spec.engine} on {self.device})...")
+                rss_before = _rss()
+                started = time.perf_counter()
+                engine = await asyncio.to_thread(self.loader, spec.engine, self.device)
+                seconds = time.perf_counter() - started
+                size = engine_memory_bytes(engine) or max(_rss() - rss_before, 0) or int(spec.estimated_mb * MB)
+
+                now = time.time()
+                self._resident[name] = ResidentModel(engine, size, seconds, now, now)
+                get_engine_registry().register(engine, voices=(), name=name)
+                self.loads += 1
+                record_model_load(name, seconds, size)
+                logger.info(f"✓ Model '{name}' resident ({size / MB:.0f} MB, loaded in {seconds:.1f}s)")
+
+                self._evict_for(0, keep=name)
+        except Exception as e:
+            self.load_failures += 1
+            logger.error(f"Failed to load model '{name}': {e}")
+            raise
+        finally:
+            self._loading.pop(name, None)
+
+    def _evict_for(self, incoming: int, keep: Optional[str] = None):
+        """Evict least recently used models until `incoming` more bytes fit the budget"""
+        if self.budget is None:
+            return
+        for name in list(self._resident):
+            if self.resident_bytes + incoming <= self.budget:
+                return
+            resident = self._resident[name]
+            if name == keep or self.specs[name].pinned or resident.in_use or name in self._waiting:
+                continue
+            self.evict(name)
+        if self.resident_bytes + incoming > self.budget:
+            logger.warning(
+                f"⚠ Model memory over budget: {(self.resident_bytes + incoming) / MB:.0f} MB "
+                f"> {self.budget / MB:.0f} MB (remaining models pinned or in use)"
+            )
+
+    def evict(self, name: str) -> bool:
+        """Drop a resident model and release its memory"""
+        resident = self._resident.pop(name, None)
+        if resident is None:
+            return False
+        registry = get_engine_registry()
+        if registry.get(name) is resident.engine:
+            registry.unregister(name)
+        del resident
+        gc.collect()
+        if "torch" in sys.modules:
+            import torch
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+
+        self.evictions += 1
+        record_model_eviction(name)
+        logger.info(f"Evicted model '{name}' (memory budget)")
+        return True
+
+    async def preload(self):
+        """Load the specs marked `preload` (failures are logged, not raised)"""
+        for spec in self.specs.values():
+            if spec.preload and not self.is_resident(spec.name):
+                try:
+                    await self.acquire(spec.name)
+                except Exception:
+                    pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "budget_mb": round(self.budget / MB) if self.budget else None,
+            "resident_mb": round(self.resident_bytes / MB, 1),
+            "default": self.default,
+            "resident": {
+                name: {
+                    "size_mb": round(model.size_bytes / MB, 1),
+                    "load_seconds": round(model.load_seconds, 2),
+                    "idle_seconds": round(time.time() - model.last_used, 1),
+                    "uses": model.uses,
+                    "in_use": model.in_use,
+                    "pinned": self.specs[name].pinned
+                }
+                for name, model in self._resident.items()
+            },
+            "loading": list(self._loading),
+            "available": [name for name in self.specs if name not in self._resident],
+            "loads": self.loads,
+            "load_failures": self.load_failures,
+            "queued": self.queued,
+            "evictions": self.evictions
+        }
+
+
+# Global manager instance
+_model_manager: Optional[ModelManager] = None
+
+
+def get_model_manager(config: Optional[Dict[str, Any]] = None) -> ModelManager:
+    """
+    Get or create the global model manager from the `models` config section.
+
+    The primary engine (TTS_ENGINE, else model.engine) is always a spec,
+    pinned and the default.
+    """
+    global _model_manager
+    if _model_manager is None:
+        config = config or {}
+        settings = config.get("models", {})
+        model_config = config.get("model", {})
+        primary = (os.getenv("TTS_ENGINE") or model_config.get("engine") or "chatterbox").lower()
+
+        specs = [
+            ModelSpec(name=name, **{"engine": name, **(options or {})})
+            for name, options in (settings.get("specs") or {}).items()
+        ]
+        if not any(spec.name == primary for spec in specs):
+            specs.insert(0, ModelSpec(name=primary, engine=primary, languages=["en"]))
+        for spec in specs:
+            spec.languages = [language.lower() for language in spec.languages]
+            if spec.name == primary:
+                spec.pinned = True
+
+        _model_manager = ModelManager(
+            specs,
+            budget_mb=settings.get("budget_mb"),
+            device=model_config.get("device", "cpu"),  # Resolved (not "auto") by the time servers build this
+            default=primary
+        )
+        logger.info(
+            f"Model manager initialized ({len(specs)} models, "
+            f"budget {settings.get('budget_mb') or 'unlimited'} MB)"
+        )
+    return _model_manager
+
+
+@asynccontextmanager
+async def serving_engine(primary: TTSEngine, language: Optional[str], config: Optional[Dict[str, Any]] = None):
+    """
+    Engine for a request in `language`: the loaded primary engine (pinned,
+    so used as is), else the manager's model for that language, loaded if
+    needed and kept from eviction until the block exits.
+    """
+    manager = get_model_manager(config)
+    name = manager.resolve(language=language)
+    if name == manager.default:
+        yield primary
+    else:
+        async with manager.use(name) as engine:
+            yield engine
@@ -59,6 +59,72 @@ tts_audio_duration_seconds = Histogram(
     buckets=[1, 5, 10, 30, 60, 120, 300]
 )
 
+tts_silence_trimmed_ms = Histogram(
+    'tts_silence_trimmed_milliseconds',
+    'Leading/trailing silence trimmed per TTS request',
+    ['endpoint', 'position'],
+    buckets=[0, 50, 100, 200, 400, 800, 1600, 3200]
+)
+
+tts_single_flight_requests_total = Counter(
+    'tts_single_flight_requests_total',
+    'TTS requests by single-flight role (leader synthesizes, joined reuses)',
+    ['endpoint', 'role']
+)
+
+tts_single_flight_dedup_ratio = Gauge(
+    'tts_single_flight_dedup_ratio',
+    'Share of TTS requests served by joining an identical in-flight synthesis',
+    ['endpoint']
+)
+
+tts_guidance_mode_total = Counter(
+    'tts_guidance_mode_total',
+    'TTS requests by guidance mode served (cfg or none) and why (request, voice, load, default)',
+    ['endpoint', 'mode', 'reason']
+)
+
+tts_admission_wait_seconds = Gauge(
+    'tts_admission_wait_seconds',
+    'EWMA of interactive synthesis queue wait for a model slot'
+)
+
+tts_admission_overloaded = Gauge(
+    'tts_admission_overloaded',
+    'Whether the admission controller is serving auto-guidance requests guidance-free'
+)
+
+tts_engine_fallback_total = Counter(
+    'tts_engine_fallback_total',
+    'TTS requests served degraded by the fallback engine, by requested voice',
+    ['endpoint', 'engine', 'voice']
+)
+
+tts_model_resident = Gauge(
+    'tts_model_resident',
+    'Whether a model is resident in memory (see model_manager.py)',
+    ['model']
+)
+
+tts_model_resident_bytes = Gauge(
+    'tts_model_resident_bytes',
+    'Memory held by a resident model',
+    ['model']
+)
+
+tts_model_load_seconds = Histogram(
+    'tts_model_load_seconds',
+    'Time to load a model on demand',
+    ['model'],
+    buckets=[1, 2.5, 5, 10, 20, 40, 80, 160, 320]
+)
+
+tts_model_evictions_total = Counter(
+    'tts_model_evictions_total',
+    'Models evicted to stay within the memory budget',
+    ['model']
+)
+
 # API key metrics
 api_key_requests_total = Counter(
     'api_key_requests_total',
@@ -99,6 +165,17 @@ model_inference_errors_total = Counter(
     'Total TTS model inference errors'
 )
 
+model_ready = Gauge(
+    'tts_model_ready',
+    'Whether the server is ready for traffic (model loaded and warmed up)'
+)
+
+warmup_latency_ms = Gauge(
+    'tts_warmup_latency_milliseconds',
+    'Warm-up synthesis latency by text length (first call vs steady state)',
+    ['length', 'phase']
+)
+
 # Database connection pool metrics
 db_pool_size = Gauge(
     'db_pool_size',
@@ -145,6 +222,69 @@ def record_tts_request(voice_id: str, format: str, status: str, duration: float,
         logger.error(f"Error recording TTS metrics: {e}")
 
 
+def record_silence_trimmed(endpoint: str, head_ms: float, tail_ms: float):
+    """Record silence trimmed from one TTS response"""
+    try:
+        tts_silence_trimmed_ms.labels(endpoint=endpoint, position="head").observe(head_ms)
+        tts_silence_trimmed_ms.labels(endpoint=endpoint, position="tail").observe(tail_ms)
+    except Exception as e:
+        logger.error(f"Error recording silence trim metrics: {e}")
+
+
+def record_single_flight(endpoint: str, joined: bool, dedup_ratio: float):
+    """Record one request's single-flight outcome"""
+    try:
+        tts_single_flight_requests_total.labels(endpoint=endpoint, role="joined" if joined else "leader").inc()
+        tts_single_flight_dedup_ratio.labels(endpoint=endpoint).set(dedup_ratio)
+    except Exception as e:
+        logger.error(f"Error recording single-flight metrics: {e}")
+
+
+def record_guidance(endpoint: str, mode: str, reason: str):
+    """Record the guidance mode one request was served with"""
+    try:
+        tts_guidance_mode_total.labels(endpoint=endpoint, mode=mode, reason=reason).inc()
+    except Exception as e:
+        logger.error(f"Error recording guidance metrics: {e}")
+
+
+def record_admission(wait_seconds: float, overloaded: bool):
+    """Record the admission controller's queue wait EWMA and overload state"""
+    try:
+        tts_admission_wait_seconds.set(wait_seconds)
+        tts_admission_overloaded.set(1 if overloaded else 0)
+    except Exception as e:
+        logger.error(f"Error recording admission metrics: {e}")
+
+
+def record_fallback(endpoint: str, engine: str, voice: str):
+    """Record one request degraded to the fallback engine"""
+    try:
+        tts_engine_fallback_total.labels(endpoint=endpoint, engine=engine, voice=voice).inc()
+    except Exception as e:
+        logger.error(f"Error recording fallback metrics: {e}")
+
+
+def record_model_load(model: str, seconds: float, size_bytes: int):
+    """Record a model loaded into memory"""
+    try:
+        tts_model_load_seconds.labels(model=model).observe(seconds)
+        tts_model_resident.labels(model=model).set(1)
+        tts_model_resident_bytes.labels(model=model).set(size_bytes)
+    except Exception as e:
+        logger.error(f"Error recording model load metrics: {e}")
+
+
+def record_model_eviction(model: str):
+    """Record a model evicted from memory"""
+    try:
+        tts_model_evictions_total.labels(model=model).inc()
+        tts_model_resident.labels(model=model).set(0)
+        tts_model_resident_bytes.labels(model=model).set(0)
+    except Exception as e:
+        logger.error(f"Error recording model eviction metrics: {e}")
+
+
 def record_http_request(method: str, endpoint: str, status_code: int, duration: float):
     """Record HTTP request metrics"""
     try:
@@ -178,6 +318,24 @@ def set_model_loaded(loaded: bool):
         logger.error(f"Error setting model loaded metric: {e}")
 
 
+def set_model_ready(ready: bool):
+    """Set readiness (model loaded and warm-up finished)"""
+    try:
+        model_ready.set(1 if ready else 0)
+    except Exception as e:
+        logger.error(f"Error setting model ready metric: {e}")
+
+
+def record_warmup(latency: Dict[str, Dict[str, float]]):
+    """Record warm-up first-call and steady-state latency per text length"""
+    try:
+        for length, result in latency.items():
+            warmup_latency_ms.labels(length=length, phase="first").set(result["first_ms"])
+            warmup_latency_ms.labels(length=length, phase="steady").set(result["steady_ms"])
+    except Exception as e:
+        logger.error(f"Error recording warm-up metrics: {e}")
+
+
 def record_model_error():
     """Record model inference error"""
     try:
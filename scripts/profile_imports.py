@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Import-Time Profiler
+====================
+Reports where a module's import time goes, using `python -X importtime` in
+a fresh interpreter (so nothing is already cached in sys.modules).
+
+Prints total import time, the slowest top-level packages (cumulative) and
+the slowest individual modules (self time). With --forbid, exits non-zero
+if any of the listed packages is imported eagerly: use it to keep torch
+and the optional SDKs out of the server's startup path.
+
+Usage:
+    python scripts/profile_imports.py server
+    python scripts/profile_imports.py server --top 30
+    python scripts/profile_imports.py server --forbid torch,chatterbox,anthropic,openai,twilio
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Any, Dict, List
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+REPO_DIR = SCRIPTS_DIR.parent  # Servers read config/ and logs/ relative to the repo root
+LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(stderr: str) -> List[Dict[str, Any]]:
+    """Parse `-X importtime` output into {module, self_us, cumulative_us, depth}"""
+    entries = []
+    for line in stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append({
+                "module": module,
+                "self_us": int(self_us),
+                "cumulative_us": int(cumulative_us),
+                "depth": (len(indent) - 1) // 2
+            })
+    return entries
+
+
+def profile_module(module: str, cwd: Path = REPO_DIR) -> Dict[str, Any]:
+    """Import `module` (from scripts/) in a fresh interpreter and summarize import time"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, capture_output=True, text=True, env={**os.environ, "PYTHONPATH": str(SCRIPTS_DIR)}
+    )
+    entries = parse_importtime(result.stderr)
+
+    packages: Dict[str, int] = {}
+    for entry in entries:
+        if entry["depth"] == 0 or entry["module"] == module:
+            continue
+        root = entry["module"].split(".")[0]
+        packages[root] = max(packages.get(root, 0), entry["cumulative_us"])
+
+    target = next((entry for entry in entries if entry["module"] == module), None)
+    return {
+        "module": module,
+        "ok": result.returncode == 0,
+        "error": result.stderr.strip().splitlines()[-1] if result.returncode else None,
+        "total_ms": round(target["cumulative_us"] / 1000, 1) if target else None,
+        "packages": dict(sorted(packages.items(), key=lambda item: -item[1])),
+        "modules": sorted(entries, key=lambda entry: -entry["self_us"]),
+        "imported": {entry["module"].split(".")[0] for entry in entries}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Profile module import time")
+    parser.add_argument("module", nargs="?", default="server", help="Module to import (from scripts/)")
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--forbid", default="", help="Comma-separated packages that must not be imported")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    report = profile_module(args.module)
+    forbidden = sorted(set(filter(None, args.forbid.split(","))) & report["imported"])
+
+    if args.json:
+        print(json.dumps({
+            "module": report["module"],
+            "ok": report["ok"],
+            "error": report["error"],
+            "total_ms": report["total_ms"],
+            "packages_ms": {name: round(us / 1000, 1) for name, us in report["packages"].items()},
+            "forbidden_imported": forbidden
+        }, indent=2))
+        sys.exit(1 if forbidden or not report["ok"] else 0)
+
+    print("=" * 80)
+    print(f"Import profile: {args.module}")
+    print("=" * 80)
+    if not report["ok"]:
+        print(f"⚠ Import failed: {report['error']}")
+    print(f"Total: {report['total_ms']} ms")
+    print()
+    print(f"{'package (cumulative)':<40} {'ms':>10}")
+    for name, us in list(report["packages"].items())[:args.top]:
+        print(f"{name:<40} {us / 1000:>10.1f}")
+    print()
+    print(f"{'module (self)':<60} {'ms':>10}")
+    for entry in report["modules"][:args.top]:
+        print(f"{entry['module']:<60} {entry['self_us'] / 1000:>10.1f}")
+    print("=" * 80)
+
+    if forbidden:
+        print(f"✗ Imported eagerly: {', '.join(forbidden)}")
+        sys.exit(1)
+    sys.exit(0 if report["ok"] else 1)
+
+
+if __name__ == "__main__":
+    main()
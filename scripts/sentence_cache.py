@@ -0,0 +1,210 @@
+"""
+Sentence Audio Cache
+====================
+Disk cache of synthesized audio per sentence, so distinct requests that
+share sentences only synthesize the novel ones.
+
+Whole-request caching misses most reuse: greetings and sign-offs ("Thank
+you for choosing us!") recur across requests whose other sentences
+differ. Entries here are keyed by (normalized sentence, voice, generation
+parameters, speed, seed), so any request containing a cached sentence in
+the same voice and settings reuses it.
+
+Storage:
+- one headerless PCM16 file per sentence (2 bytes/sample: 48 KB per second
+  at 24 kHz, lossless, and directly mappable - Opus would be ~8x smaller
+  but every hit would pay a decode)
+- the directory is the index: a lookup opens the entry's file, so every
+  worker process sharing the directory hits the sentences any of them
+  rendered
+- reads map the file (`np.memmap`) and convert it to float32 in one pass
+  straight from the mapping; hot entries stay in the OS page cache shared
+  by all workers (the float32 result is a private copy: callers scale it)
+- LRU eviction by the total bytes of the directory, measured by a scan
+  after each write, so the bound holds across workers; recency is the file
+  mtime (refreshed on hit), so the order survives restarts
+- writes are atomic (temp file + rename); concurrent writers of the same
+  sentence just race to the same content. `put` blocks on disk I/O; async
+  callers run it in a worker thread
+
+Usage:
+    cache = SentenceCache("./sentence_cache", max_bytes=512 * 1024 * 1024)
+    key = cache.key(sentence, voice_id, params, speed=1.0, seed=None)
+    wav = cache.get(key)
+    if wav is None:
+        wav = synthesize(sentence)
+        await asyncio.to_thread(cache.put, key, wav)
+"""
+
+import os
+import json
+import hashlib
+import logging
+import tempfile
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from audio_encoding import as_mono_float32, finalize_audio, PCM16_SCALE
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MB = 512
+ENTRY_SUFFIX = ".pcm"
+
+
+def normalize_sentence(sentence: str) -> str:
+    """Canonical form for cache keys: Unicode NFKC, collapsed whitespace (case and punctuation kept - they change prosody)"""
+    return " ".join(unicodedata.normalize("NFKC", sentence).split())
+
+
+class SentenceCache:
+    """Byte-bounded LRU of per-sentence PCM16 audio on disk"""
+
+    def __init__(self, directory, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024, sample_rate: int = 24000):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.sample_rate = sample_rate
+
+        # As of the last directory scan (every worker writes to the directory)
+        self.entries = 0
+        self.bytes = 0
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+        self._evict()
+        if self.entries:
+            logger.info(f"✓ Sentence cache: {self.entries} entries, {self.bytes / 1024 / 1024:.1f} MB in {self.directory}")
+
+    def key(
+        self,
+        sentence: str,
+        voice_id: str,
+        params: Optional[Dict[str, Any]] = None,
+        speed: float = 1.0,
+        seed: Optional[int] = None,
+        reference_audio: Optional[str] = None
+    ) -> str:
+        fields = {
+            "sentence": normalize_sentence(sentence),
+            "voice": str(voice_id),
+            "params": params or {},
+            "speed": speed,
+            "seed": seed,
+            "reference": reference_audio,
+            "sample_rate": self.sample_rate
+        }
+        canonical = json.dumps(fields, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Cached float32 audio for key (a fresh array), or None"""
+        path = self._path(key)
+        try:
+            pcm = np.memmap(path, dtype="<i2", mode="r")
+            wav = np.multiply(pcm, np.float32(1.0 / PCM16_SCALE), dtype=np.float32)
+            del pcm
+            os.utime(path)
+        except (FileNotFoundError, ValueError) as e:
+            # Never written, removed by an eviction, or empty
+            if not isinstance(e, FileNotFoundError):
+                logger.debug(f"Sentence cache entry {key[:12]} unreadable: {e}")
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return wav
+
+    def put(self, key: str, wav):
+        """Store audio for key (the input is not modified)"""
+        samples = as_mono_float32(wav)
+        if len(samples) == 0:
+            return
+        pcm = finalize_audio(samples.copy(), encoding="pcm16")
+
+        path = self._path(key)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(pcm.tobytes())
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"⚠ Sentence cache write failed: {e}")
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            return
+
+        self._evict()
+
+    def _scan(self):
+        """Entries on disk as (mtime, size, path), least recently used first"""
+        files = []
+        for path in self.directory.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+        return sorted(files)
+
+    def _evict(self):
+        """Delete least recently used entries until the directory fits max_bytes"""
+        files = self._scan()
+        total, kept = sum(size for _, size, _ in files), len(files)
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+                self.evictions += 1
+            except FileNotFoundError:
+                pass  # Another worker evicted it
+            total -= size
+            kept -= 1
+        self.entries, self.bytes = kept, total
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "entries": self.entries,
+            "bytes": self.bytes,
+            "evictions": self.evictions,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hit_ratio, 4)
+        }
+
+
+# Global cache instance
+_sentence_cache: Optional[SentenceCache] = None
+
+
+def get_sentence_cache(config: Optional[Dict[str, Any]] = None) -> Optional[SentenceCache]:
+    """
+    Get or create the global sentence cache from the `sentence_cache`
+    config section (None when disabled).
+    """
+    global _sentence_cache
+    if _sentence_cache is None:
+        settings = (config or {}).get("sentence_cache", {})
+        if not settings.get("enabled", False):
+            return None
+        _sentence_cache = SentenceCache(
+            settings.get("directory", "./sentence_cache"),
+            max_bytes=int(settings.get("max_mb", DEFAULT_MAX_MB) * 1024 * 1024),
+            sample_rate=(config or {}).get("audio_output", {}).get("sample_rate", 24000)
+        )
+    return _sentence_cache
@@ -2,6 +2,13 @@
 """
 Chatterbox TTS Server with Twilio Integration
 Complete FastAPI server for voice agent system with LLM and TTS
+
+Fast start: heavy imports (torch, chatterbox) happen inside the model
+loader, and the LLM / Twilio SDKs are imported on first use. With
+`model.background_load` (default on) the port is bound immediately and the
+model loads in a background task; /health reports its progress and /ready
+stays 503 until it is loaded and warmed up. Profile import time with
+`python scripts/profile_imports.py server`.
 """
 
 import os
@@ -10,13 +17,12 @@ import logging
 import asyncio
 import base64
 import json
+import time
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime
 
 import yaml
-import torch
-import soundfile as sf
 import numpy as np
 from fastapi import FastAPI, HTTPException, Request, Response, File, UploadFile, Form
 from fastapi.responses import StreamingResponse, JSONResponse
@@ -26,32 +32,21 @@ import uvicorn
 import asyncpg
 import redis.asyncio as aioredis
 
-# Import Chatterbox TTS
-from chatterbox.tts import ChatterboxTTS
-
 # Import our production modules
 from auth import APIKeyMiddleware
 from api_v1 import router as api_v1_router
-from monitoring import router as monitoring_router, set_app_info, set_model_loaded
-
-# LLM clients
-try:
-    from anthropic import Anthropic
-except ImportError:
-    Anthropic = None
-
-try:
-    from openai import OpenAI
-except ImportError:
-    OpenAI = None
-
-# Twilio
-try:
-    from twilio.twiml.voice_response import VoiceResponse, Gather
-    from twilio.rest import Client as TwilioClient
-except ImportError:
-    VoiceResponse = None
-    TwilioClient = None
+from tts_engines import TTSEngine, get_engine_registry
+from voice_catalog import VoiceCatalog
+from audio_encoding import encode_wav
+from time_stretch import time_stretch
+from media_streams import router as media_streams_router, media_stream_twiml, discard_call
+from batch_jobs import router as batch_router, start_batch_worker
+from warmup import Warmup, warmup_voices, FAILED as WARMUP_FAILED
+from admission import get_admission_controller
+from synthesis_lanes import get_lane_scheduler, INTERACTIVE
+from engine_fallback import get_fallback_router, load_fallback_engine
+from model_manager import get_model_manager
+from monitoring import router as monitoring_router, set_app_info, set_model_loaded, set_model_ready, record_warmup
 
 # Configure logging
 logging.basicConfig(
@@ -82,16 +77,11 @@ def load_config():
 
     config['llm']['api_key'] = os.getenv('ANTHROPIC_API_KEY') or os.getenv('OPENAI_API_KEY') or config['llm'].get('api_key', '')
 
-    # Device configuration
-    device = os.getenv('CHATTERBOX_DEVICE', config['model'].get('device', 'auto'))
-    if device == 'auto':
-        if torch.cuda.is_available():
-            device = 'cuda'
-        elif hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
-            device = 'mps'
-        else:
-            device = 'cpu'
-    config['model']['device'] = device
+    # Device configuration ("auto" is resolved by the model loader, which imports torch)
+    config['model']['device'] = os.getenv('CHATTERBOX_DEVICE', config['model'].get('device', 'auto'))
+    background_load = os.getenv('MODEL_BACKGROUND_LOAD')
+    if background_load is not None:
+        config['model']['background_load'] = background_load.lower() in ('1', 'true', 'yes')
     
     # Database configuration
     if 'database' not in config:
@@ -111,6 +101,29 @@ def load_config():
 
     return config
 
+def resolve_device(device: str) -> str:
+    """Resolve "auto" to cuda, mps or cpu (imports torch)"""
+    if device != 'auto':
+        return device
+    try:
+        import torch
+    except ImportError:
+        return 'cpu'
+    if torch.cuda.is_available():
+        return 'cuda'
+    if hasattr(torch.backends, 'mps') and torch.backends.mps.is_available():
+        return 'mps'
+    return 'cpu'
+
+
+def twiml_classes():
+    """Twilio TwiML builders, imported on first use ((None, None) without the SDK)"""
+    try:
+        from twilio.twiml.voice_response import VoiceResponse, Gather
+        return VoiceResponse, Gather
+    except ImportError:
+        return None, None
+
 config = load_config()
 
 # Initialize FastAPI
@@ -139,10 +152,60 @@ app.state.config = config
 class AppState:
     """Application state manager"""
     def __init__(self):
-        self.tts_model: Optional[ChatterboxTTS] = None
+        self.tts_model: Optional[TTSEngine] = None
         self.llm_client: Optional[Any] = None
         self.twilio_client: Optional[Any] = None
         self.call_sessions: Dict[str, Dict] = {}  # Track active calls
+        self.model_status: Dict[str, Any] = {"status": "pending", "phase": None, "started_at": None, "error": None}
+        self._llm_checked = False
+        self._twilio_checked = False
+
+    def get_llm_client(self) -> Optional[Any]:
+        """LLM client, created (and its SDK imported) on first use"""
+        if not self._llm_checked:
+            self._llm_checked = True
+            try:
+                provider = config['llm']['provider']
+                api_key = config['llm']['api_key']
+                if provider == 'anthropic' and api_key:
+                    from anthropic import Anthropic
+                    self.llm_client = Anthropic(api_key=api_key)
+                    logger.info("✓ Anthropic LLM client initialized")
+                elif provider == 'openai' and api_key:
+                    from openai import OpenAI
+                    self.llm_client = OpenAI(api_key=api_key)
+                    logger.info("✓ OpenAI LLM client initialized")
+                else:
+                    logger.warning("LLM client not initialized (missing API key or provider)")
+            except Exception as e:
+                logger.error(f"Failed to initialize LLM client: {e}")
+        return self.llm_client
+
+    def get_twilio_client(self) -> Optional[Any]:
+        """Twilio REST client, created (and its SDK imported) on first use"""
+        if not self._twilio_checked:
+            self._twilio_checked = True
+            try:
+                if config['twilio']['account_sid'] and config['twilio']['auth_token']:
+                    from twilio.rest import Client as TwilioClient
+                    self.twilio_client = TwilioClient(
+                        config['twilio']['account_sid'],
+                        config['twilio']['auth_token']
+                    )
+                    logger.info("✓ Twilio client initialized")
+                else:
+                    logger.warning("Twilio client not initialized (missing credentials)")
+            except Exception as e:
+                logger.error(f"Failed to initialize Twilio client: {e}")
+        return self.twilio_client
+
+    def model_progress(self) -> Dict[str, Any]:
+        """Model loading progress for /health"""
+        progress = dict(self.model_status)
+        if progress["started_at"]:
+            end = progress.pop("finished_at", None) or time.time()
+            progress["elapsed_seconds"] = round(end - progress["started_at"], 1)
+        return progress
 
 state = AppState()
 
@@ -175,6 +238,77 @@ class LLMRequest(BaseModel):
     max_tokens: int = 150
     temperature: float = 0.7
 
+async def run_warmup(warmup: Warmup):
+    """Run model warm-up and publish readiness"""
+    state.model_status["phase"] = "warming up"
+    stats = await warmup.run()
+    record_warmup(stats['latency'])
+    set_model_ready(warmup.ready)
+    state.model_status["phase"] = f"warm-up {warmup.status}"
+
+
+async def load_model():
+    """Resolve the device, load the TTS engine off the event loop, then start warm-up"""
+    status = state.model_status
+    status.update(status="loading", phase="resolving device", started_at=time.time())
+    try:
+        config['model']['device'] = await asyncio.to_thread(resolve_device, config['model']['device'])
+        manager = get_model_manager(config)
+        manager.device = config['model']['device']
+        status["phase"] = f"loading {manager.default} on {config['model']['device']}"
+        logger.info(f"Loading {manager.default} TTS engine on {config['model']['device']}...")
+
+        # Primary engine: pinned in the model manager, further models load on demand
+        state.tts_model = await manager.acquire(manager.default)
+        app.state.tts_model = state.tts_model  # Also store in app.state for API v1
+        get_engine_registry().register(state.tts_model, default=True, name=manager.default)
+        set_model_loaded(True)
+        status.update(status="loaded", phase="loaded", finished_at=time.time())
+        logger.info(f"✓ TTS model loaded successfully in {time.time() - status['started_at']:.1f}s")
+    except Exception as e:
+        logger.error(f"Failed to load TTS model: {e}")
+        logger.error("Server will start but TTS will not work until model is loaded")
+        status.update(status="failed", phase="failed", error=str(e), finished_at=time.time())
+        set_model_loaded(False)
+        return
+
+    # Fallback engine for requests the primary queue can't serve within budget
+    if state.tts_model.name != "kokoro":
+        app.state.fallback_task = asyncio.create_task(load_fallback())
+    app.state.preload_task = asyncio.create_task(manager.preload())
+
+    # Warm up in the background; /ready stays 503 until it finishes
+    warmup_config = config.get('warmup', {})
+    app.state.warmup = Warmup(
+        state.tts_model,
+        warmup_voices(config) if warmup_config.get('enabled', True) else [],
+        rounds=warmup_config.get('rounds', 3),
+        retries=warmup_config.get('retries', 2),
+        retry_delay=warmup_config.get('retry_delay', 5.0)
+    )
+    if warmup_config.get('enabled', True):
+        app.state.warmup_task = asyncio.create_task(run_warmup(app.state.warmup))
+    else:
+        app.state.warmup.skip()
+        set_model_ready(True)
+
+
+async def load_fallback():
+    """Load the fallback engine and track it (pinned) in the model manager"""
+    router = get_fallback_router(config)
+    engine = await asyncio.to_thread(load_fallback_engine, router)
+    if engine is not None:
+        get_model_manager(config).adopt(router.engine_name, engine, pinned=True)
+
+
+def require_model():
+    """Raise 503 unless the TTS model is loaded (with Retry-After while it is loading)"""
+    if state.tts_model:
+        return
+    if state.model_status["status"] in ("pending", "loading"):
+        raise HTTPException(status_code=503, detail="TTS model loading", headers={"Retry-After": "10"})
+    raise HTTPException(status_code=503, detail="TTS model not loaded")
+
 # Startup event
 @app.on_event("startup")
 async def startup_event():
@@ -206,6 +340,20 @@ async def startup_event():
         logger.warning(f"Database unavailable, continuing without authentication: {e}")
         app.state.pg = None
     
+    # Load voice catalog into memory (keeps Postgres off the TTS hot path)
+    app.state.voice_catalog = None
+    if app.state.pg:
+        try:
+            catalog = VoiceCatalog(
+                app.state.pg,
+                refresh_interval=config.get('voice_catalog', {}).get('refresh_interval', 30)
+            )
+            await catalog.load()
+            catalog.start()
+            app.state.voice_catalog = catalog
+        except Exception as e:
+            logger.warning(f"Voice catalog unavailable, falling back to per-request queries: {e}")
+    
     # Initialize Redis connection (OPTIONAL - graceful degradation)
     try:
         redis_config = config.get('redis', {})
@@ -235,46 +383,25 @@ async def startup_event():
         logger.warning("⚠ Authentication middleware disabled - running in open mode")
         logger.warning("⚠ All endpoints accessible without API keys")
 
-    # Initialize TTS model
-    try:
-        logger.info(f"Loading Chatterbox TTS model on {config['model']['device']}...")
-        state.tts_model = ChatterboxTTS.from_pretrained(device=config['model']['device'])
-        app.state.tts_model = state.tts_model  # Also store in app.state for API v1
-        set_model_loaded(True)
-        logger.info("✓ TTS model loaded successfully")
-    except Exception as e:
-        logger.error(f"Failed to load TTS model: {e}")
-        logger.error("Server will start but TTS will not work until model is loaded")
-        set_model_loaded(False)
+    # Model admission (concurrency bound, load-driven guidance mode)
+    get_admission_controller(config)
 
-    # Initialize LLM client
-    try:
-        provider = config['llm']['provider']
-        api_key = config['llm']['api_key']
-
-        if provider == 'anthropic' and Anthropic and api_key:
-            state.llm_client = Anthropic(api_key=api_key)
-            logger.info("✓ Anthropic LLM client initialized")
-        elif provider == 'openai' and OpenAI and api_key:
-            state.llm_client = OpenAI(api_key=api_key)
-            logger.info("✓ OpenAI LLM client initialized")
-        else:
-            logger.warning("LLM client not initialized (missing API key or provider)")
-    except Exception as e:
-        logger.error(f"Failed to initialize LLM client: {e}")
+    # Load TTS model (in the background by default, so the port binds immediately)
+    set_model_ready(False)
+    if config['model'].get('background_load', True):
+        app.state.model_task = asyncio.create_task(load_model())
+        logger.info("TTS model loading in background (progress on /health)")
+    else:
+        await load_model()
 
-    # Initialize Twilio client
+    # LLM and Twilio clients are created on first use (state.get_llm_client / get_twilio_client)
+
+    # Start batch worker (resumes jobs left unfinished by a previous run)
     try:
-        if TwilioClient and config['twilio']['account_sid'] and config['twilio']['auth_token']:
-            state.twilio_client = TwilioClient(
-                config['twilio']['account_sid'],
-                config['twilio']['auth_token']
-            )
-            logger.info("✓ Twilio client initialized")
-        else:
-            logger.warning("Twilio client not initialized (missing credentials)")
+        app.state.batch_worker = await start_batch_worker(app, config)
     except Exception as e:
-        logger.error(f"Failed to initialize Twilio client: {e}")
+        logger.error(f"Failed to start batch worker: {e}")
+        app.state.batch_worker = None
 
     # Set application info for monitoring
     set_app_info(
@@ -289,7 +416,7 @@ async def startup_event():
     logger.info(f"Port: {config['server']['port']}")
     logger.info(f"Database: {'✓ Connected' if app.state.pg else '✗ Not connected'}")
     logger.info(f"Redis: {'✓ Connected' if app.state.redis else '✗ Not connected'}")
-    logger.info(f"TTS Model: {'✓ Loaded' if state.tts_model else '✗ Not loaded'}")
+    logger.info(f"TTS Model: {'✓ Loaded' if state.tts_model else state.model_status['status']}")
     logger.info("=" * 80)
 
 
@@ -298,6 +425,19 @@ async def shutdown_event():
     """Cleanup on shutdown"""
     logger.info("Shutting down server...")
     
+    # Cancel model loading / warm-up if still running
+    for task_name in ('model_task', 'warmup_task'):
+        if getattr(app.state, task_name, None):
+            getattr(app.state, task_name).cancel()
+
+    # Stop voice catalog refresh
+    if getattr(app.state, 'voice_catalog', None):
+        await app.state.voice_catalog.stop()
+    
+    # Stop batch worker (unfinished jobs resume on next start)
+    if getattr(app.state, 'batch_worker', None):
+        await app.state.batch_worker.stop()
+    
     # Close database pool
     if hasattr(app.state, 'pg') and app.state.pg:
         await app.state.pg.close()
@@ -319,8 +459,10 @@ async def root():
         "service": "CallWaiting TTS API",
         "version": "1.0.0",
         "model_loaded": state.tts_model is not None,
-        "llm_available": state.llm_client is not None,
-        "twilio_available": state.twilio_client is not None,
+        "engine": state.tts_model.name if state.tts_model else None,
+        "model_status": state.model_status["status"],
+        "llm_available": bool(config['llm']['api_key']),
+        "twilio_available": bool(config['twilio']['account_sid'] and config['twilio']['auth_token']),
         "database_connected": hasattr(app.state, 'pg') and app.state.pg is not None,
         "redis_connected": hasattr(app.state, 'redis') and app.state.redis is not None,
         "device": config['model']['device'],
@@ -328,6 +470,25 @@ async def root():
         "api_v1": "/v1"
     }
 
+@app.get("/live")
+async def liveness_probe():
+    """Liveness probe: the process and event loop are responsive"""
+    return {"status": "alive"}
+
+@app.get("/ready")
+async def readiness_probe():
+    """Readiness probe: 200 only once the model is loaded and warmed up"""
+    warmup = getattr(app.state, 'warmup', None)
+    ready = state.tts_model is not None and warmup is not None and warmup.ready
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={
+            "ready": ready,
+            "model_loaded": state.tts_model is not None,
+            "warmup": warmup.get_stats() if warmup else None
+        }
+    )
+
 @app.get("/health")
 async def health_check():
     """Detailed health check"""
@@ -337,10 +498,17 @@ async def health_check():
         "components": {
             "tts_model": state.tts_model is not None,
             "database": hasattr(app.state, 'pg') and app.state.pg is not None,
+            "voice_catalog": getattr(app.state, 'voice_catalog', None) is not None,
             "redis": hasattr(app.state, 'redis') and app.state.redis is not None,
-            "llm_client": state.llm_client is not None,
-            "twilio_client": state.twilio_client is not None
+            "llm_client": bool(config['llm']['api_key']),
+            "twilio_client": bool(config['twilio']['account_sid'] and config['twilio']['auth_token'])
         },
+        "model": state.model_progress(),
+        "acceleration": getattr(state.tts_model, "acceleration", None),
+        "warmup": app.state.warmup.get_stats() if getattr(app.state, 'warmup', None) else None,
+        "admission": get_admission_controller(config).get_stats(),
+        "fallback": get_fallback_router(config).get_stats(),
+        "models": get_model_manager(config).get_stats(),
         "config": {
             "device": config['model']['device'],
             "llm_provider": config['llm']['provider']
@@ -348,8 +516,15 @@ async def health_check():
     }
 
     warnings = []
-    if not state.tts_model:
+    if state.model_status["status"] in ("pending", "loading"):
+        warnings.append(f"TTS model loading ({state.model_status['phase']})")
+    elif not state.tts_model:
         warnings.append("TTS model not loaded")
+    warmup = getattr(app.state, 'warmup', None)
+    if warmup is not None and warmup.status == WARMUP_FAILED:
+        warnings.append(f"Warm-up failed, not ready ({warmup.error})")
+    elif warmup is not None and warmup.voice_errors:
+        warnings.append(f"Warm-up skipped voices: {', '.join(sorted(warmup.voice_errors))}")
     if not hasattr(app.state, 'pg') or not app.state.pg:
         warnings.append("Database not connected")
     if not hasattr(app.state, 'redis') or not app.state.redis:
@@ -365,13 +540,14 @@ async def health_check():
 # Include production API routes
 app.include_router(api_v1_router, tags=["API v1"])
 app.include_router(monitoring_router, tags=["Monitoring"])
+app.include_router(media_streams_router, tags=["Twilio Media Streams"])
+app.include_router(batch_router, tags=["Batch Jobs"])
 
 # TTS Generation Endpoint
 @app.post("/tts")
 async def generate_tts(request: TTSRequest):
     """Generate TTS audio from text"""
-    if not state.tts_model:
-        raise HTTPException(status_code=503, detail="TTS model not loaded")
+    require_model()
 
     try:
         logger.info(f"Generating TTS for: {request.text[:50]}...")
@@ -385,33 +561,37 @@ async def generate_tts(request: TTSRequest):
             else:
                 logger.warning(f"Voice file not found: {voice_path}, using default")
 
-        # Generate audio
-        wav = state.tts_model.generate(
-            text=request.text,
-            exaggeration=request.exaggeration,
-            temperature=request.temperature,
-            cfg_weight=request.cfg_weight,
-            seed=request.seed if request.seed > 0 else None,
-            reference_audio=reference_audio
-        )
+        # Generate audio (non-default languages may wait for their model to load)
+        manager = get_model_manager(config)
+        async with manager.use(manager.resolve(language=request.language)) as engine, \
+                get_lane_scheduler().slot(INTERACTIVE), get_admission_controller().slot():
+            wav = await asyncio.to_thread(
+                engine.generate,
+                text=request.text,
+                exaggeration=request.exaggeration,
+                temperature=request.temperature,
+                cfg_weight=request.cfg_weight,
+                seed=request.seed if request.seed > 0 else None,
+                reference_audio=reference_audio,
+                language=request.language
+            )
 
         # Apply speed factor if needed
         if request.speed_factor != 1.0:
-            import librosa
-            wav = librosa.effects.time_stretch(wav, rate=1.0 / request.speed_factor)
+            wav = time_stretch(wav, rate=1.0 / request.speed_factor)
 
-        # Save to temporary file
+        # Encode in memory (no disk round trip)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = Path("outputs") / f"tts_{timestamp}.wav"
-        sf.write(output_path, wav, config['audio_output']['sample_rate'])
+        filename = f"tts_{timestamp}.wav"
+        audio = encode_wav(wav, config['audio_output']['sample_rate'])
 
-        logger.info(f"Generated audio saved to {output_path}")
+        logger.info(f"Generated audio: {filename} ({audio.nbytes} bytes)")
 
         # Return audio file
         return StreamingResponse(
-            iter([open(output_path, "rb").read()]),
+            iter([audio]),
             media_type="audio/wav",
-            headers={"Content-Disposition": f"attachment; filename={output_path.name}"}
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
 
     except Exception as e:
@@ -422,8 +602,7 @@ async def generate_tts(request: TTSRequest):
 @app.post("/v1/audio/speech")
 async def openai_speech(request: OpenAISpeechRequest):
     """OpenAI-compatible TTS endpoint"""
-    if not state.tts_model:
-        raise HTTPException(status_code=503, detail="TTS model not loaded")
+    require_model()
 
     try:
         # Convert to internal format
@@ -444,14 +623,15 @@ async def openai_speech(request: OpenAISpeechRequest):
 @app.post("/llm")
 async def generate_llm_response(request: LLMRequest):
     """Generate LLM response"""
-    if not state.llm_client:
+    llm_client = state.get_llm_client()
+    if not llm_client:
         raise HTTPException(status_code=503, detail="LLM client not initialized")
 
     try:
         provider = config['llm']['provider']
 
         if provider == 'anthropic':
-            response = state.llm_client.messages.create(
+            response = llm_client.messages.create(
                 model=config['llm']['model'],
                 max_tokens=request.max_tokens,
                 temperature=request.temperature,
@@ -460,7 +640,7 @@ async def generate_llm_response(request: LLMRequest):
             text = response.content[0].text
 
         elif provider == 'openai':
-            response = state.llm_client.chat.completions.create(
+            response = llm_client.chat.completions.create(
                 model=config['llm']['model'],
                 max_tokens=request.max_tokens,
                 temperature=request.temperature,
@@ -481,6 +661,7 @@ async def generate_llm_response(request: LLMRequest):
 @app.post("/twilio/voice")
 async def twilio_voice_webhook(request: Request):
     """Handle incoming Twilio voice calls"""
+    VoiceResponse, Gather = twiml_classes()
     if not VoiceResponse:
         raise HTTPException(status_code=503, detail="Twilio not available")
 
@@ -519,6 +700,7 @@ async def twilio_voice_webhook(request: Request):
 @app.post("/twilio/process-speech")
 async def process_speech(request: Request):
     """Process speech input from Twilio"""
+    VoiceResponse, Gather = twiml_classes()
     if not VoiceResponse:
         raise HTTPException(status_code=503, detail="Twilio not available")
 
@@ -530,7 +712,7 @@ async def process_speech(request: Request):
 
     # Get LLM response
     try:
-        if state.llm_client:
+        if state.get_llm_client():
             llm_response = await generate_llm_response(
                 LLMRequest(prompt=speech_result)
             )
@@ -546,24 +728,16 @@ async def process_speech(request: Request):
                 'timestamp': datetime.now().isoformat()
             })
 
-        # Generate TTS
-        if state.tts_model:
-            wav = state.tts_model.generate(
-                text=response_text,
-                exaggeration=1.3,
-                temperature=0.8
-            )
-
-            # Save audio for Twilio
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            audio_path = Path("outputs") / f"call_{call_sid}_{timestamp}.wav"
-            sf.write(audio_path, wav, config['audio_output']['sample_rate'])
-
-            logger.info(f"Generated response audio: {audio_path}")
-
         # Create TwiML response
         response = VoiceResponse()
-        response.say(response_text)
+        if state.tts_model:
+            # Speak with our own voice: the reply is synthesized and streamed
+            # into the call over a bidirectional Media Stream
+            stream_url = config['twilio'].get('media_stream_url') or \
+                f"wss://{request.headers.get('host', request.url.netloc)}/twilio/media-stream"
+            media_stream_twiml(response, stream_url, call_sid=call_sid, text=response_text)
+        else:
+            response.say(response_text)
 
         # Continue conversation
         gather = Gather(
@@ -593,7 +767,8 @@ async def twilio_status_callback(request: Request):
     logger.info(f"Call {call_sid} status: {call_status}")
 
     # Clean up session on call end
-    if call_status in ['completed', 'failed', 'busy', 'no-answer']:
+    if call_status in ['completed', 'failed', 'busy', 'no-answer', 'canceled']:
+        discard_call(call_sid)
         if call_sid in state.call_sessions:
             session = state.call_sessions.pop(call_sid)
             logger.info(f"Call session ended: {session}")
@@ -23,10 +23,12 @@ logger = logging.getLogger(__name__)
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
+import yaml
 import torch
 
 # Import TTS
-from chatterbox.tts import ChatterboxTTS
+from tts_engines import load_engine, get_engine_registry
+from engine_fallback import get_fallback_router, load_fallback_engine
 
 # Import our production API
 from api_production import router as production_router
@@ -52,6 +54,7 @@ app.add_middleware(
 
 # Store model in app state
 app.state.tts_model = None
+app.state.config = {}
 
 @app.on_event("startup")
 async def startup():
@@ -64,6 +67,11 @@ async def startup():
     for d in ['outputs', 'logs', 'model_cache', 'voices']:
         Path(d).mkdir(exist_ok=True)
 
+    # Optional config (admission, engine fallback, audio output)
+    config_path = Path("config/config.yaml")
+    if config_path.exists():
+        app.state.config = yaml.safe_load(config_path.read_text()) or {}
+
     # Bootstrap voices
     logger.info("Loading voice configurations...")
     voice_manager = get_voice_manager()
@@ -81,10 +89,13 @@ async def startup():
         logger.info("⚠ Using CPU mode (slower)")
 
     # Load TTS model
-    logger.info(f"Loading Chatterbox TTS model on {device}...")
+    logger.info(f"Loading {os.getenv('TTS_ENGINE', 'chatterbox')} TTS engine on {device}...")
     try:
-        app.state.tts_model = ChatterboxTTS.from_pretrained(device=device)
+        app.state.tts_model = load_engine(device=device)
+        get_engine_registry().register(app.state.tts_model, default=True)
         logger.info("✓ TTS model loaded successfully")
+        if app.state.tts_model.name != "kokoro":
+            load_fallback_engine(get_fallback_router(app.state.config))
     except Exception as e:
         logger.error(f"✗ Failed to load TTS model: {e}")
         logger.error("Server will start but TTS will not work")
@@ -120,8 +131,10 @@ async def root():
         "status": "running",
         "version": "1.0.0",
         "model_loaded": app.state.tts_model is not None,
+        "engine": app.state.tts_model.name if app.state.tts_model else None,
         "endpoints": {
             "tts": "/api/tts",
+            "tts_template": "/api/tts/template",
             "voices": "/api/voices",
             "health": "/api/health",
             "docs": "/docs"
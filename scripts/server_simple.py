@@ -10,19 +10,15 @@ from pathlib import Path
 from datetime import datetime
 
 import torch
-import soundfile as sf
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
 
-# Import Chatterbox TTS
-try:
-    from chatterbox.tts import ChatterboxTTS
-except ImportError:
-    ChatterboxTTS = None
-    logging.error("Chatterbox TTS not installed!")
+from audio_encoding import encode_wav
+from time_stretch import time_stretch
+from tts_engines import load_engine
 
 # Configure logging
 logging.basicConfig(
@@ -80,17 +76,14 @@ async def startup_event():
         device = 'cpu'
         logger.warning("No GPU detected, using CPU (will be slow!)")
     
-    # Load TTS model
-    if ChatterboxTTS:
-        try:
-            logger.info(f"Loading Chatterbox TTS model on {device}...")
-            tts_model = ChatterboxTTS.from_pretrained(device=device)
-            logger.info("✓ TTS model loaded successfully!")
-        except Exception as e:
-            logger.error(f"Failed to load TTS model: {e}")
-            logger.error("Server will start but TTS will not work")
-    else:
-        logger.error("ChatterboxTTS not available")
+    # Load TTS engine (TTS_ENGINE=chatterbox|kokoro|fake)
+    try:
+        logger.info(f"Loading {os.getenv('TTS_ENGINE', 'chatterbox')} TTS engine on {device}...")
+        tts_model = load_engine(device=device)
+        logger.info("✓ TTS model loaded successfully!")
+    except Exception as e:
+        logger.error(f"Failed to load TTS model: {e}")
+        logger.error("Server will start but TTS will not work")
     
     logger.info("=" * 80)
     logger.info("Server startup complete!")
@@ -107,6 +100,7 @@ async def root():
         "service": "Chatterbox TTS API (Simple)",
         "version": "1.0.0",
         "model_loaded": tts_model is not None,
+        "engine": tts_model.name if tts_model else None,
         "device": "cuda" if torch.cuda.is_available() else "cpu",
         "docs": "/docs",
         "endpoints": {
@@ -144,27 +138,19 @@ async def generate_tts(request: TTSRequest):
         
         # Apply speed if needed
         if request.speed != 1.0:
-            try:
-                import librosa
-                wav = librosa.effects.time_stretch(wav, rate=1.0 / request.speed)
-            except ImportError:
-                logger.warning("librosa not available, skipping speed adjustment")
+            wav = time_stretch(wav, rate=1.0 / request.speed)
         
-        # Save to temporary file
+        # Encode in memory (no disk round trip)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = Path("outputs") / f"tts_{timestamp}.wav"
-        sf.write(output_path, wav, 24000)
+        filename = f"tts_{timestamp}.wav"
+        audio = encode_wav(wav, 24000)
         
-        logger.info(f"Generated audio: {output_path}")
-        
-        # Return audio
-        with open(output_path, "rb") as f:
-            audio_data = f.read()
+        logger.info(f"Generated audio: {filename} ({audio.nbytes} bytes)")
         
         return StreamingResponse(
-            iter([audio_data]),
+            iter([audio]),
             media_type="audio/wav",
-            headers={"Content-Disposition": f"attachment; filename={output_path.name}"}
+            headers={"Content-Disposition": f"attachment; filename={filename}"}
         )
         
     except Exception as e:
@@ -182,15 +168,10 @@ async def simple_generate(text: str):
         
         wav = tts_model.generate(text=text)
         
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = Path("outputs") / f"tts_{timestamp}.wav"
-        sf.write(output_path, wav, 24000)
-        
-        with open(output_path, "rb") as f:
-            audio_data = f.read()
+        audio = encode_wav(wav, 24000)
         
         return StreamingResponse(
-            iter([audio_data]),
+            iter([audio]),
             media_type="audio/wav"
         )
         
@@ -0,0 +1,249 @@
+"""
+Silence Trimming
+================
+Energy-gate trimming of leading and trailing near-silence.
+
+Chatterbox output often starts and ends with several hundred milliseconds
+of near-silence. On a call that is dead air before the first word, and on
+every response it is payload nobody hears. The gate measures RMS per 10 ms
+frame (vectorized per block) and drops silence before the first voiced
+frame and after the last one, keeping a configurable pad on each side so
+onsets and decays are not clipped.
+
+`SilenceTrimmer` works block by block for streaming responses: voiced audio
+passes straight through, and only a silent run is held back until it is
+known whether speech resumes (internal pause, released) or the stream ends
+(trailing silence, trimmed to the tail pad). `trim_silence` is the one-shot
+form for buffered audio and returns a view, not a copy.
+
+Usage:
+    trimmer = SilenceTrimmer(sample_rate=24000, head_pad_ms=50, tail_pad_ms=100)
+    for block in blocks:
+        send(trimmer.process(block))
+    send(trimmer.flush())
+    record(trimmer.trimmed_ms)
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from audio_encoding import as_mono_float32
+
+logger = logging.getLogger(__name__)
+
+SILENCE_THRESHOLD_DB = -45.0      # Frame RMS below this counts as silence
+SILENCE_FRAME_MS = 10.0
+DEFAULT_HEAD_PAD_MS = 50.0
+DEFAULT_TAIL_PAD_MS = 100.0
+
+# Longest silent run held back while streaming; longer pauses are released
+# (minus the tail pad) so a stalled stream does not buffer without bound
+MAX_HOLD_MS = 2000.0
+
+
+def silent_frames(wav: np.ndarray, frame: int, threshold_db: float = SILENCE_THRESHOLD_DB) -> np.ndarray:
+    """
+    Per-frame silence mask (vectorized; a partial last frame is included).
+
+    Returns:
+        bool array, True where frame RMS is below the threshold
+    """
+    count = -(-len(wav) // frame)
+    padded = np.zeros(count * frame, dtype=np.float32)
+    padded[:len(wav)] = wav
+    frames = padded.reshape(count, frame)
+    energy = np.einsum("ij,ij->i", frames, frames) / frame
+    return energy < 10 ** (threshold_db / 10)
+
+
+def leading_silence(wav: np.ndarray, frame: int, threshold_db: float = SILENCE_THRESHOLD_DB) -> int:
+    """Samples of silence at the start of wav (frame resolution)"""
+    if len(wav) == 0:
+        return 0
+    voiced = np.flatnonzero(~silent_frames(wav, frame, threshold_db))
+    return len(wav) if len(voiced) == 0 else int(voiced[0]) * frame
+
+
+def trailing_silence(wav: np.ndarray, frame: int, threshold_db: float = SILENCE_THRESHOLD_DB) -> int:
+    """Samples of silence at the end of wav (frame resolution)"""
+    return leading_silence(wav[::-1], frame, threshold_db)
+
+
+def trim_silence(
+    wav,
+    sample_rate: int = 24000,
+    head_pad_ms: float = DEFAULT_HEAD_PAD_MS,
+    tail_pad_ms: float = DEFAULT_TAIL_PAD_MS,
+    threshold_db: float = SILENCE_THRESHOLD_DB
+) -> Tuple[np.ndarray, int, int]:
+    """
+    Trim leading/trailing silence from a complete buffer.
+
+    Returns:
+        (view of the kept audio, head samples trimmed, tail samples trimmed)
+    """
+    samples = as_mono_float32(wav)
+    frame = max(1, int(sample_rate * SILENCE_FRAME_MS / 1000))
+
+    head = max(0, leading_silence(samples, frame, threshold_db) - int(sample_rate * head_pad_ms / 1000))
+    if head >= len(samples):
+        # All silence: nothing worth sending
+        return samples[:0], len(samples), 0
+
+    tail = max(0, trailing_silence(samples, frame, threshold_db) - int(sample_rate * tail_pad_ms / 1000))
+    return samples[head:len(samples) - tail], head, tail
+
+
+class SilenceTrimmer:
+    """
+    Streaming leading/trailing silence gate.
+
+    Output is delayed by at most one partial frame while speech is active;
+    silent runs are held until the next voiced frame or `flush`.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 24000,
+        head_pad_ms: float = DEFAULT_HEAD_PAD_MS,
+        tail_pad_ms: float = DEFAULT_TAIL_PAD_MS,
+        threshold_db: float = SILENCE_THRESHOLD_DB,
+        max_hold_ms: float = MAX_HOLD_MS
+    ):
+        self.sample_rate = sample_rate
+        self.threshold_db = threshold_db
+        self.frame = max(1, int(sample_rate * SILENCE_FRAME_MS / 1000))
+        self.head_pad = int(sample_rate * head_pad_ms / 1000)
+        self.tail_pad = int(sample_rate * tail_pad_ms / 1000)
+        self.max_hold = max(int(sample_rate * max_hold_ms / 1000), self.tail_pad)
+
+        self._started = False
+        self._remainder = np.empty(0, dtype=np.float32)   # Partial frame
+        self._held: List[np.ndarray] = []                 # Silent run (head pad or pause)
+        self._held_samples = 0
+
+        self.trimmed_head_samples = 0
+        self.trimmed_tail_samples = 0
+
+    @classmethod
+    def from_config(cls, settings: Optional[Dict[str, Any]], sample_rate: int = 24000) -> Optional["SilenceTrimmer"]:
+        """Build from the `audio_output.trim_silence` config section (None if disabled)"""
+        settings = settings or {}
+        if not settings.get("enabled", True):
+            return None
+        return cls(
+            sample_rate=sample_rate,
+            head_pad_ms=settings.get("head_pad_ms", DEFAULT_HEAD_PAD_MS),
+            tail_pad_ms=settings.get("tail_pad_ms", DEFAULT_TAIL_PAD_MS),
+            threshold_db=settings.get("threshold_db", SILENCE_THRESHOLD_DB)
+        )
+
+    @property
+    def trimmed_head_ms(self) -> float:
+        return self.trimmed_head_samples * 1000 / self.sample_rate
+
+    @property
+    def trimmed_tail_ms(self) -> float:
+        return self.trimmed_tail_samples * 1000 / self.sample_rate
+
+    @property
+    def trimmed_ms(self) -> float:
+        return self.trimmed_head_ms + self.trimmed_tail_ms
+
+    def trim(self, wav) -> np.ndarray:
+        """One-shot trim of a complete buffer with this trimmer's settings (returns a view)"""
+        kept, head, tail = trim_silence(
+            wav, self.sample_rate,
+            head_pad_ms=self.head_pad * 1000 / self.sample_rate,
+            tail_pad_ms=self.tail_pad * 1000 / self.sample_rate,
+            threshold_db=self.threshold_db
+        )
+        self.trimmed_head_samples += head
+        self.trimmed_tail_samples += tail
+        return kept
+
+    def _hold(self, silence: np.ndarray):
+        self._held.append(silence)
+        self._held_samples += len(silence)
+
+    def _take_held(self) -> List[np.ndarray]:
+        held, self._held, self._held_samples = self._held, [], 0
+        return held
+
+    def _keep_last(self, samples: int):
+        """Before speech: keep only the last `samples` of held silence (the head pad)"""
+        excess = self._held_samples - samples
+        if excess <= 0:
+            return
+        joined = np.concatenate(self._held)
+        self._held = [joined[excess:].copy()]
+        self._held_samples = samples
+        self.trimmed_head_samples += excess
+
+    def process(self, block) -> np.ndarray:
+        """
+        Gate a block of audio.
+
+        Returns:
+            Samples that can be sent now (may be empty)
+        """
+        block = as_mono_float32(block)
+        if len(self._remainder):
+            block = np.concatenate((self._remainder, block))
+        whole = len(block) - len(block) % self.frame
+        self._remainder = block[whole:].copy()
+        block = block[:whole]
+        if not whole:
+            return block
+
+        voiced = np.flatnonzero(~silent_frames(block, self.frame, self.threshold_db))
+        if len(voiced) == 0:
+            self._hold(block)
+            if not self._started:
+                self._keep_last(self.head_pad)
+            elif self._held_samples > self.max_hold:
+                # Long pause: release all but a tail pad's worth
+                joined = np.concatenate(self._take_held())
+                release = len(joined) - self.tail_pad
+                self._hold(joined[release:])
+                return joined[:release]
+            return np.empty(0, dtype=np.float32)
+
+        first = int(voiced[0]) * self.frame
+        last = (int(voiced[-1]) + 1) * self.frame
+
+        if not self._started:
+            self._hold(block[:first])
+            self._keep_last(self.head_pad)
+            self._started = True
+            output = self._take_held() + [block[first:last]]
+        else:
+            output = self._take_held() + [block[:last]]
+
+        if last < len(block):
+            self._hold(block[last:])
+        return np.concatenate(output)
+
+    def flush(self) -> np.ndarray:
+        """End of stream: release up to the tail pad of held silence"""
+        if len(self._remainder):
+            remainder, self._remainder = self._remainder, np.empty(0, dtype=np.float32)
+            if not silent_frames(remainder, self.frame, self.threshold_db)[0]:
+                # Final partial frame is voiced: nothing after it to trim
+                if not self._started:
+                    self._keep_last(self.head_pad)
+                    self._started = True
+                return np.concatenate(self._take_held() + [remainder])
+            self._hold(remainder)
+
+        if not self._started:
+            # Nothing voiced at all
+            self.trimmed_head_samples += self._held_samples
+            self._take_held()
+            return np.empty(0, dtype=np.float32)
+
+        held = np.concatenate(self._take_held()) if self._held else np.empty(0, dtype=np.float32)
+        self.trimmed_tail_samples += max(0, len(held) - self.tail_pad)
+        return held[:self.tail_pad]
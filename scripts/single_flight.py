@@ -0,0 +1,166 @@
+"""
+Single-Flight Request Coalescing
+================================
+Runs identical concurrent synthesis requests once.
+
+When a campaign fires, hundreds of requests with the same text, voice and
+parameters arrive together. Without coalescing each one is synthesized
+separately (and sessionless requests are serialized per voice by
+`VoiceRequestQueue`), so the last caller waits for N identical renders.
+
+`SingleFlight` keys requests by a canonical hash of everything that
+affects the output. The first request for a key (the leader) starts the
+producer in a background task; every identical request that arrives while
+it runs (a follower) subscribes to the same flight. Each subscriber gets
+every item published so far, then follows live, so late joiners receive
+the complete response even mid-stream. The flight is forgotten once it
+finishes: this is coalescing, not caching.
+
+The producer keeps running if the leader disconnects, and is cancelled
+only when every subscriber has gone.
+
+Usage:
+    flights = get_single_flight("v1")
+    stream, joined = flights.subscribe(request_key(text=text, voice=voice_id), lambda: render(text))
+    return StreamingResponse(stream)
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def request_key(**fields: Any) -> str:
+    """Canonical key for a synthesis request (order-independent, None-stable)"""
+    canonical = json.dumps(fields, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class Flight:
+    """One in-flight production: a growing list of items plus completion state"""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.items: List[Any] = []
+        self.done = False
+        self.error: Optional[BaseException] = None
+        self.subscribers = 0
+        self.task: Optional[asyncio.Task] = None
+        self._changed = asyncio.Condition()
+
+    async def publish(self, item: Any):
+        async with self._changed:
+            self.items.append(item)
+            self._changed.notify_all()
+
+    async def finish(self, error: Optional[BaseException] = None):
+        async with self._changed:
+            self.done = True
+            self.error = error
+            self._changed.notify_all()
+
+    async def stream(self) -> AsyncIterator[Any]:
+        """Replay everything published so far, then follow until the flight ends"""
+        self.subscribers += 1
+        index = 0
+        try:
+            while True:
+                async with self._changed:
+                    await self._changed.wait_for(lambda: index < len(self.items) or self.done)
+                    items = self.items[index:]
+                    finished, error = self.done, self.error
+                index += len(items)
+
+                for item in items:
+                    yield item
+                if finished and index >= len(self.items):
+                    if error is not None:
+                        raise error
+                    return
+        finally:
+            self.subscribers -= 1
+            if self.subscribers == 0 and not self.done and self.task is not None:
+                logger.info(f"Single-flight {self.key[:12]}: all subscribers gone, cancelling")
+                self.task.cancel()
+
+
+class SingleFlight:
+    """Registry of in-flight productions for one endpoint"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._flights: Dict[str, Flight] = {}
+
+        # Stats
+        self.total_requests = 0
+        self.leader_requests = 0
+        self.joined_requests = 0
+
+    def subscribe(self, key: str, producer: Callable[[], AsyncIterator[Any]]) -> Tuple[AsyncIterator[Any], bool]:
+        """
+        Join the flight for key, starting it with producer() if none is running.
+
+        Returns:
+            (item stream, True if this request joined an existing flight)
+        """
+        self.total_requests += 1
+        flight = self._flights.get(key)
+        joined = flight is not None
+
+        if joined:
+            self.joined_requests += 1
+            logger.info(
+                f"Single-flight {self.name}: joined {key[:12]} "
+                f"({flight.subscribers} streaming, {len(flight.items)} items ready)"
+            )
+        else:
+            self.leader_requests += 1
+            flight = self._flights[key] = Flight(key)
+            flight.task = asyncio.create_task(self._run(flight, producer))
+
+        return flight.stream(), joined
+
+    async def _run(self, flight: Flight, producer: Callable[[], AsyncIterator[Any]]):
+        error = None
+        try:
+            async for item in producer():
+                await flight.publish(item)
+        except asyncio.CancelledError as e:
+            error = e
+        except Exception as e:
+            logger.error(f"Single-flight {self.name}: producer failed: {e}")
+            error = e
+        finally:
+            # New requests after this point start a fresh flight
+            self._flights.pop(flight.key, None)
+            await flight.finish(error)
+
+    @property
+    def dedup_ratio(self) -> float:
+        """Share of requests served by joining an existing flight"""
+        return self.joined_requests / self.total_requests if self.total_requests else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "total_requests": self.total_requests,
+            "leader_requests": self.leader_requests,
+            "joined_requests": self.joined_requests,
+            "dedup_ratio": round(self.dedup_ratio, 4),
+            "in_flight": len(self._flights)
+        }
+
+
+# Global registries, one per endpoint
+_single_flights: Dict[str, SingleFlight] = {}
+
+
+def get_single_flight(name: str) -> SingleFlight:
+    """Get or create the single-flight registry for an endpoint"""
+    if name not in _single_flights:
+        _single_flights[name] = SingleFlight(name)
+        logger.info(f"Single-flight coalescing initialized for {name}")
+    return _single_flights[name]
@@ -0,0 +1,370 @@
+"""
+Streaming Compressed Encoders
+=============================
+In-process, incremental encoders for compressed response formats
+(MP3, Opus in Ogg, raw Opus packets).
+
+The old MP3 path buffered the whole waveform, wrote a WAV, loaded it into
+pydub and spawned ffmpeg for a one-shot export: one subprocess per request
+and nothing sent until everything was done. These encoders keep one
+persistent encoder per stream instead. Each synthesized chunk is converted
+to PCM16 (`audio_encoding.finalize_audio`) and fed in; whatever compressed
+frames are complete are returned immediately.
+
+Opus is far smaller for speech: 24-32 kbps sounds close to 128k MP3 and is
+~5% of the 384 kbps of 24 kHz PCM16 WAV.
+
+Usage:
+    encoder = StreamingMP3Encoder(sample_rate=24000, bitrate=128)
+    # or StreamingOpusEncoder(sample_rate=24000, bitrate=32, container="ogg")
+    for wav_chunk in synthesized_chunks:
+        data = encoder.encode(wav_chunk)
+        if data:
+            yield data
+    yield encoder.flush()
+"""
+
+import io
+import struct
+import random
+import logging
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from audio_encoding import finalize_audio, as_mono_float32
+
+logger = logging.getLogger(__name__)
+
+# LAME bindings (optional dependency; pydub + ffmpeg is the fallback)
+try:
+    import lameenc
+except ImportError:
+    lameenc = None
+
+# Opus bindings (optional dependency; needs the libopus shared library)
+try:
+    import opuslib
+except Exception:  # ImportError, or a bare Exception when libopus is missing
+    opuslib = None
+
+MP3_STREAMING = lameenc is not None
+OPUS_AVAILABLE = opuslib is not None
+
+MEDIA_TYPES = {
+    "mp3": "audio/mpeg",
+    "opus": "audio/ogg; codecs=opus",
+    # Raw Opus packets, each prefixed with its length (uint16 big-endian)
+    "opus_packets": "audio/opus",
+}
+
+# Bitrates in kbps: (default, min, max)
+BITRATES = {
+    "mp3": (128, 8, 320),
+    "opus": (32, 6, 510),
+    "opus_packets": (32, 6, 510),
+}
+
+# Sample rates libopus accepts natively
+OPUS_SAMPLE_RATES = (8000, 12000, 16000, 24000, 48000)
+
+# Samples per block fed to the encoder by iter_encode (0.5 s at 24 kHz)
+ENCODE_BLOCK = 12000
+
+
+class StreamingMP3Encoder:
+    """
+    Frame-incremental MP3 encoder (LAME, in process).
+
+    MP3 frames are 1152 samples (576 at ≤24 kHz); LAME buffers partial frames
+    internally, so `encode` can be called with blocks of any size and
+    returns only complete frames.
+    """
+
+    media_type = "audio/mpeg"
+
+    def __init__(self, sample_rate: int = 24000, bitrate: int = 128, quality: int = 5):
+        if lameenc is None:
+            raise RuntimeError("lameenc not installed - streaming MP3 unavailable")
+
+        self.sample_rate = sample_rate
+        self.bitrate = bitrate
+
+        self._encoder = lameenc.Encoder()
+        self._encoder.set_bit_rate(bitrate)
+        self._encoder.set_in_sample_rate(sample_rate)
+        self._encoder.set_channels(1)
+        self._encoder.set_quality(quality)  # 2 = best, 5 = LAME default (~3x faster), 7 = fastest
+
+        self.samples_in = 0
+        self.bytes_out = 0
+
+    def encode(self, wav) -> bytes:
+        """
+        Encode a block of float audio (scaled in place, see finalize_audio).
+
+        Returns:
+            MP3 bytes for the frames completed by this block (may be empty)
+        """
+        pcm = finalize_audio(wav, encoding="pcm16")
+        if len(pcm) == 0:
+            return b""
+        data = bytes(self._encoder.encode(pcm.tobytes()))
+        self.samples_in += len(pcm)
+        self.bytes_out += len(data)
+        return data
+
+    def flush(self) -> bytes:
+        """Encode buffered samples and return the final frames"""
+        data = bytes(self._encoder.flush())
+        self.bytes_out += len(data)
+        return data
+
+    def iter_encode(self, wav, block: int = ENCODE_BLOCK) -> Iterator[bytes]:
+        """Encode a complete buffer block by block, yielding frames as they are ready"""
+        samples = as_mono_float32(wav)
+        for start in range(0, len(samples), block):
+            data = self.encode(samples[start:start + block])
+            if data:
+                yield data
+        yield self.flush()
+
+
+def encode_mp3_pydub(wav, sample_rate: int = 24000, bitrate: int = 128) -> bytes:
+    """
+    One-shot MP3 encoding through pydub + ffmpeg.
+
+    Fallback for deployments without lameenc; spawns an ffmpeg subprocess.
+    """
+    from pydub import AudioSegment
+
+    # Work on a copy: callers fall back to WAV from the same samples on failure
+    pcm = finalize_audio(as_mono_float32(wav).copy(), encoding="pcm16", mode="normalize")
+    segment = AudioSegment(pcm.tobytes(), frame_rate=sample_rate, sample_width=2, channels=1)
+    buffer = io.BytesIO()
+    segment.export(buffer, format="mp3", bitrate=f"{bitrate}k")
+    return buffer.getvalue()
+
+
+def resolve_bitrate(format: str, bitrate: Optional[int] = None) -> int:
+    """
+    Pick and validate the bitrate (kbps) for a compressed format.
+
+    Raises:
+        ValueError: If the bitrate is out of range for the format
+    """
+    default, low, high = BITRATES[format]
+    if bitrate is None:
+        return default
+    if not low <= bitrate <= high:
+        raise ValueError(f"Bitrate for {format} must be between {low} and {high} kbps")
+    return bitrate
+
+
+def _build_ogg_crc_table() -> List[int]:
+    """CRC-32 table for Ogg (polynomial 0x04C11DB7, not bit-reflected)"""
+    table = []
+    for i in range(256):
+        r = i << 24
+        for _ in range(8):
+            r = ((r << 1) ^ 0x04C11DB7) if r & 0x80000000 else r << 1
+        table.append(r & 0xFFFFFFFF)
+    return table
+
+
+OGG_CRC_TABLE = _build_ogg_crc_table()
+
+
+def ogg_crc(data: bytes) -> int:
+    """Ogg page checksum (zlib.crc32 is bit-reflected, so it cannot be used)"""
+    crc = 0
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ OGG_CRC_TABLE[(crc >> 24) ^ byte]
+    return crc
+
+
+class OggPageWriter:
+    """
+    Minimal Ogg muxer for a single logical stream.
+
+    Packets are grouped into pages of at most 255 lacing segments; each
+    page carries the granule position of its last packet.
+    """
+
+    def __init__(self, serial: Optional[int] = None):
+        self.serial = serial if serial is not None else random.getrandbits(32)
+        self.sequence = 0
+
+    def _page(self, packets: List[bytes], granule: int, flags: int) -> bytes:
+        lacing = bytearray()
+        for packet in packets:
+            lacing.extend(b"\xff" * (len(packet) // 255))
+            lacing.append(len(packet) % 255)
+
+        header = struct.pack(
+            "<4sBBqIIIB", b"OggS", 0, flags, granule, self.serial, self.sequence, 0, len(lacing)
+        )
+        page = bytearray(header + lacing + b"".join(packets))
+        struct.pack_into("<I", page, 22, ogg_crc(page))
+        self.sequence += 1
+        return bytes(page)
+
+    def pages(self, packets: List[Tuple[bytes, int]], bos: bool = False, eos: bool = False) -> bytes:
+        """
+        Write (packet, granule) pairs as one or more pages.
+
+        Args:
+            packets: Complete packets with the granule position after each
+            bos: Mark the first page as beginning of stream
+            eos: Mark the last page as end of stream
+        """
+        output = []
+        group: List[bytes] = []
+        segments = 0
+        granule = 0
+
+        for packet, packet_granule in packets:
+            needed = len(packet) // 255 + 1
+            if group and segments + needed > 255:
+                output.append(self._page(group, granule, 0x02 if bos and not output else 0))
+                group, segments = [], 0
+            group.append(packet)
+            segments += needed
+            granule = packet_granule
+
+        if group:
+            flags = (0x02 if bos and not output else 0) | (0x04 if eos else 0)
+            output.append(self._page(group, granule, flags))
+
+        return b"".join(output)
+
+
+class StreamingOpusEncoder:
+    """
+    Frame-incremental Opus encoder (libopus, in process).
+
+    Audio is cut into 20 ms frames; a partial trailing frame waits for the
+    next block. With container="ogg" the output is a standard Ogg Opus
+    stream (RFC 7845) playable by browsers; with container="packets" each
+    Opus packet is written with a 2-byte big-endian length prefix for
+    clients (e.g. WebRTC) that feed packets to a decoder directly.
+    """
+
+    def __init__(self, sample_rate: int = 24000, bitrate: int = 32, container: str = "ogg", frame_ms: int = 20):
+        if opuslib is None:
+            raise RuntimeError("opuslib/libopus not installed - Opus unavailable")
+        if sample_rate not in OPUS_SAMPLE_RATES:
+            raise ValueError(f"Opus does not support {sample_rate} Hz input")
+        if container not in ("ogg", "packets"):
+            raise ValueError(f"Unsupported Opus container: {container}")
+
+        self.sample_rate = sample_rate
+        self.bitrate = bitrate
+        self.container = container
+        self.frame_size = sample_rate * frame_ms // 1000
+
+        self._encoder = opuslib.Encoder(sample_rate, 1, "voip")
+        self._encoder.bitrate = bitrate * 1000
+
+        # Ogg granule positions always count 48 kHz samples
+        self._granule_scale = 48000 // sample_rate
+        self.pre_skip = self._encoder.lookahead * self._granule_scale
+
+        self._ogg = OggPageWriter() if container == "ogg" else None
+        self._pending = np.empty(0, dtype=np.float32)
+        self._headers_sent = False
+
+        self.samples_in = 0
+        self.samples_encoded = 0
+        self.bytes_out = 0
+
+    @property
+    def media_type(self) -> str:
+        return MEDIA_TYPES["opus" if self.container == "ogg" else "opus_packets"]
+
+    def _headers(self) -> bytes:
+        """OpusHead (BOS) and OpusTags pages"""
+        head = b"OpusHead" + struct.pack("<BBHIhB", 1, 1, self.pre_skip, self.sample_rate, 0, 0)
+        vendor = b"chatterbox-tts"
+        tags = b"OpusTags" + struct.pack("<I", len(vendor)) + vendor + struct.pack("<I", 0)
+        return self._ogg.pages([(head, 0)], bos=True) + self._ogg.pages([(tags, 0)])
+
+    def _encode_frames(self, samples: np.ndarray) -> List[Tuple[bytes, int]]:
+        packets = []
+        for start in range(0, len(samples), self.frame_size):
+            frame = samples[start:start + self.frame_size]
+            packet = self._encoder.encode_float(frame.tobytes(), self.frame_size)
+            self.samples_encoded += self.frame_size
+            packets.append((packet, self.samples_encoded * self._granule_scale))
+        return packets
+
+    def _emit(self, packets: List[Tuple[bytes, int]], eos: bool = False) -> bytes:
+        if self._ogg is None:
+            data = b"".join(struct.pack(">H", len(packet)) + packet for packet, _ in packets)
+        else:
+            data = b""
+            if not self._headers_sent:
+                data = self._headers()
+                self._headers_sent = True
+            if packets:
+                data += self._ogg.pages(packets, eos=eos)
+        self.bytes_out += len(data)
+        return data
+
+    def encode(self, wav) -> bytes:
+        """
+        Encode a block of float audio.
+
+        Returns:
+            Ogg pages or length-prefixed packets for the whole 20 ms frames
+            available so far (the Ogg headers come with the first call)
+        """
+        samples = as_mono_float32(wav)
+        self.samples_in += len(samples)
+        if len(self._pending):
+            samples = np.concatenate((self._pending, samples))
+
+        whole = len(samples) - len(samples) % self.frame_size
+        self._pending = samples[whole:].copy()
+        return self._emit(self._encode_frames(samples[:whole]))
+
+    def flush(self) -> bytes:
+        """Encode the remaining audio plus the encoder lookahead, ending the stream"""
+        # Zero-pad so the last real sample makes it through the lookahead
+        tail = len(self._pending) + self.pre_skip // self._granule_scale
+        tail += -tail % self.frame_size
+        samples = np.zeros(tail, dtype=np.float32)
+        samples[:len(self._pending)] = self._pending
+        self._pending = np.empty(0, dtype=np.float32)
+
+        packets = self._encode_frames(samples)
+        if self._ogg is not None and packets:
+            # Final granule trims the padding (RFC 7845 §4)
+            end = self.pre_skip + self.samples_in * self._granule_scale
+            packets[-1] = (packets[-1][0], min(end, packets[-1][1]))
+        return self._emit(packets, eos=True)
+
+    def iter_encode(self, wav, block: int = ENCODE_BLOCK) -> Iterator[bytes]:
+        """Encode a complete buffer block by block, yielding output as it is ready"""
+        samples = as_mono_float32(wav)
+        for start in range(0, len(samples), block):
+            data = self.encode(samples[start:start + block])
+            if data:
+                yield data
+        yield self.flush()
+
+
+def create_streaming_encoder(format: str, sample_rate: int = 24000, bitrate: Optional[int] = None):
+    """
+    Create the incremental encoder for a compressed format.
+
+    Returns:
+        StreamingMP3Encoder or StreamingOpusEncoder (both expose encode/flush/iter_encode)
+    """
+    bitrate = resolve_bitrate(format, bitrate)
+    if format == "mp3":
+        return StreamingMP3Encoder(sample_rate=sample_rate, bitrate=bitrate)
+    if format in ("opus", "opus_packets"):
+        container = "ogg" if format == "opus" else "packets"
+        return StreamingOpusEncoder(sample_rate=sample_rate, bitrate=bitrate, container=container)
+    raise ValueError(f"No streaming encoder for format: {format}")
@@ -0,0 +1,215 @@
+"""
+Streaming Generation
+====================
+Sub-sentence audio: vocode windows of speech tokens while T3 is still
+decoding the rest of the sentence.
+
+Chatterbox samples speech tokens autoregressively (25 per second of audio)
+and only then runs the S3Gen vocoder over the whole sequence, so the first
+audio of a sentence waits for the whole sentence. Here the decode loop
+(guidance.iter_speech_tokens) yields tokens as they are sampled, and each
+time a window of new tokens is ready it is vocoded and its audio yielded:
+
+- the first window is short (`first_tokens`, 0.4 s of audio by default),
+  so first audio arrives after a few hundred milliseconds; later windows
+  are longer (`tokens`), which costs less vocoder overhead per second
+- each window is vocoded together with the `context_tokens` before it, and
+  the context's audio is dropped, so the vocoder sees the same left
+  acoustic context as in a whole-sentence pass
+- consecutive windows overlap by `crossfade_ms` and are joined with a
+  raised-cosine crossfade (both windows render the same signal there, so
+  the fades sum to one rather than keeping equal power), so window seams
+  do not click
+
+`astream` turns any engine's blocking `stream()` into an async iterator
+(the engine runs in a worker thread; closing the iterator stops it after
+the current block). Engines without streaming yield the whole clip, so
+callers keep their sentence-level behaviour.
+
+Usage:
+    async for block in astream(engine, text, windows=StreamWindows(), **params):
+        ...
+"""
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, fields
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RATE = 25          # Speech tokens per second of audio
+SPEECH_VOCAB_SIZE = 6561  # Token IDs at or above this are special tokens
+
+
+@dataclass
+class StreamWindows:
+    """Token window sizes for streaming generation"""
+    first_tokens: int = 10      # First window (0.4 s): time to first audio
+    tokens: int = 25            # Later windows (1 s)
+    context_tokens: int = 8     # Re-vocoded before each window, audio dropped
+    crossfade_ms: float = 20.0  # Overlap joined across window seams
+
+    @classmethod
+    def from_config(cls, settings: Optional[Dict[str, Any]]) -> "StreamWindows":
+        """From the `streaming` config section (unknown keys ignored)"""
+        names = {field.name for field in fields(cls)}
+        return cls(**{name: value for name, value in (settings or {}).items() if name in names})
+
+
+def stream_windows(config: Optional[Dict[str, Any]]) -> Optional[StreamWindows]:
+    """Window sizes from the `streaming` config section (None when disabled)"""
+    settings = (config or {}).get("streaming") or {}
+    if not settings.get("enabled", True):
+        return None
+    return StreamWindows.from_config(settings)
+
+
+class WindowVocoder:
+    """Vocodes growing token sequences window by window and stitches the audio"""
+
+    def __init__(self, vocode, windows: StreamWindows, sample_rate: int = 24000):
+        """
+        Args:
+            vocode: Callable mapping a list of token IDs to float32 audio
+            windows: Window sizes
+            sample_rate: Output sample rate
+        """
+        self.vocode = vocode
+        self.windows = windows
+        self.samples_per_token = sample_rate // TOKEN_RATE
+        self.crossfade = min(int(sample_rate * windows.crossfade_ms / 1000), self.samples_per_token)
+        self.tokens = []
+        self.done = 0              # Tokens whose audio has been emitted (up to the held-back tail)
+        self._tail = np.empty(0, dtype=np.float32)
+        self.windows_vocoded = 0
+
+        theta = (np.arange(self.crossfade, dtype=np.float32) + 0.5) * (np.pi / 2 / max(self.crossfade, 1))
+        self._fade_in, self._fade_out = np.sin(theta) ** 2, np.cos(theta) ** 2
+
+    def add(self, token: int) -> Optional[np.ndarray]:
+        """Add one sampled token; returns audio once a window is complete"""
+        if token >= SPEECH_VOCAB_SIZE:
+            return None
+        self.tokens.append(token)
+        window = self.windows.first_tokens if self.done == 0 else self.windows.tokens
+        if len(self.tokens) - self.done < window:
+            return None
+        return self._emit(final=False)
+
+    def finish(self) -> np.ndarray:
+        """Audio for the remaining tokens (end of sentence)"""
+        if len(self.tokens) == self.done:
+            tail, self._tail = self._tail, np.empty(0, dtype=np.float32)
+            return tail
+        return self._emit(final=True)
+
+    def _emit(self, final: bool) -> np.ndarray:
+        start, end = self.done, len(self.tokens)
+        context_start = max(0, start - self.windows.context_tokens)
+        audio = np.asarray(self.vocode(self.tokens[context_start:end]), dtype=np.float32)
+        self.windows_vocoded += 1
+
+        # Drop the context's audio, keeping the crossfade overlap before the seam
+        skip = (start - context_start) * self.samples_per_token
+        overlap = min(self.crossfade, len(self._tail), skip)
+        audio = audio[skip - overlap:]
+        if overlap:
+            mixed = self._tail[len(self._tail) - overlap:] * self._fade_out + audio[:overlap] * self._fade_in
+            audio = np.concatenate((self._tail[:len(self._tail) - overlap], mixed, audio[overlap:]))
+        elif len(self._tail):
+            audio = np.concatenate((self._tail, audio))
+
+        self.done = end
+        if final:
+            self._tail = np.empty(0, dtype=np.float32)
+            return audio
+        keep = min(self.crossfade, len(audio))
+        self._tail = audio[len(audio) - keep:].copy()
+        return audio[:len(audio) - keep]
+
+
+def chatterbox_stream(
+    model,
+    text: str,
+    temperature: float = 0.8,
+    exaggeration: float = 0.5,
+    cfg_weight: float = 0.5,
+    audio_prompt_path: Optional[str] = None,
+    windows: Optional[StreamWindows] = None,
+    repetition_penalty: float = 1.2,
+    min_p: float = 0.05,
+    top_p: float = 1.0,
+    max_new_tokens: int = 1000,
+    backend=None
+) -> Iterator[np.ndarray]:
+    """
+    ChatterboxTTS generation yielding audio window by window (guided, or
+    guidance-free with cfg_weight 0). Each block is watermarked as upstream
+    watermarks whole clips.
+    """
+    import torch
+    from guidance import iter_speech_tokens, prepare_text_tokens, unguided_backend
+
+    text_tokens = prepare_text_tokens(model, text, exaggeration, audio_prompt_path)
+
+    def vocode(tokens):
+        speech_tokens = torch.tensor(tokens, dtype=torch.long, device=model.device)
+        wav, _ = model.s3gen.inference(speech_tokens=speech_tokens, ref_dict=model.conds.gen)
+        return wav.squeeze(0).detach().cpu().numpy()
+
+    def finish(audio: np.ndarray) -> np.ndarray:
+        return model.watermarker.apply_watermark(audio, sample_rate=model.sr) if len(audio) else audio
+
+    vocoder = WindowVocoder(vocode, windows or StreamWindows(), sample_rate=model.sr)
+    with torch.inference_mode():
+        for token in iter_speech_tokens(
+            model.t3, backend or unguided_backend(model.t3), model.conds.t3, text_tokens,
+            max_new_tokens, temperature, repetition_penalty, min_p, top_p, cfg_weight=cfg_weight
+        ):
+            audio = vocoder.add(int(token))
+            if audio is not None and len(audio):
+                yield finish(audio)
+        yield finish(vocoder.finish())
+    logger.debug(f"Streamed {len(vocoder.tokens)} tokens in {vocoder.windows_vocoded} windows")
+
+
+_DONE = object()
+
+
+async def astream(engine, text: str, **params) -> AsyncIterator[np.ndarray]:
+    """
+    Async iterator over `engine.stream(text, **params)`, run in a worker
+    thread. Closing the iterator early stops the engine after its current
+    block.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+
+    def produce():
+        try:
+            for block in engine.stream(text, **params):
+                loop.call_soon_threadsafe(queue.put_nowait, block)
+                if stop.is_set():
+                    break
+        except BaseException as e:
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+        else:
+            loop.call_soon_threadsafe(queue.put_nowait, _DONE)
+
+    worker = loop.run_in_executor(None, produce)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        await asyncio.shield(worker)
@@ -0,0 +1,96 @@
+"""
+Synthesis Lanes
+===============
+Two-lane access to the TTS model: interactive requests first, bulk work
+(batch jobs) only when the model is otherwise idle.
+
+A batch of hundreds of reminders must not add latency to live calls.
+Interactive synthesis never waits on this scheduler. Bulk synthesis takes
+one of `bulk_concurrency` slots and then waits until no interactive
+synthesis is running before each model call. Pre-emption is at model-call
+granularity: a bulk call already running finishes, and the next one waits.
+
+Usage:
+    lanes = get_lane_scheduler()
+    async with lanes.slot("bulk"):
+        wav = await asyncio.to_thread(tts_model.generate, ...)
+"""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+
+
+class LaneScheduler:
+    """Gives interactive synthesis priority over bulk synthesis"""
+
+    def __init__(self, bulk_concurrency: int = 1):
+        self.bulk_concurrency = bulk_concurrency
+        self._interactive_active = 0
+        self._idle: Optional[asyncio.Event] = None
+        self._bulk_slots: Optional[asyncio.Semaphore] = None
+
+        # Stats
+        self.interactive_calls = 0
+        self.bulk_calls = 0
+        self.bulk_yields = 0
+
+    def _primitives(self):
+        # Created lazily so the scheduler can be built outside an event loop
+        if self._idle is None:
+            self._idle = asyncio.Event()
+            self._idle.set()
+            self._bulk_slots = asyncio.Semaphore(self.bulk_concurrency)
+        return self._idle, self._bulk_slots
+
+    @asynccontextmanager
+    async def slot(self, lane: str = INTERACTIVE):
+        """Hold the model for one synthesis call in the given lane"""
+        idle, bulk_slots = self._primitives()
+
+        if lane != BULK:
+            self._interactive_active += 1
+            self.interactive_calls += 1
+            idle.clear()
+            try:
+                yield
+            finally:
+                self._interactive_active -= 1
+                if self._interactive_active == 0:
+                    idle.set()
+            return
+
+        async with bulk_slots:
+            if not idle.is_set():
+                self.bulk_yields += 1
+            await idle.wait()
+            self.bulk_calls += 1
+            yield
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "interactive_active": self._interactive_active,
+            "interactive_calls": self.interactive_calls,
+            "bulk_calls": self.bulk_calls,
+            "bulk_yields": self.bulk_yields,
+            "bulk_concurrency": self.bulk_concurrency
+        }
+
+
+# Global scheduler instance
+_lane_scheduler: Optional[LaneScheduler] = None
+
+
+def get_lane_scheduler() -> LaneScheduler:
+    """Get or create the global lane scheduler"""
+    global _lane_scheduler
+    if _lane_scheduler is None:
+        _lane_scheduler = LaneScheduler()
+        logger.info("Synthesis lane scheduler initialized")
+    return _lane_scheduler
@@ -0,0 +1,238 @@
+"""
+Telephony Audio Output
+======================
+Native 8 kHz G.711 (μ-law / A-law) output for phone calls.
+
+Twilio and most SIP trunks carry 8 kHz G.711. Instead of returning 24 kHz
+WAV/MP3 and transcoding downstream, the TTS output is converted in-process:
+
+1. Polyphase decimating FIR (24 kHz → 8 kHz): only every third output
+   sample is computed, as a sum of short per-phase correlations.
+2. Table-driven G.711 companding (`audio_encoding.finalize_audio`).
+3. Frame alignment: output is cut into 20 ms frames (160 bytes at 8 kHz).
+
+Both stages are stateful, so audio can be fed block by block as synthesis
+chunks finish and frames stream out without discontinuities.
+
+Usage:
+    encoder = TelephonyEncoder("mulaw", input_rate=24000)
+    for wav_chunk in synthesized_chunks:
+        for frame in iter_frames(encoder.encode(wav_chunk)):
+            send(frame)
+    for frame in iter_frames(encoder.flush()):
+        send(frame)
+"""
+
+import logging
+from typing import Iterator
+
+import numpy as np
+
+from audio_encoding import as_mono_float32, finalize_audio, SILENCE_CODES
+
+logger = logging.getLogger(__name__)
+
+TELEPHONY_SAMPLE_RATE = 8000
+FRAME_MS = 20
+FRAME_SAMPLES = TELEPHONY_SAMPLE_RATE * FRAME_MS // 1000  # 160 samples = 160 bytes
+
+MEDIA_TYPES = {
+    "mulaw": "audio/x-mulaw; rate=8000; channels=1",
+    "alaw": "audio/x-alaw; rate=8000; channels=1",
+}
+
+
+def design_lowpass(num_taps: int, cutoff: float, beta: float = 8.0) -> np.ndarray:
+    """
+    Design a Kaiser-windowed sinc lowpass FIR.
+
+    Args:
+        num_taps: Filter length
+        cutoff: Cutoff as a fraction of the input sample rate (0 < cutoff < 0.5)
+        beta: Kaiser window shape (higher = more stopband attenuation)
+
+    Returns:
+        float32 taps with unity DC gain
+    """
+    n = np.arange(num_taps) - (num_taps - 1) / 2
+    taps = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(num_taps, beta)
+    taps /= taps.sum()
+    return taps.astype(np.float32)
+
+
+class PolyphaseDecimator:
+    """
+    Streaming integer-factor decimator (e.g. 24 kHz → 8 kHz).
+
+    A decimating FIR only needs one output per `factor` inputs; the polyphase
+    form computes exactly those outputs, so cost is taps/factor MACs per
+    input sample. Filter history and decimation phase carry over between
+    calls to `process`, so block boundaries are seamless.
+    """
+
+    def __init__(self, input_rate: int = 24000, output_rate: int = TELEPHONY_SAMPLE_RATE, taps_per_phase: int = 32):
+        if input_rate % output_rate != 0:
+            raise ValueError(f"Input rate {input_rate} is not a multiple of output rate {output_rate}")
+
+        self.input_rate = input_rate
+        self.output_rate = output_rate
+        self.factor = input_rate // output_rate
+
+        num_taps = taps_per_phase * self.factor
+        # -6 dB at ~3.7 kHz: flat through the 3.4 kHz telephony band
+        cutoff = 0.46 * output_rate / input_rate
+        taps = design_lowpass(num_taps, cutoff)[::-1]
+        # Polyphase components: phase r holds taps r, r + factor, r + 2*factor, ...
+        self.phases = [taps[r::self.factor].copy() for r in range(self.factor)]
+        self.num_taps = num_taps
+
+        self._history = np.zeros(num_taps - 1, dtype=np.float32)
+        self._phase = 0  # Offset of the next output window in the next signal
+
+    @property
+    def delay_samples(self) -> int:
+        """Group delay of the filter in output samples"""
+        return (self.num_taps - 1) // 2 // self.factor
+
+    def process(self, block) -> np.ndarray:
+        """
+        Decimate a block of input samples.
+
+        Returns:
+            float32 output samples (may be empty for tiny blocks)
+        """
+        block = as_mono_float32(block)
+        if self.factor == 1 or len(block) == 0:
+            return block
+
+        signal = np.concatenate((self._history, block))
+        factor = self.factor
+
+        # Output n uses the window starting at phase + n * factor
+        num_windows = len(signal) - self.num_taps + 1
+        count = max(0, -(-(num_windows - self._phase) // factor))
+
+        output = np.zeros(count, dtype=np.float32)
+        if count:
+            for r, phase_taps in enumerate(self.phases):
+                # Every factor-th sample of this phase, enough for `count` outputs
+                start = self._phase + r
+                stream = signal[start:start + (count + len(phase_taps) - 1) * factor:factor]
+                output += np.correlate(stream, phase_taps, mode="valid")[:count]
+
+        # Carry decimation phase and filter history into the next block
+        self._phase = self._phase + count * factor - num_windows
+        self._history = signal[len(signal) - (self.num_taps - 1):].copy()
+
+        return output
+
+    def flush(self) -> np.ndarray:
+        """Drain the filter tail (call once at end of stream)"""
+        return self.process(np.zeros(self.num_taps // 2, dtype=np.float32))
+
+
+class TelephonyEncoder:
+    """
+    Streaming float → 8 kHz G.711 encoder with 20 ms frame alignment.
+
+    `encode` returns only whole frames; a partial trailing frame is held
+    until more audio arrives, and `flush` pads it with digital silence.
+    """
+
+    def __init__(self, encoding: str = "mulaw", input_rate: int = 24000):
+        if encoding not in SILENCE_CODES:
+            raise ValueError(f"Unsupported telephony encoding: {encoding}")
+
+        self.encoding = encoding
+        self.resampler = PolyphaseDecimator(input_rate, TELEPHONY_SAMPLE_RATE)
+        self._pending = np.empty(0, dtype=np.uint8)
+
+        self.frames_sent = 0
+
+    @property
+    def media_type(self) -> str:
+        return MEDIA_TYPES[self.encoding]
+
+    def _frames(self, samples: np.ndarray, pad: bool) -> memoryview:
+        coded = finalize_audio(samples, encoding=self.encoding)
+        if len(self._pending):
+            coded = np.concatenate((self._pending, coded))
+
+        whole = len(coded) - len(coded) % FRAME_SAMPLES
+        if pad and whole < len(coded):
+            padded = np.full(whole + FRAME_SAMPLES, SILENCE_CODES[self.encoding], dtype=np.uint8)
+            padded[:len(coded)] = coded
+            coded, whole = padded, len(padded)
+
+        self._pending = coded[whole:].copy()
+        self.frames_sent += whole // FRAME_SAMPLES
+        return memoryview(coded[:whole])
+
+    def encode(self, wav) -> memoryview:
+        """
+        Encode a block of audio at the input rate.
+
+        Returns:
+            memoryview of whole 20 ms frames (length is a multiple of 160)
+        """
+        return self._frames(self.resampler.process(wav), pad=False)
+
+    def flush(self) -> memoryview:
+        """Emit remaining audio, padding the last frame with silence"""
+        return self._frames(self.resampler.flush(), pad=True)
+
+
+def iter_frames(data: memoryview, frames_per_chunk: int = 1) -> Iterator[memoryview]:
+    """Split frame-aligned G.711 data into 20 ms (or N × 20 ms) slices"""
+    step = FRAME_SAMPLES * frames_per_chunk
+    for start in range(0, len(data), step):
+        yield data[start:start + step]
+
+
+def _build_decode_tables() -> dict:
+    """Build 256-entry G.711 → PCM16 expansion tables (reference g711.c)"""
+    codes = np.arange(256, dtype=np.int32)
+
+    # μ-law: complement, then (mantissa << 3 + bias) << segment
+    u = ~codes & 0xFF
+    t = (((u & 0x0F) << 3) + 0x84) << ((u & 0x70) >> 4)
+    mulaw = np.where(u & 0x80, 0x84 - t, t - 0x84)
+
+    # A-law: toggle even bits, then mantissa with half-step offset << segment
+    a = codes ^ 0x55
+    segment = (a & 0x70) >> 4
+    t = ((a & 0x0F) << 4) + np.where(segment == 0, 8, 0x108)
+    t = np.where(segment > 1, t << np.maximum(segment - 1, 0), t)
+    alaw = np.where(a & 0x80, t, -t)
+
+    return {"mulaw": mulaw.astype(np.int16), "alaw": alaw.astype(np.int16)}
+
+
+DECODE_TABLES = _build_decode_tables()
+
+
+def decode_telephony(data, encoding: str = "mulaw") -> np.ndarray:
+    """
+    Expand G.711 bytes (e.g. inbound call audio) to PCM16 samples.
+
+    Returns:
+        int16 samples at the G.711 sample rate
+    """
+    if encoding not in DECODE_TABLES:
+        raise ValueError(f"Unsupported telephony encoding: {encoding}")
+    return DECODE_TABLES[encoding][np.frombuffer(data, dtype=np.uint8)]
+
+
+def encode_telephony(wav, encoding: str = "mulaw", input_rate: int = 24000) -> memoryview:
+    """
+    Encode a complete buffer to 8 kHz G.711 in one call.
+
+    Returns:
+        memoryview of frame-aligned G.711 bytes
+    """
+    encoder = TelephonyEncoder(encoding, input_rate)
+    body = encoder.encode(wav)
+    tail = encoder.flush()
+    if not len(tail):
+        return body
+    return memoryview(np.concatenate((np.frombuffer(body, dtype=np.uint8), np.frombuffer(tail, dtype=np.uint8))))
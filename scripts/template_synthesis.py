@@ -0,0 +1,254 @@
+"""
+Template-Slot Synthesis
+=======================
+Renders templated messages by synthesizing only their variable slots.
+
+Most call traffic is templated ("Your appointment is tomorrow at {time}.",
+"Your payment of {amount} has been processed."). Re-synthesizing the fixed
+wording on every call spends most model time on audio that never changes.
+Here a template is split into fixed segments and slots:
+
+- fixed segments are rendered once per voice (and voice parameters) and
+  kept in an in-memory LRU, optionally pre-rendered ahead of traffic
+- only slot values are synthesized at request time
+- the pieces are stitched with `ChunkAssembler` (equal-power crossfades,
+  boundary silence cut to a short phrase pause)
+
+Segments are synthesized in isolation, so prosody across a boundary is
+less fluid than a single render; templates read best when slots sit at
+phrase boundaries.
+
+Usage:
+    synthesizer = TemplateSynthesizer(tts_model)
+    wav, stats = await synthesizer.render(
+        "Your appointment is tomorrow at {time}.", {"time": "three P M"},
+        voice="maya-professional", params=voice_params
+    )
+    stats["cached_ratio"]   # share of output audio served from cache
+"""
+
+import asyncio
+import contextlib
+import logging
+import re
+import string
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from admission import get_admission_controller
+from synthesis_lanes import get_lane_scheduler, INTERACTIVE
+from audio_encoding import as_mono_float32
+from chunk_assembler import ChunkAssembler
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_PAUSE_MS = 40.0           # Silence kept at each segment boundary (mid-sentence)
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+MAX_SLOT_LENGTH = 200
+
+# Voice parameters that change a segment's audio (speed is applied after stitching)
+GENERATION_PARAMS = ("temperature", "exaggeration", "cfg_weight")
+
+_WORD = re.compile(r"\w")
+
+
+@dataclass
+class Segment:
+    """A fixed piece of template text, or a named slot"""
+    text: str
+    slot: Optional[str] = None
+
+    @property
+    def fixed(self) -> bool:
+        return self.slot is None
+
+
+def parse_template(template: str) -> List[Segment]:
+    """
+    Split a str.format-style template into fixed segments and slots.
+
+    Fixed text without any word characters (", " between two slots) is
+    dropped - the boundary pause stands in for it.
+
+    Raises:
+        ValueError: On malformed templates or positional / formatted fields
+    """
+    segments = []
+    for literal, field, format_spec, conversion in string.Formatter().parse(template):
+        literal = literal.strip()
+        if literal and _WORD.search(literal):
+            segments.append(Segment(literal))
+        if field is not None:
+            if not field.isidentifier() or format_spec or conversion:
+                raise ValueError(f"Template slots must be plain names like {{time}}, got {{{field}}}")
+            segments.append(Segment("", slot=field))
+    return segments
+
+
+class SegmentCache:
+    """LRU of rendered fixed segments, bounded by total bytes"""
+
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(voice: str, params: Dict[str, Any], text: str) -> Tuple:
+        return (voice, tuple(params.get(name) for name in GENERATION_PARAMS), text)
+
+    def get(self, key: Tuple) -> Optional[np.ndarray]:
+        wav = self._entries.get(key)
+        if wav is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return wav
+
+    def put(self, key: Tuple, wav: np.ndarray):
+        wav.setflags(write=False)  # Shared by every render: never scaled in place
+        if key in self._entries:
+            self.bytes -= self._entries.pop(key).nbytes
+        self._entries[key] = wav
+        self.bytes += wav.nbytes
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= evicted.nbytes
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "segments": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+class TemplateSynthesizer:
+    """Renders templates from cached fixed segments plus per-request slots"""
+
+    def __init__(self, tts_model, sample_rate: int = 24000, cache: Optional[SegmentCache] = None):
+        self.tts_model = tts_model
+        self.sample_rate = sample_rate
+        self.cache = cache or get_segment_cache()
+
+    async def _synthesize(self, text: str, params: Dict[str, Any]) -> np.ndarray:
+        async with get_lane_scheduler().slot(INTERACTIVE), get_admission_controller().slot():
+            wav = await asyncio.to_thread(
+                self.tts_model.generate,
+                text=text,
+                exaggeration=params['exaggeration'],
+                temperature=params['temperature'],
+                cfg_weight=params['cfg_weight']
+            )
+        return as_mono_float32(wav)
+
+    async def _fixed_segment(self, text: str, voice: str, params: Dict[str, Any]) -> Tuple[np.ndarray, bool]:
+        """Cached audio for a fixed segment (rendered on first use); returns (wav, was_cached)"""
+        key = SegmentCache.key(voice, params, text)
+        wav = self.cache.get(key)
+        if wav is not None:
+            return wav, True
+        wav = await self._synthesize(text, params)
+        self.cache.put(key, wav)
+        return wav, False
+
+    async def prerender(self, template: str, voice: str, params: Dict[str, Any]) -> int:
+        """
+        Render a template's fixed segments ahead of traffic.
+
+        Returns:
+            Number of segments newly rendered
+        """
+        rendered = 0
+        for segment in parse_template(template):
+            if segment.fixed:
+                _, cached = await self._fixed_segment(segment.text, voice, params)
+                rendered += not cached
+        return rendered
+
+    async def render(
+        self,
+        template: str,
+        values: Dict[str, str],
+        voice: str,
+        params: Dict[str, Any],
+        lock: Optional[Callable[[], Any]] = None
+    ) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """
+        Render a filled-in template.
+
+        Args:
+            template: str.format-style template ("... at {time}.")
+            values: Slot values
+            voice: Voice slug (part of the cache key)
+            params: Generation parameters (temperature, exaggeration, cfg_weight)
+            lock: Optional async context manager factory held around model calls
+
+        Returns:
+            (float32 audio, stats with cached/synthesized segment counts,
+            seconds and cached_ratio by audio duration)
+
+        Raises:
+            ValueError: Malformed template, missing or oversized slot values
+        """
+        segments = parse_template(template)
+        missing = [segment.slot for segment in segments if not segment.fixed and segment.slot not in values]
+        if missing:
+            raise ValueError(f"Missing template values: {', '.join(sorted(set(missing)))}")
+        for segment in segments:
+            if not segment.fixed:
+                value = str(values[segment.slot]).strip()
+                if len(value) > MAX_SLOT_LENGTH:
+                    raise ValueError(f"Value for {{{segment.slot}}} too long (max {MAX_SLOT_LENGTH} characters)")
+                segment.text = value
+        segments = [segment for segment in segments if segment.text]
+        if not segments:
+            raise ValueError("Template renders to empty text")
+
+        stats = {"cached_segments": 0, "synthesized_segments": 0, "cached_seconds": 0.0,
+                 "synthesized_seconds": 0.0, "model_seconds": 0.0}
+        pieces = []
+        async with (lock() if lock is not None else contextlib.nullcontext()):
+            for segment in segments:
+                start = time.perf_counter()
+                if segment.fixed:
+                    wav, cached = await self._fixed_segment(segment.text, voice, params)
+                else:
+                    wav, cached = await self._synthesize(segment.text, params), False
+                if not cached:
+                    stats["model_seconds"] += time.perf_counter() - start
+
+                kind = "cached" if cached else "synthesized"
+                stats[f"{kind}_segments"] += 1
+                stats[f"{kind}_seconds"] += len(wav) / self.sample_rate
+                pieces.append(wav)
+
+        total = sum(len(wav) for wav in pieces)
+        assembler = ChunkAssembler(self.sample_rate, expected_samples=total, pause_ms=SEGMENT_PAUSE_MS)
+        for wav in pieces:
+            assembler.add(wav)
+
+        audio_seconds = stats["cached_seconds"] + stats["synthesized_seconds"]
+        stats["cached_ratio"] = stats["cached_seconds"] / audio_seconds if audio_seconds else 0.0
+        return assembler.result(), stats
+
+
+# Global segment cache instance
+_segment_cache: Optional[SegmentCache] = None
+
+
+def get_segment_cache() -> SegmentCache:
+    """Get or create the global fixed-segment cache"""
+    global _segment_cache
+    if _segment_cache is None:
+        _segment_cache = SegmentCache()
+        logger.info("Template segment cache initialized")
+    return _segment_cache
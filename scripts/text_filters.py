@@ -8,7 +8,7 @@ Improves clarity, rhythm, and naturalness of synthesized speech.
 
 import re
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +100,44 @@ def add_prosody_breaks(text: str, style: str = "neutral") -> str:
     return text
 
 
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text on sentence boundaries (". ", "! ", "? ").
+
+    Each sentence keeps its terminal punctuation; empty pieces are dropped.
+    """
+    sentences = text.replace("! ", "!|").replace("? ", "?|").replace(". ", ".|").split("|")
+    return [sentence.strip() for sentence in sentences if sentence.strip()]
+
+
+def chunk_text(text: str, max_length: int = 200) -> List[str]:
+    """
+    Split text into chunks for long-form synthesis.
+    Splits on sentence boundaries when possible.
+    """
+    if len(text) <= max_length:
+        return [text]
+    
+    chunks = []
+    current_chunk = ""
+    
+    # Split on sentence boundaries
+    sentences = text.replace("! ", "!|").replace("? ", "?|").replace(". ", ".|").split("|")
+    
+    for sentence in sentences:
+        if len(current_chunk) + len(sentence) <= max_length:
+            current_chunk += sentence
+        else:
+            if current_chunk:
+                chunks.append(current_chunk.strip())
+            current_chunk = sentence
+    
+    if current_chunk:
+        chunks.append(current_chunk.strip())
+    
+    return chunks
+
+
 def detect_emotion(text: str) -> str:
     """
     Detect emotional context from text.
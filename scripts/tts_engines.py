@@ -0,0 +1,512 @@
+"""
+TTS Engines
+===========
+One interface over every synthesis backend, plus a registry routing voices
+to engines.
+
+Every engine exposes:
+- `generate(text, voice=None, temperature=0.8, exaggeration=1.3,
+  cfg_weight=0.5, seed=None, reference_audio=None, **kwargs)` returning
+  mono float32 audio at `capabilities.sample_rate`; parameters an engine has
+  no use for are ignored
+- `generate_batch(texts, **params)` and `stream(text, **params)` (default
+  implementations loop / yield the whole clip)
+- `capabilities`: batching, streaming, cloning, sample rate
+
+Engines:
+- ChatterboxEngine: wraps ChatterboxTTS (seed -> torch.manual_seed,
+  reference_audio -> audio_prompt_path, cfg_weight 0 -> guidance-free
+  decode, see guidance.py); `stream` vocodes speech-token windows as they
+  are decoded (see streaming_generation.py)
+- ChatterboxMultilingualEngine: wraps ChatterboxMultilingualTTS
+  (language -> language_id)
+- KokoroEngine: wraps KokoroTTSEngine, one instance per Kokoro voice
+- FakeTTSEngine: deterministic speech-like audio with configurable latency
+  and real-time factor, for exercising schedulers, caches and benchmarks
+  on a CPU-only box without weights
+
+Servers pick the engine with the TTS_ENGINE environment variable
+(chatterbox, chatterbox-multilingual, kokoro, fake; default chatterbox);
+model_manager.py loads further engines on demand:
+
+    engine = load_engine(device="cuda")
+    get_engine_registry().register(engine, default=True)
+"""
+
+import os
+import time
+import hashlib
+import logging
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from audio_encoding import as_mono_float32
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENGINE = "chatterbox"
+
+
+@dataclass(frozen=True)
+class EngineCapabilities:
+    """What an engine can do beyond one-clip-at-a-time synthesis"""
+    sample_rate: int = 24000
+    batching: bool = False    # generate_batch is cheaper than a loop of generate
+    streaming: bool = False   # stream yields audio before the clip is finished
+    cloning: bool = False     # honours reference_audio
+
+
+class TTSEngine(ABC):
+    """Base class for synthesis backends"""
+
+    name = "engine"
+    capabilities = EngineCapabilities()
+
+    @abstractmethod
+    def generate(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        temperature: float = 0.8,
+        exaggeration: float = 1.3,
+        cfg_weight: float = 0.5,
+        seed: Optional[int] = None,
+        reference_audio: Optional[str] = None,
+        **kwargs
+    ) -> np.ndarray:
+        """Synthesize one clip (mono float32 at capabilities.sample_rate)"""
+
+    def generate_batch(self, texts: Iterable[str], **params) -> List[np.ndarray]:
+        """Synthesize several clips with the same parameters"""
+        return [self.generate(text, **params) for text in texts]
+
+    def stream(self, text: str, **params) -> Iterator[np.ndarray]:
+        """Yield audio blocks for one clip"""
+        yield self.generate(text, **params)
+
+    @property
+    def sr(self) -> int:
+        return self.capabilities.sample_rate
+
+    def describe(self) -> Dict[str, Any]:
+        return {"name": self.name, **asdict(self.capabilities)}
+
+
+# ============================================================================
+# Chatterbox
+# ============================================================================
+
+class ChatterboxEngine(TTSEngine):
+    """Chatterbox TTS (voice cloning via reference audio)"""
+
+    name = "chatterbox"
+
+    def __init__(self, model):
+        self.model = model
+        self.capabilities = EngineCapabilities(sample_rate=getattr(model, "sr", 24000), streaming=True, cloning=True)
+        self.acceleration: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def load(cls, device: str = "cpu") -> "ChatterboxEngine":
+        """
+        Load through the memory-mapped weight cache (see weight_cache.py) unless
+        disabled; on CPU with CPU_ACCELERATION=1, apply cpu_acceleration.py.
+        """
+        engine = cls(cls._load_model(device))
+        if device == "cpu" and os.getenv("CPU_ACCELERATION", "").lower() in ("1", "true", "yes", "on"):
+            from cpu_acceleration import accelerate_cpu
+            engine.acceleration = accelerate_cpu(engine.model)
+        return engine
+
+    @staticmethod
+    def _load_model(device: str):
+        cache_dir = os.getenv("CHATTERBOX_WEIGHT_CACHE", "model_cache/weights")
+        if cache_dir.lower() not in ("", "0", "off", "false"):
+            try:
+                from weight_cache import WeightCache, load_chatterbox
+                return load_chatterbox(WeightCache(cache_dir), device=device)
+            except ImportError as e:
+                logger.warning(f"⚠ Weight cache unavailable for this chatterbox version ({e})")
+
+        from chatterbox.tts import ChatterboxTTS
+        return ChatterboxTTS.from_pretrained(device=device)
+
+    def generate(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        temperature: float = 0.8,
+        exaggeration: float = 1.3,
+        cfg_weight: float = 0.5,
+        seed: Optional[int] = None,
+        reference_audio: Optional[str] = None,
+        **kwargs
+    ) -> np.ndarray:
+        if seed is not None:
+            import torch
+            torch.manual_seed(seed)
+            if torch.cuda.is_available():
+                torch.cuda.manual_seed_all(seed)
+
+        if cfg_weight <= 0:
+            # Upstream generate always decodes a CFG pair; guidance.py decodes one row
+            from guidance import chatterbox_generate_unguided
+            wav = chatterbox_generate_unguided(
+                self.model,
+                text,
+                temperature=temperature,
+                exaggeration=exaggeration,
+                audio_prompt_path=reference_audio,
+                backend=self._unguided_backend()
+            )
+            return as_mono_float32(wav)
+
+        wav = self.model.generate(
+            text,
+            audio_prompt_path=reference_audio,
+            temperature=temperature,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight
+        )
+        return as_mono_float32(wav)
+
+    def stream(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        temperature: float = 0.8,
+        exaggeration: float = 1.3,
+        cfg_weight: float = 0.5,
+        seed: Optional[int] = None,
+        reference_audio: Optional[str] = None,
+        windows=None,
+        **kwargs
+    ) -> Iterator[np.ndarray]:
+        """Audio blocks vocoded from speech-token windows as T3 decodes (see streaming_generation.py)"""
+        from streaming_generation import chatterbox_stream
+
+        if seed is not None:
+            import torch
+            torch.manual_seed(seed)
+            if torch.cuda.is_available():
+                torch.cuda.manual_seed_all(seed)
+
+        for block in chatterbox_stream(
+            self.model,
+            text,
+            temperature=temperature,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight,
+            audio_prompt_path=reference_audio,
+            windows=windows,
+            backend=self._unguided_backend()
+        ):
+            yield as_mono_float32(block)
+
+    def _unguided_backend(self):
+        # Backend for guidance.py's decode loop (either batch size, so streaming shares it);
+        # rebuilt if t3 was swapped (e.g. quantized by cpu_acceleration)
+        if getattr(self, "_backend_t3", None) is not self.model.t3:
+            from guidance import unguided_backend
+            self._backend = unguided_backend(self.model.t3)
+            self._backend_t3 = self.model.t3
+        return self._backend
+
+
+class ChatterboxMultilingualEngine(ChatterboxEngine):
+    """Chatterbox multilingual (23 languages, `language` picks the text tokenizer's language)"""
+
+    name = "chatterbox-multilingual"
+
+    def __init__(self, model):
+        super().__init__(model)
+        # Token-window streaming uses the English tokenizer path; whole clips only
+        self.capabilities = EngineCapabilities(sample_rate=getattr(model, "sr", 24000), cloning=True)
+
+    stream = TTSEngine.stream
+
+    @staticmethod
+    def _load_model(device: str):
+        from chatterbox.mtl_tts import ChatterboxMultilingualTTS
+        return ChatterboxMultilingualTTS.from_pretrained(device=device)
+
+    def generate(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        temperature: float = 0.8,
+        exaggeration: float = 1.3,
+        cfg_weight: float = 0.5,
+        seed: Optional[int] = None,
+        reference_audio: Optional[str] = None,
+        language: str = "en",
+        **kwargs
+    ) -> np.ndarray:
+        if seed is not None:
+            import torch
+            torch.manual_seed(seed)
+            if torch.cuda.is_available():
+                torch.cuda.manual_seed_all(seed)
+
+        # No guidance-free path: upstream decodes the CFG pair, cfg_weight 0 just drops its effect
+        wav = self.model.generate(
+            text,
+            language_id=language,
+            audio_prompt_path=reference_audio,
+            temperature=temperature,
+            exaggeration=exaggeration,
+            cfg_weight=cfg_weight
+        )
+        return as_mono_float32(wav)
+
+
+# ============================================================================
+# Kokoro
+# ============================================================================
+
+class KokoroEngine(TTSEngine):
+    """Kokoro ONNX voices (no cloning); per-voice KokoroTTSEngine wrappers share one session pool"""
+
+    name = "kokoro"
+    capabilities = EngineCapabilities(sample_rate=24000)
+
+    def __init__(self, device: str = "cpu", language: str = "en-us", default_voice: str = "af_heart"):
+        self.device = device
+        self.language = language
+        self.default_voice = default_voice
+        self._voices: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def voices() -> List[str]:
+        from kokoro_tts_engine import KokoroTTSEngine
+        return list(KokoroTTSEngine.VOICES)
+
+    def preload(self, voices: Iterable[str]):
+        """Create the voices' wrappers now (loads the shared ONNX session) instead of on first use"""
+        for voice in voices:
+            self._voice_engine(voice)
+
+    def _voice_engine(self, voice: str):
+        with self._lock:
+            if voice not in self._voices:
+                from kokoro_tts_engine import KokoroTTSEngine
+                self._voices[voice] = KokoroTTSEngine(voice=voice, language=self.language, device=self.device)
+            return self._voices[voice]
+
+    def generate(
+        self,
+        text: str,
+        voice: Optional[str] = None,
+        temperature: float = 0.8,
+        exaggeration: float = 1.3,
+        cfg_weight: float = 0.5,
+        seed: Optional[int] = None,
+        reference_audio: Optional[str] = None,
+        **kwargs
+    ) -> np.ndarray:
+        engine = self._voice_engine(voice or self.default_voice)
+        wav = engine.generate(text, speed=kwargs.get("speed"), pitch=kwargs.get("pitch"))
+        return as_mono_float32(wav)
+
+
+# ============================================================================
+# Fake (deterministic, no weights)
+# ============================================================================
+
+class FakeTTSEngine(TTSEngine):
+    """
+    Deterministic stand-in for a real model.
+
+    Output length follows the text (`chars_per_second`), with short leading
+    and trailing silence like real model output. The waveform depends only on
+    (text, voice, seed, reference_audio, temperature, exaggeration,
+    cfg_weight), so caches and single-flight behave as with a seeded model.
+
+    Each call blocks for `latency_ms` plus `rtf` x the clip duration (half
+    the RTF with cfg_weight 0, like a guidance-free decode).
+    """
+
+    name = "fake"
+
+    def __init__(
+        self,
+        rtf: float = 0.0,
+        latency_ms: float = 0.0,
+        sample_rate: int = 24000,
+        chars_per_second: float = 15.0,
+        stream_block_ms: float = 200.0
+    ):
+        self.rtf = rtf
+        self.latency_ms = latency_ms
+        self.chars_per_second = chars_per_second
+        self.stream_block_ms = stream_block_ms
+        self.capabilities = EngineCapabilities(sample_rate=sample_rate, batching=True, streaming=True, cloning=True)
+
+        # Stats
+        self.calls = 0
+        self.audio_seconds = 0.0
+
+    @classmethod
+    def from_env(cls) -> "FakeTTSEngine":
+        """Configure from TTS_FAKE_RTF and TTS_FAKE_LATENCY_MS"""
+        return cls(
+            rtf=float(os.getenv("TTS_FAKE_RTF", "0.0")),
+            latency_ms=float(os.getenv("TTS_FAKE_LATENCY_MS", "0.0"))
+        )
+
+    def render(self, text: str, **params) -> np.ndarray:
+        """The clip generate() would return, without the simulated delay"""
+        sr = self.capabilities.sample_rate
+        identity = repr((
+            text, params.get("voice"), params.get("seed"), params.get("reference_audio"),
+            params.get("temperature", 0.8), params.get("exaggeration", 1.3), params.get("cfg_weight", 0.5)
+        ))
+        digest = hashlib.sha256(identity.encode("utf-8")).digest()
+        rng = np.random.default_rng(int.from_bytes(digest[:8], "little"))
+
+        voiced = max(1, int(sr * len(text) / self.chars_per_second))
+        t = np.arange(voiced, dtype=np.float32) / sr
+        f0 = 110.0 + 120.0 * rng.random()
+        syllables = 0.5 + 0.5 * np.sin(2 * np.pi * 4.0 * t + rng.random() * np.pi) ** 2
+        speech = (np.sin(2 * np.pi * f0 * t) + 0.4 * np.sin(4 * np.pi * f0 * t)) * syllables
+        speech += 0.01 * rng.standard_normal(voiced)
+
+        wav = np.zeros(int(0.05 * sr) + voiced + int(0.15 * sr), dtype=np.float32)
+        wav[int(0.05 * sr):int(0.05 * sr) + voiced] = 0.3 * speech
+        return wav
+
+    def _rtf(self, params: Dict[str, Any]) -> float:
+        return self.rtf / 2 if params.get("cfg_weight", 0.5) <= 0 else self.rtf
+
+    def _delay(self, seconds: float, rtf: float):
+        if self.latency_ms or rtf:
+            time.sleep(self.latency_ms / 1000 + rtf * seconds)
+
+    def generate(self, text: str, **params) -> np.ndarray:
+        wav = self.render(text, **params)
+        duration = len(wav) / self.capabilities.sample_rate
+        self._delay(duration, self._rtf(params))
+        self.calls += 1
+        self.audio_seconds += duration
+        return wav
+
+    def generate_batch(self, texts: Iterable[str], **params) -> List[np.ndarray]:
+        """One latency for the whole batch; RTF still applies to every clip"""
+        wavs = [self.render(text, **params) for text in texts]
+        duration = sum(len(wav) for wav in wavs) / self.capabilities.sample_rate
+        self._delay(duration, self._rtf(params))
+        self.calls += len(wavs)
+        self.audio_seconds += duration
+        return wavs
+
+    def stream(self, text: str, **params) -> Iterator[np.ndarray]:
+        """First block after `latency_ms`, later blocks paced by RTF"""
+        wav = self.render(text, **params)
+        sr = self.capabilities.sample_rate
+        block = max(1, int(sr * self.stream_block_ms / 1000))
+        rtf = self._rtf(params)
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        self.calls += 1
+        self.audio_seconds += len(wav) / sr
+        for start in range(0, len(wav), block):
+            chunk = wav[start:start + block]
+            if rtf:
+                time.sleep(rtf * len(chunk) / sr)
+            yield chunk
+
+
+# ============================================================================
+# Loading and routing
+# ============================================================================
+
+def load_engine(name: Optional[str] = None, device: str = "cpu") -> TTSEngine:
+    """
+    Build an engine by name (default: TTS_ENGINE env var, then chatterbox).
+
+    Raises:
+        ValueError: Unknown engine name
+    """
+    name = (name or os.getenv("TTS_ENGINE") or DEFAULT_ENGINE).lower()
+    if name == "chatterbox":
+        engine = ChatterboxEngine.load(device)
+    elif name == "chatterbox-multilingual":
+        engine = ChatterboxMultilingualEngine.load(device)
+    elif name == "kokoro":
+        engine = KokoroEngine(device=device)
+    elif name == "fake":
+        engine = FakeTTSEngine.from_env()
+    else:
+        raise ValueError(f"Unknown TTS engine: {name} (expected chatterbox, chatterbox-multilingual, kokoro or fake)")
+    logger.info(f"✓ TTS engine ready: {engine.describe()}")
+    return engine
+
+
+class EngineRegistry:
+    """Routes voice IDs to engines; unrouted voices go to the default engine"""
+
+    def __init__(self):
+        self._engines: Dict[str, TTSEngine] = {}
+        self._routes: Dict[str, str] = {}
+        self.default: Optional[str] = None
+
+    def register(self, engine: TTSEngine, voices: Iterable[str] = (), default: bool = False, name: Optional[str] = None):
+        """Add an engine (under `name`, default engine.name) and the voices it serves"""
+        name = name or engine.name
+        voices = list(voices)
+        self._engines[name] = engine
+        for voice in voices:
+            self._routes[voice] = name
+        if default or self.default is None:
+            self.default = name
+        logger.info(f"Registered TTS engine '{name}' ({len(voices)} routed voices)")
+
+    def unregister(self, name: str) -> Optional[TTSEngine]:
+        """Remove an engine and its voice routes (the default falls back to unset)"""
+        engine = self._engines.pop(name, None)
+        self._routes = {voice: route for voice, route in self._routes.items() if route != name}
+        if self.default == name:
+            self.default = None
+        if engine is not None:
+            logger.info(f"Unregistered TTS engine '{name}'")
+        return engine
+
+    def get(self, name: str) -> Optional[TTSEngine]:
+        return self._engines.get(name)
+
+    def route(self, voice: Optional[str]) -> Optional[str]:
+        """Name of the engine serving `voice`"""
+        return self._routes.get(voice, self.default) if voice else self.default
+
+    def for_voice(self, voice: Optional[str]) -> Optional[TTSEngine]:
+        name = self.route(voice)
+        return self._engines.get(name) if name else None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "default": self.default,
+            "engines": {
+                name: {
+                    **engine.describe(),
+                    "voices": sum(1 for route in self._routes.values() if route == name)
+                }
+                for name, engine in self._engines.items()
+            }
+        }
+
+
+# Global registry instance
+_engine_registry: Optional[EngineRegistry] = None
+
+
+def get_engine_registry() -> EngineRegistry:
+    """Get or create the global engine registry"""
+    global _engine_registry
+    if _engine_registry is None:
+        _engine_registry = EngineRegistry()
+    return _engine_registry
@@ -16,7 +16,7 @@ import httpx
 from fastapi import FastAPI, Form, Request, Response
 from fastapi.responses import PlainTextResponse
 from twilio.rest import Client
-from twilio.twiml.voice_response import VoiceResponse, Gather
+from twilio.twiml.voice_response import VoiceResponse, Gather, Connect
 import logging
 from typing import Optional
 
@@ -38,6 +38,12 @@ DEFAULT_VOICE_ID = os.getenv("DEFAULT_VOICE_ID", "naija_female")
 
 WEBHOOK_BASE_URL = os.getenv("WEBHOOK_BASE_URL", "https://your-server.com")
 
+# Bidirectional Media Streams endpoint on the TTS server (scripts/media_streams.py)
+MEDIA_STREAM_URL = os.getenv(
+    "MEDIA_STREAM_URL",
+    TTS_BASE_URL.replace("https://", "wss://").replace("http://", "ws://") + "/twilio/media-stream"
+)
+
 # Initialize Twilio client
 twilio_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
 
@@ -70,27 +76,20 @@ async def generate_tts(text: str, voice_id: str = DEFAULT_VOICE_ID) -> bytes:
         return response.content
 
 
-async def upload_to_storage(audio_data: bytes, filename: str) -> str:
+def media_stream_twiml(text: str, voice_id: str = DEFAULT_VOICE_ID) -> VoiceResponse:
     """
-    Upload audio to public storage and return URL.
-    
-    For now, this is a placeholder. Implement with:
-    - AWS S3
-    - Supabase Storage
-    - CloudFlare R2
-    - Your own server
-    
-    Args:
-        audio_data: MP3 bytes
-        filename: Desired filename
-    
-    Returns:
-        Public URL to the audio file
+    Build TwiML that speaks text with our TTS over a Media Stream.
+
+    The TTS server synthesizes and streams 8 kHz μ-law frames into the call
+    as they are generated, then closes the stream to continue the call.
     """
-    # TODO: Implement actual storage
-    # For now, return a placeholder
-    logger.warning("Storage not implemented - using placeholder URL")
-    return f"{WEBHOOK_BASE_URL}/audio/{filename}"
+    response = VoiceResponse()
+    connect = Connect()
+    stream = connect.stream(url=MEDIA_STREAM_URL)
+    stream.parameter(name="text", value=text)
+    stream.parameter(name="voice", value=voice_id)
+    response.append(connect)
+    return response
 
 
 @app.get("/")
@@ -226,6 +225,9 @@ async def play_tts_in_call(call_sid: str, text: str, voice_id: str = DEFAULT_VOI
     1. Answer call immediately
     2. Generate TTS asynchronously
     3. Play audio in the live call
+
+    Audio is streamed over Twilio Media Streams, so no storage upload or
+    public audio URL is needed.
     
     Args:
         call_sid: Twilio Call SID
@@ -233,20 +235,11 @@ async def play_tts_in_call(call_sid: str, text: str, voice_id: str = DEFAULT_VOI
         voice_id: Voice to use
     """
     try:
-        # Generate TTS
-        audio_data = await generate_tts(text, voice_id)
-        
-        # Upload to storage
-        filename = f"tts_{call_sid}.mp3"
-        audio_url = await upload_to_storage(audio_data, filename)
-        
-        # Update the call to play the audio
-        call = twilio_client.calls(call_sid).update(
-            url=f"{WEBHOOK_BASE_URL}/twilio/play?url={audio_url}",
-            method='POST'
-        )
-        
-        logger.info(f"Updated call {call_sid} to play {audio_url}")
+        # Redirect the live call to a media stream that speaks the text
+        response = media_stream_twiml(text, voice_id)
+        twilio_client.calls(call_sid).update(twiml=str(response))
+
+        logger.info(f"Streaming TTS into call {call_sid} via {MEDIA_STREAM_URL}")
         
     except Exception as e:
         logger.error(f"Error playing TTS in call: {e}", exc_info=True)
@@ -0,0 +1,274 @@
+"""
+Voice Catalog Cache
+===================
+In-process cache of the Postgres `voices` table.
+
+The TTS hot path (`/v1/tts`) and the catalog endpoints (`/v1/voices`) used to
+query Postgres on every call. The catalog is instead loaded once at startup and
+kept in memory; a background task polls a cheap version query and reloads only
+when the table changed.
+
+Versioning relies on the `update_voices_updated_at` trigger in
+database/schema.sql: every UPDATE bumps `updated_at`, inserts default it to
+NOW(), and deletes change the row count. (count, max(updated_at)) is therefore
+a version stamp that changes whenever the catalog does.
+
+Features:
+- O(1) voice lookup by ID with the same access rules as `get_voice_by_id`
+- Per-tenant views (public voices + tenant-private voices), cached per version
+- Strong ETags per tenant view for conditional GETs
+"""
+
+import json
+import time
+import uuid
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Optional, Dict, List, Any
+
+logger = logging.getLogger(__name__)
+
+
+VERSION_QUERY = """
+    SELECT COUNT(*) AS total, MAX(updated_at) AS last_updated
+    FROM voices
+"""
+
+CATALOG_QUERY = """
+    SELECT id, slug, display_name, description, language, gender, sample_url,
+           audio_file_path, params, owner_tenant, is_public, status, updated_at
+    FROM voices
+"""
+
+# Fields exposed through the public catalog endpoints
+PUBLIC_FIELDS = ("id", "slug", "display_name", "description", "language", "gender", "sample_url", "is_public")
+
+
+@dataclass
+class TenantView:
+    """Voices visible to one tenant, with a strong ETag over their content"""
+    voices: List[Dict[str, Any]]
+    etag: str
+    version: str = ""
+
+
+@dataclass
+class CatalogStats:
+    """Cache effectiveness counters"""
+    hits: int = 0
+    misses: int = 0
+    reloads: int = 0
+    last_reload_at: Optional[float] = None
+
+
+def _normalize_row(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a DB row into a plain dict with decoded JSON params"""
+    voice = dict(row)
+    params = voice.get("params")
+    if isinstance(params, str):
+        try:
+            voice["params"] = json.loads(params)
+        except ValueError:
+            logger.warning(f"Invalid params JSON for voice {voice.get('slug')}")
+            voice["params"] = {}
+    elif params is None:
+        voice["params"] = {}
+    return voice
+
+
+def compute_etag(voices: List[Dict[str, Any]]) -> str:
+    """Compute a strong ETag over the public representation of a voice list"""
+    payload = [
+        {key: (str(voice[key]) if key == "id" else voice.get(key)) for key in PUBLIC_FIELDS}
+        for voice in voices
+    ]
+    digest = hashlib.sha256(
+        json.dumps(payload, sort_keys=True, separators=(",", ":")).encode()
+    ).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluate an If-None-Match header against an ETag.
+
+    Uses the weak comparison required by RFC 7232 for If-None-Match, so a
+    client echoing W/"..." still gets a 304.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class VoiceCatalog:
+    """
+    In-memory voice catalog backed by Postgres.
+
+    Usage:
+        catalog = VoiceCatalog(pool)
+        await catalog.load()
+        catalog.start()                       # background version polling
+
+        voice = catalog.get(voice_id, tenant_id)
+        view = catalog.view_for_tenant(tenant_id)
+    """
+
+    def __init__(self, pool, refresh_interval: float = 30.0):
+        self.pool = pool
+        self.refresh_interval = refresh_interval
+
+        self._voices: Dict[uuid.UUID, Dict[str, Any]] = {}
+        self._views: Dict[Optional[uuid.UUID], TenantView] = {}
+        self._version: Optional[str] = None
+        self._reload_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+
+        self.stats = CatalogStats()
+
+    @property
+    def loaded(self) -> bool:
+        return self._version is not None
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._version
+
+    async def _fetch_version(self, conn) -> str:
+        row = await conn.fetchrow(VERSION_QUERY)
+        last_updated = row["last_updated"].isoformat() if row["last_updated"] else "none"
+        return f"{row['total']}:{last_updated}"
+
+    async def load(self):
+        """Load the full catalog from Postgres"""
+        async with self._reload_lock:
+            async with self.pool.acquire() as conn:
+                version = await self._fetch_version(conn)
+                rows = await conn.fetch(CATALOG_QUERY)
+
+            voices = {}
+            for row in rows:
+                voice = _normalize_row(row)
+                voices[voice["id"]] = voice
+
+            # Swap atomically; readers never observe a half-built catalog
+            self._voices = voices
+            self._views = {}
+            self._version = version
+            self.stats.reloads += 1
+            self.stats.last_reload_at = time.time()
+
+            logger.info(f"✓ Voice catalog loaded: {len(voices)} voices (version={version})")
+
+    async def refresh(self) -> bool:
+        """
+        Reload the catalog if the version stamp changed.
+
+        Returns:
+            True if the catalog was reloaded
+        """
+        async with self.pool.acquire() as conn:
+            version = await self._fetch_version(conn)
+
+        if version == self._version:
+            return False
+
+        logger.info(f"Voice catalog version changed ({self._version} → {version}), reloading")
+        await self.load()
+        return True
+
+    async def _refresh_loop(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Keep serving the last good catalog
+                logger.warning(f"Voice catalog refresh failed: {e}")
+
+    def start(self):
+        """Start background version polling"""
+        if self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """Stop background version polling"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    def get(self, voice_id: str, tenant_id: Optional[uuid.UUID] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get an active voice by ID, checking access permissions.
+
+        Mirrors `api_v1.get_voice_by_id`: returns the voice if it is public or
+        owned by the requesting tenant, otherwise None.
+        """
+        try:
+            voice_uuid = uuid.UUID(str(voice_id))
+        except ValueError:
+            return None
+
+        voice = self._voices.get(voice_uuid)
+        if voice is None or voice.get("status") != "active":
+            self.stats.misses += 1
+            return None
+
+        self.stats.hits += 1
+        if not voice["is_public"]:
+            if not tenant_id or voice["owner_tenant"] != tenant_id:
+                logger.warning(f"Access denied to private voice {voice_id} for tenant {tenant_id}")
+                return None
+
+        return voice
+
+    def contains(self, voice_id: str) -> bool:
+        """Check whether an ID exists in the catalog (any status/owner)"""
+        try:
+            return uuid.UUID(str(voice_id)) in self._voices
+        except ValueError:
+            return False
+
+    def view_for_tenant(self, tenant_id: Optional[uuid.UUID] = None) -> TenantView:
+        """Get the list of voices visible to a tenant, sorted by display name"""
+        view = self._views.get(tenant_id)
+        if view is not None and view.version == self._version:
+            return view
+
+        voices = sorted(
+            (
+                voice for voice in self._voices.values()
+                if voice.get("status") == "active"
+                and (voice["is_public"] or (tenant_id and voice["owner_tenant"] == tenant_id))
+            ),
+            key=lambda voice: voice["display_name"]
+        )
+        view = TenantView(voices=voices, etag=compute_etag(voices), version=self._version or "")
+        self._views[tenant_id] = view
+        return view
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get catalog statistics"""
+        return {
+            "voices": len(self._voices),
+            "version": self._version,
+            "hits": self.stats.hits,
+            "misses": self.stats.misses,
+            "reloads": self.stats.reloads,
+            "tenant_views": len(self._views)
+        }
@@ -0,0 +1,195 @@
+"""
+Model Warm-up
+=============
+Representative synthesis before the server takes traffic.
+
+The first calls into a freshly loaded model pay for lazy initialization
+(kernel selection, allocator growth, conditioning caches). Warm-up runs
+those calls at startup instead of on the first customers:
+
+1. short, medium and long texts, each once cold and then `rounds` times
+   warm, recording first-call versus steady-state latency
+2. one medium call per configured voice (voice preset parameters and
+   reference clips), so each voice's conditioning path has run once
+
+The server's /ready probe stays 503 until `Warmup.ready`. A failing text
+pass is retried (`retries` times, `retry_delay` seconds apart) before
+warm-up is marked failed; once it succeeds the server is ready even if
+some voices fail, which are logged, skipped and reported on /health.
+
+Usage:
+    warmup = Warmup(tts_model, warmup_voices(config), rounds=3, retries=2)
+    asyncio.create_task(warmup.run())
+"""
+
+import time
+import asyncio
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from admission import get_admission_controller
+
+logger = logging.getLogger(__name__)
+
+WARMUP_TEXTS = {
+    "short": "Hello! How can I help you today?",
+    "medium": (
+        "This is a friendly reminder from CallWaiting Services. "
+        "You have an appointment scheduled for tomorrow at three P M."
+    ),
+    "long": (
+        "Good afternoon. This message confirms that your payment of two hundred and fifty dollars "
+        "has been successfully processed. Your account is now current, and all services remain active. "
+        "A receipt has been sent to your email address on file. If you have any questions about this "
+        "transaction, please contact our billing department. Thank you for your prompt payment!"
+    )
+}
+
+PENDING = "pending"
+WARMING = "warming"
+READY = "ready"
+FAILED = "failed"
+SKIPPED = "skipped"
+
+
+def warmup_voices(config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Voices to condition during warm-up, from the `warmup` config section.
+
+    `voices` lists preset slugs from voices/*.json (empty: every preset);
+    `reference_audio` lists cloning clips (paths relative to voices/ allowed).
+    """
+    from voice_manager import get_voice_manager
+
+    settings = config.get("warmup", {})
+    manager = get_voice_manager()
+    slugs = settings.get("voices") or list(manager.voices)
+
+    voices = [{"name": slug, "params": manager.get_voice_params(slug)} for slug in slugs]
+    for clip in settings.get("reference_audio") or []:
+        path = Path(clip) if Path(clip).exists() else Path("voices") / clip
+        if path.exists():
+            voices.append({"name": path.name, "params": {}, "reference_audio": str(path)})
+        else:
+            logger.warning(f"⚠ Warm-up reference clip not found: {clip}")
+    return voices
+
+
+class Warmup:
+    """Runs warm-up synthesis once and reports readiness and latency"""
+
+    def __init__(
+        self,
+        tts_model,
+        voices: Optional[List[Dict[str, Any]]] = None,
+        rounds: int = 3,
+        texts: Optional[Dict[str, str]] = None,
+        retries: int = 2,
+        retry_delay: float = 5.0
+    ):
+        self.tts_model = tts_model
+        self.voices = voices or []
+        self.rounds = max(1, rounds)
+        if texts is not None and not (texts and all(isinstance(text, str) and text.strip() for text in texts.values())):
+            raise ValueError("Warm-up texts must map names to non-empty strings")
+        self.texts = texts or WARMUP_TEXTS
+        # Per-voice pass: the medium text, else the first one given
+        self.voice_text = self.texts.get("medium") or next(iter(self.texts.values()))
+        self.retries = max(0, retries)
+        self.retry_delay = retry_delay
+
+        self.status = PENDING
+        self.error: Optional[str] = None
+        self.started_at: Optional[float] = None
+        self.seconds: Optional[float] = None
+        self.latency: Dict[str, Dict[str, float]] = {}
+        self.voice_latency: Dict[str, float] = {}
+        self.voice_errors: Dict[str, str] = {}
+        self.attempts = 0
+
+    @property
+    def ready(self) -> bool:
+        return self.status in (READY, SKIPPED)
+
+    def skip(self):
+        """Mark ready without running (warm-up disabled)"""
+        self.status = SKIPPED
+
+    async def _generate_ms(self, text: str, params: Dict[str, Any], reference_audio: Optional[str] = None) -> float:
+        kwargs = {name: params[name] for name in ("temperature", "exaggeration", "cfg_weight") if name in params}
+        # Through the model's admission slot like requests (its waits are not queue pressure)
+        async with get_admission_controller().slot(record_wait=False):
+            start = time.perf_counter()
+            await asyncio.to_thread(self.tts_model.generate, text=text, reference_audio=reference_audio, **kwargs)
+            return (time.perf_counter() - start) * 1000
+
+    async def _warm_texts(self, params: Dict[str, Any]):
+        for length, text in self.texts.items():
+            first = await self._generate_ms(text, params)
+            steady = [await self._generate_ms(text, params) for _ in range(self.rounds)]
+            steady_ms = sorted(steady)[len(steady) // 2]
+            self.latency[length] = {
+                "first_ms": round(first, 1),
+                "steady_ms": round(steady_ms, 1),
+                "first_to_steady": round(first / steady_ms, 2) if steady_ms else None
+            }
+            logger.info(
+                f"Warm-up {length}: first {first:.0f}ms, steady {steady_ms:.0f}ms "
+                f"({self.latency[length]['first_to_steady']}x)"
+            )
+
+    async def run(self) -> Dict[str, Any]:
+        """Run warm-up; never raises (a text pass failing every retry leaves status FAILED)"""
+        self.status = WARMING
+        self.started_at = time.time()
+        start = time.perf_counter()
+        default_params = self.voices[0]["params"] if self.voices else {}
+
+        try:
+            while True:
+                self.attempts += 1
+                try:
+                    await self._warm_texts(default_params)
+                    self.error = None
+                    break
+                except Exception as e:
+                    self.error = str(e)
+                    if self.attempts > self.retries:
+                        self.status = FAILED
+                        logger.error(f"✗ Warm-up failed after {self.attempts} attempt(s): {e}")
+                        return self.get_stats()
+                    logger.warning(f"⚠ Warm-up attempt {self.attempts} failed ({e}), retrying in {self.retry_delay:.0f}s")
+                    await asyncio.sleep(self.retry_delay)
+
+            # The model works: one voice's bad preset or missing clip does not keep the server unready
+            for voice in self.voices:
+                try:
+                    self.voice_latency[voice["name"]] = round(await self._generate_ms(
+                        self.voice_text, voice["params"], voice.get("reference_audio")
+                    ), 1)
+                except Exception as e:
+                    self.voice_errors[voice["name"]] = str(e)
+                    logger.warning(f"⚠ Warm-up skipped voice {voice['name']}: {e}")
+
+            self.status = READY
+            logger.info(
+                f"✓ Warm-up complete in {time.perf_counter() - start:.1f}s "
+                f"({len(self.voice_latency)}/{len(self.voices)} voices)"
+            )
+        finally:
+            self.seconds = round(time.perf_counter() - start, 2)
+
+        return self.get_stats()
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "ready": self.ready,
+            "seconds": self.seconds,
+            "latency": self.latency,
+            "voices": self.voice_latency,
+            "voice_errors": self.voice_errors,
+            "attempts": self.attempts,
+            "error": self.error
+        }
@@ -0,0 +1,391 @@
+"""
+Weight Cache
+============
+Memory-mappable local cache of model weights, keyed by repo revision.
+
+Cold start on a fresh pod is dominated by fetching checkpoints and then
+building modules (random init, then a copy of every weight). This cache
+stores each model component's tensors as one flat, 64-byte aligned file
+plus a JSON index:
+
+    model_cache/weights/<repo>/<revision>/
+        index.json          tensor name -> dtype, shape, offset per component
+        t3.bin, s3gen.bin, ve.bin
+        tokenizer.json, conds.pt   (extra files, copied as-is)
+
+Loading maps each file read-only (`np.memmap`), so nothing is read until a
+tensor is touched, and several worker processes on one host share the same
+page-cache pages instead of holding private copies. Every file has a
+SHA-256 in the index; it is verified once after download (then only size
+and mtime are checked) or on every load with `verify="always"`.
+
+`load_chatterbox` rebuilds ChatterboxTTS from the cache: modules are
+constructed on the meta device (no random init) and the mapped tensors are
+assigned directly (`load_state_dict(assign=True)`), falling back to regular
+construction if a module keeps meta tensors.
+
+The TTS engine loader uses this cache for Chatterbox by default
+(CHATTERBOX_WEIGHT_CACHE=<dir> to move it, =off to disable; pin the
+revision with CHATTERBOX_REVISION). Without a pinned revision, the newest
+cached revision is used and the hub is only asked for its current commit
+when the cache is empty, so a warm start makes no network calls; set
+CHATTERBOX_REVISION to move to a new upstream commit.
+
+Usage:
+    cache = WeightCache("model_cache/weights")
+    model = load_chatterbox(cache, device="cuda")   # First run fills the cache
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+ALIGNMENT = 64
+INDEX_FILE = "index.json"
+VERIFIED_STAMP = ".verified"
+CHATTERBOX_REPO = "ResembleAI/chatterbox"
+CHATTERBOX_FILES = ("ve.safetensors", "t3_cfg.safetensors", "s3gen.safetensors", "tokenizer.json", "conds.pt")
+
+# dtypes numpy can't represent are stored as same-width integers
+RAW_DTYPES = {"bfloat16": np.int16}
+
+
+class WeightCacheError(Exception):
+    """Cache entry missing, incomplete or failing its checksum"""
+
+
+def _sha256(path: Path, block: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(block):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _to_numpy(tensor) -> tuple:
+    """(array, dtype name) for a numpy array or torch tensor"""
+    if hasattr(tensor, "detach"):
+        import torch
+        tensor = tensor.detach().cpu().contiguous()
+        dtype = str(tensor.dtype).replace("torch.", "")
+        if dtype in RAW_DTYPES:
+            tensor = tensor.view(torch.int16)
+        return tensor.numpy(), dtype
+    array = np.ascontiguousarray(tensor)
+    return array, array.dtype.name
+
+
+class WeightCache:
+    """Revision-keyed store of memory-mappable model weights"""
+
+    def __init__(self, root: str = "model_cache/weights"):
+        self.root = Path(root)
+
+    def path(self, repo: str, revision: str) -> Path:
+        return self.root / repo.replace("/", "--") / revision
+
+    def contains(self, repo: str, revision: str) -> bool:
+        return (self.path(repo, revision) / INDEX_FILE).exists()
+
+    def revisions(self, repo: str) -> List[str]:
+        """Complete cached revisions of `repo`, most recently stored first"""
+        repo_dir = self.root / repo.replace("/", "--")
+        entries = [
+            entry for entry in (repo_dir.iterdir() if repo_dir.exists() else [])
+            if not entry.name.startswith(".") and (entry / INDEX_FILE).exists()
+        ]
+        entries.sort(key=lambda entry: (entry / INDEX_FILE).stat().st_mtime_ns, reverse=True)
+        return [entry.name for entry in entries]
+
+    def store(
+        self,
+        repo: str,
+        revision: str,
+        components: Dict[str, Dict[str, Any]],
+        extra_files: Optional[Dict[str, str]] = None
+    ) -> Path:
+        """
+        Write components (name -> state dict) and extra files for a revision.
+
+        Written to a temporary directory and renamed into place, so readers
+        never see a partial entry.
+        """
+        target = self.path(repo, revision)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=f".{revision}-", dir=target.parent))
+
+        index: Dict[str, Any] = {"repo": repo, "revision": revision, "components": {}, "files": {}}
+        try:
+            for component, state_dict in components.items():
+                entries, offset = {}, 0
+                file_path = staging / f"{component}.bin"
+                with open(file_path, "wb") as f:
+                    for name, tensor in state_dict.items():
+                        array, dtype = _to_numpy(tensor)
+                        padding = -offset % ALIGNMENT
+                        f.write(b"\0" * padding)
+                        offset += padding
+                        f.write(array.tobytes())
+                        entries[name] = {"dtype": dtype, "shape": list(array.shape), "offset": offset, "nbytes": array.nbytes}
+                        offset += array.nbytes
+                index["components"][component] = {"file": file_path.name, "tensors": entries}
+                index["files"][file_path.name] = _sha256(file_path)
+
+            for name, source in (extra_files or {}).items():
+                shutil.copyfile(source, staging / name)
+                index["files"][name] = _sha256(staging / name)
+
+            with open(staging / INDEX_FILE, "w") as f:
+                json.dump(index, f, indent=2)
+            (staging / VERIFIED_STAMP).write_text(self._stamp(staging, index))
+
+            if target.exists():
+                shutil.rmtree(target)
+            staging.rename(target)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        size_mb = sum(p.stat().st_size for p in target.iterdir()) / 1e6
+        logger.info(f"✓ Cached {repo}@{revision}: {len(components)} components, {size_mb:.0f}MB")
+        return target
+
+    @staticmethod
+    def _stamp(directory: Path, index: Dict[str, Any]) -> str:
+        """Size and mtime of every file, recorded once checksums have passed"""
+        return json.dumps({
+            name: [(directory / name).stat().st_size, (directory / name).stat().st_mtime_ns]
+            for name in sorted(index["files"])
+        })
+
+    def verify(self, repo: str, revision: str, mode: str = "once") -> Dict[str, Any]:
+        """
+        Check an entry's files against their checksums.
+
+        mode: "always" hashes every file, "once" hashes only when files changed
+        since the last successful check, "never" checks presence only.
+
+        Raises:
+            WeightCacheError: Entry missing or corrupt
+        """
+        directory = self.path(repo, revision)
+        try:
+            with open(directory / INDEX_FILE) as f:
+                index = json.load(f)
+        except (OSError, ValueError) as e:
+            raise WeightCacheError(f"No usable cache entry for {repo}@{revision}: {e}")
+
+        missing = [name for name in index["files"] if not (directory / name).exists()]
+        if missing:
+            raise WeightCacheError(f"Cache entry {repo}@{revision} is missing {missing}")
+        if mode == "never":
+            return index
+
+        stamp_path = directory / VERIFIED_STAMP
+        if mode == "once" and stamp_path.exists() and stamp_path.read_text() == self._stamp(directory, index):
+            return index
+
+        for name, expected in index["files"].items():
+            if _sha256(directory / name) != expected:
+                raise WeightCacheError(f"Checksum mismatch for {name} in {repo}@{revision}")
+        stamp_path.write_text(self._stamp(directory, index))
+        return index
+
+    def load(self, repo: str, revision: str, verify: str = "once") -> Dict[str, Dict[str, np.ndarray]]:
+        """
+        Map an entry's components as read-only numpy arrays (no data is read yet).
+
+        Returns:
+            component -> {tensor name -> array}; raw dtypes (bfloat16) are
+            returned as same-width integers, see `to_torch`
+        """
+        directory = self.path(repo, revision)
+        index = self.verify(repo, revision, verify)
+
+        components = {}
+        for component, meta in index["components"].items():
+            file_path = directory / meta["file"]
+            if file_path.stat().st_size == 0:
+                components[component] = {}
+                continue
+            mapped = np.memmap(file_path, dtype=np.uint8, mode="r")
+            tensors = {}
+            for name, entry in meta["tensors"].items():
+                dtype = RAW_DTYPES.get(entry["dtype"], entry["dtype"])
+                raw = mapped[entry["offset"]:entry["offset"] + entry["nbytes"]]
+                tensors[name] = raw.view(dtype).reshape(entry["shape"])
+            components[component] = tensors
+        return components
+
+    def load_index(self, repo: str, revision: str) -> Dict[str, Any]:
+        with open(self.path(repo, revision) / INDEX_FILE) as f:
+            return json.load(f)
+
+    def file(self, repo: str, revision: str, name: str) -> Path:
+        return self.path(repo, revision) / name
+
+    def prune(self, repo: str, keep: Iterable[str]) -> int:
+        """Delete cached revisions of `repo` other than `keep`; returns how many"""
+        keep = set(keep)
+        removed = 0
+        repo_dir = self.root / repo.replace("/", "--")
+        for entry in repo_dir.iterdir() if repo_dir.exists() else []:
+            if entry.is_dir() and not entry.name.startswith(".") and entry.name not in keep:
+                shutil.rmtree(entry)
+                removed += 1
+        return removed
+
+
+def to_torch(tensors: Dict[str, np.ndarray], dtypes: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Wrap mapped arrays as torch tensors without copying.
+
+    Tensors share memory with the read-only mapping; pass them to
+    `load_state_dict(..., assign=True)` so modules keep using the shared pages.
+    """
+    import torch
+    import warnings
+
+    result = {}
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)  # "The given NumPy array is not writable"
+        for name, array in tensors.items():
+            tensor = torch.from_numpy(array)
+            if dtypes[name] in RAW_DTYPES:
+                tensor = tensor.view(getattr(torch, dtypes[name]))
+            result[name] = tensor
+    return result
+
+
+# ============================================================================
+# Chatterbox
+# ============================================================================
+
+def resolve_revision(
+    repo: str = CHATTERBOX_REPO,
+    revision: Optional[str] = None,
+    cache: Optional[WeightCache] = None
+) -> str:
+    """
+    Pin a revision: explicit value, else CHATTERBOX_REVISION, else the newest
+    revision in `cache`, else the hub's current commit for `repo` (falls back
+    to "main" when offline).
+    """
+    revision = revision or os.getenv("CHATTERBOX_REVISION")
+    if revision:
+        return revision
+    cached = cache.revisions(repo) if cache is not None else []
+    if cached:
+        return cached[0]
+    try:
+        from huggingface_hub import HfApi
+        return HfApi().model_info(repo).sha
+    except Exception as e:
+        logger.warning(f"⚠ Could not resolve {repo} revision ({e}), using 'main'")
+        return "main"
+
+
+def download_chatterbox(revision: str, repo: str = CHATTERBOX_REPO) -> Path:
+    """Fetch a revision's checkpoint files; returns the local snapshot directory"""
+    from huggingface_hub import hf_hub_download
+
+    for name in CHATTERBOX_FILES:
+        local_path = hf_hub_download(repo_id=repo, filename=name, revision=revision)
+    return Path(local_path).parent
+
+
+def _build(factory, state_dict: Dict[str, Any], strict: bool = True):
+    """Construct on the meta device and assign mapped tensors; regular construction as fallback"""
+    import torch
+
+    try:
+        with torch.device("meta"):
+            module = factory()
+        module.load_state_dict(state_dict, strict=strict, assign=True)
+        if not any(t.is_meta for t in list(module.parameters()) + list(module.buffers())):
+            return module
+    except Exception as e:
+        logger.debug(f"Meta-device construction failed for {factory}: {e}")
+
+    module = factory()
+    module.load_state_dict(state_dict, strict=strict, assign=True)
+    return module
+
+
+def export_chatterbox(cache: WeightCache, model, revision: str, repo: str = CHATTERBOX_REPO) -> Path:
+    """Store a loaded ChatterboxTTS's weights, tokenizer and default conditionals"""
+    from huggingface_hub import hf_hub_download
+
+    extra_files = {"tokenizer.json": hf_hub_download(repo, "tokenizer.json", revision=revision)}
+    with tempfile.TemporaryDirectory() as scratch:
+        if getattr(model, "conds", None) is not None:
+            conds_path = Path(scratch) / "conds.pt"
+            model.conds.save(conds_path)
+            extra_files["conds.pt"] = str(conds_path)
+        return cache.store(
+            repo, revision,
+            {"t3": model.t3.state_dict(), "s3gen": model.s3gen.state_dict(), "ve": model.ve.state_dict()},
+            extra_files
+        )
+
+
+def load_chatterbox(
+    cache: Optional[WeightCache] = None,
+    device: str = "cpu",
+    revision: Optional[str] = None,
+    repo: str = CHATTERBOX_REPO,
+    verify: str = "once"
+):
+    """
+    ChatterboxTTS from the weight cache; on a miss (or corrupt entry) load
+    the pinned revision from the hub and fill the cache for the next start.
+    """
+    from chatterbox.tts import ChatterboxTTS, Conditionals
+    from chatterbox.models.t3 import T3
+    from chatterbox.models.s3gen import S3Gen
+    from chatterbox.models.voice_encoder import VoiceEncoder
+    from chatterbox.models.tokenizers import EnTokenizer
+
+    cache = cache or WeightCache()
+    revision = resolve_revision(repo, revision, cache)
+
+    try:
+        components = cache.load(repo, revision, verify=verify)
+    except WeightCacheError as e:
+        logger.info(f"Weight cache miss for {repo}@{revision} ({e}); loading from hub")
+        # from_pretrained always fetches the default branch; the cache entry must hold `revision`
+        model = ChatterboxTTS.from_local(download_chatterbox(revision, repo), device)
+        try:
+            export_chatterbox(cache, model, revision, repo)
+            cache.prune(repo, keep=[revision])
+        except Exception as export_error:
+            logger.warning(f"⚠ Could not fill weight cache: {export_error}")
+        return model
+
+    index = cache.load_index(repo, revision)
+    dtypes = {component: {name: entry["dtype"] for name, entry in meta["tensors"].items()}
+              for component, meta in index["components"].items()}
+    state = {component: to_torch(tensors, dtypes[component]) for component, tensors in components.items()}
+
+    ve = _build(VoiceEncoder, state["ve"]).to(device).eval()
+    t3 = _build(T3, state["t3"]).to(device).eval()
+    s3gen = _build(S3Gen, state["s3gen"], strict=False).to(device).eval()
+    tokenizer = EnTokenizer(str(cache.file(repo, revision, "tokenizer.json")))
+
+    conds = None
+    conds_path = cache.file(repo, revision, "conds.pt")
+    if conds_path.exists():
+        map_location = "cpu" if device in ("cpu", "mps") else None
+        conds = Conditionals.load(conds_path, map_location=map_location).to(device)
+
+    logger.info(f"✓ Chatterbox loaded from weight cache ({repo}@{revision[:12]})")
+    return ChatterboxTTS(t3, s3gen, ve, tokenizer, device, conds=conds)
@@ -0,0 +1,26 @@
+"""
+Shared test fixtures
+"""
+
+import pytest
+
+
+class StubCatalog:
+    """Loaded voice catalog holding one voice (authoritative: unknown IDs never fall through to Postgres)"""
+
+    loaded = True
+
+    def __init__(self, voice_id, slug="test", params=None):
+        self.voice = {"id": voice_id, "slug": slug, "params": params or {}, "audio_file_path": None}
+
+    def get(self, voice_id, tenant_id=None):
+        return self.voice if voice_id == self.voice["id"] else None
+
+    def contains(self, voice_id):
+        return True
+
+
+@pytest.fixture
+def stub_catalog():
+    """Factory: stub_catalog(voice_id, slug="test") -> a one-voice catalog for app.state.voice_catalog"""
+    return StubCatalog
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Tests for guidance modes and the admission controller (scripts/guidance.py, scripts/admission.py)
+Run with: pytest tests/test_admission.py
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from guidance import CFG, NONE, AUTO, validate_mode, profile_mode, apply_mode  # noqa: E402
+from admission import AdmissionController  # noqa: E402
+from tts_engines import FakeTTSEngine  # noqa: E402
+
+
+def test_mode_validation_and_profiles():
+    assert validate_mode(None) is None
+    assert validate_mode("NONE") == NONE
+    with pytest.raises(ValueError):
+        validate_mode("fast")
+
+    assert profile_mode({"cfg_weight": 0.5}) == AUTO
+    assert profile_mode({"cfg_weight": 0.5, "guidance": "none"}) == NONE
+    assert profile_mode({"cfg_weight": 0}) == NONE
+    assert profile_mode(None) == AUTO
+
+
+def test_apply_mode_sets_cfg_weight():
+    params = {"temperature": 0.8, "cfg_weight": 0.75, "guidance": "auto"}
+    assert apply_mode(params, NONE) == {"temperature": 0.8, "cfg_weight": 0.0}
+    assert apply_mode(params, CFG) == {"temperature": 0.8, "cfg_weight": 0.75}
+    assert apply_mode({"cfg_weight": 0}, CFG)["cfg_weight"] > 0  # Guided even on a guidance-free voice
+    assert params["guidance"] == "auto"  # Input untouched
+
+
+def test_choose_precedence():
+    admission = AdmissionController(wait_threshold_ms=100)
+    admission.overloaded = True
+    admission.wait_ewma = 1.0
+
+    assert admission.choose(CFG, NONE) == (CFG, "request")
+    assert admission.choose(None, CFG) == (CFG, "voice")
+    assert admission.choose(None, AUTO) == (NONE, "load")
+    assert admission.choose(AUTO, CFG) == (NONE, "load")  # Explicit auto overrides the profile
+
+    admission.auto_guidance = False
+    assert admission.choose(None, AUTO) == (CFG, "default")
+    assert admission.get_stats()["modes"] == {CFG: 3, NONE: 2}
+
+
+def test_overload_hysteresis():
+    admission = AdmissionController(wait_threshold_ms=100, recover_ratio=0.5, alpha=1.0)
+
+    admission.wait_ewma = 0.08
+    assert admission.choose() == (CFG, "default")
+    admission.wait_ewma = 0.15
+    assert admission.choose() == (NONE, "load")
+    admission.wait_ewma = 0.08  # Below threshold but above recovery: stay guidance-free
+    assert admission.choose() == (NONE, "load")
+    admission.wait_ewma = 0.04
+    assert admission.choose() == (CFG, "default")
+    assert admission.overload_episodes == 1
+
+
+def test_slot_bounds_concurrency_and_tracks_queue_wait():
+    admission = AdmissionController(max_concurrent=1, wait_threshold_ms=30)
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        async with admission.slot():
+            peak = max(peak, admission.active)
+            await asyncio.sleep(0.03)
+
+    async def burst():
+        await asyncio.gather(*(call() for _ in range(5)))
+
+    asyncio.run(burst())
+
+    stats = admission.get_stats()
+    assert peak == 1
+    assert stats["admitted"] == 5
+    assert stats["service_ewma_ms"] >= 25
+    assert stats["wait_ewma_ms"] > 0
+    assert admission.overloaded  # Later calls waited ~60-120 ms for the single slot
+    assert admission.choose() == (NONE, "load")
+
+
+def test_bulk_waits_do_not_count():
+    admission = AdmissionController(max_concurrent=1)
+
+    async def call(record_wait):
+        async with admission.slot(record_wait=record_wait):
+            await asyncio.sleep(0.02)
+
+    async def burst():
+        await asyncio.gather(call(True), call(False), call(False))
+
+    asyncio.run(burst())
+    assert admission.wait_ewma < 0.005  # Only the first (unqueued) interactive call recorded a wait
+
+
+def test_warmup_and_template_calls_share_the_slot(monkeypatch):
+    """Every caller of the primary model queues on the same admission slot"""
+    import threading
+    import admission
+    import synthesis_lanes
+    from warmup import Warmup
+    from template_synthesis import TemplateSynthesizer, SegmentCache
+
+    controller = AdmissionController(max_concurrent=1)
+    monkeypatch.setattr(admission, "_admission_controller", controller)
+    lanes = synthesis_lanes.LaneScheduler()
+    monkeypatch.setattr(synthesis_lanes, "_lane_scheduler", lanes)
+    lock = threading.Lock()
+    running = peak = 0
+
+    class Counting(FakeTTSEngine):
+        def generate(self, text, **params):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return super().generate(text)
+
+    engine = Counting()
+    params = {"temperature": 0.8, "exaggeration": 0.5, "cfg_weight": 0.5}
+    warmup = Warmup(engine, rounds=1, texts={"short": "Hello there."})
+    templates = TemplateSynthesizer(engine, cache=SegmentCache())
+
+    async def burst():
+        await asyncio.gather(warmup.run(), *(templates._synthesize(f"Segment {i}.", params) for i in range(3)))
+
+    asyncio.run(burst())
+    assert peak == 1
+    assert controller.admitted == 5  # Two warm-up calls, three segments
+    assert lanes.interactive_calls == 3  # Template renders count as interactive, so bulk work yields to them
+
+
+def test_fake_engine_guidance_free_is_faster():
+    engine = FakeTTSEngine(rtf=0.1)
+    text = "Guidance-free decoding should take about half the time."
+
+    start = time.perf_counter()
+    guided = engine.generate(text, cfg_weight=0.5)
+    guided_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    unguided = engine.generate(text, cfg_weight=0.0)
+    unguided_s = time.perf_counter() - start
+
+    assert len(guided) == len(unguided)
+    assert unguided_s < guided_s * 0.75
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Unit tests for in-memory audio encoding (scripts/audio_encoding.py)
+Run with: pytest tests/test_audio_encoding.py
+"""
+
+import io
+import sys
+import wave
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from audio_encoding import (  # noqa: E402
+    encode_wav, encode_pcm16, finalize_audio, wav_header, WAV_HEADER_SIZE
+)
+from telephony_audio import TelephonyEncoder, FRAME_SAMPLES  # noqa: E402
+
+
+def test_wav_header_layout():
+    """Header matches the canonical 44-byte PCM layout"""
+    header = wav_header(24000, sample_rate=24000)
+    assert len(header) == WAV_HEADER_SIZE
+    assert header[:4] == b"RIFF" and header[8:12] == b"WAVE"
+    assert int.from_bytes(header[40:44], "little") == 48000
+
+
+def test_encode_wav_roundtrip():
+    """Encoded WAV is readable by the stdlib wave module"""
+    wav = np.sin(np.linspace(0, 200, 2400, dtype=np.float32)) * 0.5
+    audio = encode_wav(wav.copy(), sample_rate=24000)
+
+    assert isinstance(audio, memoryview)
+    with wave.open(io.BytesIO(audio)) as reader:
+        assert reader.getframerate() == 24000
+        assert reader.getnchannels() == 1
+        assert reader.getsampwidth() == 2
+        decoded = np.frombuffer(reader.readframes(reader.getnframes()), dtype="<i2")
+
+    np.testing.assert_allclose(decoded / 32767.0, wav, atol=1e-4)
+
+
+def test_encode_pcm16_is_byte_view():
+    """PCM16 output is a byte-format view with two bytes per sample"""
+    audio = encode_pcm16(np.zeros((1, 480), dtype=np.float64))
+    assert audio.format == "B"
+    assert audio.nbytes == 960
+
+
+def test_finalize_clips_instead_of_wrapping():
+    """Out-of-range samples clip to full scale rather than overflowing"""
+    pcm = finalize_audio(np.array([1.5, -2.0, 0.5], dtype=np.float32))
+    assert pcm.tolist() == [32767, -32768, 16384]
+
+
+def test_finalize_normalize_rescales_peak():
+    """Normalize mode maps the peak to full scale"""
+    pcm = finalize_audio(np.array([2.0, -1.0], dtype=np.float32), mode="normalize")
+    assert pcm.tolist() == [32767, -16384]
+
+
+def test_finalize_dither_stays_within_one_lsb():
+    """TPDF dither perturbs each sample by at most one LSB"""
+    wav = np.random.default_rng(0).uniform(-0.5, 0.5, 100000).astype(np.float32)
+    plain = finalize_audio(wav.copy())
+    dithered = finalize_audio(wav.copy(), dither=True, rng=np.random.default_rng(1))
+    assert np.abs(plain.astype(np.int32) - dithered).max() <= 1
+
+
+def test_finalize_mulaw_reference_codes():
+    """μ-law output matches G.711 reference codes"""
+    codes = finalize_audio(np.array([0.0, 1.0, -1.0], dtype=np.float32), encoding="mulaw")
+    assert codes.tolist() == [0xFF, 0x80, 0x00]
+
+
+def test_finalize_alaw_reference_codes():
+    """A-law output matches G.711 reference codes"""
+    codes = finalize_audio(np.array([0.0, 1.0, -1.0], dtype=np.float32), encoding="alaw")
+    assert codes.tolist() == [0xD5, 0xAA, 0x2A]
+
+
+def test_telephony_encoder_streams_whole_frames():
+    """Block-wise 24 kHz input yields only whole 20 ms frames at 8 kHz"""
+    wav = np.random.default_rng(0).uniform(-0.5, 0.5, 24000).astype(np.float32)
+    encoder = TelephonyEncoder("mulaw", input_rate=24000)
+
+    sizes = [len(encoder.encode(wav[start:start + 1000])) for start in range(0, len(wav), 1000)]
+    sizes.append(len(encoder.flush()))
+
+    assert all(size % FRAME_SAMPLES == 0 for size in sizes)
+    assert sum(sizes) >= 8000
+
+
+def test_streaming_mp3_emits_frames_incrementally():
+    """MP3 frames come out per block, before flush"""
+    pytest.importorskip("lameenc")
+    from streaming_encoders import StreamingMP3Encoder
+
+    wav = (0.3 * np.sin(2 * np.pi * 440 * np.arange(48000) / 24000)).astype(np.float32)
+    encoder = StreamingMP3Encoder(sample_rate=24000, bitrate=64)
+
+    first = encoder.encode(wav[:24000])
+    rest = encoder.encode(wav[24000:]) + encoder.flush()
+
+    assert first[:2] == b"\xff\xf3"  # MPEG-2 Layer III frame sync
+    # 64 kbps for 2 s is ~16 KB
+    assert 14000 < len(first) + len(rest) < 18000
+
+
+def test_ogg_crc_check_value():
+    """Ogg page CRC (poly 0x04C11DB7, init 0, unreflected) matches the standard check value"""
+    from streaming_encoders import ogg_crc
+
+    assert ogg_crc(b"123456789") == 0x89A1897F
+
+
+def test_streaming_opus_ogg_pages():
+    """Ogg Opus output starts with OpusHead (BOS), ends with EOS, and every page checksum verifies"""
+    from streaming_encoders import OPUS_AVAILABLE, create_streaming_encoder, ogg_crc
+    if not OPUS_AVAILABLE:
+        pytest.skip("opuslib/libopus not installed")
+
+    wav = (0.3 * np.sin(2 * np.pi * 440 * np.arange(24000) / 24000)).astype(np.float32)
+    encoder = create_streaming_encoder("opus", sample_rate=24000, bitrate=32)
+    data = b"".join(encoder.iter_encode(wav))
+
+    pages = []
+    offset = 0
+    while offset < len(data):
+        assert data[offset:offset + 4] == b"OggS"
+        segments = data[offset + 26]
+        size = 27 + segments + sum(data[offset + 27:offset + 27 + segments])
+        page = bytearray(data[offset:offset + size])
+        crc = int.from_bytes(page[22:26], "little")
+        page[22:26] = b"\x00\x00\x00\x00"
+        assert ogg_crc(bytes(page)) == crc
+        pages.append(data[offset:offset + size])
+        offset += size
+
+    assert pages[0][5] == 0x02 and pages[0][28:36] == b"OpusHead"
+    assert pages[-1][5] & 0x04
+    # Final granule = pre-skip + 1 s at 48 kHz
+    assert int.from_bytes(pages[-1][6:14], "little") == encoder.pre_skip + 48000
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for the batch synthesis job API (scripts/batch_jobs.py)
+Run with: pytest tests/test_batch_jobs.py
+"""
+
+import io
+import sys
+import time
+import zipfile
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("asyncpg")
+pytest.importorskip("prometheus_client")
+pytest.importorskip("psutil")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import batch_jobs  # noqa: E402
+from tts_engines import FakeTTSEngine  # noqa: E402
+
+VOICE_ID = "6f1c1a2e-0000-4000-8000-000000000001"
+
+
+def make_app(tmp_path, engine, catalog):
+    app = FastAPI()
+    app.include_router(batch_jobs.router)
+    app.state.tts_model = engine
+    app.state.voice_catalog = catalog
+    app.state.config = {
+        "batch": {"db_path": str(tmp_path / "jobs.db"), "artifact_dir": str(tmp_path / "artifacts")},
+        "audio_output": {"trim_silence": {"enabled": False}}
+    }
+
+    @app.on_event("startup")
+    async def startup():
+        app.state.batch_worker = await batch_jobs.start_batch_worker(app, app.state.config)
+
+    @app.on_event("shutdown")
+    async def shutdown():
+        await app.state.batch_worker.stop()
+
+    return app
+
+
+def wait_for(client, job_id, timeout=10.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        status = client.get(f"/v1/batch/{job_id}").json()
+        if status["status"] in ("completed", "failed"):
+            return status
+        time.sleep(0.05)
+    raise AssertionError(f"Job did not finish: {status}")
+
+
+def test_batch_job_runs_and_packages_outputs(tmp_path, stub_catalog):
+    engine = FakeTTSEngine()
+    texts = ["Your appointment is tomorrow.", "Your payment was received.", "Thank you for choosing us!"]
+
+    with TestClient(make_app(tmp_path, engine, stub_catalog(VOICE_ID))) as client:
+        response = client.post("/v1/batch", json={
+            "voice_id": VOICE_ID,
+            "format": "pcm16",
+            "items": [{"text": text, "reference": f"row-{i}"} for i, text in enumerate(texts)]
+        })
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+
+        status = wait_for(client, job_id)
+        assert status["status"] == "completed"
+        assert status["completed"] == 3 and status["failed"] == 0
+        assert [item["reference"] for item in status["items"]] == ["row-0", "row-1", "row-2"]
+
+        item = client.get(status["items"][1]["url"])
+        assert item.status_code == 200
+        assert len(item.content) == status["items"][1]["bytes"] > 0
+
+        archive = client.get(status["archive_url"])
+        with zipfile.ZipFile(io.BytesIO(archive.content)) as zf:
+            assert sorted(zf.namelist()) == ["00000.pcm", "00001.pcm", "00002.pcm", "manifest.json"]
+
+
+def test_unknown_voice_rejected_up_front(tmp_path, stub_catalog):
+    with TestClient(make_app(tmp_path, FakeTTSEngine(), stub_catalog(VOICE_ID))) as client:
+        response = client.post("/v1/batch", json={
+            "voice_id": "6f1c1a2e-0000-4000-8000-00000000dead",
+            "items": [{"text": "Hello"}]
+        })
+        assert response.status_code == 404
+
+
+def test_unfinished_job_resumes_after_restart(tmp_path, stub_catalog):
+    """A job persisted as queued (server stopped before it ran) is picked up on the next start"""
+    store = batch_jobs.BatchStore(tmp_path / "jobs.db")
+    payload = batch_jobs.BatchRequest(voice_id=VOICE_ID, format="wav", items=[{"text": "Hello there."}])
+    catalog = stub_catalog(VOICE_ID)
+    store.create_job("job-1", None, payload, {VOICE_ID: catalog.get(VOICE_ID)})
+
+    engine = FakeTTSEngine()
+    with TestClient(make_app(tmp_path, engine, catalog)) as client:
+        status = wait_for(client, "job-1")
+
+    assert status["status"] == "completed"
+    assert engine.calls == 1
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the bulk synthesis CLI (scripts/bulk_synthesize.py)
+Run with: pytest tests/test_bulk_synthesize.py
+"""
+
+import csv
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import bulk_synthesize  # noqa: E402
+
+
+def stub_factory(voice, device):
+    """Tone engine: 10 ms of audio per character; fails on 'FAIL'"""
+    loads_file = os.environ["BULK_TEST_LOADS"]
+    with open(loads_file, "a") as f:
+        f.write(f"{os.getpid()}:{voice}\n")
+
+    def synthesize(text, params):
+        if "FAIL" in text:
+            raise RuntimeError("boom")
+        t = np.arange(int(24000 * 0.01 * len(text))) / 24000
+        return (0.3 * np.sin(2 * np.pi * 220 * t * params.get("speed", 1.0))).astype(np.float32)
+    return synthesize
+
+
+def write_rows(path, rows):
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=["id", "text", "voice", "speed"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def test_bulk_run_reuses_engines_and_resumes(tmp_path, monkeypatch):
+    monkeypatch.setitem(bulk_synthesize.ENGINE_FACTORIES, "stub", stub_factory)
+    monkeypatch.setenv("BULK_TEST_LOADS", str(tmp_path / "loads.txt"))
+
+    rows = [{"id": f"r{i}", "text": f"Reminder number {i}.", "voice": ["a", "b"][i % 2], "speed": ""} for i in range(10)]
+    rows.append({"id": "dup", "text": "Reminder number 0.", "voice": "a", "speed": ""})
+    rows.append({"id": "bad", "text": "FAIL here", "voice": "a", "speed": "1.2"})
+    source = tmp_path / "rows.csv"
+    write_rows(source, rows)
+    out = tmp_path / "out"
+
+    summary = bulk_synthesize.run_bulk(bulk_synthesize.read_rows(source), out, engine="stub", workers=2, chunk_size=3)
+    assert summary["failed"] == 1
+    assert summary["rendered"] == 11
+    assert len(list(out.glob("*.wav"))) == 10  # "dup" hashes to the same file as r0
+
+    # Engines are built once per (process, voice), not once per row
+    loads = (tmp_path / "loads.txt").read_text().split()
+    assert len(loads) == len(set(loads)) and len(loads) <= 4
+
+    manifest = [json.loads(line) for line in (out / "manifest.jsonl").read_text().splitlines()]
+    ok = [entry for entry in manifest if entry["status"] == "ok"]
+    assert all(entry["rtf"] is not None and entry["audio_seconds"] > 0 for entry in ok)
+    assert next(entry for entry in manifest if entry["id"] == "bad")["error"] == "boom"
+
+    # Second run only retries the failed row
+    again = bulk_synthesize.run_bulk(bulk_synthesize.read_rows(source), out, engine="stub", workers=2)
+    assert again["skipped"] == 11
+    assert again["rendered"] == 0 and again["failed"] == 1
+
+
+def test_output_name_depends_on_params():
+    base = bulk_synthesize.output_name("kokoro", "af_heart", "Hello.", {})
+    assert bulk_synthesize.output_name("kokoro", "af_heart", "Hello.", {}) == base
+    assert bulk_synthesize.output_name("kokoro", "af_heart", "Hello.", {"speed": 0.9}) != base
+    assert bulk_synthesize.output_name("kokoro", "af_bella", "Hello.", {}) != base
+
+
+def test_identical_rows_render_once(tmp_path, monkeypatch):
+    """Rows hashing to one file are rendered by one worker; every row still gets a manifest line"""
+    monkeypatch.setitem(bulk_synthesize.ENGINE_FACTORIES, "stub", stub_factory)
+    monkeypatch.setenv("BULK_TEST_LOADS", str(tmp_path / "loads.txt"))
+
+    rows = [{"id": f"r{i}", "text": "Same reminder.", "voice": "a", "speed": ""} for i in range(6)]
+    source = tmp_path / "rows.csv"
+    write_rows(source, rows)
+    out = tmp_path / "out"
+
+    summary = bulk_synthesize.run_bulk(bulk_synthesize.read_rows(source), out, engine="stub", workers=3, chunk_size=1)
+    assert summary["rendered"] == 6 and summary["failed"] == 0
+    assert len(list(out.glob("*.wav"))) == 1
+    assert not list(out.glob("*.tmp"))
+
+    manifest = [json.loads(line) for line in (out / "manifest.jsonl").read_text().splitlines()]
+    assert sorted(entry["id"] for entry in manifest) == [f"r{i}" for i in range(6)]
+    assert len({entry["file"] for entry in manifest}) == 1
+    assert (tmp_path / "loads.txt").read_text().count(":a") == 1  # Only one chunk was planned
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Unit tests for multi-chunk audio assembly (scripts/chunk_assembler.py)
+Run with: pytest tests/test_chunk_assembler.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from chunk_assembler import ChunkAssembler  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+
+def chunk(voiced_seconds: float, silence_seconds: float = 0.4, end_value: float = 0.2) -> np.ndarray:
+    """Voiced tone padded with silence, ending on a DC step (clicks on a hard join)"""
+    voiced = int(voiced_seconds * SAMPLE_RATE)
+    silence = int(silence_seconds * SAMPLE_RATE)
+    wav = np.zeros(silence + voiced + silence, dtype=np.float32)
+    wav[silence:silence + voiced] = 0.3 * np.sin(2 * np.pi * 200 * np.arange(voiced) / SAMPLE_RATE)
+    wav[-48:] = end_value
+    return wav
+
+
+def test_buffered_and_streaming_agree():
+    """Both modes produce identical samples; boundary silence is trimmed to the pause"""
+    chunks = [chunk(1.0), chunk(0.5), chunk(0.8)]
+
+    buffered = ChunkAssembler(SAMPLE_RATE, expected_samples=1000)  # deliberately short estimate
+    for wav in chunks:
+        buffered.add(wav)
+
+    streaming = ChunkAssembler(SAMPLE_RATE, streaming=True)
+    parts = [streaming.add(wav) for wav in chunks] + [streaming.finish()]
+
+    np.testing.assert_array_equal(buffered.result(), np.concatenate(parts))
+    assert buffered.reallocations > 0
+    assert buffered.trimmed_samples > 0
+    assert len(buffered.result()) < sum(len(wav) for wav in chunks)
+
+
+def test_crossfade_removes_boundary_step():
+    """A DC step at a chunk boundary is smoothed instead of jumping in one sample"""
+    assembler = ChunkAssembler(SAMPLE_RATE, pause_ms=None)
+    first = np.full(4800, 0.5, dtype=np.float32)
+    second = np.zeros(4800, dtype=np.float32)
+    assembler.add(first)
+    assembler.add(second)
+
+    out = assembler.result()
+    assert len(out) == len(first) + len(second) - assembler.crossfade
+    assert np.abs(np.diff(out)).max() < 0.01
+
+
+def test_streamed_blocks_join_like_whole_chunks():
+    """A chunk fed as add(partial=True) + extend(...) blocks matches feeding it whole"""
+    chunks = [chunk(1.0), chunk(0.8, end_value=0.0)]
+    blocks = np.split(chunks[1], [int(s * SAMPLE_RATE) for s in (0.6, 0.9, 1.2)])
+
+    whole = ChunkAssembler(SAMPLE_RATE, streaming=True)
+    expected = [whole.add(wav) for wav in chunks] + [whole.finish()]
+
+    streamed = ChunkAssembler(SAMPLE_RATE, streaming=True)
+    parts = [streamed.add(chunks[0]), streamed.add(blocks[0], partial=True)]
+    parts += [streamed.extend(block) for block in blocks[1:]] + [streamed.finish()]
+
+    # Same head trim and crossfade; only the streamed chunk's trailing silence is kept whole
+    out, reference = np.concatenate(parts), np.concatenate(expected)
+    np.testing.assert_array_equal(out[:len(reference)], reference)
+    assert len(out) - len(reference) == int(0.28 * SAMPLE_RATE)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for CPU acceleration (scripts/cpu_acceleration.py)
+Run with: pytest tests/test_cpu_acceleration.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import cpu_acceleration  # noqa: E402
+from cpu_acceleration import cgroup_cpu_limit, effective_cpus, compare_outputs, quality_guard, accelerate_cpu  # noqa: E402
+
+SR = 24000
+
+
+def tone(freq: float, seconds: float = 1.0, seed: int = 0) -> np.ndarray:
+    t = np.arange(int(SR * seconds)) / SR
+    noise = np.random.default_rng(seed).standard_normal(len(t)) * 0.01
+    return (0.5 * np.sin(2 * np.pi * freq * t) + noise).astype(np.float32)
+
+
+def test_cgroup_v2_quota(tmp_path):
+    (tmp_path / "cpu.max").write_text("250000 100000\n")
+    assert cgroup_cpu_limit(str(tmp_path)) == 2.5
+
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+    assert cgroup_cpu_limit(str(tmp_path)) is None
+
+
+def test_cgroup_v1_quota(tmp_path):
+    (tmp_path / "cpu").mkdir()
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("200000\n")
+    (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+    assert cgroup_cpu_limit(str(tmp_path)) == 2.0
+
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("-1\n")
+    assert cgroup_cpu_limit(str(tmp_path)) is None
+
+
+def test_effective_cpus_capped_by_quota(tmp_path):
+    assert cgroup_cpu_limit(str(tmp_path)) is None  # No cgroup files: unlimited
+
+    (tmp_path / "cpu.max").write_text("50000 100000\n")
+    assert effective_cpus(str(tmp_path)) == 1  # Half a CPU still gets one thread
+
+
+def test_quality_guard_accepts_similar_and_rejects_different_audio():
+    reference = [tone(220), tone(330)]
+    similar = [tone(220, 1.05, seed=1), tone(330, 0.95, seed=1)]
+    assert quality_guard(reference, similar)["passed"]
+
+    wrong_pitch = [tone(220), tone(2000)]
+    result = quality_guard(reference, wrong_pitch)
+    assert not result["passed"]
+    assert result["sentences"][1]["spectral_distance_db"] > 3.0
+
+    truncated = [tone(220), tone(330, 0.5)]
+    assert compare_outputs(reference[1], truncated[1])["duration_ratio"] == 2.0
+    assert not quality_guard(reference, truncated)["passed"]
+
+
+class FakeModel:
+    """Stand-in for ChatterboxTTS: t3/s3gen modules and a generate() whose output depends on them"""
+
+    def __init__(self):
+        self.t3 = "fp32-t3"
+        self.s3gen = "fp32-s3gen"
+
+    def generate(self, text):
+        return tone(2000 if self.t3 == "broken-t3" else 220, seconds=len(text) / 30)
+
+
+def patch_torch_parts(monkeypatch, quantized_t3):
+    monkeypatch.setattr(cpu_acceleration, "tune_threads", lambda: {"intra_op_threads": 2, "inter_op_threads": 1})
+    monkeypatch.setattr(cpu_acceleration, "linear_layers", lambda module: 10)
+    monkeypatch.setattr(
+        cpu_acceleration, "quantize_linear",
+        lambda module: quantized_t3 if module == "fp32-t3" else "int8-s3gen"
+    )
+    monkeypatch.setattr(cpu_acceleration, "_synthesize", lambda model, text, seed: model.generate(text))
+
+
+def test_accelerate_keeps_int8_when_guard_passes(monkeypatch):
+    patch_torch_parts(monkeypatch, quantized_t3="int8-t3")
+    model = FakeModel()
+
+    report = accelerate_cpu(model)
+
+    assert report["applied"]
+    assert (model.t3, model.s3gen) == ("int8-t3", "int8-s3gen")
+    assert report["quantized_linear_layers"] == 20
+    assert report["fp32_rtf"] is not None and report["int8_rtf"] is not None
+    assert report["quality"]["passed"]
+
+
+def test_accelerate_reverts_to_fp32_when_guard_fails(monkeypatch):
+    patch_torch_parts(monkeypatch, quantized_t3="broken-t3")
+    model = FakeModel()
+
+    report = accelerate_cpu(model)
+
+    assert not report["applied"]
+    assert (model.t3, model.s3gen) == ("fp32-t3", "fp32-s3gen")
+    assert not report["quality"]["passed"]
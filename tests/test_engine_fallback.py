@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for load-adaptive engine fallback (scripts/engine_fallback.py)
+Run with: pytest tests/test_engine_fallback.py
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("asyncpg")
+pytest.importorskip("prometheus_client")
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import admission  # noqa: E402
+import engine_fallback  # noqa: E402
+import tts_engines  # noqa: E402
+import api_v1  # noqa: E402
+from admission import AdmissionController  # noqa: E402
+from engine_fallback import FallbackRouter  # noqa: E402
+from tts_engines import EngineRegistry, FakeTTSEngine  # noqa: E402
+
+VOICE_ID = "6f1c1a2e-0000-4000-8000-000000000002"
+MAPPING = {"maya-professional": "af_heart"}
+
+
+class RecordingEngine(FakeTTSEngine):
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+        self.voices = []
+
+    def generate(self, text, **params):
+        self.voices.append(params.get("voice"))
+        return super().generate(text, **params)
+
+
+def backed_up(seconds: float) -> AdmissionController:
+    """Controller whose single slot is busy with calls taking `seconds`"""
+    controller = AdmissionController(max_concurrent=1)
+    controller.active = 1
+    controller.service_ewma = seconds
+    return controller
+
+
+@pytest.fixture
+def engines(monkeypatch):
+    registry = EngineRegistry()
+    primary, fallback = RecordingEngine("chatterbox"), RecordingEngine("kokoro")
+    registry.register(primary, default=True)
+    registry.register(fallback)
+    monkeypatch.setattr(tts_engines, "_engine_registry", registry)
+    return primary, fallback
+
+
+def test_decide_compares_predicted_latency_with_budget(engines):
+    router = FallbackRouter(MAPPING, budget_ms=None, enabled=True)
+
+    assert router.decide("maya-professional", None, backed_up(3.0)).reason == "no_budget"
+    assert router.decide("maya-professional", 5000, backed_up(3.0)).reason == "within_budget"
+    assert router.decide("emily-en-us", 1000, backed_up(3.0)).reason == "no_mapping"
+
+    decision = router.decide("maya-professional", 1000, backed_up(3.0))
+    assert decision.degraded and decision.voice == "af_heart" and decision.engine is engines[1]
+    assert decision.predicted_ms == pytest.approx(1500)  # Waits for half the running call
+    assert decision.headers()["X-Degraded"] == "true"
+
+    router.budget_ms = 1000  # Configured default budget applies when the request sets none
+    assert router.decide("maya-professional", None, backed_up(3.0)).degraded
+    assert router.get_stats()["degraded"] == 2
+
+
+def test_idle_queue_and_disabled_router_stay_on_primary(engines):
+    router = FallbackRouter(MAPPING, enabled=True)
+    idle = AdmissionController()
+    assert not router.decide("maya-professional", 100, idle).degraded
+
+    router.enabled = False
+    assert router.decide("maya-professional", 1, backed_up(3.0)).reason == "disabled"
+
+
+def test_slow_model_on_idle_queue_stays_on_primary(engines):
+    """Budgets are for first audio: a long average call does not degrade requests nobody queues behind"""
+    router = FallbackRouter(MAPPING, enabled=True, first_audio_ms=300)
+    idle = AdmissionController(max_concurrent=1)
+    idle.service_ewma = 5.0  # Whole sentences take 5 s, but the slot is free
+
+    decision = router.decide("maya-professional", 800, idle)
+    assert not decision.degraded and decision.reason == "within_budget"
+    assert decision.predicted_ms == pytest.approx(300)
+
+    idle.service_ewma = 0.1  # First-audio estimate never exceeds a whole call
+    assert router.decide("maya-professional", 800, idle).predicted_ms == pytest.approx(100)
+
+
+def test_unavailable_fallback_engine(monkeypatch):
+    registry = EngineRegistry()
+    registry.register(RecordingEngine("chatterbox"), default=True)
+    monkeypatch.setattr(tts_engines, "_engine_registry", registry)
+
+    router = FallbackRouter(MAPPING, enabled=True)
+    assert router.decide("maya-professional", 1, backed_up(3.0)).reason == "unavailable"
+
+
+def test_v1_tts_marks_degraded_responses(engines, monkeypatch, stub_catalog):
+    primary, fallback = engines
+    controller = backed_up(3.0)
+    monkeypatch.setattr(admission, "_admission_controller", controller)
+    monkeypatch.setattr(engine_fallback, "_fallback_router", FallbackRouter(MAPPING, enabled=True))
+
+    app = FastAPI()
+    app.include_router(api_v1.router)
+    app.state.tts_model = primary
+    app.state.voice_catalog = stub_catalog(VOICE_ID, "maya-professional")
+    app.state.config = {"audio_output": {"trim_silence": {"enabled": False}}}
+    client = TestClient(app)
+
+    response = client.post("/v1/tts", json={
+        "text": "Your appointment is confirmed.", "voice_id": VOICE_ID, "format": "pcm16", "latency_budget_ms": 800
+    })
+    assert response.status_code == 200
+    assert response.headers["x-degraded"] == "true"
+    assert response.headers["x-engine"] == "kokoro"
+    assert response.headers["x-fallback-voice"] == "af_heart"
+    assert "x-guidance-mode" not in response.headers
+    assert fallback.voices == ["af_heart"] and primary.calls == 0
+
+    controller.active, controller.service_ewma = 0, 0.5  # Queue drained: same request goes to the primary engine
+    response = client.post("/v1/tts", json={
+        "text": "Your appointment is confirmed.", "voice_id": VOICE_ID, "format": "pcm16", "latency_budget_ms": 800
+    })
+    assert response.headers["x-degraded"] == "false"
+    assert response.headers["x-guidance-mode"] == "cfg"
+    assert primary.calls == 1
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared Kokoro session pool (scripts/kokoro_tts_engine.py)
+Run with: pytest tests/test_kokoro_pool.py
+
+onnxruntime and kokoro_onnx are replaced by small fakes, so these tests
+check the pool's wiring (one session, per-call voice selection, thread
+settings, concurrency limit) rather than audio quality.
+"""
+
+import sys
+import time
+import types
+import threading
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import kokoro_tts_engine  # noqa: E402
+
+
+class FakeSession:
+    created = 0
+
+    def __init__(self, path, sess_options=None, providers=None):
+        FakeSession.created += 1
+        self.options = sess_options
+        self.providers = providers
+
+    def get_providers(self):
+        return self.providers
+
+
+class FakeKokoro:
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, session):
+        self.session = session
+        self.voices = {"af_heart": 1, "am_adam": 2}
+
+    @classmethod
+    def from_session(cls, session, voices_path):
+        return cls(session)
+
+    def get_voices(self):
+        return list(self.voices)
+
+    def create(self, text, voice, speed=1.0, lang="en-us"):
+        with FakeKokoro.lock:
+            FakeKokoro.active += 1
+            FakeKokoro.peak = max(FakeKokoro.peak, FakeKokoro.active)
+        time.sleep(0.02)
+        with FakeKokoro.lock:
+            FakeKokoro.active -= 1
+        return np.full(2400, self.voices[voice] / 10, dtype=np.float32), 24000
+
+
+@pytest.fixture
+def fake_runtime(monkeypatch):
+    ort = types.SimpleNamespace(
+        SessionOptions=types.SimpleNamespace,
+        ExecutionMode=types.SimpleNamespace(ORT_SEQUENTIAL="sequential"),
+        GraphOptimizationLevel=types.SimpleNamespace(ORT_ENABLE_ALL="all"),
+        InferenceSession=FakeSession,
+        get_available_providers=lambda: ["CPUExecutionProvider"]
+    )
+    monkeypatch.setitem(sys.modules, "onnxruntime", ort)
+    monkeypatch.setitem(sys.modules, "kokoro_onnx", types.SimpleNamespace(Kokoro=FakeKokoro))
+    monkeypatch.setattr(kokoro_tts_engine, "_kokoro_pool", None)
+    monkeypatch.setattr(kokoro_tts_engine, "available_cpus", lambda: 8)
+    FakeSession.created = 0
+    FakeKokoro.peak = 0
+
+
+def test_voices_share_one_session(fake_runtime):
+    heart = kokoro_tts_engine.KokoroTTSEngine(voice="af_heart")
+    adam = kokoro_tts_engine.KokoroTTSEngine(voice="am_adam")
+
+    assert heart.kokoro is adam.kokoro
+    assert FakeSession.created == 1
+    assert heart.generate("Hello.")[0] == pytest.approx(0.1)
+    assert adam.generate("Hello.")[0] == pytest.approx(0.2)
+
+
+def test_threads_split_across_concurrent_sessions(fake_runtime):
+    pool = kokoro_tts_engine.KokoroSessionPool(concurrency=2)
+    assert FakeSession.created == 1
+    assert pool.session.options.intra_op_num_threads == 4
+    assert pool.session.options.inter_op_num_threads == 1
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        list(executor.map(lambda _: pool.create("Hi", voice="af_heart"), range(12)))
+    assert FakeKokoro.peak == 2
+    assert pool.get_stats()["calls"] == 12
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for the Twilio Media Streams WebSocket handler (scripts/media_streams.py)
+Uses a local WebSocket client and the fake engine - no model or Twilio needed.
+Run with: pytest tests/test_media_streams.py
+"""
+
+import sys
+import json
+import math
+import time
+import base64
+from pathlib import Path
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from media_streams import router  # noqa: E402
+from telephony_audio import FRAME_SAMPLES, FRAME_MS  # noqa: E402
+from tts_engines import FakeTTSEngine  # noqa: E402
+
+
+def make_client(engine):
+    app = FastAPI()
+    app.include_router(router)
+    app.state.tts_model = engine
+    return TestClient(app)
+
+
+def start_message(text, call_sid="CA123"):
+    return {
+        "event": "start",
+        "streamSid": "MZ123",
+        "start": {
+            "streamSid": "MZ123",
+            "callSid": call_sid,
+            "customParameters": {"text": text},
+            "mediaFormat": {"encoding": "audio/x-mulaw", "sampleRate": 8000, "channels": 1}
+        }
+    }
+
+
+def test_streams_paced_mulaw_frames_then_closes():
+    """Speaks customParameters.text as 20 ms frames, marks the end, closes on mark echo"""
+    engine = FakeTTSEngine()
+    with make_client(engine).websocket_connect("/twilio/media-stream") as ws:
+        ws.send_json({"event": "connected", "protocol": "Call", "version": "1.0.0"})
+        ws.send_json(start_message("Hello"))
+
+        started = time.monotonic()
+        frames = []
+        while True:
+            message = ws.receive_json()
+            if message["event"] == "mark":
+                break
+            assert message["event"] == "media"
+            assert message["streamSid"] == "MZ123"
+            frames.append(base64.b64decode(message["media"]["payload"]))
+        elapsed = time.monotonic() - started
+
+        # The clip's length in 20 ms frames, plus the filter tail
+        clip_frames = math.ceil(len(engine.render("Hello")) / 24000 * 1000 / FRAME_MS)
+        assert len(frames) in (clip_frames, clip_frames + 1)
+        assert all(len(frame) == FRAME_SAMPLES for frame in frames)
+        # Paced to real time (minus the lead), not dumped at once
+        assert elapsed >= 0.2
+
+        ws.send_json({"event": "mark", "streamSid": "MZ123", "mark": {"name": message["mark"]["name"]}})
+        assert ws.receive()["type"] == "websocket.close"
+
+
+def test_barge_in_sends_clear():
+    """Loud inbound audio while speaking cancels playback with a clear message"""
+    engine = FakeTTSEngine()
+    loud = base64.b64encode(bytes([0x80]) * FRAME_SAMPLES).decode("ascii")  # μ-law near full scale
+
+    with make_client(engine).websocket_connect("/twilio/media-stream") as ws:
+        ws.send_json(start_message("This sentence is long enough to interrupt."))
+        assert ws.receive_json()["event"] == "media"
+
+        for _ in range(5):
+            ws.send_json({"event": "media", "streamSid": "MZ123", "media": {"track": "inbound", "payload": loud}})
+
+        events = []
+        while True:
+            message = ws.receive_json()
+            events.append(message["event"])
+            if message["event"] == "clear":
+                break
+        assert message["streamSid"] == "MZ123"
+        # Far fewer frames than the 2.5 s utterance
+        assert len(events) < 50
+
+        ws.send_json({"event": "stop", "streamSid": "MZ123"})
+
+
+def test_barge_in_closes_reply_stream():
+    """A barge-in drops the utterance's mark, so a close-when-done stream closes on clear"""
+    engine = FakeTTSEngine()
+    loud = base64.b64encode(bytes([0x80]) * FRAME_SAMPLES).decode("ascii")
+
+    with make_client(engine).websocket_connect("/twilio/media-stream") as ws:
+        ws.send_json(start_message("This sentence is long enough to interrupt."))
+        assert ws.receive_json()["event"] == "media"
+
+        for _ in range(5):
+            ws.send_json({"event": "media", "streamSid": "MZ123", "media": {"track": "inbound", "payload": loud}})
+
+        while True:
+            message = ws.receive()
+            assert message["type"] != "websocket.close", "closed before the clear message"
+            if json.loads(message["text"])["event"] == "clear":
+                break
+        assert ws.receive()["type"] == "websocket.close"
+
+
+def test_pending_utterances_expire_and_are_capped(monkeypatch):
+    """Utterances for streams that never connect do not accumulate"""
+    import media_streams
+
+    monkeypatch.setattr(media_streams, "_pending_utterances", {})
+    clock = [1000.0]
+    monkeypatch.setattr(media_streams, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+
+    for i in range(media_streams.MAX_PENDING_UTTERANCES + 5):
+        media_streams.queue_utterance("CA-many", f"Line {i}.")
+    _, utterances = media_streams._pending_utterances["CA-many"]
+    assert len(utterances) == media_streams.MAX_PENDING_UTTERANCES
+    assert utterances[0]["text"] == "Line 5."  # Oldest dropped
+
+    media_streams.queue_utterance("CA-ended", "Goodbye.")
+    media_streams.discard_call("CA-ended")  # Status callback: call completed
+    assert "CA-ended" not in media_streams._pending_utterances
+
+    clock[0] += media_streams.PENDING_TTL_SECONDS + 1  # CA-many hung up before its stream opened
+    media_streams.queue_utterance("CA-new", "Hello.")
+    assert list(media_streams._pending_utterances) == ["CA-new"]
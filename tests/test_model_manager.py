@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Tests for memory-budgeted model residency (scripts/model_manager.py)
+Run with: pytest tests/test_model_manager.py
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("prometheus_client")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import tts_engines  # noqa: E402
+import model_manager  # noqa: E402
+from model_manager import ModelManager, ModelSpec, MB  # noqa: E402
+from tts_engines import EngineRegistry, FakeTTSEngine  # noqa: E402
+
+SIZES_MB = {"primary": 400, "french": 300, "german": 300, "kokoro": 100}
+
+
+class Loader:
+    """Builds fake engines of fixed sizes, counting loads"""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+        self.loads = []
+
+    def __call__(self, engine: str, device: str):
+        time.sleep(self.delay)
+        self.loads.append(engine)
+        built = FakeTTSEngine()
+        built.memory_bytes = SIZES_MB[engine] * MB
+        return built
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    registry = EngineRegistry()
+    monkeypatch.setattr(tts_engines, "_engine_registry", registry)
+    return registry
+
+
+def manager(budget_mb=None, loader=None) -> ModelManager:
+    return ModelManager(
+        [
+            ModelSpec("primary", "primary", languages=["en"], pinned=True),
+            ModelSpec("french", "french", languages=["fr"]),
+            ModelSpec("german", "german", languages=["de"]),
+        ],
+        budget_mb=budget_mb,
+        loader=loader or Loader()
+    )
+
+
+def test_resolve_by_name_and_language():
+    models = manager()
+    assert models.default == "primary"
+    assert models.resolve(language="FR") == "french"
+    assert models.resolve(language="en") == "primary"
+    assert models.resolve(language="fr-CA") == "french"  # Primary subtag
+    assert models.resolve(language="en-US") == "primary"
+    assert models.resolve(language="sw") == "primary"  # Unlisted language: default model
+    assert models.resolve(engine="german", language="fr") == "german"
+    with pytest.raises(KeyError):
+        models.resolve(engine="spanish")
+
+
+def test_concurrent_first_requests_share_one_load(registry):
+    loader = Loader(delay=0.05)
+    models = manager(loader=loader)
+
+    async def burst():
+        return await asyncio.gather(*(models.acquire("french") for _ in range(4)))
+
+    engines = asyncio.run(burst())
+    assert loader.loads == ["french"]
+    assert all(engine is engines[0] for engine in engines)
+    assert registry.get("french") is engines[0]
+
+    stats = models.get_stats()
+    assert stats["loads"] == 1 and stats["queued"] == 3
+    assert stats["resident"]["french"]["size_mb"] == 300
+    assert stats["resident"]["french"]["uses"] == 4
+
+
+def test_lru_eviction_respects_budget_and_pins(registry):
+    loader = Loader()
+    models = manager(budget_mb=1000, loader=loader)
+
+    async def scenario():
+        await models.acquire("primary")
+        await models.acquire("french")
+        await models.acquire("german")      # 1000 MB: at budget
+        await models.acquire("french")      # German is now least recently used of the unpinned
+        models.specs["spanish"] = ModelSpec("spanish", "kokoro")
+        await models.acquire("spanish")
+
+    asyncio.run(scenario())
+    assert not models.is_resident("german") and registry.get("german") is None
+    assert models.is_resident("primary") and models.is_resident("french") and models.is_resident("spanish")
+    assert models.resident_bytes <= 1000 * MB
+    assert models.get_stats()["evictions"] == 1
+
+    asyncio.run(models.acquire("german"))  # Reloads on demand, evicting the LRU unpinned model again
+    assert loader.loads.count("german") == 2
+    assert models.is_resident("primary")
+
+
+def test_models_in_use_are_not_evicted():
+    models = manager(budget_mb=800)
+
+    async def scenario():
+        await models.acquire("primary")
+        async with models.use("french"):
+            await models.acquire("german")  # Over budget, but French is serving a request
+            assert models.is_resident("french") and models.is_resident("german")
+
+    asyncio.run(scenario())
+    # Released: the overshoot settles by evicting the least recently used model
+    assert not models.is_resident("french") and models.is_resident("german")
+    assert models.resident_bytes <= 800 * MB
+
+
+def test_queued_load_does_not_evict_a_model_its_callers_are_waiting_for():
+    """A load queued behind another must not evict the model that load's callers are about to resume with"""
+    models = ModelManager(
+        [
+            ModelSpec("primary", "primary", languages=["en"], pinned=True),
+            ModelSpec("french", "french", languages=["fr"], estimated_mb=300),
+            ModelSpec("german", "german", languages=["de"], estimated_mb=300),
+        ],
+        budget_mb=750,
+        loader=Loader()
+    )
+
+    async def scenario():
+        await models.acquire("primary")
+        return await asyncio.gather(models.acquire("french"), models.acquire("german"), return_exceptions=True)
+
+    french, german = asyncio.run(scenario())
+    assert not isinstance(french, Exception) and not isinstance(german, Exception)
+    assert french is not german
+    assert models.resident_bytes <= 750 * MB  # Overshoot settled once both callers resumed
+
+
+def test_failed_load_raises_and_can_retry():
+    attempts = []
+
+    def flaky(engine, device):
+        attempts.append(engine)
+        if len(attempts) == 1:
+            raise RuntimeError("download failed")
+        return Loader()(engine, device)
+
+    models = manager(loader=flaky)
+    with pytest.raises(RuntimeError):
+        asyncio.run(models.acquire("french"))
+    assert asyncio.run(models.acquire("french")) is not None
+    assert models.get_stats()["load_failures"] == 1
+
+
+def test_adopt_and_config(monkeypatch):
+    monkeypatch.setattr(model_manager, "_model_manager", None)
+    monkeypatch.delenv("TTS_ENGINE", raising=False)
+    models = model_manager.get_model_manager({
+        "model": {"engine": "fake", "device": "cpu"},
+        "models": {"budget_mb": 500, "specs": {"french": {"languages": ["FR"], "estimated_mb": 300}}}
+    })
+    assert models.default == "fake" and models.specs["fake"].pinned
+    assert models.specs["french"].engine == "french" and models.specs["french"].languages == ["fr"]
+    assert models.get_stats()["budget_mb"] == 500
+
+    fallback = FakeTTSEngine()
+    fallback.memory_bytes = 100 * MB
+    models.adopt("kokoro", fallback, pinned=True)
+    assert models.is_resident("kokoro") and models.specs["kokoro"].pinned
+    assert models.get_stats()["resident_mb"] == 100
+
+
+def test_v1_tts_serves_each_voice_on_its_language_model(monkeypatch, stub_catalog):
+    pytest.importorskip("asyncpg")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    import api_v1
+
+    voice_id = "6f1c1a2e-0000-4000-8000-000000000005"
+    loader = Loader()
+    models = manager(loader=loader)
+    monkeypatch.setattr(model_manager, "_model_manager", models)
+
+    primary = FakeTTSEngine()
+    catalog = stub_catalog(voice_id, "emily-en-us")
+    app = FastAPI()
+    app.include_router(api_v1.router)
+    app.state.tts_model = primary
+    app.state.voice_catalog = catalog
+    app.state.config = {"audio_output": {"trim_silence": {"enabled": False}}}
+    client = TestClient(app)
+    payload = {"text": "Bonjour.", "voice_id": voice_id, "format": "pcm16"}
+
+    catalog.voice["language"] = "en-US"
+    assert client.post("/v1/tts", json=payload).status_code == 200
+    assert primary.calls == 1 and loader.loads == []
+
+    catalog.voice["language"] = "fr-FR"
+    payload["seed"] = 7  # Another request, not a replay
+    assert client.post("/v1/tts", json=payload).status_code == 200
+    assert primary.calls == 1 and loader.loads == ["french"]
+    french = models.get_stats()["resident"]["french"]
+    assert french["uses"] == 1 and french["in_use"] == 0  # Released when the stream ended
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Tests for the import-time profiler (scripts/profile_imports.py)
+Run with: pytest tests/test_profile_imports.py
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from profile_imports import parse_importtime, profile_module  # noqa: E402
+
+SAMPLE = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |       2400 |     numpy.core
+import time:      1500 |       4000 |   numpy
+import time:       900 |       5020 | tts_engines
+"""
+
+
+def test_parse_importtime():
+    entries = parse_importtime(SAMPLE)
+    assert [entry["module"] for entry in entries] == ["_io", "numpy.core", "numpy", "tts_engines"]
+    assert entries[1] == {"module": "numpy.core", "self_us": 300, "cumulative_us": 2400, "depth": 2}
+    assert entries[3]["depth"] == 0
+
+
+def test_engine_module_keeps_torch_lazy():
+    report = profile_module("tts_engines")
+    assert report["ok"]
+    assert report["total_ms"] > 0
+    assert "numpy" in report["packages"]
+    assert not {"torch", "chatterbox", "kokoro_onnx"} & report["imported"]
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the per-sentence audio cache (scripts/sentence_cache.py)
+Run with: pytest tests/test_sentence_cache.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from sentence_cache import SentenceCache  # noqa: E402
+
+PARAMS = {"temperature": 0.8, "exaggeration": 1.3, "cfg_weight": 0.5}
+
+
+def tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(24000 * seconds)) / 24000
+    return (0.5 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def test_round_trip_and_key_normalization(tmp_path):
+    cache = SentenceCache(tmp_path)
+    key = cache.key("Thank you for choosing us!", "voice-1", PARAMS)
+    wav = tone(0.5)
+    original = wav.copy()
+
+    assert cache.get(key) is None
+    cache.put(key, wav)
+    np.testing.assert_array_equal(wav, original)  # Input untouched
+
+    assert cache.key("  Thank you  for choosing us! ", "voice-1", PARAMS) == key
+    assert cache.key("Thank you for choosing us!", "voice-2", PARAMS) != key
+    assert cache.key("Thank you for choosing us!", "voice-1", PARAMS, speed=1.2) != key
+
+    cached = cache.get(key)
+    assert cached.dtype == np.float32
+    np.testing.assert_allclose(cached, original, atol=1 / 32767)
+    assert (tmp_path / f"{key}.pcm").stat().st_size == 2 * len(original)
+
+
+def test_lru_eviction_survives_restart(tmp_path):
+    entry_bytes = 2 * len(tone(0.25))
+    cache = SentenceCache(tmp_path, max_bytes=2 * entry_bytes)
+    keys = [cache.key(f"Sentence {i}.", "voice", PARAMS) for i in range(3)]
+
+    cache.put(keys[0], tone(0.25))
+    time.sleep(0.01)                        # Distinct mtimes (recency)
+    cache.put(keys[1], tone(0.25))
+    time.sleep(0.01)
+    assert cache.get(keys[0]) is not None   # keys[0] now most recent
+    time.sleep(0.01)
+    cache.put(keys[2], tone(0.25))          # evicts keys[1]
+
+    assert cache.get(keys[1]) is None
+    assert not (tmp_path / f"{keys[1]}.pcm").exists()
+
+    reopened = SentenceCache(tmp_path, max_bytes=2 * entry_bytes)
+    assert reopened.get_stats()["entries"] == 2
+    assert reopened.get(keys[0]) is not None and reopened.get(keys[2]) is not None
+
+
+def test_unreadable_entries_are_misses(tmp_path):
+    cache = SentenceCache(tmp_path)
+    removed, emptied = cache.key("Goodbye.", "voice-1", PARAMS), cache.key("Hello.", "voice-1", PARAMS)
+    cache.put(removed, tone(0.2))
+    cache.put(emptied, tone(0.2))
+
+    (tmp_path / f"{removed}.pcm").unlink()           # Another worker's eviction
+    (tmp_path / f"{emptied}.pcm").write_bytes(b"")
+    assert cache.get(removed) is None and cache.get(emptied) is None
+    assert cache.misses == 2 and cache.hits == 0
+
+
+def test_workers_share_entries_and_the_byte_bound(tmp_path):
+    """Two processes' caches on one directory: each hits the other's entries, and the total stays bounded"""
+    entry_bytes = 2 * len(tone(0.25))
+    first = SentenceCache(tmp_path, max_bytes=2 * entry_bytes)
+    second = SentenceCache(tmp_path, max_bytes=2 * entry_bytes)
+    keys = [first.key(f"Sentence {i}.", "voice", PARAMS) for i in range(3)]
+
+    first.put(keys[0], tone(0.25))
+    assert second.get(keys[0]) is not None and second.hits == 1  # Rendered by the other worker
+
+    time.sleep(0.01)
+    second.put(keys[1], tone(0.25))
+    time.sleep(0.01)
+    first.put(keys[2], tone(0.25))  # Evicts the oldest entry, whichever worker wrote it
+    assert sum(path.stat().st_size for path in tmp_path.glob("*.pcm")) <= 2 * entry_bytes
+    assert first.get(keys[0]) is None and second.get(keys[1]) is not None
+    assert first.get_stats()["entries"] == 2 and first.get_stats()["evictions"] == 1
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Unit tests for leading/trailing silence trimming (scripts/silence_trim.py)
+Run with: pytest tests/test_silence_trim.py
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from silence_trim import SilenceTrimmer, trim_silence  # noqa: E402
+
+SAMPLE_RATE = 24000
+
+
+def utterance(head: float = 0.4, tail: float = 0.6, pause: float = 0.3) -> np.ndarray:
+    """Two voiced tones separated by an internal pause, with silent head/tail and a noise floor"""
+    rng = np.random.default_rng(0)
+
+    def tone(seconds):
+        n = int(seconds * SAMPLE_RATE)
+        return 0.3 * np.sin(2 * np.pi * 200 * np.arange(n) / SAMPLE_RATE)
+
+    def silence(seconds):
+        return np.zeros(int(seconds * SAMPLE_RATE))
+
+    wav = np.concatenate((silence(head), tone(0.5), silence(pause), tone(0.4), silence(tail)))
+    return (wav + rng.standard_normal(len(wav)) * 1e-4).astype(np.float32)
+
+
+def test_one_shot_keeps_pads():
+    """Head and tail are cut down to the configured pads; the internal pause survives"""
+    wav = utterance()
+    kept, head, tail = trim_silence(wav, SAMPLE_RATE, head_pad_ms=50, tail_pad_ms=100)
+
+    assert head == int(0.35 * SAMPLE_RATE)
+    assert tail == int(0.5 * SAMPLE_RATE)
+    assert len(kept) == len(wav) - head - tail
+    assert np.shares_memory(kept, wav)
+
+
+def test_streaming_matches_one_shot():
+    """Block-wise gating gives the same samples as trimming the whole buffer"""
+    wav = utterance()
+    expected, head, tail = trim_silence(wav, SAMPLE_RATE, head_pad_ms=50, tail_pad_ms=100)
+
+    for block in (97, 2400, 24000):
+        trimmer = SilenceTrimmer(SAMPLE_RATE, head_pad_ms=50, tail_pad_ms=100)
+        parts = [trimmer.process(wav[i:i + block]) for i in range(0, len(wav), block)]
+        parts.append(trimmer.flush())
+
+        np.testing.assert_array_equal(np.concatenate(parts), expected)
+        assert trimmer.trimmed_head_samples == head
+        assert trimmer.trimmed_tail_samples == tail
+
+
+def test_streaming_emits_speech_before_end():
+    """Voiced audio is released as it arrives, not held until flush"""
+    wav = utterance(head=0.2, tail=0.2)
+    trimmer = SilenceTrimmer(SAMPLE_RATE)
+    first = trimmer.process(wav[:int(0.5 * SAMPLE_RATE)])
+    assert len(first) >= int(0.25 * SAMPLE_RATE)
+
+
+def test_all_silence():
+    trimmer = SilenceTrimmer(SAMPLE_RATE)
+    silence = np.zeros(SAMPLE_RATE, dtype=np.float32)
+    assert len(trimmer.process(silence)) == 0
+    assert len(trimmer.flush()) == 0
+    assert trimmer.trimmed_ms == 1000
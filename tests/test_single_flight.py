@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Unit tests for single-flight request coalescing (scripts/single_flight.py)
+Run with: pytest tests/test_single_flight.py
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from single_flight import SingleFlight, request_key  # noqa: E402
+
+
+def test_request_key_is_canonical():
+    assert request_key(text="hi", voice="a", seed=None) == request_key(seed=None, voice="a", text="hi")
+    assert request_key(text="hi", voice="a") != request_key(text="hi", voice="b")
+
+
+def test_identical_requests_share_one_production():
+    """Concurrent and late-joining subscribers all get every chunk; the producer runs once"""
+    runs = []
+
+    async def producer():
+        runs.append(1)
+        for i in range(5):
+            await asyncio.sleep(0.01)
+            yield f"chunk{i}".encode()
+
+    async def collect(stream):
+        return [chunk async for chunk in stream]
+
+    async def scenario():
+        flights = SingleFlight("test")
+        key = request_key(text="Your appointment is tomorrow")
+
+        early = [flights.subscribe(key, producer) for _ in range(3)]
+        tasks = [asyncio.create_task(collect(stream)) for stream, _ in early]
+
+        await asyncio.sleep(0.025)  # Mid-stream
+        late, joined = flights.subscribe(key, producer)
+        tasks.append(asyncio.create_task(collect(late)))
+
+        results = await asyncio.gather(*tasks)
+        return flights, [j for _, j in early] + [joined], results
+
+    flights, joined, results = asyncio.run(scenario())
+
+    assert len(runs) == 1
+    assert joined == [False, True, True, True]
+    expected = [f"chunk{i}".encode() for i in range(5)]
+    assert all(result == expected for result in results)
+    assert flights.dedup_ratio == pytest.approx(0.75)
+    assert flights.get_stats()["in_flight"] == 0
+
+
+def test_error_reaches_every_subscriber():
+    async def producer():
+        yield b"partial"
+        raise RuntimeError("engine failed")
+
+    async def collect(stream):
+        chunks = []
+        with pytest.raises(RuntimeError, match="engine failed"):
+            async for chunk in stream:
+                chunks.append(chunk)
+        return chunks
+
+    async def scenario():
+        flights = SingleFlight("test")
+        streams = [flights.subscribe("key", producer)[0] for _ in range(2)]
+        return await asyncio.gather(*(collect(stream) for stream in streams))
+
+    assert asyncio.run(scenario()) == [[b"partial"], [b"partial"]]
+
+
+def test_producer_cancelled_when_all_subscribers_leave():
+    cancelled = []
+
+    async def producer():
+        try:
+            while True:
+                await asyncio.sleep(0.01)
+                yield b"x"
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def scenario():
+        flights = SingleFlight("test")
+        stream, _ = flights.subscribe("key", producer)
+        async for _ in stream:
+            break
+        await stream.aclose()
+        await asyncio.sleep(0.05)
+        return flights
+
+    flights = asyncio.run(scenario())
+    assert cancelled == [True]
+    assert flights.get_stats()["in_flight"] == 0
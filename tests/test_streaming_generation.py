@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Tests for token-window streaming generation (scripts/streaming_generation.py)
+Run with: pytest tests/test_streaming_generation.py
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from streaming_generation import (  # noqa: E402
+    StreamWindows, WindowVocoder, astream, stream_windows, SPEECH_VOCAB_SIZE
+)
+from tts_engines import FakeTTSEngine  # noqa: E402
+
+SAMPLES_PER_TOKEN = 960  # 24 kHz / 25 tokens per second
+
+
+def vocode(tokens):
+    """Stand-in vocoder: each token renders its own 40 ms tone, independent of context"""
+    t = np.arange(SAMPLES_PER_TOKEN, dtype=np.float32) / 24000
+    return np.concatenate([0.2 * np.sin(2 * np.pi * (100 + token % 400) * t) for token in tokens])
+
+
+def test_windows_stitch_to_whole_sentence_audio():
+    tokens = [(i * 37) % 6000 for i in range(93)]
+    calls = []
+
+    def recording_vocode(window):
+        calls.append(len(window))
+        return vocode(window)
+
+    vocoder = WindowVocoder(recording_vocode, StreamWindows(first_tokens=10, tokens=25, context_tokens=8))
+    blocks = []
+    for token in tokens:
+        audio = vocoder.add(token)
+        if audio is not None:
+            blocks.append(audio)
+    blocks.append(vocoder.finish())
+
+    np.testing.assert_allclose(np.concatenate(blocks), vocode(tokens), atol=1e-6)
+    assert len(blocks[0]) == 10 * SAMPLES_PER_TOKEN - vocoder.crossfade  # First audio after 10 tokens
+    assert calls == [10, 8 + 25, 8 + 25, 8 + 25, 8 + 8]  # Each later window re-vocodes 8 context tokens
+
+
+def test_special_tokens_and_short_sentences():
+    vocoder = WindowVocoder(vocode, StreamWindows(first_tokens=10))
+    for token in [5, SPEECH_VOCAB_SIZE + 1, 7, 9]:
+        assert vocoder.add(token) is None
+    assert len(vocoder.finish()) == 3 * SAMPLES_PER_TOKEN  # One whole-sentence window
+    assert vocoder.windows_vocoded == 1
+
+
+def test_stream_windows_from_config():
+    assert stream_windows({"streaming": {"enabled": False}}) is None
+    windows = stream_windows({"streaming": {"first_tokens": 6, "crossfade_ms": 10, "enabled": True}})
+    assert windows == StreamWindows(first_tokens=6, crossfade_ms=10.0)
+    assert stream_windows({}) == StreamWindows()
+
+
+def test_astream_yields_blocks_as_they_are_produced():
+    engine = FakeTTSEngine(rtf=0.5, stream_block_ms=100)
+    text = "Streaming starts before the sentence is finished."
+
+    async def consume():
+        started = time.perf_counter()
+        first_at, blocks = None, []
+        async for block in astream(engine, text, seed=1):
+            first_at = first_at or time.perf_counter() - started
+            blocks.append(block)
+        return first_at, time.perf_counter() - started, blocks
+
+    first_at, total, blocks = asyncio.run(consume())
+    np.testing.assert_array_equal(np.concatenate(blocks), engine.render(text, seed=1))
+    assert first_at < total / 5
+
+
+def test_closing_astream_stops_the_engine():
+    produced = []
+
+    class Endless(FakeTTSEngine):
+        def stream(self, text, **params):
+            while True:
+                produced.append(1)
+                time.sleep(0.005)
+                yield np.zeros(240, dtype=np.float32)
+
+    async def take_two():
+        stream = astream(Endless(), "text")
+        blocks = [await stream.__anext__(), await stream.__anext__()]
+        await stream.aclose()
+        return blocks
+
+    assert len(asyncio.run(take_two())) == 2
+    count = len(produced)
+    time.sleep(0.05)
+    assert len(produced) == count and count < 10
+
+
+def test_astream_raises_engine_errors():
+    class Broken(FakeTTSEngine):
+        def stream(self, text, **params):
+            yield np.zeros(240, dtype=np.float32)
+            raise RuntimeError("decoder failed")
+
+    async def consume():
+        return [block async for block in astream(Broken(), "text")]
+
+    with pytest.raises(RuntimeError, match="decoder failed"):
+        asyncio.run(consume())
+
+
+def test_v1_pcm16_streams_and_caches_sentences(monkeypatch, tmp_path, stub_catalog):
+    pytest.importorskip("asyncpg")
+    pytest.importorskip("prometheus_client")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    import api_v1
+    import sentence_cache
+
+    voice_id = "6f1c1a2e-0000-4000-8000-000000000003"
+
+    class StreamOnly(FakeTTSEngine):
+        def generate(self, text, **params):
+            raise AssertionError("streamed formats should not synthesize whole sentences")
+
+    engine = StreamOnly(stream_block_ms=100)
+    monkeypatch.setattr(sentence_cache, "_sentence_cache", sentence_cache.SentenceCache(str(tmp_path)))
+    app = FastAPI()
+    app.include_router(api_v1.router)
+    app.state.tts_model = engine
+    app.state.voice_catalog = stub_catalog(voice_id, "emily-en-us")
+    app.state.config = {"audio_output": {"trim_silence": {"enabled": False}}}
+    client = TestClient(app)
+
+    payload = {"text": "Your appointment is confirmed. See you on Tuesday.", "voice_id": voice_id, "format": "pcm16"}
+    first = client.post("/v1/tts", json=payload)
+    assert first.status_code == 200
+    assert engine.calls == 2  # One stream per sentence
+    assert len(first.content) > 2 * 24000  # Both sentences' audio (> 1 s of PCM16)
+
+    second = client.post("/v1/tts", json=payload)
+    assert engine.calls == 2  # Streamed sentences were cached whole
+    # Same audio, except streamed sentences keep their whole 150 ms trailing pause (cached: trimmed to 120 ms)
+    assert 0 < len(first.content) - len(second.content) <= 2 * int(2 * 0.03 * 24000)
+
+
+def test_v1_streamed_sentences_cache_unscaled_audio(monkeypatch, tmp_path, stub_catalog):
+    """Encoders scale blocks in place; the cache must keep the engine's float samples"""
+    pytest.importorskip("asyncpg")
+    pytest.importorskip("prometheus_client")
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    import api_v1
+    import sentence_cache
+
+    voice_id = "6f1c1a2e-0000-4000-8000-000000000004"
+
+    engine = FakeTTSEngine(stream_block_ms=100)
+    monkeypatch.setattr(sentence_cache, "_sentence_cache", sentence_cache.SentenceCache(str(tmp_path)))
+    app = FastAPI()
+    app.include_router(api_v1.router)
+    app.state.tts_model = engine
+    app.state.voice_catalog = stub_catalog(voice_id, "emily-en-us")
+    app.state.config = {"audio_output": {"trim_silence": {"enabled": False}}}
+    client = TestClient(app)
+
+    payload = {"text": "Your appointment is confirmed.", "voice_id": voice_id, "format": "pcm16"}
+    first = np.frombuffer(client.post("/v1/tts", json=payload).content, dtype="<i2")
+    replay = np.frombuffer(client.post("/v1/tts", json=payload).content, dtype="<i2")
+    assert engine.calls == 1
+    assert np.abs(replay).max() < 32767  # Not clipped
+    assert abs(int(np.abs(replay).max()) - int(np.abs(first).max())) <= 1
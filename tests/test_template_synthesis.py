@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Unit tests for template-slot synthesis (scripts/template_synthesis.py)
+Run with: pytest tests/test_template_synthesis.py
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from template_synthesis import TemplateSynthesizer, SegmentCache, parse_template  # noqa: E402
+from tts_engines import FakeTTSEngine  # noqa: E402
+
+PARAMS = {"temperature": 0.6, "exaggeration": 0.85, "cfg_weight": 0.75}
+
+
+def test_parse_template():
+    segments = parse_template("Your payment of {amount} has been processed, {name}.")
+    assert [(s.text, s.slot) for s in segments] == [
+        ("Your payment of", None), ("", "amount"), ("has been processed,", None), ("", "name")
+    ]
+    with pytest.raises(ValueError):
+        parse_template("Bad {0} slot")
+    with pytest.raises(ValueError):
+        parse_template("Unclosed {time")
+
+
+def test_fixed_segments_rendered_once_per_voice():
+    """Second render only synthesizes the slot; the cached share is reported"""
+    engine = FakeTTSEngine()
+    synthesizer = TemplateSynthesizer(engine, cache=SegmentCache())
+    template = "Your appointment is tomorrow at {time}. Please arrive fifteen minutes early."
+
+    async def scenario():
+        first = await synthesizer.render(template, {"time": "three P M"}, "maya", PARAMS)
+        second = await synthesizer.render(template, {"time": "ten A M"}, "maya", PARAMS)
+        other_voice = await synthesizer.render(template, {"time": "ten A M"}, "emily", PARAMS)
+        return first, second, other_voice
+
+    (wav1, stats1), (wav2, stats2), (_, stats3) = asyncio.run(scenario())
+
+    assert stats1["synthesized_segments"] == 3 and stats1["cached_ratio"] == 0.0
+    assert stats2["cached_segments"] == 2 and stats2["synthesized_segments"] == 1
+    assert stats2["cached_ratio"] > 0.8
+    assert stats3["cached_segments"] == 0
+    assert engine.calls == 3 + 1 + 3   # Fixed segments once per voice, slots every time
+    assert len(wav2) > 0 and np.isfinite(wav2).all()
+
+
+def test_missing_value_rejected():
+    synthesizer = TemplateSynthesizer(FakeTTSEngine(), cache=SegmentCache())
+    with pytest.raises(ValueError, match="amount"):
+        asyncio.run(synthesizer.render("Payment of {amount} received.", {}, "maya", PARAMS))
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Tests for the TTS engine interface and registry (scripts/tts_engines.py)
+Run with: pytest tests/test_tts_engines.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from tts_engines import EngineRegistry, FakeTTSEngine, TTSEngine, load_engine  # noqa: E402
+
+
+def test_fake_engine_is_deterministic():
+    engine = FakeTTSEngine()
+    first = engine.generate("Your appointment is tomorrow.", seed=7)
+    assert first.dtype == np.float32 and first.ndim == 1
+    np.testing.assert_array_equal(first, FakeTTSEngine().generate("Your appointment is tomorrow.", seed=7))
+    assert not np.array_equal(first, engine.generate("Your appointment is tomorrow.", seed=8))
+
+    # Silence at both ends, like real model output
+    assert np.abs(first[:240]).max() == 0 and np.abs(first[-240:]).max() == 0
+
+    # Streaming yields the same clip in blocks
+    blocks = list(engine.stream("Your appointment is tomorrow.", seed=7))
+    assert len(blocks) > 1
+    np.testing.assert_array_equal(np.concatenate(blocks), first)
+
+
+def test_fake_engine_latency_and_rtf():
+    engine = FakeTTSEngine(rtf=0.1, latency_ms=50)
+    start = time.perf_counter()
+    wav = engine.generate("x" * 30)  # 2 s of voiced audio + padding
+    elapsed = time.perf_counter() - start
+    assert elapsed >= 0.05 + 0.1 * len(wav) / 24000 - 0.01
+
+    start = time.perf_counter()
+    engine.generate_batch(["x" * 30] * 3)
+    assert time.perf_counter() - start < 3 * elapsed  # Latency paid once per batch
+    assert engine.calls == 4
+
+
+def test_registry_routes_voices():
+    registry = EngineRegistry()
+    primary, secondary = FakeTTSEngine(), FakeTTSEngine()
+    registry.register(primary, default=True)
+    registry.register(secondary, voices=["af_heart", "am_adam"], name="kokoro")
+
+    assert registry.for_voice("af_heart") is secondary
+    assert registry.for_voice("emily") is primary
+    assert registry.for_voice(None) is primary
+    assert registry.get_stats()["engines"]["kokoro"]["voices"] == 2
+
+
+def test_load_engine_from_env(monkeypatch):
+    monkeypatch.setenv("TTS_ENGINE", "fake")
+    monkeypatch.setenv("TTS_FAKE_RTF", "0.25")
+    engine = load_engine()
+    assert isinstance(engine, TTSEngine) and engine.name == "fake" and engine.rtf == 0.25
+
+    with pytest.raises(ValueError):
+        load_engine("nope")
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-process voice catalog (scripts/voice_catalog.py) and the
+/v1 voice lookups served from it (scripts/api_v1.py)
+Uses a stub connection pool - no Postgres needed.
+Run with: pytest tests/test_voice_catalog.py
+"""
+
+import sys
+import uuid
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from voice_catalog import VoiceCatalog, VERSION_QUERY, CATALOG_QUERY, compute_etag, etag_matches  # noqa: E402
+
+TENANT_A = uuid.UUID("00000000-0000-4000-8000-00000000000a")
+TENANT_B = uuid.UUID("00000000-0000-4000-8000-00000000000b")
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def voice_row(number, display_name, owner=None, status="active", **fields):
+    return {
+        "id": uuid.UUID(f"6f1c1a2e-0000-4000-8000-{number:012d}"),
+        "slug": display_name.lower().replace(" ", "-"),
+        "display_name": display_name,
+        "description": None,
+        "language": "en-US",
+        "gender": "female",
+        "sample_url": None,
+        "audio_file_path": None,
+        "params": '{"temperature": 0.8}',
+        "owner_tenant": owner,
+        "is_public": owner is None,
+        "status": status,
+        "updated_at": EPOCH + timedelta(minutes=number),
+        **fields
+    }
+
+
+class StubConnection:
+    """Answers the catalog, version and per-ID queries from an in-memory table"""
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    async def fetchrow(self, query, *args):
+        self.pool.queries.append(query)
+        rows = self.pool.rows
+        if query == VERSION_QUERY:
+            return {"total": len(rows), "last_updated": max((row["updated_at"] for row in rows), default=None)}
+        voice_id = args[0]  # get_voice_by_id
+        return next((row for row in rows if row["id"] == voice_id and row["status"] == "active"), None)
+
+    async def fetch(self, query, *args):
+        self.pool.queries.append(query)
+        if query == CATALOG_QUERY:
+            return [dict(row) for row in self.pool.rows]
+        tenant_id = args[0] if args else None  # list_voices without a catalog
+        return sorted(
+            (row for row in self.pool.rows
+             if row["status"] == "active" and (row["is_public"] or row["owner_tenant"] == tenant_id)),
+            key=lambda row: row["display_name"]
+        )
+
+
+class StubPool:
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield StubConnection(self)
+
+
+def catalog_rows():
+    return [
+        voice_row(1, "Naomi"),
+        voice_row(2, "Emily"),
+        voice_row(3, "Acme Agent", owner=TENANT_A),
+        voice_row(4, "Retired", status="disabled"),
+    ]
+
+
+def loaded_catalog(rows=None):
+    pool = StubPool(rows if rows is not None else catalog_rows())
+    catalog = VoiceCatalog(pool)
+    asyncio.run(catalog.load())
+    return catalog, pool
+
+
+def test_version_stamp_reloads_only_on_change():
+    catalog, pool = loaded_catalog()
+    assert catalog.loaded
+    assert catalog.version == f"4:{(EPOCH + timedelta(minutes=4)).isoformat()}"
+    assert catalog.get_stats()["voices"] == 4
+
+    assert asyncio.run(catalog.refresh()) is False  # Version unchanged: no catalog query
+    assert pool.queries.count(CATALOG_QUERY) == 1
+
+    pool.rows[0]["updated_at"] = EPOCH + timedelta(hours=1)  # UPDATE bumps updated_at
+    assert asyncio.run(catalog.refresh()) is True
+    pool.rows.pop()                                            # DELETE changes the count
+    assert asyncio.run(catalog.refresh()) is True
+    assert catalog.version.startswith("3:")
+    assert catalog.stats.reloads == 3
+
+
+def test_tenant_views_and_access():
+    catalog, _ = loaded_catalog()
+    public = catalog.view_for_tenant(None)
+    assert [voice["display_name"] for voice in public.voices] == ["Emily", "Naomi"]
+    assert [voice["display_name"] for voice in catalog.view_for_tenant(TENANT_A).voices] == ["Acme Agent", "Emily", "Naomi"]
+    assert catalog.view_for_tenant(TENANT_B).voices == public.voices
+    assert catalog.view_for_tenant(None) is public  # Cached per version
+
+    private_id = str(voice_row(3, "Acme Agent")["id"])
+    assert catalog.get(private_id, TENANT_A)["params"] == {"temperature": 0.8}  # params JSON decoded
+    assert catalog.get(private_id, TENANT_B) is None
+    assert catalog.get(private_id) is None
+    assert catalog.get(str(voice_row(4, "Retired")["id"])) is None  # Inactive
+    assert catalog.get("not-a-uuid") is None
+    assert catalog.contains(private_id) and not catalog.contains(str(uuid.uuid4()))
+
+    asyncio.run(catalog.load())
+    assert catalog.view_for_tenant(None) is not public  # Rebuilt after a reload
+
+
+def test_strong_etag():
+    catalog, pool = loaded_catalog()
+    etag = catalog.view_for_tenant(None).etag
+    assert etag.startswith('"') and etag.endswith('"') and not etag.startswith("W/")
+    assert etag != catalog.view_for_tenant(TENANT_A).etag
+
+    # Only the public representation counts: internal fields do not change it
+    pool.rows[0]["params"] = '{"temperature": 0.5}'
+    pool.rows[0]["updated_at"] = EPOCH + timedelta(hours=1)
+    asyncio.run(catalog.refresh())
+    assert catalog.view_for_tenant(None).etag == etag
+
+    pool.rows[0]["description"] = "Warm and calm"
+    pool.rows[0]["updated_at"] = EPOCH + timedelta(hours=2)
+    asyncio.run(catalog.refresh())
+    assert catalog.view_for_tenant(None).etag != etag
+
+    assert compute_etag([]) == compute_etag([])
+    assert etag_matches(etag, etag) and etag_matches(f"W/{etag}", etag)
+    assert etag_matches(f'"other", {etag}', etag) and etag_matches("*", etag)
+    assert not etag_matches(None, etag) and not etag_matches('"other"', etag)
+
+
+def make_client(catalog, pool):
+    pytest.importorskip("asyncpg")
+    from fastapi import FastAPI, Request
+    from fastapi.testclient import TestClient
+    import api_v1
+
+    app = FastAPI()
+    app.include_router(api_v1.router)
+    app.state.voice_catalog = catalog
+    app.state.pg = pool
+
+    @app.middleware("http")
+    async def tenant(request: Request, call_next):
+        tenant_id = request.headers.get("x-tenant")
+        request.state.tenant_id = uuid.UUID(tenant_id) if tenant_id else None
+        return await call_next(request)
+
+    return TestClient(app)
+
+
+def test_list_voices_conditional_get():
+    catalog, pool = loaded_catalog()
+    client = make_client(catalog, pool)
+
+    first = client.get("/v1/voices")
+    assert first.status_code == 200
+    assert [voice["slug"] for voice in first.json()] == ["emily", "naomi"]
+    etag = first.headers["etag"]
+    assert etag == catalog.view_for_tenant(None).etag
+
+    assert client.get("/v1/voices", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/v1/voices", headers={"If-None-Match": f"W/{etag}"}).status_code == 304
+    tenant = client.get("/v1/voices", headers={"If-None-Match": etag, "X-Tenant": str(TENANT_A)})
+    assert tenant.status_code == 200 and len(tenant.json()) == 3  # Another view, another ETag
+    assert pool.queries.count(CATALOG_QUERY) == 1  # All served from memory
+
+
+def test_catalog_miss_falls_back_to_postgres():
+    catalog, pool = loaded_catalog()
+    client = make_client(catalog, pool)
+    known = str(voice_row(1, "Naomi")["id"])
+    private = str(voice_row(3, "Acme Agent")["id"])
+
+    pool.queries.clear()
+    assert client.get(f"/v1/voices/{known}").json()["slug"] == "naomi"
+    assert client.get(f"/v1/voices/{private}").status_code == 404  # Known but private: no DB query
+    assert pool.queries == []
+
+    created = voice_row(5, "Created Since Load")  # Not in the catalog until the next refresh
+    pool.rows.append(created)
+    assert client.get(f"/v1/voices/{created['id']}").json()["slug"] == "created-since-load"
+    assert len(pool.queries) == 1
+
+    # Catalog not loaded: lists come from Postgres too, with the same ETag
+    cold = VoiceCatalog(pool)
+    listed = make_client(cold, pool).get("/v1/voices")
+    assert [voice["slug"] for voice in listed.json()] == ["created-since-load", "emily", "naomi"]
+    assert listed.headers["etag"] == compute_etag(sorted(
+        (row for row in pool.rows if row["is_public"] and row["status"] == "active"),
+        key=lambda row: row["display_name"]
+    ))
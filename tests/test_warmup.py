@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for model warm-up (scripts/warmup.py)
+Run with: pytest tests/test_warmup.py
+"""
+
+import sys
+import time
+import asyncio
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from tts_engines import FakeTTSEngine  # noqa: E402
+from warmup import Warmup, READY, FAILED  # noqa: E402
+
+
+class ColdStartEngine(FakeTTSEngine):
+    """First call is slow (lazy initialization), later calls are fast"""
+
+    def __init__(self):
+        super().__init__()
+        self.references = []
+
+    def generate(self, text, **params):
+        if self.calls == 0:
+            time.sleep(0.05)
+        self.references.append(params.get("reference_audio"))
+        return super().generate(text, **params)
+
+
+def test_warmup_reports_first_vs_steady_latency():
+    engine = ColdStartEngine()
+    voices = [
+        {"name": "emily-en-us", "params": {"temperature": 0.8, "exaggeration": 1.3, "cfg_weight": 0.5}},
+        {"name": "Emily.wav", "params": {}, "reference_audio": "voices/Emily.wav"}
+    ]
+    warmup = Warmup(engine, voices, rounds=2)
+    assert not warmup.ready
+
+    stats = asyncio.run(warmup.run())
+
+    assert warmup.status == READY and stats["ready"]
+    assert engine.calls == 3 * 3 + 2
+    assert stats["latency"]["short"]["first_ms"] > stats["latency"]["short"]["steady_ms"]
+    assert set(stats["voices"]) == {"emily-en-us", "Emily.wav"}
+    assert engine.references[-1] == "voices/Emily.wav"
+
+
+def test_failed_warmup_keeps_server_unready():
+    class BrokenEngine(FakeTTSEngine):
+        def generate(self, text, **params):
+            raise RuntimeError("CUDA out of memory")
+
+    warmup = Warmup(BrokenEngine(), retries=1, retry_delay=0)
+    stats = asyncio.run(warmup.run())
+    assert warmup.status == FAILED and not warmup.ready
+    assert stats["error"] == "CUDA out of memory"
+    assert stats["attempts"] == 2
+
+
+def test_transient_failure_is_retried():
+    class FlakyEngine(FakeTTSEngine):
+        def generate(self, text, **params):
+            if self.calls == 0:
+                self.calls += 1
+                raise RuntimeError("CUDA error: launch failure")
+            return super().generate(text, **params)
+
+    warmup = Warmup(FlakyEngine(), rounds=1, retries=2, retry_delay=0)
+    stats = asyncio.run(warmup.run())
+    assert warmup.ready and stats["attempts"] == 2 and stats["error"] is None
+
+
+def test_voice_failures_are_skipped():
+    class MissingClipEngine(FakeTTSEngine):
+        def generate(self, text, **params):
+            if params.get("reference_audio"):
+                raise FileNotFoundError(params["reference_audio"])
+            return super().generate(text, **params)
+
+    voices = [
+        {"name": "Gone.wav", "params": {}, "reference_audio": "voices/Gone.wav"},
+        {"name": "emily-en-us", "params": {"temperature": 0.8}}
+    ]
+    warmup = Warmup(MissingClipEngine(), voices, rounds=1)
+    stats = asyncio.run(warmup.run())
+    assert warmup.status == READY
+    assert set(stats["voices"]) == {"emily-en-us"}
+    assert stats["voice_errors"] == {"Gone.wav": "voices/Gone.wav"}
+
+
+def test_custom_texts_without_medium():
+    engine = ColdStartEngine()
+    warmup = Warmup(engine, [{"name": "emily-en-us", "params": {}}], rounds=1, texts={"greeting": "Hello there."})
+    stats = asyncio.run(warmup.run())
+    assert warmup.status == READY
+    assert set(stats["voices"]) == {"emily-en-us"} and stats["voice_errors"] == {}
+
+    for texts in ({}, {"medium": ""}, {"medium": None}):
+        with pytest.raises(ValueError):
+            Warmup(engine, texts=texts)
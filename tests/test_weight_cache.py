@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Tests for the memory-mapped weight cache (scripts/weight_cache.py)
+Run with: pytest tests/test_weight_cache.py
+"""
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from weight_cache import WeightCache, WeightCacheError, resolve_revision  # noqa: E402
+
+REPO = "ResembleAI/chatterbox"
+
+
+def state_dicts():
+    rng = np.random.default_rng(0)
+    return {
+        "t3": {
+            "embed.weight": rng.standard_normal((100, 16)).astype(np.float32),
+            "norm.bias": rng.standard_normal(3).astype(np.float16),
+            "step": np.array(7, dtype=np.int64)
+        },
+        "ve": {"proj.weight": rng.standard_normal((8, 8)).astype(np.float32)}
+    }
+
+
+def test_round_trip_is_memory_mapped(tmp_path):
+    cache = WeightCache(tmp_path)
+    tokenizer = tmp_path / "tokenizer.json"
+    tokenizer.write_text('{"vocab": {}}')
+    cache.store(REPO, "abc123", state_dicts(), {"tokenizer.json": str(tokenizer)})
+
+    loaded = cache.load(REPO, "abc123")
+    for component, tensors in state_dicts().items():
+        for name, expected in tensors.items():
+            array = loaded[component][name]
+            np.testing.assert_array_equal(array, expected)
+            assert array.dtype == expected.dtype
+            assert not array.flags.writeable
+            assert isinstance(array.base, np.memmap) or isinstance(array, np.memmap)
+    assert cache.file(REPO, "abc123", "tokenizer.json").read_text() == '{"vocab": {}}'
+
+    index = cache.load_index(REPO, "abc123")
+    assert all(entry["offset"] % 64 == 0 for entry in index["components"]["t3"]["tensors"].values())
+
+
+def test_revisions_are_separate_and_prunable(tmp_path):
+    cache = WeightCache(tmp_path)
+    cache.store(REPO, "old", state_dicts())
+    cache.store(REPO, "new", state_dicts())
+    assert cache.contains(REPO, "old") and cache.contains(REPO, "new")
+    with pytest.raises(WeightCacheError):
+        cache.load(REPO, "missing")
+
+    assert cache.prune(REPO, keep=["new"]) == 1
+    assert not cache.contains(REPO, "old") and cache.contains(REPO, "new")
+
+
+def test_cached_revision_resolves_without_the_hub(tmp_path, monkeypatch):
+    monkeypatch.delenv("CHATTERBOX_REVISION", raising=False)
+    cache = WeightCache(tmp_path)
+    assert cache.revisions(REPO) == []
+
+    cache.store(REPO, "old", state_dicts())
+    cache.store(REPO, "new", state_dicts())
+    assert cache.revisions(REPO) == ["new", "old"]
+
+    hub_calls = []
+    monkeypatch.setitem(sys.modules, "huggingface_hub", SimpleNamespace(HfApi=lambda: hub_calls.append(1)))
+    assert resolve_revision(REPO, cache=cache) == "new"
+    assert not hub_calls
+    assert resolve_revision(REPO, "pinned", cache=cache) == "pinned"
+    monkeypatch.setenv("CHATTERBOX_REVISION", "from-env")
+    assert resolve_revision(REPO, cache=cache) == "from-env"
+
+
+def test_corruption_detected(tmp_path):
+    cache = WeightCache(tmp_path)
+    cache.store(REPO, "abc123", state_dicts())
+    cache.load(REPO, "abc123", verify="always")
+
+    data = cache.file(REPO, "abc123", "t3.bin")
+    raw = bytearray(data.read_bytes())
+    raw[10] ^= 0xFF
+    data.write_bytes(raw)  # Size unchanged, mtime changes: "once" re-hashes
+
+    with pytest.raises(WeightCacheError, match="Checksum mismatch"):
+        cache.load(REPO, "abc123")